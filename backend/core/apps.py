@@ -4,6 +4,10 @@ class CoreConfig(AppConfig):  # 👉 defines configuration for the core app
     default_auto_field = "django.db.models.BigAutoField"  # 👉 sets default primary key type for models in this app
     name = "core"  # 👉 sets the app label used by django for referencing this app internally
 
+    def ready(self):
+        # 🔔 import signals so flush/migrate invalidate cached reference tables
+        import core.signals  # noqa: F401
+
 
 # 👉 summary:
 # configures the core app within the django project.
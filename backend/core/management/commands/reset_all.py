@@ -24,6 +24,7 @@ from users.admin_area.models import (
     TransactionLog,
 )
 from core.models import Message, MessageAttachment
+from core.services.table_versions import bump_all_table_versions
 from users.client_area.models import (
     ClientFoodPreferenceChangeLog,
     ClientMealComboSelection,
@@ -290,6 +291,10 @@ class Command(BaseCommand):
 
             self._ensure_test_admin(user_model)
 
+            # Cascaded admin parameter rows and the sequence resets above skip
+            # the versioned querysets, so invalidate every cached table here.
+            bump_all_table_versions()
+
         if not keep_media:
             self._clear_media_root()
         else:
@@ -1,7 +1,11 @@
 from django.db import models
 
+from .versioned_table import VersionedTableMixin, VersionedTableQuerySet
+
+
+class FoodLibraryItem(VersionedTableMixin, models.Model):
+    table_version_name = "food_library"
 
-class FoodLibraryItem(models.Model):
     class SourceType(models.TextChoices):
         STANDARD = "standard", "Standard"
         BRANDED = "branded", "Branded"
@@ -74,6 +78,8 @@ class FoodLibraryItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = VersionedTableQuerySet.as_manager()
+
     class Meta:
         ordering = ("source_food_id",)
         verbose_name = "Food Library Default"
@@ -83,7 +89,9 @@ class FoodLibraryItem(models.Model):
         return f"{self.name} [{self.category}]"
 
 
-class MealComboTemplate(models.Model):
+class MealComboTemplate(VersionedTableMixin, models.Model):
+    table_version_name = "meal_combos"
+
     combo_id = models.IntegerField(unique=True, db_index=True)
 
     protein_slot_1 = models.CharField(max_length=120, default="-")
@@ -103,6 +111,8 @@ class MealComboTemplate(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = VersionedTableQuerySet.as_manager()
+
     class Meta:
         ordering = ("combo_id",)
         verbose_name = "Meal Combo Default"
@@ -125,7 +135,9 @@ class MealComboTemplate(models.Model):
         return f"Combo #{self.combo_id}"
 
 
-class ComboMacroErrorLookup(models.Model):
+class ComboMacroErrorLookup(VersionedTableMixin, models.Model):
+    table_version_name = "combo_errors"
+
     error_code = models.IntegerField(unique=True, db_index=True)
     protein_error = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     carbs_error = models.DecimalField(max_digits=10, decimal_places=2, default=0)
@@ -133,6 +145,8 @@ class ComboMacroErrorLookup(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = VersionedTableQuerySet.as_manager()
+
     class Meta:
         ordering = ("error_code",)
         verbose_name = "Combo Macro Error Lookup"
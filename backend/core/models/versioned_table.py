@@ -0,0 +1,52 @@
+from django.db import models
+
+
+def _bump_for_model(model):
+    # Lazy import: core.services imports core.models at package import time.
+    from core.services.table_versions import bump_table_version
+
+    name = getattr(model, "table_version_name", None)
+    if name:
+        bump_table_version(name)
+
+
+class VersionedTableQuerySet(models.QuerySet):
+    """
+    QuerySet for reference tables cached in-process. Bulk writes skip model
+    save()/delete(), so they bump the table version stamp here instead.
+    """
+
+    def bulk_create(self, *args, **kwargs):
+        result = super().bulk_create(*args, **kwargs)
+        _bump_for_model(self.model)
+        return result
+
+    def bulk_update(self, *args, **kwargs):
+        result = super().bulk_update(*args, **kwargs)
+        _bump_for_model(self.model)
+        return result
+
+    def update(self, *args, **kwargs):
+        result = super().update(*args, **kwargs)
+        _bump_for_model(self.model)
+        return result
+
+    def delete(self):
+        result = super().delete()
+        _bump_for_model(self.model)
+        return result
+
+
+class VersionedTableMixin:
+    """Bumps `table_version_name` on single-row saves and deletes (Django admin edits)."""
+
+    table_version_name = None
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        _bump_for_model(type(self))
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _bump_for_model(type(self))
+        return result
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.cache import cache
+
+
+def increment_counter(key: str) -> None:
+    """Bump a counter in the shared cache so every web and Celery process adds to the same total."""
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key expired or was evicted between add and incr.
+        cache.set(key, 1, timeout=None)
+
+
+def hit_rate_stats(hits_key: str, misses_key: str) -> dict[str, Any]:
+    hits = int(cache.get(hits_key) or 0)
+    misses = int(cache.get(misses_key) or 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+    }
+
+
+def reset_counters(*keys: str) -> None:
+    cache.delete_many(list(keys))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import threading
+
+from core.models import ComboMacroErrorLookup
+from core.services.table_versions import COMBO_ERRORS, get_table_version
+
+
+@dataclass(frozen=True)
+class ComboErrorTable:
+    """
+    ComboMacroErrorLookup loaded into contiguous columns ordered by error_code.
+    Treat the arrays as read-only: one instance is shared by every caller in the process.
+    """
+
+    version: str
+    error_codes: array
+    protein_errors: array
+    carbs_errors: array
+    fats_errors: array
+
+    def __len__(self) -> int:
+        return len(self.error_codes)
+
+
+_cached_table: ComboErrorTable | None = None
+_cache_lock = threading.Lock()
+
+
+def _load_table(version: str) -> ComboErrorTable:
+    error_codes = array("q")
+    protein_errors = array("d")
+    carbs_errors = array("d")
+    fats_errors = array("d")
+
+    rows = ComboMacroErrorLookup.objects.values_list(
+        "error_code", "protein_error", "carbs_error", "fats_error"
+    ).order_by("error_code")
+    for error_code, protein_error, carbs_error, fats_error in rows.iterator(chunk_size=5000):
+        error_codes.append(int(error_code))
+        protein_errors.append(float(protein_error or 0))
+        carbs_errors.append(float(carbs_error or 0))
+        fats_errors.append(float(fats_error or 0))
+
+    return ComboErrorTable(
+        version=version,
+        error_codes=error_codes,
+        protein_errors=protein_errors,
+        carbs_errors=carbs_errors,
+        fats_errors=fats_errors,
+    )
+
+
+def get_combo_error_table() -> ComboErrorTable:
+    """
+    Process-wide copy of the combo macro error lookup, reloaded only when the
+    `combo_errors` table version changes (CSV import, reset, admin edits).
+    """
+    global _cached_table
+
+    version = get_table_version(COMBO_ERRORS)
+    table = _cached_table
+    if table is not None and table.version == version:
+        return table
+
+    with _cache_lock:
+        table = _cached_table
+        if table is None or table.version != version:
+            table = _load_table(version)
+            _cached_table = table
+    return table
+
+
+def clear_combo_error_table_cache() -> None:
+    global _cached_table
+    with _cache_lock:
+        _cached_table = None
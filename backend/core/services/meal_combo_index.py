@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import threading
+
+from core.models import MealComboTemplate
+from core.services.table_versions import MEAL_COMBOS, get_table_version
+
+MEAL_COMBO_SLOT_KEYS = ("protein_1", "protein_2", "carbs_1", "carbs_2", "fats_1", "fats_2")
+TEMPLATE_FIELD_BY_SLOT = {
+    "protein_1": "protein_slot_1",
+    "protein_2": "protein_slot_2",
+    "carbs_1": "carb_slot_1",
+    "carbs_2": "carb_slot_2",
+    "fats_1": "fat_slot_1",
+    "fats_2": "fat_slot_2",
+}
+
+
+@dataclass(frozen=True)
+class MealComboIndex:
+    """
+    MealComboTemplate held in memory for slot lookups.
+
+    `combos` is ordered by combo_id and a combo set is an int bitmap over those
+    positions, so `&`/`|` replace SQL filters and the lowest set bit is what
+    `.order_by("combo_id").first()` would return. `postings` maps each slot to
+    {stored value: bitmap}; values are compared exactly as stored, like the ORM
+    filters they replace. `slot_values` holds each slot's distinct non-empty
+    values in database collation order. Shared by every caller in the process:
+    treat the combos as read-only.
+    """
+
+    version: str
+    combos: tuple[MealComboTemplate, ...]
+    by_combo_id: dict[int, MealComboTemplate]
+    by_slots: dict[tuple[str, ...], MealComboTemplate]
+    slot_values: dict[str, tuple[str, ...]]
+    postings: dict[str, dict[str, int]]
+
+    def __len__(self) -> int:
+        return len(self.combos)
+
+    @property
+    def all_mask(self) -> int:
+        return (1 << len(self.combos)) - 1
+
+    def find(self, slots: tuple[str, ...]) -> MealComboTemplate | None:
+        return self.by_slots.get(tuple(slots))
+
+    def mask(self, slot_key: str, values: Iterable[str]) -> int:
+        postings = self.postings[slot_key]
+        mask = 0
+        for value in values:
+            mask |= postings.get(value, 0)
+        return mask
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return mask.bit_count()
+
+    def first(self, mask: int) -> MealComboTemplate | None:
+        if not mask:
+            return None
+        return self.combos[(mask & -mask).bit_length() - 1]
+
+    def iter_combos(self, mask: int) -> Iterator[MealComboTemplate]:
+        while mask:
+            lowest = mask & -mask
+            yield self.combos[lowest.bit_length() - 1]
+            mask ^= lowest
+
+
+_cached_index: MealComboIndex | None = None
+_cache_lock = threading.Lock()
+
+
+def _load_index(version: str) -> MealComboIndex:
+    combos = tuple(MealComboTemplate.objects.order_by("combo_id"))
+    fields = [TEMPLATE_FIELD_BY_SLOT[slot_key] for slot_key in MEAL_COMBO_SLOT_KEYS]
+    by_slots: dict[tuple[str, ...], MealComboTemplate] = {}
+    postings: dict[str, dict[str, int]] = {slot_key: {} for slot_key in MEAL_COMBO_SLOT_KEYS}
+
+    for position, combo in enumerate(combos):
+        bit = 1 << position
+        values = tuple(getattr(combo, field) for field in fields)
+        by_slots.setdefault(values, combo)
+        for slot_key, value in zip(MEAL_COMBO_SLOT_KEYS, values):
+            slot_postings = postings[slot_key]
+            slot_postings[value] = slot_postings.get(value, 0) | bit
+
+    # Option lists keep the database collation order the slot options endpoint has always returned.
+    slot_values = {
+        slot_key: tuple(
+            MealComboTemplate.objects.exclude(**{field: ""}).values_list(field, flat=True).distinct().order_by(field)
+        )
+        for slot_key, field in zip(MEAL_COMBO_SLOT_KEYS, fields)
+    }
+    return MealComboIndex(
+        version=version,
+        combos=combos,
+        by_combo_id={combo.combo_id: combo for combo in combos},
+        by_slots=by_slots,
+        slot_values=slot_values,
+        postings=postings,
+    )
+
+
+def get_meal_combo_index() -> MealComboIndex:
+    """
+    Process-wide slot index over MealComboTemplate, rebuilt only when the
+    `meal_combos` table version changes (CSV import, admin edits).
+    """
+    global _cached_index
+
+    version = get_table_version(MEAL_COMBOS)
+    index = _cached_index
+    if index is not None and index.version == version:
+        return index
+
+    with _cache_lock:
+        index = _cached_index
+        if index is None or index.version != version:
+            index = _load_index(version)
+            _cached_index = index
+    return index
+
+
+def clear_meal_combo_index_cache() -> None:
+    global _cached_index
+    with _cache_lock:
+        _cached_index = None
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import threading
+from types import MappingProxyType
 from typing import Any
 
-from core.models import FoodLibraryItem, MealComboTemplate
+from core.models import FoodLibraryItem
 from core.services.food_canonical import canonical_standard_name
+from core.services.meal_combo_index import MEAL_COMBO_SLOT_KEYS, TEMPLATE_FIELD_BY_SLOT, get_meal_combo_index
+from core.services.table_versions import FOOD_LIBRARY, get_table_version
 
-MEAL_COMBO_SLOT_KEYS = ("protein_1", "protein_2", "carbs_1", "carbs_2", "fats_1", "fats_2")
-TEMPLATE_FIELD_BY_SLOT = {
-    "protein_1": "protein_slot_1",
-    "protein_2": "protein_slot_2",
-    "carbs_1": "carb_slot_1",
-    "carbs_2": "carb_slot_2",
-    "fats_1": "fat_slot_1",
-    "fats_2": "fat_slot_2",
-}
+
+@dataclass(frozen=True)
+class FoodAliasMap:
+    version: str
+    aliases: Mapping[str, str]
+
+
+_cached_alias_map: FoodAliasMap | None = None
+_alias_cache_lock = threading.Lock()
 
 
 def _normalize_slot(value: Any) -> str:
@@ -37,75 +42,106 @@ def _ordered_distinct(values: Iterable[Any]) -> list[str]:
 
 
 def get_supported_combo_slot_values() -> dict[str, list[str]]:
-    supported = {}
-    for slot_key, field_name in TEMPLATE_FIELD_BY_SLOT.items():
-        supported[slot_key] = _ordered_distinct(
-            MealComboTemplate.objects.exclude(**{field_name: ""})
-            .values_list(field_name, flat=True)
-            .distinct()
-            .order_by(field_name)
-        )
-    return supported
+    index = get_meal_combo_index()
+    return {slot_key: _ordered_distinct(index.slot_values[slot_key]) for slot_key in TEMPLATE_FIELD_BY_SLOT}
 
 
 def _supported_set(supported_values: dict[str, Iterable[str]], slot_key: str) -> set[str]:
     return {_normalize_slot(value) for value in supported_values.get(slot_key, [])}
 
 
-def _food_alias_to_combo_category() -> dict[str, str]:
+def _load_food_alias_map(version: str) -> FoodAliasMap:
     rows = FoodLibraryItem.objects.filter(
         is_active=True,
         is_standard=True,
         approval_status=FoodLibraryItem.ApprovalStatus.APPROVED,
-    )
+    ).values_list("display_name", "name", "canonical_name", "canonical_category", "category")
     alias_map: dict[str, str] = {}
-    for row in rows:
-        category = _normalize_slot(row.canonical_category or row.category)
-        if category == "-":
+    for display_name, name, canonical_name, canonical_category, category in rows:
+        combo_category = _normalize_slot(canonical_category or category)
+        if combo_category == "-":
             continue
-        for raw_alias in (row.display_name, row.name, row.canonical_name, row.canonical_category, row.category):
+        for raw_alias in (display_name, name, canonical_name, canonical_category, category):
             alias = _normalize_slot(raw_alias)
             if alias != "-" and alias not in alias_map:
-                alias_map[alias] = category
-    return alias_map
+                alias_map[alias] = combo_category
+    return FoodAliasMap(version=version, aliases=MappingProxyType(alias_map))
 
 
-def normalize_slots_to_supported_combo_values(
-    slots: dict[str, Any],
+def _food_alias_to_combo_category() -> Mapping[str, str]:
+    """
+    Approved standard food names (display, raw and canonical) mapped to their
+    combo category. Cached per process until the `food_library` version changes.
+    """
+    global _cached_alias_map
+
+    version = get_table_version(FOOD_LIBRARY)
+    alias_map = _cached_alias_map
+    if alias_map is not None and alias_map.version == version:
+        return alias_map.aliases
+
+    with _alias_cache_lock:
+        alias_map = _cached_alias_map
+        if alias_map is None or alias_map.version != version:
+            alias_map = _load_food_alias_map(version)
+            _cached_alias_map = alias_map
+    return alias_map.aliases
+
+
+def clear_food_alias_map_cache() -> None:
+    global _cached_alias_map
+    with _alias_cache_lock:
+        _cached_alias_map = None
+
+
+def normalize_many_slots_to_supported_combo_values(
+    slot_rows: Iterable[dict[str, Any]],
     *,
     supported_values: dict[str, Iterable[str]] | None = None,
-) -> dict[str, str]:
+) -> list[dict[str, str]]:
+    """
+    Normalize the slots of many meals at once. Supported values, the alias map
+    and every distinct (slot, value) resolution are computed once per call.
+    """
     supported_values = supported_values or get_supported_combo_slot_values()
+    supported_by_slot = {slot_key: _supported_set(supported_values, slot_key) for slot_key in MEAL_COMBO_SLOT_KEYS}
     food_aliases = _food_alias_to_combo_category()
-    normalized_slots = {}
+    resolved: dict[tuple[str, str], str] = {}
 
-    for slot_key in MEAL_COMBO_SLOT_KEYS:
-        value = _normalize_slot((slots or {}).get(slot_key))
-        supported = _supported_set(supported_values, slot_key)
+    def resolve(slot_key: str, value: str) -> str:
+        supported = supported_by_slot[slot_key]
         if value in supported:
-            normalized_slots[slot_key] = value
-            continue
-
+            return value
         alias_value = food_aliases.get(value)
         if alias_value and alias_value in supported:
-            normalized_slots[slot_key] = alias_value
-            continue
-
+            return alias_value
         canonical_value = canonical_standard_name(value)
-        normalized_slots[slot_key] = canonical_value if canonical_value in supported else value
+        return canonical_value if canonical_value in supported else value
+
+    normalized_rows = []
+    for slots in slot_rows:
+        normalized_slots = {}
+        for slot_key in MEAL_COMBO_SLOT_KEYS:
+            value = _normalize_slot((slots or {}).get(slot_key))
+            key = (slot_key, value)
+            if key not in resolved:
+                resolved[key] = resolve(slot_key, value)
+            normalized_slots[slot_key] = resolved[key]
+        normalized_rows.append(normalized_slots)
+    return normalized_rows
+
 
-    return normalized_slots
+def normalize_slots_to_supported_combo_values(
+    slots: dict[str, Any],
+    *,
+    supported_values: dict[str, Iterable[str]] | None = None,
+) -> dict[str, str]:
+    return normalize_many_slots_to_supported_combo_values([slots], supported_values=supported_values)[0]
 
 
 def find_meal_combo_template_by_slots(*, protein_1, protein_2, carbs_1, carbs_2, fats_1, fats_2):
-    return MealComboTemplate.objects.filter(
-        protein_slot_1=_normalize_slot(protein_1),
-        protein_slot_2=_normalize_slot(protein_2),
-        carb_slot_1=_normalize_slot(carbs_1),
-        carb_slot_2=_normalize_slot(carbs_2),
-        fat_slot_1=_normalize_slot(fats_1),
-        fat_slot_2=_normalize_slot(fats_2),
-    ).first()
+    slots = (protein_1, protein_2, carbs_1, carbs_2, fats_1, fats_2)
+    return get_meal_combo_index().find(tuple(_normalize_slot(value) for value in slots))
 
 
 def find_meal_combo_id_by_slots(**kwargs):
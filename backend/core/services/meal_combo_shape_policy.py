@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
@@ -5,6 +6,7 @@ from typing import Any
 from django.db.models import QuerySet
 
 from core.models import MealComboTemplate
+from core.services.meal_combo_index import MealComboIndex, get_meal_combo_index
 
 TWO_PROTEIN_MIN_G = Decimal("50")
 ONE_CARB_PREFERRED_BELOW_G = Decimal("45")
@@ -25,6 +27,11 @@ LEAN_PROTEIN_COOKING_FAT_REQUIRED = frozenset(
         "Merluza, Hake (flesh only) STANDARD",
     }
 )
+SLOT_GROUPS = (
+    (("protein_1", "protein_2"), ("protein_slot_1", "protein_slot_2")),
+    (("carbs_1", "carbs_2"), ("carb_slot_1", "carb_slot_2")),
+    (("fats_1", "fats_2"), ("fat_slot_1", "fat_slot_2")),
+)
 
 
 def _normalize_slot(value):
@@ -84,6 +91,14 @@ class MealComboSelectionDecision:
     fallback_reason: str | None = None
 
 
+@dataclass(frozen=True)
+class MealComboSelectionRequest:
+    saved_combo: MealComboTemplate
+    meal_target: dict[str, Any] | None
+    is_training_adjacent: bool = False
+    selected_slots: dict[str, Any] | None = None
+
+
 def preferred_combo_shape_for_meal(meal_target: dict[str, Any] | None, is_training_adjacent: bool = False):
     target = meal_target or {}
     protein_allows_second = allows_second_protein(target.get("protein"))
@@ -109,6 +124,28 @@ def _selected_values_for_group(selected_slots: dict[str, Any] | None, keys: tupl
     return values
 
 
+def _compatible_group_values(saved_combo: MealComboTemplate, selected_slots: dict[str, Any] | None):
+    return [
+        (keys, _selected_values_for_group(selected_slots, keys, tuple(getattr(saved_combo, field) for field in fields)))
+        for keys, fields in SLOT_GROUPS
+    ]
+
+
+def _compatible_combo_mask(
+    index: MealComboIndex,
+    *,
+    saved_combo: MealComboTemplate,
+    selected_slots: dict[str, Any] | None = None,
+) -> int:
+    """Bitmap version of `_compatible_combo_queryset` over the in-memory combo index."""
+    mask = index.all_mask
+    for (slot_1, slot_2), values in _compatible_group_values(saved_combo, selected_slots):
+        if values:
+            allowed = values | {"-"}
+            mask &= index.mask(slot_1, allowed) & index.mask(slot_2, allowed)
+    return mask
+
+
 def _compatible_combo_queryset(
     *,
     saved_combo: MealComboTemplate,
@@ -116,21 +153,7 @@ def _compatible_combo_queryset(
     queryset: QuerySet | None = None,
 ):
     qs = queryset if queryset is not None else MealComboTemplate.objects.all()
-    protein_values = _selected_values_for_group(
-        selected_slots,
-        ("protein_1", "protein_2"),
-        (saved_combo.protein_slot_1, saved_combo.protein_slot_2),
-    )
-    carb_values = _selected_values_for_group(
-        selected_slots,
-        ("carbs_1", "carbs_2"),
-        (saved_combo.carb_slot_1, saved_combo.carb_slot_2),
-    )
-    fat_values = _selected_values_for_group(
-        selected_slots,
-        ("fats_1", "fats_2"),
-        (saved_combo.fat_slot_1, saved_combo.fat_slot_2),
-    )
+    (_, protein_values), (_, carb_values), (_, fat_values) = _compatible_group_values(saved_combo, selected_slots)
 
     if protein_values:
         allowed = sorted(protein_values | {"-"})
@@ -160,6 +183,14 @@ def select_meal_combo_template_for_target(
     the ideal one-protein or one-carb shape does not exist in the current DB.
     """
     preferred_shape = preferred_combo_shape_for_meal(meal_target, is_training_adjacent=is_training_adjacent)
+    if queryset is None:
+        return _select_from_index(
+            get_meal_combo_index(),
+            saved_combo=saved_combo,
+            preferred_shape=preferred_shape,
+            selected_slots=selected_slots,
+        )
+
     compatible_qs = _compatible_combo_queryset(saved_combo=saved_combo, selected_slots=selected_slots, queryset=queryset)
     candidate_count_before = compatible_qs.count()
     filtered_qs = compatible_qs
@@ -199,3 +230,84 @@ def select_meal_combo_template_for_target(
         candidate_count_after_filtering=0,
         fallback_reason=fallback_reason,
     )
+
+
+def _select_from_index(
+    index: MealComboIndex,
+    *,
+    saved_combo: MealComboTemplate,
+    preferred_shape: MealComboShapePreference,
+    selected_slots: dict[str, Any] | None = None,
+) -> MealComboSelectionDecision:
+    """Same decision as the queryset path of `select_meal_combo_template_for_target`, without SQL."""
+    compatible = _compatible_combo_mask(index, saved_combo=saved_combo, selected_slots=selected_slots)
+    filtered = compatible
+    fallback_reasons = []
+
+    if preferred_shape.preferred_protein_slot_2 == "-":
+        protein_filtered = filtered & index.mask("protein_2", ("-",))
+        if protein_filtered:
+            filtered = protein_filtered
+        else:
+            fallback_reasons.append("no_one_protein_combo_for_preferences")
+
+    if preferred_shape.preferred_carb_slot_2 == "-":
+        carb_filtered = filtered & index.mask("carbs_2", ("-",))
+        if carb_filtered:
+            filtered = carb_filtered
+        else:
+            fallback_reasons.append("no_one_carb_combo_for_preferences")
+
+    combo = index.first(filtered)
+    if combo:
+        return MealComboSelectionDecision(
+            combo=combo,
+            preferred_shape=preferred_shape,
+            candidate_count_before_filtering=index.count(compatible),
+            candidate_count_after_filtering=index.count(filtered),
+            fallback_reason=";".join(fallback_reasons) or None,
+        )
+
+    return MealComboSelectionDecision(
+        combo=index.first(compatible) or saved_combo,
+        preferred_shape=preferred_shape,
+        candidate_count_before_filtering=index.count(compatible),
+        candidate_count_after_filtering=0,
+        fallback_reason=";".join(fallback_reasons) or "no_preference_compatible_combo",
+    )
+
+
+def select_meal_combo_templates_for_targets(
+    requests: Sequence[MealComboSelectionRequest],
+) -> list[MealComboSelectionDecision]:
+    """
+    Batch form of `select_meal_combo_template_for_target` for every meal of a
+    week: the combo index is read once and meals with the same saved combo,
+    slot values and preferred shape share one decision. Decisions are the ones
+    the single-meal selector returns, in request order.
+    """
+    index = get_meal_combo_index()
+    decisions = []
+    memo: dict[tuple, MealComboSelectionDecision] = {}
+    for request in requests:
+        preferred_shape = preferred_combo_shape_for_meal(
+            request.meal_target,
+            is_training_adjacent=request.is_training_adjacent,
+        )
+        group_values = _compatible_group_values(request.saved_combo, request.selected_slots)
+        key = (
+            request.saved_combo.combo_id,
+            preferred_shape,
+            tuple(frozenset(values) for _, values in group_values),
+        )
+        decision = memo.get(key)
+        if decision is None:
+            decision = _select_from_index(
+                index,
+                saved_combo=request.saved_combo,
+                preferred_shape=preferred_shape,
+                selected_slots=request.selected_slots,
+            )
+            memo[key] = decision
+        decisions.append(decision)
+    return decisions
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import threading
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+COMBO_ERRORS = "combo_errors"
+ADMIN_PARAMETERS = "admin_parameters"
+MEAL_COMBOS = "meal_combos"
+FOOD_LIBRARY = "food_library"
+ALL_TABLES = (COMBO_ERRORS, ADMIN_PARAMETERS, MEAL_COMBOS, FOOD_LIBRARY)
+
+_CACHE_KEY_PREFIX = "core:table_version:"
+
+
+def _cache_key(name: str) -> str:
+    return f"{_CACHE_KEY_PREFIX}{name}"
+
+
+_last_published: dict[str, str] = {}
+
+
+def _store_new_version(name: str) -> str:
+    version = uuid.uuid4().hex
+    cache.set(_cache_key(name), version, timeout=None)
+    _last_published[name] = version
+    return version
+
+
+class _CommitPublisher:
+    """on_commit callback that republishes a stamp; remembers whether it ran."""
+
+    def __init__(self, name: str, connection):
+        self.name = name
+        self.connection = connection
+        self.ran = False
+
+    def __call__(self):
+        self.ran = True
+        _store_new_version(self.name)
+
+    def is_pending(self) -> bool:
+        """
+        Still queued on its connection. Django has no public rollback hook, so this
+        reads the private `run_on_commit` list of (savepoint_ids, func, robust)
+        entries (Django 4.2+, pinned to 5.2 in requirements.txt; the shape is
+        asserted in core/tests_combo_error_table.py). If that list changes shape
+        the check falls back to the public `in_atomic_block`, which only spots a
+        rollback once the outermost block has ended.
+        """
+        try:
+            return any(entry[1] is self for entry in self.connection.run_on_commit)
+        except (AttributeError, IndexError, TypeError):
+            return self.connection.in_atomic_block
+
+
+_pending_publishers: list[_CommitPublisher] = []
+_pending_lock = threading.Lock()
+
+
+def _bump_rolled_back_tables() -> None:
+    """
+    A bump inside a transaction that later rolled back never reaches on_commit,
+    yet this process may have cached the uncommitted rows under the stamp
+    published at write time. Django has no rollback hook, so detect it here: a
+    publisher that neither ran nor is still queued was discarded by a rollback.
+    """
+    if not _pending_publishers:
+        return
+    with _pending_lock:
+        rolled_back = {p.name for p in _pending_publishers if not p.ran and not p.is_pending()}
+        _pending_publishers[:] = [p for p in _pending_publishers if not p.ran and p.is_pending()]
+    for name in rolled_back:
+        _store_new_version(name)
+
+
+def get_table_version(name: str) -> str:
+    """
+    Current version stamp for a reference table. Stamps live in the shared Django
+    cache so every web and Celery process sees the same value.
+    """
+    _bump_rolled_back_tables()
+    key = _cache_key(name)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return str(version)
+
+
+def bump_table_version(name: str) -> str:
+    version = _store_new_version(name)
+    # Bump again once the write is visible to other connections, otherwise a reader
+    # could cache pre-commit rows under the stamp we just published.
+    connection = transaction.get_connection()
+    publisher = _CommitPublisher(name, connection)
+    transaction.on_commit(publisher)
+    if connection.in_atomic_block and not publisher.ran:
+        with _pending_lock:
+            _pending_publishers.append(publisher)
+    return version
+
+
+def bump_all_table_versions() -> None:
+    """For writes that bypass the versioned querysets: flush, cascades, raw SQL resets."""
+    for name in ALL_TABLES:
+        bump_table_version(name)
+
+
+@contextmanager
+def restore_table_versions_after_rollback(names=ALL_TABLES):
+    """
+    For work that is always rolled back (benchmarks, dry runs): put the stamps
+    back afterwards so other processes keep their caches. A stamp bumped by
+    someone else in the meantime is left alone.
+    """
+    original = {name: get_table_version(name) for name in names}
+    try:
+        yield
+    finally:
+        with _pending_lock:
+            _pending_publishers[:] = [
+                p for p in _pending_publishers if p.name not in original or p.ran or p.is_pending()
+            ]
+        for name, version in original.items():
+            key = _cache_key(name)
+            if cache.get(key) == _last_published.get(name):
+                cache.set(key, version, timeout=None)
@@ -252,6 +252,16 @@ OPEN_FOOD_FACTS_USER_AGENT = os.getenv("OPEN_FOOD_FACTS_USER_AGENT") or "DTA-Die
 OPEN_FOOD_FACTS_TIMEOUT_SECONDS = int(os.getenv("OPEN_FOOD_FACTS_TIMEOUT_SECONDS") or "8")
 
 
+CACHE_URL = os.getenv("CACHE_URL") or os.getenv("REDIS_URL") or ""
+# 👆 shared cache for table version stamps and generation caches; without it each process keeps its own LocMem cache.
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+    }
+
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL") or os.getenv("REDIS_URL") or "redis://127.0.0.1:6379/0"
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND") or CELERY_BROKER_URL
 CELERY_ACCEPT_CONTENT = ["json"]
@@ -259,6 +269,54 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 
+MEAL_PLAN_STEP1_MODE = (os.getenv("MEAL_PLAN_STEP1_MODE") or "in_memory").strip().lower()
+# 👆 "in_memory" hands the Step1 matrix straight to Steps 2-10; "persisted" writes every Step1 row first.
+MEAL_PLAN_STEP1_PERSIST_DEBUG = os.getenv("MEAL_PLAN_STEP1_PERSIST_DEBUG") == "true"
+# 👆 keeps writing ClientMealPlanGenerationStep1Row rows in in_memory mode so they can be inspected.
+MEAL_PLAN_WEEK_GENERATION_MODE = (os.getenv("MEAL_PLAN_WEEK_GENERATION_MODE") or "parallel").strip().lower()
+# 👆 "parallel" fans a week batch out to one Celery task per day (chord); "serial" runs the days in one task.
+MEAL_PLAN_WEEK_MAX_WORKERS = int(os.getenv("MEAL_PLAN_WEEK_MAX_WORKERS") or 7)
+# 👆 thread pool size when a week runs in parallel without Celery.
+MEAL_PLAN_GENERATION_CACHE_ENABLED = (os.getenv("MEAL_PLAN_GENERATION_CACHE_ENABLED") or "true") == "true"
+# 👆 reuse the meals of an identical earlier generation job instead of rerunning Steps 1-10.
+MEAL_PLAN_PROGRESS_REDIS_URL = os.getenv("MEAL_PLAN_PROGRESS_REDIS_URL") or os.getenv("REDIS_URL") or ""
+# 👆 redis pub/sub used to push week batch progress to the SSE endpoint; empty disables the stream (clients poll).
+MEAL_PLAN_PROGRESS_KEEPALIVE_SECONDS = int(os.getenv("MEAL_PLAN_PROGRESS_KEEPALIVE_SECONDS") or 15)
+# 👆 idle SSE streams send a comment this often so proxies keep the connection open.
+MEAL_PLAN_PROGRESS_STREAM_TIMEOUT_SECONDS = int(os.getenv("MEAL_PLAN_PROGRESS_STREAM_TIMEOUT_SECONDS") or 600)
+# 👆 an SSE stream closes after this long; EventSource reconnects and receives a fresh snapshot.
+MEAL_PLAN_RETENTION_KEEP_JOBS_PER_DAY = int(os.getenv("MEAL_PLAN_RETENTION_KEEP_JOBS_PER_DAY") or 3)
+# 👆 finished generation jobs kept per (client, day); older ones are deleted by prune_meal_plan_generation.
+MEAL_PLAN_RETENTION_STEP1_GRACE_HOURS = int(os.getenv("MEAL_PLAN_RETENTION_STEP1_GRACE_HOURS") or 24)
+# 👆 completed jobs keep their Step1 rows (and full snapshot) this long for debugging.
+MEAL_PLAN_RETENTION_BATCH_SIZE = int(os.getenv("MEAL_PLAN_RETENTION_BATCH_SIZE") or 5000)
+# 👆 max rows per retention delete/update statement so pruning never holds long table locks.
+MEAL_PLAN_RETENTION_PAUSE_SECONDS = float(os.getenv("MEAL_PLAN_RETENTION_PAUSE_SECONDS") or 0)
+# 👆 optional sleep between retention batches to leave room for foreground writes.
+MEAL_PLAN_RETENTION_INTERVAL_SECONDS = int(os.getenv("MEAL_PLAN_RETENTION_INTERVAL_SECONDS") or 6 * 60 * 60)
+# 👆 how often celery beat runs the retention task.
+MEAL_PLAN_STEP1_PARTITION_JOB_SPAN = int(os.getenv("MEAL_PLAN_STEP1_PARTITION_JOB_SPAN") or 5000)
+# 👆 postgres only: job ids per Step1 row partition; retention drops a partition once all of its jobs expire.
+MEAL_PLAN_STEP1_PARTITIONS_AHEAD = int(os.getenv("MEAL_PLAN_STEP1_PARTITIONS_AHEAD") or 2)
+# 👆 empty Step1 partitions kept attached beyond the newest job so inserts never wait on DDL.
+MEAL_PLAN_BULK_WRITER = (os.getenv("MEAL_PLAN_BULK_WRITER") or "copy").strip().lower()
+# 👆 "copy" streams Step1/generated meal rows through postgres COPY; "orm" forces bulk_create (always used off postgres).
+MEAL_PLAN_SOLVER_BACKEND = (os.getenv("MEAL_PLAN_SOLVER_BACKEND") or "private").strip().lower()
+# 👆 Steps 2-10 backend: "private" needs backend/private_meal_solver/; "reference" is the deterministic in-process solver for CI/staging; any other value raises ImproperlyConfigured on first use.
+MEAL_PLAN_RECALCULATION_CHUNK_SIZE = int(os.getenv("MEAL_PLAN_RECALCULATION_CHUNK_SIZE") or 200)
+# 👆 clients recomputed per chunk when an admin's parameter tables change.
+MEAL_PLAN_RECALCULATION_CHUNK_PAUSE_SECONDS = float(os.getenv("MEAL_PLAN_RECALCULATION_CHUNK_PAUSE_SECONDS") or 5)
+# 👆 minimum delay before the next chunk task, leaving worker slots to interactive generation.
+MEAL_PLAN_RECALCULATION_REGENERATIONS_PER_MINUTE = float(os.getenv("MEAL_PLAN_RECALCULATION_REGENERATIONS_PER_MINUTE") or 20)
+# 👆 rate at which recalculation queues client regenerations (0 = no spacing).
+
+CELERY_BEAT_SCHEDULE = {
+    "prune-meal-plan-generation": {
+        "task": "users.client_area.tasks.meal_plan_generation.prune_meal_plan_generation_task",
+        "schedule": MEAL_PLAN_RETENTION_INTERVAL_SECONDS,
+    },
+}
+
 
 # 👉 summary:
 # this settings file defines the core configuration for the django backend.
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_migrate  # 👉 also sent by `manage.py flush`
+from django.dispatch import receiver
+
+from core.services.table_versions import bump_all_table_versions
+
+
+@receiver(post_migrate)
+def invalidate_reference_table_caches(sender, **kwargs):
+    if sender.name != "core":
+        return  # 👉 post_migrate fires once per app; bump once per run
+
+    bump_all_table_versions()
+    # 👆 flush and migrations rewrite rows without going through the versioned querysets
+
+
+# 👉 summary:
+# bumps every reference table version stamp after migrate and flush so processes
+# holding cached combo, food and parameter tables reload them.
@@ -0,0 +1,78 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.apps import apps
+from django.db import transaction
+from django.test import TestCase
+
+from core.models import ComboMacroErrorLookup
+from core.services import combo_error_table, table_versions
+from core.services.combo_error_table import get_combo_error_table
+from core.services.table_versions import COMBO_ERRORS, bump_table_version
+from core.signals import invalidate_reference_table_caches
+
+
+class ComboErrorTableCacheTests(TestCase):
+    def setUp(self):
+        ComboMacroErrorLookup.objects.bulk_create(
+            [
+                ComboMacroErrorLookup(error_code=2, protein_error=Decimal("-2.5"), carbs_error=Decimal("10"), fats_error=Decimal("20")),
+                ComboMacroErrorLookup(error_code=1, protein_error=Decimal("5"), carbs_error=Decimal("60"), fats_error=Decimal("1")),
+            ]
+        )
+
+    def test_loads_columns_ordered_by_error_code(self):
+        table = get_combo_error_table()
+
+        self.assertEqual(list(table.error_codes), [1, 2])
+        self.assertEqual(list(table.protein_errors), [5.0, -2.5])
+        self.assertEqual(list(table.carbs_errors), [60.0, 10.0])
+        self.assertEqual(list(table.fats_errors), [1.0, 20.0])
+
+    def test_reuses_loaded_table_until_version_changes(self):
+        first = get_combo_error_table()
+        with patch.object(combo_error_table, "_load_table", wraps=combo_error_table._load_table) as load_table:
+            self.assertIs(get_combo_error_table(), first)
+            load_table.assert_not_called()
+
+    def test_admin_save_and_bulk_writes_invalidate_cache(self):
+        first = get_combo_error_table()
+
+        row = ComboMacroErrorLookup.objects.get(error_code=1)
+        row.protein_error = Decimal("7")
+        row.save()
+        after_save = get_combo_error_table()
+        self.assertIsNot(after_save, first)
+        self.assertEqual(after_save.protein_errors[0], 7.0)
+
+        ComboMacroErrorLookup.objects.filter(error_code=2).delete()
+        self.assertEqual(list(get_combo_error_table().error_codes), [1])
+
+        ComboMacroErrorLookup.objects.update(fats_error=Decimal("3"))
+        self.assertEqual(list(get_combo_error_table().fats_errors), [3.0])
+
+    def test_rolled_back_write_does_not_leave_uncommitted_rows_cached(self):
+        get_combo_error_table()
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                ComboMacroErrorLookup.objects.filter(error_code=2).delete()
+                self.assertEqual(list(get_combo_error_table().error_codes), [1])
+                raise RuntimeError("roll back")
+
+        self.assertEqual(list(get_combo_error_table().error_codes), [1, 2])
+
+    def test_commit_publisher_sees_its_entry_in_the_on_commit_queue(self):
+        # Guards the private run_on_commit shape is_pending relies on across Django upgrades.
+        with transaction.atomic():
+            bump_table_version(COMBO_ERRORS)
+            publisher = table_versions._pending_publishers[-1]
+            self.assertTrue(publisher.is_pending())
+            self.assertIn(publisher, [entry[1] for entry in transaction.get_connection().run_on_commit])
+
+    def test_flush_and_migrate_invalidate_cache(self):
+        first = get_combo_error_table()
+
+        invalidate_reference_table_caches(sender=apps.get_app_config("core"))
+
+        self.assertIsNot(get_combo_error_table(), first)
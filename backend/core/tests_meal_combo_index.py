@@ -0,0 +1,106 @@
+from django.test import TestCase
+
+from core.models import MealComboTemplate
+from core.services.meal_combo_index import get_meal_combo_index
+from core.services.meal_combo_lookup import find_meal_combo_id_by_slots, get_supported_combo_slot_values
+from core.services.meal_combo_shape_policy import select_meal_combo_template_for_target
+
+
+def _combo(combo_id, protein_2="-", carb_2="-", fat_2="Oil STANDARD", protein_1="Chicken Breast STANDARD"):
+    return MealComboTemplate.objects.create(
+        combo_id=combo_id,
+        protein_slot_1=protein_1,
+        protein_slot_2=protein_2,
+        carb_slot_1="White Rice STANDARD",
+        carb_slot_2=carb_2,
+        fat_slot_1="Avocado STANDARD",
+        fat_slot_2=fat_2,
+    )
+
+
+class MealComboIndexTests(TestCase):
+    def setUp(self):
+        self.combos = [
+            _combo(2004, protein_2="Steak STANDARD", carb_2="Banana STANDARD"),
+            _combo(2001),
+            _combo(2002, protein_2="Steak STANDARD"),
+            _combo(2003, carb_2="Banana STANDARD"),
+            _combo(2005, protein_1="Steak STANDARD", fat_2="-"),
+        ]
+
+    def test_bitmaps_follow_combo_id_order(self):
+        index = get_meal_combo_index()
+
+        self.assertEqual([combo.combo_id for combo in index.combos], [2001, 2002, 2003, 2004, 2005])
+        one_carb = index.mask("carbs_2", ["-"])
+        self.assertEqual([combo.combo_id for combo in index.iter_combos(one_carb)], [2001, 2002, 2005])
+        self.assertEqual(index.count(one_carb & index.mask("protein_2", ["Steak STANDARD"])), 1)
+        self.assertEqual(index.first(index.mask("protein_1", ["Steak STANDARD"])).combo_id, 2005)
+        self.assertIsNone(index.first(index.mask("protein_1", ["Tofu STANDARD"])))
+
+    def test_lookups_and_slot_options_run_without_queries_once_loaded(self):
+        get_meal_combo_index()
+
+        with self.assertNumQueries(0):
+            combo_id = find_meal_combo_id_by_slots(
+                protein_1=" Chicken Breast STANDARD ",
+                protein_2="",
+                carbs_1="White Rice STANDARD",
+                carbs_2="Banana STANDARD",
+                fats_1="Avocado STANDARD",
+                fats_2="Oil STANDARD",
+            )
+            supported = get_supported_combo_slot_values()
+
+        self.assertEqual(combo_id, 2003)
+        self.assertEqual(supported["protein_2"], ["-", "Steak STANDARD"])
+        self.assertEqual(supported["fats_2"], ["-", "Oil STANDARD"])
+
+    def test_slot_options_keep_database_collation_order(self):
+        for combo_id, protein_2 in ((2101, "salmon STANDARD"), (2102, "Éclair STANDARD"), (2103, "Beef STANDARD")):
+            _combo(combo_id, protein_2=protein_2)
+        expected = list(
+            MealComboTemplate.objects.exclude(protein_slot_2="")
+            .values_list("protein_slot_2", flat=True)
+            .distinct()
+            .order_by("protein_slot_2")
+        )
+
+        self.assertEqual(list(get_meal_combo_index().slot_values["protein_2"]), expected)
+        supported = get_supported_combo_slot_values()["protein_2"]
+        self.assertEqual(supported, ["-"] + [value for value in expected if value != "-"])
+
+    def test_admin_edits_rebuild_the_index(self):
+        first = get_meal_combo_index()
+
+        combo = MealComboTemplate.objects.get(combo_id=2001)
+        combo.protein_slot_1 = "Tilapia STANDARD"
+        combo.save()
+
+        rebuilt = get_meal_combo_index()
+        self.assertIsNot(rebuilt, first)
+        self.assertIn("Tilapia STANDARD", rebuilt.slot_values["protein_1"])
+
+        MealComboTemplate.objects.filter(combo_id=2005).delete()
+        self.assertNotIn("Steak STANDARD", get_meal_combo_index().slot_values["protein_1"])
+
+    def test_shape_selection_matches_queryset_path(self):
+        saved_combo = MealComboTemplate.objects.get(combo_id=2004)
+        selected_slots = {"protein_1": "Chicken Breast STANDARD", "protein_2": "Steak STANDARD"}
+        for protein, carbs, training in [(40, 35, False), (55, 65, False), (55, 50, True), (40, 65, False)]:
+            target = {"protein": protein, "carbs": carbs, "fats": 15}
+            from_index = select_meal_combo_template_for_target(
+                saved_combo=saved_combo, meal_target=target, is_training_adjacent=training, selected_slots=selected_slots
+            )
+            from_queryset = select_meal_combo_template_for_target(
+                saved_combo=saved_combo,
+                meal_target=target,
+                is_training_adjacent=training,
+                selected_slots=selected_slots,
+                queryset=MealComboTemplate.objects.all(),
+            )
+
+            self.assertEqual(from_index.combo.combo_id, from_queryset.combo.combo_id)
+            self.assertEqual(from_index.candidate_count_before_filtering, from_queryset.candidate_count_before_filtering)
+            self.assertEqual(from_index.candidate_count_after_filtering, from_queryset.candidate_count_after_filtering)
+            self.assertEqual(from_index.fallback_reason, from_queryset.fallback_reason)
@@ -1,11 +1,17 @@
 from django.test import TestCase
 
 from core.models import FoodLibraryItem, MealComboTemplate
+from core.services.meal_combo_index import get_meal_combo_index
 from core.services.meal_combo_lookup import (
     find_meal_combo_id_by_slots,
+    normalize_many_slots_to_supported_combo_values,
     normalize_slots_to_supported_combo_values,
 )
-from core.services.meal_combo_shape_policy import select_meal_combo_template_for_target
+from core.services.meal_combo_shape_policy import (
+    MealComboSelectionRequest,
+    select_meal_combo_template_for_target,
+    select_meal_combo_templates_for_targets,
+)
 from core.services.meal_combo_shape_policy import allows_second_fat, requires_cooking_fat_for_protein
 
 
@@ -219,6 +225,36 @@ class MealComboShapePolicyTests(TestCase):
         self.assertEqual(decision.combo.combo_id, 1004)
         self.assertIsNotNone(decision.fallback_reason)
 
+    def test_batch_selection_matches_single_meal_decisions_without_queries(self):
+        requests = [
+            MealComboSelectionRequest(
+                saved_combo=self.two_protein_two_carb,
+                meal_target={"protein": protein, "carbs": carbs, "fats": 15},
+                is_training_adjacent=training,
+                selected_slots=self.selected_slots,
+            )
+            for protein, carbs, training in [(40, 65, False), (55, 35, False), (55, 50, True), (40, 65, False), (30, 20, False)]
+        ]
+        expected = [
+            select_meal_combo_template_for_target(
+                saved_combo=request.saved_combo,
+                meal_target=request.meal_target,
+                is_training_adjacent=request.is_training_adjacent,
+                selected_slots=request.selected_slots,
+                queryset=MealComboTemplate.objects.all(),
+            )
+            for request in requests
+        ]
+        get_meal_combo_index()
+
+        with self.assertNumQueries(0):
+            decisions = select_meal_combo_templates_for_targets(requests)
+
+        self.assertEqual(
+            [(row.combo.combo_id, row.candidate_count_before_filtering, row.candidate_count_after_filtering, row.fallback_reason) for row in decisions],
+            [(row.combo.combo_id, row.candidate_count_before_filtering, row.candidate_count_after_filtering, row.fallback_reason) for row in expected],
+        )
+
 
 class MealTemplateFatPolicyTests(TestCase):
     def test_chicken_breast_requires_cooking_oil(self):
@@ -235,3 +271,52 @@ class MealTemplateFatPolicyTests(TestCase):
 
     def test_higher_fat_meal_allows_second_fat_source(self):
         self.assertTrue(allows_second_fat(20))
+
+
+class FoodAliasMapCacheTests(TestCase):
+    def setUp(self):
+        FoodLibraryItem.objects.create(
+            source_food_id=11,
+            category="Oil STANDARD",
+            name="Oil STANDARD",
+            display_name="Olive Oil",
+            measurement_unit="oz",
+            protein=0,
+            carbs=0,
+            fats=14,
+        )
+        MealComboTemplate.objects.create(
+            combo_id=601,
+            protein_slot_1="Steak STANDARD",
+            carb_slot_1="White Rice STANDARD",
+            fat_slot_1="Oil STANDARD",
+        )
+
+    def test_batch_normalization_loads_aliases_once_and_reuses_them(self):
+        normalize_slots_to_supported_combo_values({"fats_1": "Olive Oil"})
+        meals = [{"protein_1": "Steak", "carbs_1": "White Rice", "fats_1": "Olive Oil"} for _ in range(20)]
+
+        with self.assertNumQueries(0):
+            normalized = normalize_many_slots_to_supported_combo_values(meals)
+
+        self.assertEqual(len(normalized), 20)
+        self.assertEqual(
+            normalized[0],
+            {
+                "protein_1": "Steak STANDARD",
+                "protein_2": "-",
+                "carbs_1": "White Rice STANDARD",
+                "carbs_2": "-",
+                "fats_1": "Oil STANDARD",
+                "fats_2": "-",
+            },
+        )
+
+    def test_food_library_edits_refresh_the_alias_map(self):
+        self.assertEqual(normalize_slots_to_supported_combo_values({"fats_1": "EVOO"})["fats_1"], "EVOO")
+
+        item = FoodLibraryItem.objects.get(source_food_id=11)
+        item.display_name = "EVOO"
+        item.save()
+
+        self.assertEqual(normalize_slots_to_supported_combo_values({"fats_1": "EVOO"})["fats_1"], "Oil STANDARD")
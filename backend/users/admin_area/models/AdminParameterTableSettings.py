@@ -1,9 +1,12 @@
 from django.db import models
 
 from core.models import GoalChoices
+from core.models.versioned_table import VersionedTableMixin, VersionedTableQuerySet
 
 
-class AdminMacroPlanSettingsBase(models.Model):
+class AdminMacroPlanSettingsBase(VersionedTableMixin, models.Model):
+    table_version_name = "admin_parameters"
+
     defaults_version_applied = models.CharField(max_length=20, default="v1")
     goal = models.CharField(max_length=20, choices=GoalChoices.choices, db_index=True)
     protein_factor_unit = models.CharField(max_length=20, default="g_per_lb")
@@ -12,11 +15,15 @@ class AdminMacroPlanSettingsBase(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = VersionedTableQuerySet.as_manager()
+
     class Meta:
         abstract = True
 
 
-class AdminTDEESettings(models.Model):
+class AdminTDEESettings(VersionedTableMixin, models.Model):
+    table_version_name = "admin_parameters"
+
     admin = models.OneToOneField(
         "AdminIdentity",
         on_delete=models.CASCADE,
@@ -33,6 +40,8 @@ class AdminTDEESettings(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = VersionedTableQuerySet.as_manager()
+
     class Meta:
         ordering = ("admin__admin_email",)
         verbose_name = "TDEE Settings"
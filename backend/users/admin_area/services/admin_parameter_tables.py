@@ -386,7 +386,7 @@ def ensure_admin_parameter_tables(admin):
     return reset_admin_parameter_payload_to_defaults(admin, version=version)
 
 
-def get_admin_parameter_payload(admin, *, ensure_exists=True):
+def get_admin_parameter_payload(admin, *, ensure_exists=True, fallback_to_core=True):
     if ensure_exists:
         ensure_admin_parameter_tables(admin)
     tdee_record, standard_records, keto_records, carb_records = _load_admin_rows(admin)
@@ -397,7 +397,7 @@ def get_admin_parameter_payload(admin, *, ensure_exists=True):
         keto_records=keto_records,
         carb_records=carb_records,
     ):
-        return get_core_admin_parameter_payload()
+        return get_core_admin_parameter_payload() if fallback_to_core else None
 
     version = getattr(tdee_record, "defaults_version_applied", "v1") or "v1"
     return _build_payload_from_records(
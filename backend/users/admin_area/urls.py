@@ -26,6 +26,7 @@ from users.admin_area.views.billing.payment_method import (
 from users.admin_area.views.billing.reactivate import preview, start
 from users.admin_area.views.parameters.admin_parameter_settings import (
     parameter_settings_detail,
+    parameter_settings_recalculation,
     parameter_settings_status,
     parameter_settings_use_defaults,
 )
@@ -50,6 +51,7 @@ urlpatterns = [
     path('clients/<int:user_id>/tracking/', admin_client_tracking, name='admin_client_tracking'),
     path('parameter_settings/status/', parameter_settings_status, name='parameter_settings_status'),
     path('parameter_settings/use_defaults/', parameter_settings_use_defaults, name='parameter_settings_use_defaults'),
+    path('parameter_settings/recalculation/', parameter_settings_recalculation, name='parameter_settings_recalculation'),
     path('parameter_settings/', parameter_settings_detail, name='parameter_settings_detail'),
     path('theme_preference/', admin_theme_preference, name='admin_theme_preference'),
 
@@ -18,6 +18,11 @@ from users.admin_area.services.admin_parameter_tables import (
     reset_admin_parameter_payload_to_defaults,
 )
 from users.admin_area.views.api_contract import error, ok, require_admin
+from users.client_area.services.macro_recalculation import (
+    latest_macro_recalculation,
+    macro_recalculation_payload,
+    start_macro_recalculation,
+)
 
 
 SUBDOMAIN_SLUG_RE = re.compile(r"^[a-z]+(?:-[a-z]+)*$")
@@ -162,6 +167,13 @@ def _record_change_log(*, admin_identity, action, before_json, after_json):
     return changed_paths
 
 
+def _start_recalculation_if_changed(*, admin_identity, action, changed_paths):
+    # Clients' results and generated plans only go stale when a value actually moved.
+    if not changed_paths:
+        return None
+    return macro_recalculation_payload(start_macro_recalculation(admin_identity, trigger=action))
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def parameter_settings_status(request):
@@ -218,6 +230,11 @@ def parameter_settings_use_defaults(request):
         before_json=before_json,
         after_json=after_json,
     )
+    recalculation = _start_recalculation_if_changed(
+        admin_identity=identity,
+        action="use_defaults",
+        changed_paths=changed_paths,
+    )
 
     return ok(
         {
@@ -229,6 +246,7 @@ def parameter_settings_use_defaults(request):
                 "updated_at": state.get("updated_at"),
                 "changed_paths_count": len(changed_paths),
             },
+            "recalculation": recalculation,
             "subdomain": _subdomain_status(identity),
         }
     )
@@ -288,6 +306,11 @@ def parameter_settings_detail(request):
         before_json=before_json,
         after_json=after_json,
     )
+    recalculation = _start_recalculation_if_changed(
+        admin_identity=identity,
+        action="manual_save",
+        changed_paths=changed_paths,
+    )
 
     return ok(
         {
@@ -301,6 +324,26 @@ def parameter_settings_detail(request):
                 "changed_paths_count": len(changed_paths),
                 "changed_paths_preview": changed_paths[:20],
             },
+            "recalculation": recalculation,
             "subdomain": _subdomain_status(identity),
         }
     )
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAuthenticated])
+def parameter_settings_recalculation(request):
+    """
+    GET: progress of the latest bulk recalculation of this admin's clients.
+    POST: start one by hand (e.g. after editing tables through the Django admin).
+    """
+    auth_error = require_admin(request)
+    if auth_error:
+        return auth_error
+
+    identity = _identity_for_request_user(request.user)
+    if request.method == "POST":
+        job = start_macro_recalculation(identity, trigger="manual")
+        return ok({"recalculation": macro_recalculation_payload(job)}, http_status=202)
+
+    return ok({"recalculation": macro_recalculation_payload(latest_macro_recalculation(identity))})
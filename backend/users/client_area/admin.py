@@ -7,7 +7,9 @@ from django.utils.html import format_html
 from .models import (
     ClientFoodOverride,
     ClientFoodPreferenceChangeLog,
+    ClientMacroRecalculationJob,
     ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationBatch,
     ClientMealPlanGenerationJob,
     ClientMealPlanGenerationStep1Row,
     ClientMacroAccessLink,
@@ -20,6 +22,10 @@ from .models import (
     ClientQuestionnaireProgress,
     ClientQueuedPlanChange,
 )
+from .services.meal_plan_generation.rendered_day import (
+    invalidate_rendered_days_for_image_submissions,
+    invalidate_rendered_days_for_user,
+)
 
 
 class PendingSignupUsedFilter(admin.SimpleListFilter):
@@ -459,24 +465,44 @@ class ClientFoodOverrideAdmin(admin.ModelAdmin):
     def has_add_permission(self, request):
         return False
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        invalidate_rendered_days_for_user(obj.user_id)
+
+    def delete_model(self, request, obj):
+        user_id = obj.user_id
+        super().delete_model(request, obj)
+        invalidate_rendered_days_for_user(user_id)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = set(queryset.values_list("user_id", flat=True))
+        super().delete_queryset(request, queryset)
+        for user_id in user_ids:
+            invalidate_rendered_days_for_user(user_id)
+
 
 @admin.action(description="Approve selected product images")
 def approve_product_images(modeladmin, request, queryset):
+    # Read the rows first: a status-filtered changelist queryset is empty after the update.
+    submissions = list(queryset)
     queryset.update(
         status=ProductImageSubmission.Status.APPROVED,
         reviewed_by_id=request.user.id,
         reviewed_at=timezone.now(),
         rejection_reason="",
     )
+    invalidate_rendered_days_for_image_submissions(submissions)
 
 
 @admin.action(description="Reject selected product images")
 def reject_product_images(modeladmin, request, queryset):
+    submissions = list(queryset)
     queryset.update(
         status=ProductImageSubmission.Status.REJECTED,
         reviewed_by_id=request.user.id,
         reviewed_at=timezone.now(),
     )
+    invalidate_rendered_days_for_image_submissions(submissions)
 
 
 @admin.register(ProductImageSubmission)
@@ -557,6 +583,16 @@ class ProductImageSubmissionAdmin(admin.ModelAdmin):
             obj.reviewed_by = request.user
             obj.reviewed_at = timezone.now()
         super().save_model(request, obj, form, change)
+        invalidate_rendered_days_for_image_submissions([obj])
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_rendered_days_for_image_submissions([obj])
+
+    def delete_queryset(self, request, queryset):
+        submissions = list(queryset)
+        super().delete_queryset(request, queryset)
+        invalidate_rendered_days_for_image_submissions(submissions)
 
 
 @admin.register(ClientProgressPhoto)
@@ -721,12 +757,14 @@ class ClientMealPlanGenerationJobAdmin(admin.ModelAdmin):
         "completed_at",
     )
     list_filter = ("status", "day_of_week", "algorithm_version")
-    search_fields = ("user__email", "error_message")
+    search_fields = ("user__email", "error_message", "batch_id")
     list_select_related = ("user", "client_profile", "client_profile__associated_admin")
     readonly_fields = (
         "user",
         "client_profile",
         "day_of_week",
+        "batch_id",
+        "batch_mode",
         "algorithm_version",
         "status",
         "total_steps",
@@ -766,6 +804,94 @@ class ClientMealPlanGenerationJobAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(ClientMealPlanGenerationBatch)
+class ClientMealPlanGenerationBatchAdmin(admin.ModelAdmin):
+    list_display = (
+        "batch_id",
+        "user",
+        "batch_mode",
+        "status",
+        "days_completed",
+        "days_failed",
+        "days_total",
+        "created_at",
+        "completed_at",
+    )
+    list_filter = ("status", "batch_mode")
+    search_fields = ("user__email", "batch_id", "task_id")
+    list_select_related = ("user",)
+    readonly_fields = (
+        "user",
+        "batch_id",
+        "batch_mode",
+        "status",
+        "task_id",
+        "days_requested",
+        "day_jobs_json",
+        "days_total",
+        "days_completed",
+        "days_failed",
+        "generated_meal_count",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "updated_at",
+    )
+    fields = readonly_fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(ClientMacroRecalculationJob)
+class ClientMacroRecalculationJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "admin",
+        "trigger",
+        "status",
+        "clients_processed",
+        "clients_total",
+        "clients_changed",
+        "regenerations_queued",
+        "created_at",
+        "completed_at",
+    )
+    list_filter = ("status", "trigger")
+    search_fields = ("admin__admin_email", "task_id")
+    list_select_related = ("admin",)
+    readonly_fields = (
+        "admin",
+        "trigger",
+        "status",
+        "task_id",
+        "admin_parameters_version",
+        "clients_total",
+        "clients_processed",
+        "clients_skipped",
+        "clients_changed",
+        "days_changed",
+        "regenerations_queued",
+        "last_profile_id",
+        "changed_days_json",
+        "error_message",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "updated_at",
+    )
+    fields = readonly_fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(ClientMealPlanGenerationStep1Row)
 class ClientMealPlanGenerationStep1RowAdmin(admin.ModelAdmin):
     list_display = ("job", "user_email", "meal_number", "error_code", "pro_negative", "carbs_negative", "fats_negative")
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from decimal import Decimal
+import random
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+from core.models import ComboMacroErrorLookup, FoodLibraryItem, MealComboTemplate
+from core.services.table_versions import restore_table_versions_after_rollback
+from users.client_area.models import (
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationJob,
+    ClientMealPlanGenerationStep1Row,
+    ClientProfile,
+    ClientQuestionnaireProgress,
+)
+from users.client_area.services.results_engine import (
+    BuildResultsContext,
+    build_lazy_questionnaire_results,
+    build_questionnaire_results,
+)
+
+from users.client_area.services.meal_plan_generation.pipeline import SOLVER_BACKEND_REFERENCE
+from users.client_area.services.meal_plan_generation.runner import (
+    get_generated_meal_day_detail,
+    run_full_generation_for_day,
+)
+from users.client_area.services.meal_plan_generation.step1 import build_step1_rows_for_day
+from users.client_area.services.meal_plan_generation.timings import GenerationTimings
+
+# Seeded ids start here so they never collide with imported reference rows.
+SEED_ID_OFFSET = 9_000_000
+BENCHMARK_USERNAME_PREFIX = "benchmark-"
+BENCHMARK_USERNAME_DOMAIN = "@example.com"
+BENCHMARK_DAY = "monday"
+PLAN_TYPES = ("standard", "carb_cycling", "keto")
+MEALS_PER_DAY = (3, 4, 5, 6)
+WEEK_DAYS = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+
+FOOD_CATEGORIES = {
+    FoodLibraryItem.Macro.PROTEIN: (
+        "Chicken Breast STANDARD",
+        "Steak STANDARD",
+        "Ground Beef STANDARD",
+        "Salmon STANDARD",
+        "Tilapia STANDARD",
+        "Eggs STANDARD",
+    ),
+    FoodLibraryItem.Macro.CARBS: (
+        "White Rice STANDARD",
+        "Brown Rice STANDARD",
+        "Banana STANDARD",
+        "Beans STANDARD",
+        "Quinoa STANDARD",
+        "Whole Wheat Pasta STANDARD",
+    ),
+    FoodLibraryItem.Macro.FATS: ("Avocado STANDARD", "Oil STANDARD", "Almonds STANDARD"),
+}
+
+
+class _Rollback(Exception):
+    pass
+
+
+@dataclass
+class BenchmarkSizes:
+    foods: int = 200
+    combos: int = 500
+    error_codes: int = 5000
+    repeat: int = 3
+    plan_types: tuple[str, ...] = PLAN_TYPES
+    meals_per_day: tuple[int, ...] = MEALS_PER_DAY
+    seed: int = 1234
+
+
+@dataclass
+class Measurement:
+    wall_ms: list[float] = field(default_factory=list)
+    queries: int = 0
+    rows_written: int = 0
+    peak_kib: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "wall_ms": {
+                "min": round(min(self.wall_ms), 3),
+                "median": round(statistics.median(self.wall_ms), 3),
+                "max": round(max(self.wall_ms), 3),
+            },
+            "runs": len(self.wall_ms),
+            "queries": self.queries,
+            "rows_written": self.rows_written,
+            "peak_kib": round(self.peak_kib, 1),
+        }
+
+
+def _measure(operation: Callable[[], Any], *, repeat: int, rows_written: Callable[[Any], int] | None = None) -> Measurement:
+    """
+    Time `repeat` plain runs, then one more run with the query counter and
+    tracemalloc for the query count and peak memory, so tracing does not skew
+    the timings.
+    """
+    measurement = Measurement()
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        operation()
+        measurement.wall_ms.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        with GenerationTimings().step("benchmark") as traced:
+            result = operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    measurement.queries = traced.queries
+    measurement.peak_kib = peak / 1024
+    measurement.rows_written = rows_written(result) if rows_written else 0
+    return measurement
+
+
+def clear_benchmark_data() -> None:
+    """Remove rows left by an earlier --keep-data run so seeding can run again."""
+    get_user_model().objects.filter(
+        username__startswith=BENCHMARK_USERNAME_PREFIX,
+        username__endswith=BENCHMARK_USERNAME_DOMAIN,
+    ).delete()
+    FoodLibraryItem.objects.filter(source_food_id__gte=SEED_ID_OFFSET).delete()
+    MealComboTemplate.objects.filter(combo_id__gte=SEED_ID_OFFSET).delete()
+    ComboMacroErrorLookup.objects.filter(error_code__gte=SEED_ID_OFFSET).delete()
+
+
+def seed_reference_tables(sizes: BenchmarkSizes, rng: random.Random) -> dict[str, int]:
+    foods = []
+    flat_categories = [(macro, category) for macro, categories in FOOD_CATEGORIES.items() for category in categories]
+    for index in range(sizes.foods):
+        macro, category = flat_categories[index % len(flat_categories)]
+        foods.append(
+            FoodLibraryItem(
+                source_food_id=SEED_ID_OFFSET + index,
+                macro=macro,
+                category=category,
+                name=category if index < len(flat_categories) else f"{category} variant {index}",
+                display_name=category.replace(" STANDARD", "") if index < len(flat_categories) else f"Benchmark food {index}",
+                canonical_name=category,
+                canonical_category=category,
+                measurement_unit="oz",
+                protein=Decimal(str(round(rng.uniform(0, 30), 2))),
+                carbs=Decimal(str(round(rng.uniform(0, 30), 2))),
+                fats=Decimal(str(round(rng.uniform(0, 15), 2))),
+            )
+        )
+    FoodLibraryItem.objects.bulk_create(foods, batch_size=1000)
+
+    proteins = FOOD_CATEGORIES[FoodLibraryItem.Macro.PROTEIN]
+    carbs = FOOD_CATEGORIES[FoodLibraryItem.Macro.CARBS]
+    fats = FOOD_CATEGORIES[FoodLibraryItem.Macro.FATS]
+    combos = []
+    for index in range(sizes.combos):
+        combos.append(
+            MealComboTemplate(
+                combo_id=SEED_ID_OFFSET + index,
+                protein_slot_1=rng.choice(proteins),
+                protein_slot_2=rng.choice(("-", "-", *proteins)),
+                carb_slot_1=rng.choice(carbs),
+                carb_slot_2=rng.choice(("-", "-", *carbs)),
+                fat_slot_1=rng.choice(fats),
+                fat_slot_2=rng.choice(("-", *fats)),
+            )
+        )
+    MealComboTemplate.objects.bulk_create(combos, batch_size=1000)
+
+    ComboMacroErrorLookup.objects.bulk_create(
+        [
+            ComboMacroErrorLookup(
+                error_code=SEED_ID_OFFSET + index,
+                protein_error=Decimal(str(round(rng.uniform(0, 80), 2))),
+                carbs_error=Decimal(str(round(rng.uniform(0, 120), 2))),
+                fats_error=Decimal(str(round(rng.uniform(0, 40), 2))),
+            )
+            for index in range(sizes.error_codes)
+        ],
+        batch_size=2000,
+    )
+    return {"foods": len(foods), "combos": len(combos), "error_codes": sizes.error_codes}
+
+
+def benchmark_answers(*, plan_type: str, meals_per_day: int) -> dict[str, Any]:
+    return {
+        "gender": "male",
+        "height": {"unit": "cm", "value": 180},
+        "weight": {"unit": "lbs", "value": 185},
+        "date_of_birth": "1990-01-01",
+        "goal": "maintain",
+        "lifestyle": "moderate",
+        "meal_plan_type": plan_type,
+        "workout_days": ["monday", "wednesday", "friday"],
+        "meal_schedule": {
+            "mode": "same",
+            "default_meals": meals_per_day,
+            "days": {day: meals_per_day for day in WEEK_DAYS},
+        },
+        "training_schedule": {day: "before_meal_2" for day in ("monday", "wednesday", "friday")},
+    }
+
+
+def _seed_client(plan_type: str, meals_per_day: int):
+    username = f"{BENCHMARK_USERNAME_PREFIX}{plan_type}-{meals_per_day}{BENCHMARK_USERNAME_DOMAIN}"
+    user = get_user_model().objects.create_user(
+        username=username,
+        email=username,
+        password=None,
+        role="client",
+    )
+    ClientProfile.objects.create(user=user, offer_code="food_plan_monthly", includes_food_plan=True)
+    answers = benchmark_answers(plan_type=plan_type, meals_per_day=meals_per_day)
+    ClientQuestionnaireProgress.objects.create(user=user, status="completed", answers_json=answers)
+    return user, answers
+
+
+def _benchmark_scenario(user, answers: dict[str, Any], repeat: int) -> dict[str, Any]:
+    day_payload = build_lazy_questionnaire_results(BuildResultsContext(answers=answers)).day(BENCHMARK_DAY)
+    step1_job = ClientMealPlanGenerationJob.objects.create(user=user, day_of_week=BENCHMARK_DAY, status="running")
+
+    def generate():
+        return run_full_generation_for_day(user, BENCHMARK_DAY, bypass_cache=True)
+
+    def generation_rows(result) -> int:
+        return (
+            ClientMealPlanGeneratedMeal.objects.filter(job_id=result.job_id).count()
+            + ClientMealPlanGenerationStep1Row.objects.filter(job_id=result.job_id).count()
+        )
+
+    operations = {
+        "build_questionnaire_results": _measure(
+            lambda: build_questionnaire_results(BuildResultsContext(answers=answers)),
+            repeat=repeat,
+        ),
+        "build_step1_rows_for_day": _measure(
+            lambda: build_step1_rows_for_day(step1_job, day_payload),
+            repeat=repeat,
+            rows_written=lambda row_count: row_count,
+        ),
+        "run_full_generation_for_day": _measure(generate, repeat=repeat, rows_written=generation_rows),
+    }
+    generate()
+    operations["get_generated_meal_day_detail"] = _measure(
+        lambda: get_generated_meal_day_detail(user, BENCHMARK_DAY),
+        repeat=repeat,
+    )
+    return {name: measurement.as_dict() for name, measurement in operations.items()}
+
+
+def run_generation_benchmark(sizes: BenchmarkSizes | None = None, *, keep_data: bool = False) -> dict[str, Any]:
+    """
+    Seed reference tables and one synthetic client per (plan type, meals per day),
+    run the generation path for each and report timings, query counts, rows
+    written and peak memory. Uses the reference solver, never publishes progress
+    events, and rolls every seeded row back unless `keep_data` is set. A
+    `keep_data` run first replaces the rows an earlier one kept; a rolled-back
+    run also puts the table version stamps back so other processes keep their
+    caches.
+    """
+    sizes = sizes or BenchmarkSizes()
+    rng = random.Random(sizes.seed)
+    report: dict[str, Any] = {
+        "database": connection.vendor,
+        "sizes": {
+            "foods": sizes.foods,
+            "combos": sizes.combos,
+            "error_codes": sizes.error_codes,
+            "repeat": sizes.repeat,
+        },
+        "scenarios": [],
+    }
+
+    try:
+        with (
+            nullcontext() if keep_data else restore_table_versions_after_rollback(),
+            override_settings(MEAL_PLAN_PROGRESS_REDIS_URL="", MEAL_PLAN_SOLVER_BACKEND=SOLVER_BACKEND_REFERENCE),
+            transaction.atomic(),
+        ):
+            if keep_data:
+                clear_benchmark_data()
+            report["seeded"] = seed_reference_tables(sizes, rng)
+            for plan_type in sizes.plan_types:
+                for meals_per_day in sizes.meals_per_day:
+                    user, answers = _seed_client(plan_type, meals_per_day)
+                    report["scenarios"].append(
+                        {
+                            "plan_type": plan_type,
+                            "meals_per_day": meals_per_day,
+                            "operations": _benchmark_scenario(user, answers, sizes.repeat),
+                        }
+                    )
+            if not keep_data:
+                raise _Rollback
+    except _Rollback:
+        pass
+    return report
@@ -0,0 +1,56 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from users.client_area.benchmarks.meal_plan_generation import (
+    MEALS_PER_DAY,
+    PLAN_TYPES,
+    BenchmarkSizes,
+    run_generation_benchmark,
+)
+
+
+def _csv(value: str) -> tuple[str, ...]:
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic foods, combos, error codes and clients, then time the meal plan "
+        "generation path (results, Step1, full generation with the reference solver, day detail) "
+        "and print a JSON report. Seeded rows are rolled back unless --keep-data is set."
+    )
+
+    def add_arguments(self, parser):
+        defaults = BenchmarkSizes()
+        parser.add_argument("--foods", type=int, default=defaults.foods, help="Food library rows to seed.")
+        parser.add_argument("--combos", type=int, default=defaults.combos, help="Meal combo templates to seed.")
+        parser.add_argument("--error-codes", type=int, default=defaults.error_codes, help="Combo error lookup rows to seed.")
+        parser.add_argument("--repeat", type=int, default=defaults.repeat, help="Timed runs per operation.")
+        parser.add_argument("--plan-types", default=",".join(PLAN_TYPES), help="Comma-separated meal plan types.")
+        parser.add_argument(
+            "--meals",
+            default=",".join(str(count) for count in MEALS_PER_DAY),
+            help="Comma-separated meals-per-day counts.",
+        )
+        parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed for the synthetic tables.")
+        parser.add_argument("--output", default="", help="Write the JSON report to this path instead of stdout.")
+        parser.add_argument("--keep-data", action="store_true", help="Commit the seeded rows instead of rolling back.")
+
+    def handle(self, *args, **options):
+        sizes = BenchmarkSizes(
+            foods=options["foods"],
+            combos=max(1, options["combos"]),
+            error_codes=options["error_codes"],
+            repeat=max(1, options["repeat"]),
+            plan_types=_csv(options["plan_types"]),
+            meals_per_day=tuple(int(count) for count in _csv(options["meals"])),
+            seed=options["seed"],
+        )
+        report = json.dumps(run_generation_benchmark(sizes, keep_data=options["keep_data"]), indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                handle.write(report)
+            self.stdout.write(self.style.SUCCESS(f"Benchmark report written to {options['output']}."))
+        else:
+            self.stdout.write(report)
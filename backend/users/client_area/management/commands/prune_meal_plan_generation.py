@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from users.client_area.services.meal_plan_generation.retention import prune_meal_plan_generation
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply meal plan generation retention: keep the newest N jobs per client/day, "
+        "drop Step1 rows of completed jobs and compact older job snapshots, in bounded batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep", type=int, default=None, help="Finished jobs kept per client/day (default: settings).")
+        parser.add_argument("--batch-size", type=int, default=None, help="Max rows per delete/update statement.")
+        parser.add_argument("--step1-grace-hours", type=int, default=None, help="Only prune jobs older than this.")
+        parser.add_argument("--pause", type=float, default=None, help="Seconds to sleep between batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be pruned.")
+
+    def handle(self, *args, **options):
+        result = prune_meal_plan_generation(
+            keep_latest=options["keep"],
+            batch_size=options["batch_size"],
+            step1_grace_hours=options["step1_grace_hours"],
+            pause_seconds=options["pause"],
+            dry_run=options["dry_run"],
+        )
+        prefix = "Would prune" if result.dry_run else "Pruned"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {result.jobs_deleted} jobs and {result.step1_rows_deleted} Step1 rows; "
+                f"compacted {result.snapshots_compacted} snapshots in {result.delete_batches} batches."
+            )
+        )
+        if result.partitions_created or result.partitions_dropped:
+            self.stdout.write(
+                f"Step1 partitions: {result.partitions_created} created, {result.partitions_dropped} dropped."
+            )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from users.client_area.views.meal_combo_public import warm_starter_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Build and cache the public starter template catalog for the current meal combo "
+        "table version. Run after deploys and combo imports."
+    )
+
+    def handle(self, *args, **kwargs):
+        warmed = warm_starter_catalog()
+        self.stdout.write(self.style.SUCCESS(f"Starter template catalog warmed for {warmed} day shapes."))
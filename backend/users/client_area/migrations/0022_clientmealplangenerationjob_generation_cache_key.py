@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_area", "0021_clientpendingsignup_questionnaire_payloads"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clientmealplangenerationjob",
+            name="generation_cache_key",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=64),
+        ),
+    ]
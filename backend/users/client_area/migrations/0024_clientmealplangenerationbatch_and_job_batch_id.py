@@ -0,0 +1,171 @@
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+WEEK_DAYS = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
+
+
+def _day_summary(job, generated_meal_count):
+    summary = {
+        "day_of_week": job.day_of_week,
+        "job_id": job.id,
+        "status": job.status,
+        "current_step": job.current_step,
+        "progress_percent": job.progress_percent,
+        "generated_meal_count": generated_meal_count if job.status == "completed" else 0,
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+    return json.loads(json.dumps(summary, cls=DjangoJSONEncoder))
+
+
+def _batch_status(statuses, day_count):
+    if statuses.count("completed") == day_count:
+        return "completed"
+    if "failed" in statuses:
+        return "failed"
+    if any(status in ("running", "pending") for status in statuses):
+        return "running"
+    return "pending"
+
+
+def backfill_generation_batches(apps, schema_editor):
+    ClientMealPlanGenerationJob = apps.get_model("client_area", "ClientMealPlanGenerationJob")
+    ClientMealPlanGenerationBatch = apps.get_model("client_area", "ClientMealPlanGenerationBatch")
+    ClientMealPlanGeneratedMeal = apps.get_model("client_area", "ClientMealPlanGeneratedMeal")
+
+    batches = {}
+    pending_jobs = []
+    for job in ClientMealPlanGenerationJob.objects.filter(input_snapshot_json__has_key="batch_id").order_by("created_at", "id").iterator():
+        snapshot = job.input_snapshot_json or {}
+        batch_id = str(snapshot.get("batch_id") or "")[:64]
+        if not batch_id:
+            continue
+        job.batch_id = batch_id
+        job.batch_mode = str(snapshot.get("batch_mode") or "")[:16]
+        pending_jobs.append(job)
+        if len(pending_jobs) >= 500:
+            ClientMealPlanGenerationJob.objects.bulk_update(pending_jobs, ["batch_id", "batch_mode"])
+            pending_jobs = []
+
+        entry = batches.setdefault(batch_id, {"user_id": job.user_id, "batch_mode": job.batch_mode or "week", "latest": {}})
+        entry["latest"][job.day_of_week] = job
+    if pending_jobs:
+        ClientMealPlanGenerationJob.objects.bulk_update(pending_jobs, ["batch_id", "batch_mode"])
+
+    completed_ids = [
+        job.id
+        for entry in batches.values()
+        for job in entry["latest"].values()
+        if job.status == "completed"
+    ]
+    generated_counts = {}
+    for start in range(0, len(completed_ids), 500):
+        generated_counts.update(
+            ClientMealPlanGeneratedMeal.objects.filter(job_id__in=completed_ids[start:start + 500])
+            .values("job_id")
+            .annotate(row_count=Count("id"))
+            .values_list("job_id", "row_count")
+        )
+
+    records = []
+    for batch_id, entry in batches.items():
+        latest = entry["latest"]
+        days = [day for day in WEEK_DAYS if day in latest]
+        day_jobs = {day: _day_summary(latest[day], generated_counts.get(latest[day].id, 0)) for day in days}
+        statuses = [day_jobs[day]["status"] for day in days]
+        status = _batch_status(statuses, len(days))
+        started = [latest[day].started_at for day in days if latest[day].started_at]
+        completed = [latest[day].completed_at for day in days if latest[day].completed_at]
+        records.append(
+            ClientMealPlanGenerationBatch(
+                user_id=entry["user_id"],
+                batch_id=batch_id,
+                batch_mode=entry["batch_mode"],
+                status=status,
+                days_requested=days,
+                day_jobs_json=day_jobs,
+                days_total=len(days),
+                days_completed=statuses.count("completed"),
+                days_failed=statuses.count("failed"),
+                generated_meal_count=sum(summary["generated_meal_count"] for summary in day_jobs.values()),
+                started_at=min(started) if started else None,
+                completed_at=max(completed) if completed and status in ("completed", "failed") else None,
+            )
+        )
+    ClientMealPlanGenerationBatch.objects.bulk_create(records, batch_size=500, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_area", "0023_clientmealplanrenderedday"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clientmealplangenerationjob",
+            name="batch_id",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="clientmealplangenerationjob",
+            name="batch_mode",
+            field=models.CharField(blank=True, default="", max_length=16),
+        ),
+        migrations.CreateModel(
+            name="ClientMealPlanGenerationBatch",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("batch_id", models.CharField(max_length=64, unique=True)),
+                ("batch_mode", models.CharField(default="week", max_length=16)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("task_id", models.CharField(blank=True, default="", max_length=255)),
+                ("days_requested", models.JSONField(blank=True, default=list)),
+                ("day_jobs_json", models.JSONField(blank=True, default=dict)),
+                ("days_total", models.PositiveSmallIntegerField(default=0)),
+                ("days_completed", models.PositiveSmallIntegerField(default=0)),
+                ("days_failed", models.PositiveSmallIntegerField(default=0)),
+                ("generated_meal_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="meal_plan_generation_batches",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Client Meal Plan Generation Batch",
+                "verbose_name_plural": "Client Meal Plan Generation Batches",
+                "ordering": ("-created_at",),
+            },
+        ),
+        migrations.RunPython(backfill_generation_batches, migrations.RunPython.noop),
+    ]
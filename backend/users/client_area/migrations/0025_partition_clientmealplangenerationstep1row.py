@@ -0,0 +1,165 @@
+from django.conf import settings
+from django.db import migrations
+
+
+STEP1_TABLE = "client_area_clientmealplangenerationstep1row"
+JOB_TABLE = "client_area_clientmealplangenerationjob"
+
+
+def _partition_job_span():
+    try:
+        return max(1, int(getattr(settings, "MEAL_PLAN_STEP1_PARTITION_JOB_SPAN", 5000)))
+    except (TypeError, ValueError):
+        return 5000
+
+
+def partition_step1_table(apps, schema_editor):
+    """
+    Turn the Step1 table into a table partitioned by RANGE (job_id) on PostgreSQL.
+
+    The existing table is not copied: it is attached as the first partition
+    (MINVALUE up to the next span boundary after the newest job), so retention can
+    later drop it whole. The parent gets the same index/constraint names the
+    existing table had, a PRIMARY KEY of (id, job_id) (the partition key has to be
+    part of it) and a DEFAULT partition as a safety net. Other databases keep the
+    plain table.
+
+    Django's model state deliberately keeps `id` as the primary key: every
+    partition draws ids from the one parent sequence, so `id` stays unique and
+    ORM lookups, bulk_create and the admin keep working unchanged. Declaring a
+    CompositePrimaryKey instead would change `pk` for every caller and would not
+    match the plain table other databases keep.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    quote = connection.ops.quote_name
+    legacy = f"{STEP1_TABLE}_p_legacy"
+    sequence = f"{STEP1_TABLE}_part_id_seq"
+    span = _partition_job_span()
+
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, STEP1_TABLE)
+        cursor.execute(f"SELECT COALESCE(MAX(job_id), 0), COALESCE(MAX(id), 0) FROM {quote(STEP1_TABLE)}")
+        max_job_id, max_row_id = cursor.fetchone()
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {quote(JOB_TABLE)}")
+        max_job_id = max(max_job_id, cursor.fetchone()[0])
+    legacy_upper = ((max_job_id // span) + 1) * span
+
+    statements = [f"ALTER TABLE {quote(STEP1_TABLE)} RENAME TO {quote(legacy)}"]
+    recreate = []
+    for index, (name, info) in enumerate(sorted(constraints.items())):
+        columns = ", ".join(quote(column) for column in info["columns"])
+        legacy_name = f"{STEP1_TABLE[:40]}_legacy_{index}"
+        if info["check"]:
+            continue
+        if info["primary_key"]:
+            # ATTACH gives the partition the parent's (id, job_id) key; a second PK is rejected.
+            statements.append(f"ALTER TABLE {quote(legacy)} DROP CONSTRAINT {quote(name)}")
+            continue
+        if info["unique"] or info["foreign_key"]:
+            statements.append(f"ALTER TABLE {quote(legacy)} RENAME CONSTRAINT {quote(name)} TO {quote(legacy_name)}")
+        elif info["index"]:
+            statements.append(f"ALTER INDEX {quote(name)} RENAME TO {quote(legacy_name)}")
+        if info["foreign_key"]:
+            target_table, target_column = info["foreign_key"]
+            recreate.append(
+                f"ALTER TABLE {quote(STEP1_TABLE)} ADD CONSTRAINT {quote(name)} FOREIGN KEY ({columns}) "
+                f"REFERENCES {quote(target_table)} ({quote(target_column)}) DEFERRABLE INITIALLY DEFERRED"
+            )
+        elif info["unique"]:
+            recreate.append(f"ALTER TABLE {quote(STEP1_TABLE)} ADD CONSTRAINT {quote(name)} UNIQUE ({columns})")
+        elif info["index"]:
+            recreate.append(f"CREATE INDEX {quote(name)} ON {quote(STEP1_TABLE)} ({columns})")
+
+    statements += [
+        # Partitions cannot carry their own identity/serial default; ids come from a parent-owned sequence.
+        f"ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP IDENTITY IF EXISTS",
+        f"ALTER TABLE {quote(legacy)} ALTER COLUMN id DROP DEFAULT",
+        f"CREATE TABLE {quote(STEP1_TABLE)} (LIKE {quote(legacy)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (job_id)",
+        f"CREATE SEQUENCE {quote(sequence)} AS bigint OWNED BY {quote(STEP1_TABLE)}.id",
+        f"SELECT setval('{sequence}', {max(int(max_row_id), 1)}, {'true' if max_row_id else 'false'})",
+        f"ALTER TABLE {quote(STEP1_TABLE)} ALTER COLUMN id SET DEFAULT nextval('{sequence}')",
+        f"ALTER TABLE {quote(STEP1_TABLE)} ADD PRIMARY KEY (id, job_id)",
+        *recreate,
+        # A validated CHECK lets ATTACH skip the full-table partition constraint scan.
+        f"ALTER TABLE {quote(legacy)} ADD CONSTRAINT {quote(legacy + '_bound')} "
+        f"CHECK (job_id IS NOT NULL AND job_id < {int(legacy_upper)}) NOT VALID",
+        f"ALTER TABLE {quote(legacy)} VALIDATE CONSTRAINT {quote(legacy + '_bound')}",
+        f"ALTER TABLE {quote(STEP1_TABLE)} ATTACH PARTITION {quote(legacy)} FOR VALUES FROM (MINVALUE) TO ({int(legacy_upper)})",
+        f"ALTER TABLE {quote(legacy)} DROP CONSTRAINT {quote(legacy + '_bound')}",
+    ]
+    lower = legacy_upper
+    for _ in range(2):
+        name = f"{STEP1_TABLE}_p{lower}"
+        statements += [
+            f"CREATE TABLE {quote(name)} (LIKE {quote(STEP1_TABLE)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            f"ALTER TABLE {quote(STEP1_TABLE)} ATTACH PARTITION {quote(name)} FOR VALUES FROM ({lower}) TO ({lower + span})",
+        ]
+        lower += span
+    statements.append(f"CREATE TABLE {quote(STEP1_TABLE + '_p_default')} PARTITION OF {quote(STEP1_TABLE)} DEFAULT")
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def unpartition_step1_table(apps, schema_editor):
+    """
+    Copy every partition back into a plain table with an identity `id` primary
+    key and the original constraint/index names. This rewrites all Step1 rows,
+    so run it in a maintenance window (or prune Step1 rows first).
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    quote = connection.ops.quote_name
+    partitioned = f"{STEP1_TABLE}_partitioned"
+    schema_editor.execute(f"ALTER TABLE {quote(STEP1_TABLE)} RENAME TO {quote(partitioned)}")
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, partitioned)
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {quote(partitioned)}")
+        max_row_id = cursor.fetchone()[0]
+
+    recreate = []
+    for name, info in sorted(constraints.items()):
+        columns = ", ".join(quote(column) for column in info["columns"])
+        if info["check"] or info["primary_key"]:
+            continue
+        if info["foreign_key"]:
+            target_table, target_column = info["foreign_key"]
+            recreate.append(
+                f"ALTER TABLE {quote(STEP1_TABLE)} ADD CONSTRAINT {quote(name)} FOREIGN KEY ({columns}) "
+                f"REFERENCES {quote(target_table)} ({quote(target_column)}) DEFERRABLE INITIALLY DEFERRED"
+            )
+        elif info["unique"]:
+            recreate.append(f"ALTER TABLE {quote(STEP1_TABLE)} ADD CONSTRAINT {quote(name)} UNIQUE ({columns})")
+        elif info["index"]:
+            recreate.append(f"CREATE INDEX {quote(name)} ON {quote(STEP1_TABLE)} ({columns})")
+
+    statements = [
+        f"CREATE TABLE {quote(STEP1_TABLE)} (LIKE {quote(partitioned)} INCLUDING DEFAULTS)",
+        # The default points at the partition sequence, which is dropped with the partitioned table.
+        f"ALTER TABLE {quote(STEP1_TABLE)} ALTER COLUMN id DROP DEFAULT",
+        f"INSERT INTO {quote(STEP1_TABLE)} SELECT * FROM {quote(partitioned)}",
+        f"DROP TABLE {quote(partitioned)} CASCADE",
+        f"ALTER TABLE {quote(STEP1_TABLE)} ADD CONSTRAINT {quote(STEP1_TABLE + '_pkey')} PRIMARY KEY (id)",
+        f"ALTER TABLE {quote(STEP1_TABLE)} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY",
+        f"SELECT setval(pg_get_serial_sequence('{STEP1_TABLE}', 'id'), {max(int(max_row_id), 1)}, {'true' if max_row_id else 'false'})",
+        *recreate,
+    ]
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_area", "0024_clientmealplangenerationbatch_and_job_batch_id"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_step1_table, unpartition_step1_table),
+    ]
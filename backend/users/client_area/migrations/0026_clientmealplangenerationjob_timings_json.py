@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 17:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_area", "0025_partition_clientmealplangenerationstep1row"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clientmealplangenerationjob",
+            name="timings_json",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2 on 2026-10-18 17:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_area", "0027_merge_20260325_2302"),
+        ("client_area", "0026_clientmealplangenerationjob_timings_json"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClientMacroRecalculationJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("trigger", models.CharField(blank=True, default="", max_length=32)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        db_index=True,
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("task_id", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "admin_parameters_version",
+                    models.CharField(blank=True, default="", max_length=64),
+                ),
+                ("clients_total", models.PositiveIntegerField(default=0)),
+                ("clients_processed", models.PositiveIntegerField(default=0)),
+                ("clients_skipped", models.PositiveIntegerField(default=0)),
+                ("clients_changed", models.PositiveIntegerField(default=0)),
+                ("days_changed", models.PositiveIntegerField(default=0)),
+                ("regenerations_queued", models.PositiveIntegerField(default=0)),
+                ("last_profile_id", models.PositiveBigIntegerField(default=0)),
+                ("changed_days_json", models.JSONField(blank=True, default=dict)),
+                ("error_message", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "admin",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="macro_recalculation_jobs",
+                        to="admin_area.adminidentity",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Client Macro Recalculation Job",
+                "verbose_name_plural": "Client Macro Recalculation Jobs",
+                "ordering": ("-created_at",),
+            },
+        ),
+    ]
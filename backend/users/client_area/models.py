@@ -469,11 +469,16 @@ class ClientMealPlanGenerationJob(models.Model):
     )
     day_of_week = models.CharField(max_length=12, choices=DAY_CHOICES, db_index=True)
     algorithm_version = models.CharField(max_length=32, default="wp_v1")
+    generation_cache_key = models.CharField(max_length=64, blank=True, default="", db_index=True)
+    batch_id = models.CharField(max_length=64, blank=True, default="", db_index=True)
+    batch_mode = models.CharField(max_length=16, blank=True, default="")
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending", db_index=True)
     total_steps = models.PositiveSmallIntegerField(default=10)
     current_step = models.PositiveSmallIntegerField(default=0)
     progress_percent = models.PositiveSmallIntegerField(default=0)
     input_snapshot_json = models.JSONField(default=dict, blank=True)
+    # Per-stage wall time, query count/time and rows written (see services/meal_plan_generation/timings.py).
+    timings_json = models.JSONField(default=dict, blank=True)
     error_message = models.TextField(blank=True, default="")
     created_at = models.DateTimeField(auto_now_add=True)
     started_at = models.DateTimeField(null=True, blank=True)
@@ -489,7 +494,91 @@ class ClientMealPlanGenerationJob(models.Model):
         return f"{self.user.email} | {self.day_of_week} | {self.status} ({self.progress_percent}%)"
 
 
+class ClientMealPlanGenerationBatch(models.Model):
+    STATUS_CHOICES = ClientMealPlanGenerationJob.STATUS_CHOICES
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="meal_plan_generation_batches")
+    batch_id = models.CharField(max_length=64, unique=True)
+    batch_mode = models.CharField(max_length=16, default="week")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending", db_index=True)
+    task_id = models.CharField(max_length=255, blank=True, default="")
+    days_requested = models.JSONField(default=list, blank=True)
+    day_jobs_json = models.JSONField(default=dict, blank=True)
+    days_total = models.PositiveSmallIntegerField(default=0)
+    days_completed = models.PositiveSmallIntegerField(default=0)
+    days_failed = models.PositiveSmallIntegerField(default=0)
+    generated_meal_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        verbose_name = "Client Meal Plan Generation Batch"
+        verbose_name_plural = "Client Meal Plan Generation Batches"
+
+    def __str__(self):
+        return f"{self.user.email} | batch {self.batch_id} | {self.status} ({self.days_completed}/{self.days_total})"
+
+
+class ClientMacroRecalculationJob(models.Model):
+    """
+    Bulk refresh of one admin's clients after their parameter tables change:
+    results are recomputed in chunks and only days whose meal splits moved are
+    queued for regeneration (see services/macro_recalculation.py).
+    """
+
+    STATUS_CHOICES = ClientMealPlanGenerationJob.STATUS_CHOICES
+
+    admin = models.ForeignKey(
+        AdminIdentity,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="macro_recalculation_jobs",
+    )
+    trigger = models.CharField(max_length=32, blank=True, default="")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending", db_index=True)
+    task_id = models.CharField(max_length=255, blank=True, default="")
+    admin_parameters_version = models.CharField(max_length=64, blank=True, default="")
+    clients_total = models.PositiveIntegerField(default=0)
+    clients_processed = models.PositiveIntegerField(default=0)
+    clients_skipped = models.PositiveIntegerField(default=0)
+    clients_changed = models.PositiveIntegerField(default=0)
+    days_changed = models.PositiveIntegerField(default=0)
+    regenerations_queued = models.PositiveIntegerField(default=0)
+    # Highest ClientProfile id handled so far; chunks resume after it.
+    last_profile_id = models.PositiveBigIntegerField(default=0)
+    # {user_id: [days queued for regeneration]}
+    changed_days_json = models.JSONField(default=dict, blank=True)
+    error_message = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        verbose_name = "Client Macro Recalculation Job"
+        verbose_name_plural = "Client Macro Recalculation Jobs"
+
+    @property
+    def progress_percent(self) -> int:
+        if self.status == "completed":
+            return 100
+        if not self.clients_total:
+            return 0
+        return min(99, int(self.clients_processed * 100 / self.clients_total))
+
+    def __str__(self):
+        return f"{self.admin} | recalculation {self.status} ({self.clients_processed}/{self.clients_total})"
+
+
 class ClientMealPlanGenerationStep1Row(models.Model):
+    # On PostgreSQL the table is partitioned by job_id (migration 0025) and its
+    # database primary key is (id, job_id); `id` comes from one shared sequence
+    # and remains unique, so Django keeps addressing rows by `id`.
     job = models.ForeignKey(
         "ClientMealPlanGenerationJob",
         on_delete=models.CASCADE,
@@ -561,3 +650,26 @@ class ClientMealPlanGeneratedMeal(models.Model):
 
     def __str__(self):
         return f"Job {self.job_id} | {self.day_of_week} meal {self.meal_number}"
+
+
+class ClientMealPlanRenderedDay(models.Model):
+    job = models.OneToOneField(
+        "ClientMealPlanGenerationJob",
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="rendered_day",
+    )
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="rendered_meal_plan_days")
+    day_of_week = models.CharField(max_length=12, choices=ClientMealComboSelection.DAY_CHOICES, db_index=True)
+    payload_json = models.JSONField(default=dict, blank=True)
+    source_version = models.CharField(max_length=80, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-job_id",)
+        verbose_name = "Client Meal Plan Rendered Day"
+        verbose_name_plural = "Client Meal Plan Rendered Days"
+
+    def __str__(self):
+        return f"Job {self.job_id} | {self.day_of_week} (rendered)"
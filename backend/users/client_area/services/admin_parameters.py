@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import threading
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from core.seed_data.admin_parameter_defaults import get_admin_parameter_defaults_v1
+from core.services.table_versions import ADMIN_PARAMETERS, get_table_version
+from users.admin_area.services.admin_parameter_tables import get_admin_parameter_payload
+
+
+PARAMETER_SOURCE_ADMIN = "associated_admin"
+PARAMETER_SOURCE_DEFAULTS = "dta_default_v1"
+GOAL_ADJUSTMENT_KEYS = {
+    "lose": "lose_weight_percent",
+    "maintain": "maintain_weight_percent",
+    "gain": "gain_weight_percent",
+}
+DEFAULT_DAY_MULTIPLIER = 1.2
+CARB_CYCLING = "carb_cycling"
+
+
+def _to_float(value, default=0.0):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float(default)
+
+
+def _dict(value) -> dict:
+    return value if isinstance(value, dict) else {}
+
+
+@dataclass(frozen=True)
+class CompiledTdeeTable:
+    category: Any
+    category_multiplier: float
+    # Already parsed and sorted high to low, ready to hand out to workout days first.
+    day_multipliers_desc: tuple[float, ...]
+
+
+@dataclass(frozen=True)
+class CompiledMacroRules:
+    protein_factor_value: float
+    carb_percent: float
+    fat_percent: float
+    carb_cycling_mode: str | None
+
+
+@dataclass(frozen=True)
+class CompiledMealSplit:
+    meal_key: str
+    meal_number: int
+    protein: float
+    carbs: float
+    fats: float
+
+
+EMPTY_TDEE_TABLE = CompiledTdeeTable(
+    category=None,
+    category_multiplier=0.0,
+    day_multipliers_desc=(DEFAULT_DAY_MULTIPLIER,) * 7,
+)
+
+
+@dataclass(frozen=True)
+class CompiledAdminParameters:
+    """
+    Admin parameter tree parsed once into floats and direct lookups for
+    build_questionnaire_results. Shared across requests: read-only.
+    """
+
+    source: str
+    defaults_version: str
+    goal_adjustment_percent: Mapping[str, float]
+    tdee_tables: Mapping[tuple[str, str], CompiledTdeeTable]
+    macro_rules: Mapping[tuple[str, str, bool], CompiledMacroRules]
+    distributions: Mapping[tuple[str, str, str | None, str], tuple[CompiledMealSplit, ...]]
+
+    def goal_adjustment(self, goal: str) -> float:
+        return self.goal_adjustment_percent.get(goal, 0.0)
+
+    def tdee_table(self, lifestyle: str, training_days_per_week: int) -> CompiledTdeeTable:
+        return self.tdee_tables.get((lifestyle, str(training_days_per_week)), EMPTY_TDEE_TABLE)
+
+    def macro_rules_for_day(self, meal_plan_type: str, goal: str, is_workout_day: bool) -> CompiledMacroRules:
+        rules = self.macro_rules.get((meal_plan_type, goal, is_workout_day))
+        if rules is not None:
+            return rules
+        carb_cycling_mode = None
+        if meal_plan_type == CARB_CYCLING:
+            carb_cycling_mode = "high_carbs" if is_workout_day else "low_carbs"
+        return CompiledMacroRules(1.0, 0.0, 0.0, carb_cycling_mode)
+
+    def distribution(
+        self,
+        meal_plan_type: str,
+        meals_per_day: int,
+        training_schedule_value: Any,
+        carb_cycling_mode: str | None = None,
+    ) -> tuple[CompiledMealSplit, ...]:
+        mode = (carb_cycling_mode or "low_carbs") if meal_plan_type == CARB_CYCLING else None
+        scenario_key = str(training_schedule_value or "no_training").strip()
+        if scenario_key.startswith("before_meal_"):
+            scenario_key = f"train_{scenario_key}"
+        bucket = (meal_plan_type, f"meals_{meals_per_day}", mode)
+        return self.distributions.get((*bucket, scenario_key)) or self.distributions.get((*bucket, "no_training")) or ()
+
+
+def _compile_tdee_tables(params: dict[str, Any]):
+    tdee = _dict(params.get("tdee"))
+    category_multipliers = _dict(tdee.get("category_multipliers"))
+    tables = {}
+    for lifestyle, lifestyle_payload in _dict(tdee.get("weekly_day_multiplier_splits")).items():
+        for training_days, table in _dict(_dict(lifestyle_payload).get("tables_by_training_days_per_week")).items():
+            table = _dict(table)
+            multipliers = table.get("day_multipliers") or [DEFAULT_DAY_MULTIPLIER] * 7
+            if len(multipliers) != 7:
+                multipliers = [DEFAULT_DAY_MULTIPLIER] * 7
+            category = table.get("category")
+            tables[(lifestyle, str(training_days))] = CompiledTdeeTable(
+                category=category,
+                category_multiplier=_to_float(category_multipliers.get(str(category)), 0.0) if category else 0.0,
+                day_multipliers_desc=tuple(
+                    sorted((_to_float(value, DEFAULT_DAY_MULTIPLIER) for value in multipliers), reverse=True)
+                ),
+            )
+    return tables
+
+
+def _compile_macro_rules(params: dict[str, Any]):
+    rules = {}
+    for meal_plan_type, plan_payload in _dict(params.get("meal_plans")).items():
+        for goal, goal_rules in _dict(_dict(plan_payload).get("macro_rules_by_goal")).items():
+            goal_rules = _dict(goal_rules)
+            protein_factor_value = _to_float(goal_rules.get("protein_factor_value"), 1.0)
+            for is_workout_day in (True, False):
+                if meal_plan_type == CARB_CYCLING:
+                    carb_set = _dict(goal_rules.get("high_day" if is_workout_day else "low_day"))
+                    mode = "high_carbs" if is_workout_day else "low_carbs"
+                else:
+                    carb_set, mode = goal_rules, None
+                rules[(meal_plan_type, goal, is_workout_day)] = CompiledMacroRules(
+                    protein_factor_value=protein_factor_value,
+                    carb_percent=_to_float(carb_set.get("carb_percent"), 0.0),
+                    fat_percent=_to_float(carb_set.get("fat_percent"), 0.0),
+                    carb_cycling_mode=mode,
+                )
+    return rules
+
+
+def _compile_splits(distribution_table: dict[str, Any]) -> tuple[CompiledMealSplit, ...]:
+    splits = []
+    for meal_key in sorted(distribution_table.keys(), key=lambda key: int(key.split("_")[-1])):
+        percentages = _dict(distribution_table.get(meal_key))
+        splits.append(
+            CompiledMealSplit(
+                meal_key=meal_key,
+                meal_number=int(meal_key.split("_")[-1]),
+                protein=_to_float(percentages.get("protein"), 0.0),
+                carbs=_to_float(percentages.get("carbs"), 0.0),
+                fats=_to_float(percentages.get("fats"), 0.0),
+            )
+        )
+    return tuple(splits)
+
+
+def _compile_distributions(params: dict[str, Any]):
+    distributions = {}
+    for meal_plan_type, plan_payload in _dict(params.get("meal_plans")).items():
+        for meals_key, bucket in _dict(_dict(plan_payload).get("meal_macro_distribution")).items():
+            if not meals_key.startswith("meals_"):
+                continue
+            if meal_plan_type == CARB_CYCLING:
+                scenario_sets = [(mode, _dict(scenarios)) for mode, scenarios in _dict(bucket).items()]
+            else:
+                scenario_sets = [(None, _dict(bucket))]
+            for mode, scenarios in scenario_sets:
+                for scenario_key, table in scenarios.items():
+                    table = _dict(table)
+                    if table:
+                        distributions[(meal_plan_type, meals_key, mode, scenario_key)] = _compile_splits(table)
+    return distributions
+
+
+def compile_admin_parameters(params: dict[str, Any], *, source: str) -> CompiledAdminParameters:
+    params = _dict(params)
+    goal_adjustments = _dict(params.get("goal_calorie_adjustments"))
+    return CompiledAdminParameters(
+        source=source,
+        defaults_version=params.get("version") or "v1",
+        goal_adjustment_percent=MappingProxyType(
+            {goal: _to_float(goal_adjustments.get(key), 0.0) for goal, key in GOAL_ADJUSTMENT_KEYS.items()}
+        ),
+        tdee_tables=MappingProxyType(_compile_tdee_tables(params)),
+        macro_rules=MappingProxyType(_compile_macro_rules(params)),
+        distributions=MappingProxyType(_compile_distributions(params)),
+    )
+
+
+@lru_cache(maxsize=1)
+def _compiled_defaults() -> CompiledAdminParameters:
+    # The seed files never change while the process runs, so no version check.
+    return compile_admin_parameters(get_admin_parameter_defaults_v1(), source=PARAMETER_SOURCE_DEFAULTS)
+
+
+_compiled_by_admin: dict[Any, CompiledAdminParameters] = {}
+_compiled_version: str | None = None
+_cache_lock = threading.Lock()
+
+
+def _compile_for_admin(admin_identity) -> CompiledAdminParameters:
+    parameters = get_admin_parameter_payload(admin_identity, ensure_exists=False, fallback_to_core=False)
+    if not parameters:
+        return _compiled_defaults()
+    return compile_admin_parameters(parameters, source=PARAMETER_SOURCE_ADMIN)
+
+
+def get_compiled_admin_parameters(admin_identity=None) -> CompiledAdminParameters:
+    """
+    Compiled parameters from the admin's TDEE/Standard/Keto/CarbCycling tables, or
+    the DTA defaults when there is no admin or its tables are incomplete. Entries
+    are cached in-process by admin pk and dropped whenever the `admin_parameters`
+    table version changes, so a cache hit costs no queries.
+    """
+    global _compiled_version
+
+    admin_key = getattr(admin_identity, "pk", None)
+    if admin_key is None:
+        return _compiled_defaults()
+
+    version = get_table_version(ADMIN_PARAMETERS)
+    compiled = _compiled_by_admin.get(admin_key) if _compiled_version == version else None
+    if compiled is not None:
+        return compiled
+
+    compiled = _compile_for_admin(admin_identity)
+    with _cache_lock:
+        if _compiled_version != version:
+            _compiled_by_admin.clear()
+            _compiled_version = version
+        _compiled_by_admin[admin_key] = compiled
+    return compiled
+
+
+def clear_compiled_admin_parameters_cache() -> None:
+    global _compiled_version
+    with _cache_lock:
+        _compiled_by_admin.clear()
+        _compiled_version = None
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from core.services.table_versions import ADMIN_PARAMETERS, get_table_version
+from users.client_area.models import (
+    ClientMacroRecalculationJob,
+    ClientMealPlanGenerationJob,
+    ClientProfile,
+    ClientQuestionnaireProgress,
+)
+
+from .meal_plan_generation.runner import launch_full_generation_for_week_background
+from .results_batch import build_questionnaire_results_batch
+from .results_engine import WEEK_DAYS, BuildResultsContext
+
+
+ACTIVE_RECALCULATION_STATUSES = ("pending", "running")
+SUPERSEDED_MESSAGE = "Superseded by a newer recalculation for the same admin."
+CELERY_UNAVAILABLE_MESSAGE = (
+    "Celery is not installed in the backend virtual environment. "
+    "Install backend requirements, restart Django/Celery and start the recalculation again."
+)
+
+
+@dataclass
+class RecalculationChunkResult:
+    job_id: int
+    status: str
+    clients_processed: int = 0
+    clients_skipped: int = 0
+    clients_changed: int = 0
+    days_changed: int = 0
+    regenerations_queued: int = 0
+    has_more: bool = False
+    next_delay_seconds: float = 0.0
+
+
+def _setting_number(name: str, default: float) -> float:
+    try:
+        return float(getattr(settings, name, default))
+    except (TypeError, ValueError):
+        return float(default)
+
+
+def recalculation_chunk_size() -> int:
+    return max(1, int(_setting_number("MEAL_PLAN_RECALCULATION_CHUNK_SIZE", 200)))
+
+
+def recalculation_chunk_pause_seconds() -> float:
+    return max(0.0, _setting_number("MEAL_PLAN_RECALCULATION_CHUNK_PAUSE_SECONDS", 5))
+
+
+def regeneration_interval_seconds() -> float:
+    per_minute = _setting_number("MEAL_PLAN_RECALCULATION_REGENERATIONS_PER_MINUTE", 20)
+    return 60.0 / per_minute if per_minute > 0 else 0.0
+
+
+def affected_client_profiles(admin_identity):
+    return ClientProfile.objects.filter(associated_admin=admin_identity, is_active=True)
+
+
+def _meal_split_grams(day_payload_splits) -> tuple[tuple[int, float, float, float], ...] | None:
+    if not isinstance(day_payload_splits, list):
+        return None
+    grams = []
+    for split in day_payload_splits:
+        split_grams = (split or {}).get("grams") or {}
+        grams.append(
+            (
+                int(split.get("meal_number") or 0),
+                split_grams.get("protein_g"),
+                split_grams.get("carbs_g"),
+                split_grams.get("fats_g"),
+            )
+        )
+    return tuple(grams)
+
+
+def _generated_meal_splits_by_day(user_ids: list[int]) -> dict[int, dict[str, Any]]:
+    """
+    Meal splits each client's current plan was generated from: the day payload
+    of the newest completed job per (user, day). Days never generated are absent;
+    days whose snapshot no longer holds the splits (compacted or older jobs) map to
+    None and are left alone, since there is nothing to compare against.
+    """
+    rows = (
+        ClientMealPlanGenerationJob.objects.filter(user_id__in=user_ids, status="completed")
+        .order_by("user_id", "day_of_week", "-created_at", "-id")
+        .values_list("user_id", "day_of_week", "input_snapshot_json__day_payload__meal_macro_splits")
+    )
+    splits_by_user: dict[int, dict[str, Any]] = {}
+    for user_id, day, splits in rows:
+        splits_by_user.setdefault(user_id, {}).setdefault(day, _meal_split_grams(splits))
+    return splits_by_user
+
+
+def _is_superseded(job: ClientMacroRecalculationJob) -> bool:
+    return ClientMacroRecalculationJob.objects.filter(admin_id=job.admin_id, id__gt=job.id).exists()
+
+
+def _finish(job: ClientMacroRecalculationJob, status: str, error_message: str = "") -> None:
+    job.status = status
+    job.error_message = error_message
+    job.completed_at = timezone.now()
+    job.save(update_fields=["status", "error_message", "completed_at", "updated_at"])
+
+
+def recalculate_profiles(job: ClientMacroRecalculationJob, profiles: list[ClientProfile]) -> RecalculationChunkResult:
+    """
+    Recompute results for one chunk of clients with the batch calculator and
+    queue regeneration of the days whose meal split grams no longer match the
+    ones their current plan was generated from. Regenerations are staggered
+    `regeneration_interval_seconds()` apart so the solver queue keeps room for
+    interactive requests.
+    """
+    result = RecalculationChunkResult(job_id=job.id, status=job.status)
+    progress_by_user = {
+        progress.user_id: progress
+        for progress in ClientQuestionnaireProgress.objects.filter(
+            user_id__in=[profile.user_id for profile in profiles],
+            status="completed",
+        )
+    }
+    candidates = [profile for profile in profiles if profile.user_id in progress_by_user]
+    result.clients_skipped = len(profiles) - len(candidates)
+
+    batch = build_questionnaire_results_batch(
+        [
+            BuildResultsContext(
+                answers=progress_by_user[profile.user_id].answers_json or {},
+                admin_identity=profile.associated_admin,
+            )
+            for profile in candidates
+        ]
+    )
+    generated_splits = _generated_meal_splits_by_day([profile.user_id for profile in candidates])
+    interval = regeneration_interval_seconds()
+
+    for index, profile in enumerate(candidates):
+        if not batch.valid[index]:
+            result.clients_skipped += 1
+            continue
+        current = generated_splits.get(profile.user_id) or {}
+        changed_days = [
+            day
+            for day_index, day in enumerate(WEEK_DAYS)
+            if current.get(day) is not None and current[day] != batch.meal_split_grams(index, day_index)
+        ]
+        if not changed_days:
+            continue
+
+        launch_full_generation_for_week_background(
+            profile.user,
+            days=changed_days,
+            countdown=result.regenerations_queued * interval or None,
+        )
+        job.changed_days_json[str(profile.user_id)] = changed_days
+        result.clients_changed += 1
+        result.days_changed += len(changed_days)
+        result.regenerations_queued += 1
+
+    result.clients_processed = len(profiles)
+    result.next_delay_seconds = max(recalculation_chunk_pause_seconds(), result.regenerations_queued * interval)
+    return result
+
+
+def run_macro_recalculation_chunk(job_id: int, *, chunk_size: int | None = None) -> RecalculationChunkResult:
+    """
+    Process the next chunk of a recalculation job and record its progress.
+    `has_more` tells the caller to schedule another chunk after `next_delay_seconds`.
+    """
+    job = ClientMacroRecalculationJob.objects.filter(id=job_id).select_related("admin").first()
+    if job is None:
+        return RecalculationChunkResult(job_id=job_id, status="failed")
+    if job.status not in ACTIVE_RECALCULATION_STATUSES:
+        return RecalculationChunkResult(job_id=job.id, status=job.status)
+    if _is_superseded(job):
+        _finish(job, "failed", SUPERSEDED_MESSAGE)
+        return RecalculationChunkResult(job_id=job.id, status=job.status)
+
+    profiles_qs = affected_client_profiles(job.admin)
+    if job.status == "pending":
+        job.status = "running"
+        job.started_at = timezone.now()
+        job.clients_total = profiles_qs.count()
+        job.admin_parameters_version = get_table_version(ADMIN_PARAMETERS)
+        job.save(update_fields=["status", "started_at", "clients_total", "admin_parameters_version", "updated_at"])
+
+    profiles = list(
+        profiles_qs.filter(id__gt=job.last_profile_id)
+        .select_related("user", "associated_admin")
+        .order_by("id")[: chunk_size or recalculation_chunk_size()]
+    )
+    if not profiles:
+        _finish(job, "completed")
+        return RecalculationChunkResult(job_id=job.id, status=job.status)
+
+    result = recalculate_profiles(job, profiles)
+    job.last_profile_id = profiles[-1].id
+    job.clients_processed += result.clients_processed
+    job.clients_skipped += result.clients_skipped
+    job.clients_changed += result.clients_changed
+    job.days_changed += result.days_changed
+    job.regenerations_queued += result.regenerations_queued
+    job.save(
+        update_fields=[
+            "last_profile_id",
+            "clients_processed",
+            "clients_skipped",
+            "clients_changed",
+            "days_changed",
+            "regenerations_queued",
+            "changed_days_json",
+            "updated_at",
+        ]
+    )
+    result.status = job.status
+    result.has_more = profiles_qs.filter(id__gt=job.last_profile_id).exists()
+    if not result.has_more:
+        _finish(job, "completed")
+        result.status = job.status
+    return result
+
+
+def run_macro_recalculation(job_id: int, *, chunk_size: int | None = None) -> ClientMacroRecalculationJob:
+    """Run every chunk inline, without pauses (tests and shell use)."""
+    while run_macro_recalculation_chunk(job_id, chunk_size=chunk_size).has_more:
+        pass
+    return ClientMacroRecalculationJob.objects.get(id=job_id)
+
+
+def fail_macro_recalculation(job_id: int, error_message: str) -> None:
+    job = ClientMacroRecalculationJob.objects.filter(id=job_id, status__in=ACTIVE_RECALCULATION_STATUSES).first()
+    if job is not None:
+        _finish(job, "failed", error_message)
+
+
+def _dispatch_macro_recalculation(job_id: int) -> None:
+    # Lazy import keeps request code free of task import side effects.
+    try:
+        from users.client_area.tasks import run_macro_recalculation_task
+    except ModuleNotFoundError as exc:
+        if "celery" not in str(exc).lower():
+            raise
+        # Never run inline: this is the admin's save request, and every changed
+        # day would be regenerated before it returns.
+        fail_macro_recalculation(job_id, CELERY_UNAVAILABLE_MESSAGE)
+        return
+    async_result = run_macro_recalculation_task.apply_async(kwargs={"job_id": job_id})
+    ClientMacroRecalculationJob.objects.filter(id=job_id).update(task_id=async_result.id or "", updated_at=timezone.now())
+
+
+def start_macro_recalculation(admin_identity, *, trigger: str = "manual") -> ClientMacroRecalculationJob:
+    """
+    Queue a recalculation of every active client of `admin_identity`. The task
+    is sent once the surrounding transaction commits so it reads the new
+    parameter rows; an older job still running for the same admin stops at
+    its next chunk.
+    """
+    job = ClientMacroRecalculationJob.objects.create(admin=admin_identity, trigger=trigger)
+    transaction.on_commit(lambda: _dispatch_macro_recalculation(job.id))
+    return job
+
+
+def macro_recalculation_payload(job: ClientMacroRecalculationJob | None) -> dict[str, Any] | None:
+    if job is None:
+        return None
+    payload = {
+        "job_id": job.id,
+        "trigger": job.trigger,
+        "status": job.status,
+        "progress_percent": job.progress_percent,
+        "clients_total": job.clients_total,
+        "clients_processed": job.clients_processed,
+        "clients_skipped": job.clients_skipped,
+        "clients_changed": job.clients_changed,
+        "days_changed": job.days_changed,
+        "regenerations_queued": job.regenerations_queued,
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+    return json.loads(json.dumps(payload, cls=DjangoJSONEncoder))
+
+
+def latest_macro_recalculation(admin_identity) -> ClientMacroRecalculationJob | None:
+    return ClientMacroRecalculationJob.objects.filter(admin=admin_identity).order_by("-created_at", "-id").first()
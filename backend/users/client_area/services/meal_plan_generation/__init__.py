@@ -1,7 +1,9 @@
 from .runner import (
     get_generated_meal_day_detail,
+    get_generated_meal_week_detail,
     get_generation_week_batch_status,
     get_generation_job_snapshot,
+    iter_generated_meal_week_detail,
     launch_full_generation_for_week_background,
     run_full_generation_for_day,
     run_full_generation_for_week,
@@ -16,4 +18,6 @@ __all__ = [
     "get_generation_week_batch_status",
     "get_generation_job_snapshot",
     "get_generated_meal_day_detail",
+    "get_generated_meal_week_detail",
+    "iter_generated_meal_week_detail",
 ]
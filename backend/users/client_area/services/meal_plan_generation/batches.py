@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from users.client_area.models import ClientMealPlanGenerationBatch
+
+from .progress_events import summarize_batch_status
+
+
+def queued_day_summary(day: str) -> dict[str, Any]:
+    return {
+        "day_of_week": day,
+        "job_id": None,
+        "status": "queued",
+        "current_step": 0,
+        "progress_percent": 0,
+        "generated_meal_count": 0,
+    }
+
+
+def batch_day_summary(job, generated_meal_count: int = 0) -> dict[str, Any]:
+    """Per-day row of the batch status payload; stored JSON-ready on the batch record."""
+    summary = {
+        "day_of_week": job.day_of_week,
+        "job_id": job.id,
+        "status": job.status,
+        "current_step": job.current_step,
+        "progress_percent": job.progress_percent,
+        "generated_meal_count": generated_meal_count if job.status == "completed" else 0,
+        "error_message": job.error_message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+    return json.loads(json.dumps(summary, cls=DjangoJSONEncoder))
+
+
+def apply_batch_counters(batch: ClientMealPlanGenerationBatch) -> None:
+    """Recompute status and counters from `day_jobs_json` (idempotent, so retried days never double count)."""
+    jobs = [batch.day_jobs_json.get(day) or queued_day_summary(day) for day in batch.days_requested]
+    batch.days_total = len(batch.days_requested)
+    batch.days_completed = sum(1 for job in jobs if job["status"] == "completed")
+    batch.days_failed = sum(1 for job in jobs if job["status"] == "failed")
+    batch.generated_meal_count = sum(int(job.get("generated_meal_count") or 0) for job in jobs)
+    batch.status = summarize_batch_status(jobs, batch.days_requested)
+    if batch.started_at is None and any(job["status"] != "queued" for job in jobs):
+        batch.started_at = timezone.now()
+    # A failed day already makes the batch "failed"; it is only finished once no day is still in flight.
+    all_finished = all(job["status"] in ("completed", "failed") for job in jobs)
+    if all_finished and batch.completed_at is None:
+        batch.completed_at = timezone.now()
+
+
+def create_generation_batch(user, batch_id: str, days: list[str], *, batch_mode: str = "week", task_id: str = ""):
+    batch, created = ClientMealPlanGenerationBatch.objects.get_or_create(
+        batch_id=batch_id,
+        defaults={
+            "user": user,
+            "batch_mode": batch_mode,
+            "task_id": task_id,
+            "days_requested": list(days),
+            "days_total": len(days),
+        },
+    )
+    if not created and task_id and batch.task_id != task_id:
+        batch.task_id = task_id
+        batch.save(update_fields=["task_id", "updated_at"])
+    return batch
+
+
+def set_generation_batch_task_id(batch_id: str, task_id: str) -> None:
+    ClientMealPlanGenerationBatch.objects.filter(batch_id=batch_id).update(task_id=task_id or "", updated_at=timezone.now())
+
+
+def record_batch_day(batch_id: str, day: str, summary: dict[str, Any]) -> None:
+    """
+    Store one day's summary on its batch and refresh the aggregate. Runs in its own
+    short transaction holding the batch row lock, so parallel day workers do not
+    overwrite each other's entries.
+    """
+    if not batch_id:
+        return
+    with transaction.atomic():
+        batch = ClientMealPlanGenerationBatch.objects.select_for_update().filter(batch_id=batch_id).first()
+        if batch is None:
+            return
+        day_jobs = dict(batch.day_jobs_json or {})
+        day_jobs[day] = summary
+        batch.day_jobs_json = day_jobs
+        apply_batch_counters(batch)
+        batch.save(
+            update_fields=[
+                "day_jobs_json",
+                "status",
+                "days_total",
+                "days_completed",
+                "days_failed",
+                "generated_meal_count",
+                "started_at",
+                "completed_at",
+                "updated_at",
+            ]
+        )
+
+
+def record_batch_day_on_commit(job, generated_meal_count: int = 0) -> None:
+    """Record a finished day once the job's own transaction has committed."""
+    if not job.batch_id:
+        return
+    summary = batch_day_summary(job, generated_meal_count)
+    transaction.on_commit(lambda: record_batch_day(job.batch_id, job.day_of_week, summary))
+
+
+def batch_status_payload(batch: ClientMealPlanGenerationBatch, requested_days: list[str]) -> dict[str, Any]:
+    day_jobs = batch.day_jobs_json or {}
+    jobs = [day_jobs.get(day) or queued_day_summary(day) for day in requested_days]
+    return {
+        "batch_id": batch.batch_id,
+        "status": summarize_batch_status(jobs, requested_days),
+        "days_requested": requested_days,
+        "days_completed": [job["day_of_week"] for job in jobs if job["status"] == "completed"],
+        "jobs": jobs,
+    }
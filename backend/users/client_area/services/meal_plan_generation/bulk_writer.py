@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+import io
+from itertools import islice
+from typing import Any, Iterable, Sequence
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import AutoField, BigAutoField, SmallAutoField
+from django.utils import timezone
+
+
+BULK_WRITER_COPY = "copy"
+BULK_WRITER_ORM = "orm"
+BULK_WRITER_MODES = (BULK_WRITER_COPY, BULK_WRITER_ORM)
+
+_AUTO_FIELD_TYPES = (AutoField, BigAutoField, SmallAutoField)
+_FROM_ROW, _NOW, _CONSTANT = "row", "now", "constant"
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def bulk_writer_mode() -> str:
+    mode = str(getattr(settings, "MEAL_PLAN_BULK_WRITER", BULK_WRITER_COPY) or "").strip().lower()
+    return mode if mode in BULK_WRITER_MODES else BULK_WRITER_COPY
+
+
+def copy_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+class OrmBulkWriter:
+    """
+    Inserts rows with `bulk_create`. Rows are tuples aligned with `fields`
+    (attribute names such as "job_id"), written `chunk_size` at a time. Writers
+    only insert: callers clear the rows they replace first.
+    """
+
+    def __init__(self, model, fields: Sequence[str], *, chunk_size: int = 5000):
+        self.model = model
+        self.fields = tuple(fields)
+        self.chunk_size = max(1, int(chunk_size))
+
+    def _flush(self, rows: list[tuple]) -> int:
+        objs = [self.model(**dict(zip(self.fields, row))) for row in rows]
+        self.model.objects.bulk_create(objs, batch_size=self.chunk_size)
+        return len(objs)
+
+    def write(self, rows: Iterable[Sequence[Any]]) -> int:
+        total = 0
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return total
+            total += self._flush(chunk)
+
+
+class CopyBulkWriter(OrmBulkWriter):
+    """
+    PostgreSQL writer that streams each chunk through `COPY ... FROM STDIN` from
+    an in-memory buffer. Columns missing from `fields` get their model default,
+    auto_now/auto_now_add columns get the current time, and the auto primary key
+    is left to the database sequence.
+    """
+
+    def __init__(self, model, fields: Sequence[str], **kwargs):
+        super().__init__(model, fields, **kwargs)
+        positions = {name: index for index, name in enumerate(self.fields)}
+        self.columns = []
+        self._sources = []
+        for field in model._meta.concrete_fields:
+            if field.primary_key and isinstance(field, _AUTO_FIELD_TYPES):
+                continue
+            self.columns.append(field.column)
+            if field.attname in positions:
+                self._sources.append((_FROM_ROW, positions[field.attname]))
+            elif getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+                self._sources.append((_NOW, None))
+            else:
+                self._sources.append((_CONSTANT, field.get_default()))
+
+    @staticmethod
+    def _format(value: Any) -> str:
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        if isinstance(value, float):
+            return repr(value)
+        if isinstance(value, (int, Decimal)):
+            return str(value)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return str(value).translate(_COPY_ESCAPES)
+
+    def _buffer(self, rows: list[tuple]) -> io.StringIO:
+        now = timezone.now()
+        fmt = self._format
+        # Constant columns are formatted once per chunk, not once per row.
+        sources = [
+            (kind == _FROM_ROW, value if kind == _FROM_ROW else fmt(now if kind == _NOW else value))
+            for kind, value in self._sources
+        ]
+        buffer = io.StringIO()
+        write = buffer.write
+        for row in rows:
+            write("\t".join(fmt(row[value]) if from_row else value for from_row, value in sources))
+            write("\n")
+        buffer.seek(0)
+        return buffer
+
+    def _copy(self, cursor, table: str, buffer: io.StringIO) -> None:
+        quote = connection.ops.quote_name
+        sql = f"COPY {quote(table)} ({', '.join(quote(column) for column in self.columns)}) FROM STDIN"
+        raw = cursor.cursor
+        if hasattr(raw, "copy_expert"):  # psycopg2
+            raw.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with raw.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+    def _flush(self, rows: list[tuple]) -> int:
+        buffer = self._buffer(rows)
+        with connection.cursor() as cursor:
+            self._copy(cursor, self.model._meta.db_table, buffer)
+        return len(rows)
+
+
+def get_bulk_writer(model, fields: Sequence[str], **kwargs) -> OrmBulkWriter:
+    """
+    COPY on PostgreSQL unless MEAL_PLAN_BULK_WRITER is "orm"; `bulk_create` on
+    every other backend.
+    """
+    if bulk_writer_mode() == BULK_WRITER_COPY and copy_supported():
+        return CopyBulkWriter(model, fields, **kwargs)
+    return OrmBulkWriter(model, fields, **kwargs)
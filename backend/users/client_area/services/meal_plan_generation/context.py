@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from users.client_area.models import ClientProfile, ClientQuestionnaireProgress
+from users.client_area.services.results_engine import results_day_payload
+from users.client_area.services.results_memo import get_or_build_questionnaire_results, questionnaire_results_hash
+
+
+@dataclass(frozen=True)
+class GenerationContext:
+    """
+    Everything a generation run reads about the client before Step1. Built once per
+    day request or once per week batch and passed down to every day.
+    """
+
+    profile: ClientProfile
+    progress: ClientQuestionnaireProgress
+    results: dict[str, Any]
+    results_hash: str
+
+    @property
+    def answers(self) -> dict[str, Any]:
+        return self.progress.answers_json or {}
+
+    @property
+    def parameter_settings(self) -> dict[str, Any]:
+        return self.results.get("parameter_settings") or {}
+
+    def day_payload(self, day: str):
+        return results_day_payload(self.results, day)
+
+
+def build_generation_context(user, results: dict[str, Any] | None = None) -> GenerationContext:
+    """
+    `results` lets a caller that already holds the questionnaire results for this
+    client (e.g. a Celery day task of a week batch) skip the cache lookup.
+    """
+    profile = ClientProfile.objects.filter(user=user).select_related("associated_admin").first()
+    if not profile:
+        raise ValueError("Client profile not found.")
+    progress = ClientQuestionnaireProgress.objects.filter(user=user).first()
+    if not progress or progress.status != "completed":
+        raise ValueError("Complete the questionnaire before generating a meal plan.")
+
+    answers = progress.answers_json or {}
+    admin_identity = profile.associated_admin if profile else None
+    if results is None:
+        results, results_hash = get_or_build_questionnaire_results(answers, admin_identity)
+    else:
+        results_hash = questionnaire_results_hash(answers, admin_identity)
+    if not results:
+        raise ValueError("Could not build macro results from questionnaire answers.")
+
+    return GenerationContext(profile=profile, progress=progress, results=results, results_hash=results_hash)
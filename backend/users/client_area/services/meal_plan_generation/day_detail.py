@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import reduce
+import operator
+from typing import Any, Iterable
+
+from django.db.models import Q
+
+from core.models import FoodLibraryItem
+from users.client_area.models import ClientFoodOverride, ProductImageSubmission
+
+
+# (payload slot key, MealComboTemplate field, ClientMealPlanGeneratedMeal amount field)
+MEAL_SLOT_FIELDS = (
+    ("protein_1", "protein_slot_1", "protein1_total"),
+    ("protein_2", "protein_slot_2", "protein2_total"),
+    ("carbs_1", "carb_slot_1", "carbs1_total"),
+    ("carbs_2", "carb_slot_2", "carbs2_total"),
+    ("fats_1", "fat_slot_1", "fats1_total"),
+    ("fats_2", "fat_slot_2", "fats2_total"),
+)
+
+FOOD_NAME_FIELDS = ("name", "display_name", "category", "canonical_category", "canonical_name")
+
+MEASUREMENT_LABELS = {
+    "raw": "Measure raw",
+    "cooked": "Measure cooked",
+    "boiled": "Measure cooked/boiled",
+    "grilled": "Measure cooked/grilled",
+    "baked": "Measure baked",
+    "drained": "Measure drained/cooked",
+    "dry_uncooked": "Measure dry/uncooked",
+    "as_packaged": "As packaged",
+}
+
+
+class ApprovedImageIndex:
+    """
+    Approved ProductImageSubmission rows keyed by (provider, product id) and by barcode.
+    Submissions are indexed in newest-first order and each key keeps its first match,
+    so lookups return the same submission a newest-first linear scan would.
+    """
+
+    def __init__(self, submissions: Iterable[ProductImageSubmission] = ()):
+        self._by_product: dict[tuple[str, str], tuple[int, ProductImageSubmission]] = {}
+        self._by_barcode: dict[str, tuple[int, ProductImageSubmission]] = {}
+        for position, submission in enumerate(submissions):
+            self._by_product.setdefault((submission.provider, submission.provider_product_id), (position, submission))
+            if submission.barcode:
+                self._by_barcode.setdefault(submission.barcode, (position, submission))
+
+    def for_override(self, override):
+        if not override:
+            return None
+        matches = [
+            match
+            for match in (
+                self._by_product.get((override.external_provider, override.external_food_id)),
+                self._by_barcode.get(override.barcode) if override.barcode else None,
+            )
+            if match
+        ]
+        if not matches:
+            return None
+        return min(matches, key=operator.itemgetter(0))[1]
+
+
+@dataclass
+class DayDetailIndexes:
+    foods_by_name: dict[str, FoodLibraryItem] = field(default_factory=dict)
+    overrides_by_category: dict[str, ClientFoodOverride] = field(default_factory=dict)
+    images: ApprovedImageIndex = field(default_factory=ApprovedImageIndex)
+
+
+def _selected_slot_row(day_selected_slot_foods: dict[str, Any], meal_number: int) -> dict[str, Any]:
+    row = day_selected_slot_foods.get(str(meal_number)) or day_selected_slot_foods.get(meal_number) or {}
+    return row if isinstance(row, dict) else {}
+
+
+def selected_name_for_slot(day_selected_slot_foods: dict[str, Any], meal_number: int, slot_key: str, fallback_name: str) -> str:
+    selected = str(_selected_slot_row(day_selected_slot_foods, meal_number).get(slot_key) or "").strip()
+    return selected or (fallback_name or "-")
+
+
+def collect_slot_names(rows, day_selected_slot_foods: dict[str, Any]) -> set[str]:
+    """Names every slot of these generated meals will be rendered with."""
+    names = set()
+    for row in rows:
+        combo = row.combo_template
+        for slot_key, combo_field, _ in MEAL_SLOT_FIELDS:
+            names.add(selected_name_for_slot(day_selected_slot_foods, row.meal_number, slot_key, getattr(combo, combo_field)))
+    return names
+
+
+def _load_foods_by_name(names: set[str]) -> dict[str, FoodLibraryItem]:
+    clean_names = {str(name or "").strip() for name in names}
+    clean_names = {name for name in clean_names if name and name != "-"}
+    if not clean_names:
+        return {}
+
+    name_filter = reduce(operator.or_, (Q(**{f"{field_name}__in": clean_names}) for field_name in FOOD_NAME_FIELDS))
+    foods = FoodLibraryItem.objects.filter(
+        name_filter,
+        is_active=True,
+        approval_status=FoodLibraryItem.ApprovalStatus.APPROVED,
+    ).order_by("source_food_id")
+
+    # Lowest source_food_id wins per name, matching the old full-library scan.
+    foods_by_name = {}
+    for food in foods:
+        for key in FOOD_NAME_FIELDS:
+            clean = str(getattr(food, key) or "").strip()
+            if clean in clean_names and clean not in foods_by_name:
+                foods_by_name[clean] = food
+    return foods_by_name
+
+
+def _load_approved_image_index(overrides: Iterable[ClientFoodOverride]) -> ApprovedImageIndex:
+    product_filters = []
+    barcodes = set()
+    for override in overrides:
+        product_filters.append(Q(provider=override.external_provider, provider_product_id=override.external_food_id))
+        if override.barcode:
+            barcodes.add(override.barcode)
+    if barcodes:
+        product_filters.append(Q(barcode__in=barcodes))
+    if not product_filters:
+        return ApprovedImageIndex()
+
+    submissions = ProductImageSubmission.objects.filter(
+        reduce(operator.or_, product_filters),
+        status=ProductImageSubmission.Status.APPROVED,
+    ).order_by("-created_at", "-id")
+    return ApprovedImageIndex(submissions)
+
+
+def load_day_detail_indexes(user, slot_names: set[str]) -> DayDetailIndexes:
+    """At most three queries, sized by the slots on the plan rather than the library."""
+    overrides_by_category = {}
+    if slot_names:
+        overrides_by_category = {
+            row.canonical_category: row
+            for row in ClientFoodOverride.objects.filter(user=user, active=True, canonical_category__in=slot_names)
+        }
+    return DayDetailIndexes(
+        foods_by_name=_load_foods_by_name(slot_names),
+        overrides_by_category=overrides_by_category,
+        images=_load_approved_image_index(overrides_by_category.values()),
+    )
+
+
+def _measurement_label(state, label):
+    if label:
+        return label
+    return MEASUREMENT_LABELS.get(state or "unknown", "Measurement basis not specified")
+
+
+def build_slot_payload(name: str, amount, indexes: DayDetailIndexes) -> dict[str, Any]:
+    amount_oz = float(amount or 0)
+    override = indexes.overrides_by_category.get(name or "")
+    food = None if override else indexes.foods_by_name.get(str(name or "").strip())
+    approved_image = indexes.images.for_override(override)
+    image_url = ""
+    image_source = ""
+    if approved_image and approved_image.image:
+        image_url = approved_image.image.url
+        image_source = "approved_local"
+    elif override and override.image_url:
+        image_url = override.image_url
+        image_source = "selected_product"
+    preparation_state = (
+        override.preparation_state
+        if override
+        else getattr(food, "preparation_state", "unknown")
+    )
+    measurement_basis_label = _measurement_label(
+        preparation_state,
+        override.measurement_basis_label if override else getattr(food, "measurement_basis_label", ""),
+    )
+    return {
+        "name": override.display_name if override else name or "-",
+        "canonical_name": name or "-",
+        "image_url": image_url,
+        "image_source": image_source,
+        "preparation_state": preparation_state,
+        "measurement_basis_label": measurement_basis_label,
+        "override": {
+            "source_type": override.source_type,
+            "external_provider": override.external_provider,
+            "external_food_id": override.external_food_id,
+            "display_name": override.display_name,
+            "brand_name": override.brand_name,
+            "barcode": override.barcode,
+            "image_url": image_url,
+            "image_source": image_source,
+            "preparation_state": override.preparation_state,
+            "measurement_basis_label": measurement_basis_label,
+        }
+        if override
+        else None,
+        "amount_oz": amount_oz,
+        "amount_g": round(amount_oz * 28.3495, 2),
+    }
+
+
+def build_day_detail_payload(job, rows, indexes: DayDetailIndexes) -> dict[str, Any]:
+    snapshot = job.input_snapshot_json or {}
+    day_payload = snapshot.get("day_payload") or {}
+    training_time = day_payload.get("training_before_meal") or "none"
+    if not rows:
+        return {
+            "job_id": job.id,
+            "day_of_week": job.day_of_week,
+            "training_time": training_time,
+            "meals": [],
+        }
+
+    day_selected_slot_foods = snapshot.get("day_selected_slot_foods") or {}
+    meals = []
+    for row in rows:
+        combo = row.combo_template
+        meals.append(
+            {
+                "meal_number": row.meal_number,
+                "combo_id": row.combo_template_id,
+                "error_code": row.error_code,
+                "slots": {
+                    slot_key: build_slot_payload(
+                        selected_name_for_slot(day_selected_slot_foods, row.meal_number, slot_key, getattr(combo, combo_field)),
+                        getattr(row, amount_field),
+                        indexes,
+                    )
+                    for slot_key, combo_field, amount_field in MEAL_SLOT_FIELDS
+                },
+            }
+        )
+
+    return {
+        "job_id": job.id,
+        "day_of_week": job.day_of_week,
+        "job_status": job.status,
+        "progress_percent": job.progress_percent,
+        "training_time": training_time,
+        "meals_per_day": day_payload.get("meals_per_day"),
+        "meals": meals,
+    }
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.services.cache_counters import hit_rate_stats, increment_counter, reset_counters
+from core.services.table_versions import COMBO_ERRORS, FOOD_LIBRARY, MEAL_COMBOS, get_table_version
+from users.client_area.models import ClientFoodOverride, ClientMealPlanGeneratedMeal, ClientMealPlanGenerationJob
+
+from .bulk_writer import get_bulk_writer
+
+
+GENERATION_CACHE_HITS_KEY = "meal_plan:generation_cache:hits"
+GENERATION_CACHE_MISSES_KEY = "meal_plan:generation_cache:misses"
+GENERATION_CACHE_BYPASS_KEY = "meal_plan:generation_cache:bypass"
+
+GENERATED_MEAL_COPY_FIELDS = (
+    "day_of_week",
+    "meal_number",
+    "combo_template_id",
+    "error_code",
+    "protein1_total",
+    "protein2_total",
+    "carbs1_total",
+    "carbs2_total",
+    "fats1_total",
+    "fats2_total",
+)
+GENERATED_MEAL_DEFAULTS = {
+    name: ClientMealPlanGeneratedMeal._meta.get_field(name).get_default() for name in GENERATED_MEAL_COPY_FIELDS
+}
+
+
+def _default_algorithm_version() -> str:
+    return ClientMealPlanGenerationJob._meta.get_field("algorithm_version").default
+
+
+def _food_override_fingerprint(user) -> list[list[str]]:
+    # Overrides change the macros the solver uses, so edits must change the key.
+    return [
+        [str(override_id), updated_at.isoformat() if updated_at else ""]
+        for override_id, updated_at in ClientFoodOverride.objects.filter(user=user)
+        .order_by("id")
+        .values_list("id", "updated_at")
+    ]
+
+
+def compute_generation_cache_key(
+    *,
+    user,
+    day_payload: dict[str, Any],
+    day_selected_slot_foods: dict[str, Any],
+    algorithm_version: str | None = None,
+) -> str:
+    key_material = {
+        "day_payload": day_payload or {},
+        "day_selected_slot_foods": day_selected_slot_foods or {},
+        "food_overrides": _food_override_fingerprint(user),
+        "table_versions": {
+            COMBO_ERRORS: get_table_version(COMBO_ERRORS),
+            MEAL_COMBOS: get_table_version(MEAL_COMBOS),
+            FOOD_LIBRARY: get_table_version(FOOD_LIBRARY),
+        },
+        "algorithm_version": algorithm_version or _default_algorithm_version(),
+    }
+    encoded = json.dumps(key_material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def generation_cache_enabled() -> bool:
+    if not getattr(settings, "MEAL_PLAN_GENERATION_CACHE_ENABLED", True):
+        return False
+    return not cache.get(GENERATION_CACHE_BYPASS_KEY, False)
+
+
+def set_generation_cache_bypass(bypass: bool) -> None:
+    """Superadmin switch that forces every generation to rerun Steps 1-10."""
+    if bypass:
+        cache.set(GENERATION_CACHE_BYPASS_KEY, True, timeout=None)
+    else:
+        cache.delete(GENERATION_CACHE_BYPASS_KEY)
+
+
+def find_cached_generation_job(user, cache_key: str, *, exclude_job_id: int | None = None):
+    if not cache_key:
+        return None
+    queryset = ClientMealPlanGenerationJob.objects.filter(
+        user=user,
+        generation_cache_key=cache_key,
+        status="completed",
+        generated_meals__isnull=False,
+    )
+    if exclude_job_id:
+        queryset = queryset.exclude(id=exclude_job_id)
+    return queryset.order_by("-completed_at", "-id").first()
+
+
+def write_generated_meals(job, rows: Iterable[dict[str, Any]]) -> int:
+    """
+    Persist generated meal rows for `job` through the bulk writer (COPY on
+    PostgreSQL). Each row maps GENERATED_MEAL_COPY_FIELDS names to values;
+    missing ones fall back to the model defaults.
+    """
+    writer = get_bulk_writer(ClientMealPlanGeneratedMeal, ("job_id", "user_id", *GENERATED_MEAL_COPY_FIELDS))
+    return writer.write(
+        (job.id, job.user_id, *(row.get(name, GENERATED_MEAL_DEFAULTS.get(name)) for name in GENERATED_MEAL_COPY_FIELDS))
+        for row in rows
+    )
+
+
+def clone_generated_meals(source_job, target_job) -> int:
+    rows = ClientMealPlanGeneratedMeal.objects.filter(job=source_job).values(*GENERATED_MEAL_COPY_FIELDS)
+    return write_generated_meals(target_job, rows)
+
+
+def record_generation_cache_hit() -> None:
+    increment_counter(GENERATION_CACHE_HITS_KEY)
+
+
+def record_generation_cache_miss() -> None:
+    increment_counter(GENERATION_CACHE_MISSES_KEY)
+
+
+def get_generation_cache_stats() -> dict[str, Any]:
+    return {
+        "enabled": bool(getattr(settings, "MEAL_PLAN_GENERATION_CACHE_ENABLED", True)),
+        "bypass": bool(cache.get(GENERATION_CACHE_BYPASS_KEY, False)),
+        **hit_rate_stats(GENERATION_CACHE_HITS_KEY, GENERATION_CACHE_MISSES_KEY),
+    }
+
+
+def reset_generation_cache_stats() -> None:
+    reset_counters(GENERATION_CACHE_HITS_KEY, GENERATION_CACHE_MISSES_KEY)
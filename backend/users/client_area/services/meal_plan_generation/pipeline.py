@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import inspect
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 
 
 class PrivateMealSolverUnavailable(RuntimeError):
@@ -26,6 +31,127 @@ def _load_private_pipeline():
     return private_runner
 
 
-def run_steps_2_to_10_for_day(*, job, day_payload: dict) -> FullPipelineRunResult:
-    private_runner = _load_private_pipeline()
-    return private_runner(job=job, day_payload=day_payload)
+def _load_reference_pipeline():
+    from .reference_solver import run_steps_2_to_10_for_day as reference_runner
+
+    return reference_runner
+
+
+def _runner_accepts_step1_matrix(runner) -> bool:
+    try:
+        parameters = inspect.signature(runner).parameters
+    except (TypeError, ValueError):
+        return False
+    return "step1_matrix" in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values()
+    )
+
+
+SOLVER_BACKEND_PRIVATE = "private"
+SOLVER_BACKEND_REFERENCE = "reference"
+
+
+@dataclass(frozen=True)
+class SolverBackend:
+    """
+    A Steps 2-10 implementation. `loader` returns the runner callable
+    (`runner(*, job, day_payload, step1_matrix=None)`) and raises
+    PrivateMealSolverUnavailable when the code is not installed. `version` is
+    stored as the job's algorithm_version, so cached generations never cross
+    backends.
+    """
+
+    name: str
+    version: str
+    description: str
+    loader: Callable[[], Callable[..., FullPipelineRunResult]]
+
+    def load_runner(self):
+        return self.loader()
+
+    def describe(self) -> dict[str, Any]:
+        try:
+            runner = self.load_runner()
+        except PrivateMealSolverUnavailable:
+            runner = None
+        return {
+            "name": self.name,
+            "version": self.version,
+            "description": self.description,
+            "available": runner is not None,
+            "accepts_step1_matrix": runner is not None and _runner_accepts_step1_matrix(runner),
+        }
+
+
+_SOLVER_BACKENDS: dict[str, SolverBackend] = {}
+
+
+def register_solver_backend(backend: SolverBackend) -> SolverBackend:
+    _SOLVER_BACKENDS[backend.name] = backend
+    return backend
+
+
+register_solver_backend(
+    SolverBackend(
+        name=SOLVER_BACKEND_PRIVATE,
+        version="wp_v1",
+        description="Proprietary WordPress-port solver from backend/private_meal_solver/.",
+        # Looked up at call time so the loader can be swapped in tests.
+        loader=lambda: _load_private_pipeline(),
+    )
+)
+register_solver_backend(
+    SolverBackend(
+        name=SOLVER_BACKEND_REFERENCE,
+        version="reference_v1",
+        description="Deterministic in-process solver for CI, staging and benchmarks; not the production algorithm.",
+        loader=lambda: _load_reference_pipeline(),
+    )
+)
+
+
+def solver_backend_name() -> str:
+    """MEAL_PLAN_SOLVER_BACKEND (private when unset); raises ImproperlyConfigured for unregistered names."""
+    name = str(getattr(settings, "MEAL_PLAN_SOLVER_BACKEND", SOLVER_BACKEND_PRIVATE) or SOLVER_BACKEND_PRIVATE).strip().lower()
+    if name not in _SOLVER_BACKENDS:
+        raise ImproperlyConfigured(
+            f"MEAL_PLAN_SOLVER_BACKEND={name!r} is not a registered solver backend; "
+            f"expected one of: {', '.join(sorted(_SOLVER_BACKENDS))}."
+        )
+    return name
+
+
+def get_solver_backend(name: str | None = None) -> SolverBackend:
+    """Backend named by `name`, or by MEAL_PLAN_SOLVER_BACKEND when `name` is empty."""
+    name = name or solver_backend_name()
+    if name not in _SOLVER_BACKENDS:
+        raise ImproperlyConfigured(f"Unknown solver backend {name!r}.")
+    return _SOLVER_BACKENDS[name]
+
+
+def list_solver_backends() -> list[dict[str, Any]]:
+    return [backend.describe() for backend in _SOLVER_BACKENDS.values()]
+
+
+def solver_accepts_step1_matrix(backend: SolverBackend | None = None) -> bool:
+    """
+    True when the selected Steps 2-10 runner can read the in-memory Step1 matrix
+    instead of ClientMealPlanGenerationStep1Row rows.
+    """
+    try:
+        return _runner_accepts_step1_matrix((backend or get_solver_backend()).load_runner())
+    except PrivateMealSolverUnavailable:
+        return False
+
+
+def run_steps_2_to_10_for_day(
+    *,
+    job,
+    day_payload: dict,
+    step1_matrix=None,
+    backend: SolverBackend | None = None,
+) -> FullPipelineRunResult:
+    runner = (backend or get_solver_backend()).load_runner()
+    if step1_matrix is not None and _runner_accepts_step1_matrix(runner):
+        return runner(job=job, day_payload=day_payload, step1_matrix=step1_matrix)
+    return runner(job=job, day_payload=day_payload)
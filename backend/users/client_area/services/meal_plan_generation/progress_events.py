@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_CHANNEL_PREFIX = "meal_plan:progress"
+TERMINAL_JOB_STATUSES = ("completed", "failed")
+
+_publisher = None
+_publisher_url = None
+_publisher_lock = threading.Lock()
+
+
+def progress_redis_url() -> str:
+    return str(getattr(settings, "MEAL_PLAN_PROGRESS_REDIS_URL", "") or "")
+
+
+def progress_stream_enabled() -> bool:
+    return bool(progress_redis_url())
+
+
+def week_batch_channel(user_id: int, batch_id: str) -> str:
+    return f"{PROGRESS_CHANNEL_PREFIX}:{int(user_id)}:{batch_id}"
+
+
+def summarize_batch_status(jobs: list[dict[str, Any]], requested_days: list[str]) -> str:
+    """Batch status from per-day job rows, shared by the polling endpoint and the event stream."""
+    statuses = [job["status"] for job in jobs]
+    if statuses.count("completed") == len(requested_days):
+        return "completed"
+    if "failed" in statuses:
+        return "failed"
+    if any(status in ("running", "pending", "queued") for status in statuses):
+        return "running"
+    return "pending"
+
+
+def job_progress_event(job, generated_meal_count: int = 0) -> dict[str, Any]:
+    return {
+        "batch_id": job.batch_id,
+        "day_of_week": job.day_of_week,
+        "job_id": job.id,
+        "status": job.status,
+        "current_step": job.current_step,
+        "progress_percent": job.progress_percent,
+        "generated_meal_count": generated_meal_count if job.status == "completed" else 0,
+        "error_message": job.error_message,
+    }
+
+
+def _get_publisher():
+    global _publisher, _publisher_url
+    url = progress_redis_url()
+    if not url:
+        return None
+    with _publisher_lock:
+        if _publisher is None or _publisher_url != url:
+            import redis
+
+            _publisher = redis.Redis.from_url(url)
+            _publisher_url = url
+        return _publisher
+
+
+def _publish(channel: str, event: dict[str, Any]) -> None:
+    publisher = _get_publisher()
+    if publisher is None:
+        return
+    try:
+        publisher.publish(channel, json.dumps(event, cls=DjangoJSONEncoder))
+    except Exception:
+        # Progress events are best-effort; the polling endpoint stays authoritative.
+        logger.warning("Could not publish meal plan progress on %s", channel, exc_info=True)
+
+
+def publish_job_progress(job, *, generated_meal_count: int = 0) -> None:
+    """
+    Push the job's current step/progress to its week batch channel. Jobs outside a
+    batch have no subscribers and are skipped.
+
+    Completed events wait for the surrounding transaction to commit so a client
+    reacting to them can already read the generated meals; running events go out
+    immediately. Failed days are sent by publish_day_failure once the day's
+    transaction has rolled back.
+    """
+    if not job.batch_id or not progress_stream_enabled():
+        return
+    channel = week_batch_channel(job.user_id, job.batch_id)
+    event = job_progress_event(job, generated_meal_count)
+    if job.status == "completed":
+        transaction.on_commit(lambda: _publish(channel, event))
+    else:
+        _publish(channel, event)
+
+
+def publish_day_failure(user_id: int, batch_id: str | None, day: str, error_message: str) -> None:
+    """
+    Failed event for a batch day, sent after its transaction rolled back. This also
+    covers days that fail before their job row exists (no macro schedule, context
+    errors), which would otherwise leave the stream waiting until its timeout.
+    """
+    if not batch_id or not progress_stream_enabled():
+        return
+    _publish(
+        week_batch_channel(user_id, batch_id),
+        {"batch_id": batch_id, "day_of_week": day, "status": "failed", "error_message": error_message},
+    )
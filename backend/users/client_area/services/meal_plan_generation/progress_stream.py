@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, AsyncIterator
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .progress_events import (
+    TERMINAL_JOB_STATUSES,
+    progress_redis_url,
+    summarize_batch_status,
+    week_batch_channel,
+)
+from .runner import _normalize_days, get_generation_week_batch_status
+
+
+def format_sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+async def _subscribe(channel: str):
+    import redis.asyncio as redis_asyncio
+
+    client = redis_asyncio.Redis.from_url(progress_redis_url())
+    pubsub = client.pubsub()
+    await pubsub.subscribe(channel)
+    return client, pubsub
+
+
+async def _close_subscription(client, pubsub, channel: str) -> None:
+    try:
+        await pubsub.unsubscribe(channel)
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
+
+
+def _batch_event(batch_id: str, requested_days: list[str], jobs_by_day: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    jobs = [jobs_by_day[day] for day in requested_days]
+    return {
+        "batch_id": batch_id,
+        "status": summarize_batch_status(jobs, requested_days),
+        "days_requested": requested_days,
+        "days_completed": [job["day_of_week"] for job in jobs if job["status"] == "completed"],
+    }
+
+
+def _all_days_finished(jobs_by_day: dict[str, dict[str, Any]]) -> bool:
+    return all(job["status"] in TERMINAL_JOB_STATUSES for job in jobs_by_day.values())
+
+
+async def stream_week_batch_events(user, batch_id: str, days: list[str] | None = None) -> AsyncIterator[str]:
+    """
+    Server-Sent Events for one week batch.
+
+    Subscribes before reading the batch status so no transition published in
+    between is lost, sends that status once as `snapshot`, then relays the
+    runner's `job` events from Redis and ends with a `batch` event when every
+    requested day has completed or failed. Idle periods send keepalive comments;
+    the stream closes after MEAL_PLAN_PROGRESS_STREAM_TIMEOUT_SECONDS and
+    EventSource reconnects on its own.
+    """
+    requested_days = _normalize_days(days)
+    channel = week_batch_channel(user.id, batch_id)
+    keepalive_seconds = float(getattr(settings, "MEAL_PLAN_PROGRESS_KEEPALIVE_SECONDS", 15))
+    timeout_seconds = float(getattr(settings, "MEAL_PLAN_PROGRESS_STREAM_TIMEOUT_SECONDS", 600))
+
+    client, pubsub = await _subscribe(channel)
+    try:
+        snapshot = await sync_to_async(get_generation_week_batch_status)(user, batch_id, requested_days)
+        yield format_sse("snapshot", snapshot)
+        jobs_by_day = {job["day_of_week"]: job for job in snapshot["jobs"]}
+        if _all_days_finished(jobs_by_day):
+            yield format_sse("batch", _batch_event(batch_id, requested_days, jobs_by_day))
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        while (remaining := deadline - loop.time()) > 0:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=min(keepalive_seconds, remaining))
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            event = json.loads(message["data"])
+            day = event.get("day_of_week")
+            if day not in jobs_by_day:
+                continue
+            jobs_by_day[day] = {**jobs_by_day[day], **event}
+            yield format_sse("job", event)
+            if _all_days_finished(jobs_by_day):
+                yield format_sse("batch", _batch_event(batch_id, requested_days, jobs_by_day))
+                return
+    finally:
+        await _close_subscription(client, pubsub, channel)
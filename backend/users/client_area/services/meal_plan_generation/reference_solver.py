@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+from core.models import FoodLibraryItem, MealComboTemplate
+from core.services.meal_combo_index import MEAL_COMBO_SLOT_KEYS, MealComboIndex, get_meal_combo_index
+from core.services.meal_combo_lookup import normalize_many_slots_to_supported_combo_values
+from core.services.meal_combo_shape_policy import preferred_combo_shape_for_meal
+
+from .generation_cache import write_generated_meals
+from .pipeline import FullPipelineRunResult
+from .step1 import Step1Matrix, Step1MealColumns, compute_step1_matrix
+
+
+# (macro group, Step1 residual column, FoodLibraryItem macro field, slot 1/2 template fields, split fields, amount fields)
+MACRO_GROUPS = (
+    ("protein", "pro_negative", "protein", ("protein_slot_1", "protein_slot_2"), ("protein_split_1", "protein_split_2"), ("protein1_total", "protein2_total")),
+    ("carbs", "carbs_negative", "carbs", ("carb_slot_1", "carb_slot_2"), ("carb_split_1", "carb_split_2"), ("carbs1_total", "carbs2_total")),
+    ("fats", "fats_negative", "fats", ("fat_slot_1", "fat_slot_2"), ("fat_split_1", "fat_split_2"), ("fats1_total", "fats2_total")),
+)
+AMOUNT_QUANTUM = Decimal("0.000001")
+
+
+def _best_error_index(columns: Step1MealColumns) -> int:
+    """Error code with the smallest total residual; the lowest code wins ties."""
+    best_index, best_total = 0, None
+    for index, residuals in enumerate(zip(columns.pro_negative, columns.carbs_negative, columns.fats_negative)):
+        total = sum(residuals)
+        if best_total is None or total < best_total:
+            best_index, best_total = index, total
+    return best_index
+
+
+def _pick_combo(index: MealComboIndex, selected_slots: dict[str, str], meal_target: dict[str, float]) -> MealComboTemplate:
+    """
+    Narrow by each selected slot value that still leaves candidates, then by the
+    preferred one-protein/one-carb shape, and take the lowest combo_id.
+    """
+    mask = index.all_mask
+    for slot_key in MEAL_COMBO_SLOT_KEYS:
+        value = selected_slots.get(slot_key)
+        if value:
+            narrowed = mask & index.mask(slot_key, (value,))
+            mask = narrowed or mask
+
+    shape = preferred_combo_shape_for_meal(meal_target)
+    for slot_key, preferred in (("protein_2", shape.preferred_protein_slot_2), ("carbs_2", shape.preferred_carb_slot_2)):
+        if preferred == "-":
+            mask = (mask & index.mask(slot_key, ("-",))) or mask
+    return index.first(mask)
+
+
+def _slot_shares(combo: MealComboTemplate, slot_fields: tuple[str, str], split_fields: tuple[str, str]) -> tuple[Decimal, Decimal]:
+    has_second = getattr(combo, slot_fields[1]) not in ("", "-")
+    split_1, split_2 = (getattr(combo, field) for field in split_fields)
+    if split_1 is None:
+        split_1 = Decimal("50") if has_second else Decimal("100")
+    if split_2 is None:
+        split_2 = Decimal("100") - split_1 if has_second else Decimal("0")
+    return split_1 / 100, split_2 / 100
+
+
+def _macro_density(foods: dict[str, FoodLibraryItem], name: str, macro_field: str) -> Decimal:
+    food = foods.get(name)
+    return Decimal(str(getattr(food, macro_field))) if food is not None else Decimal("0")
+
+
+def _load_foods_by_category(names: set[str]) -> dict[str, FoodLibraryItem]:
+    foods = {}
+    for food in FoodLibraryItem.objects.filter(category__in=names, is_active=True).order_by("source_food_id"):
+        foods.setdefault(food.category, food)
+    return foods
+
+
+def run_steps_2_to_10_for_day(*, job, day_payload: dict[str, Any], step1_matrix: Step1Matrix | None = None) -> FullPipelineRunResult:
+    """
+    Deterministic stand-in for the private Steps 2-10, used for CI, staging and
+    load tests. Per meal it takes the Step1 error code with the smallest total
+    residual, picks a combo honouring the client's slot selections and the
+    preferred combo shape, and converts each residual macro into ounces of the
+    slot's food using the combo splits and the food library macros per ounce.
+    Slots without a food library row get a zero amount.
+    """
+    matrix = step1_matrix if step1_matrix is not None else compute_step1_matrix(day_payload)
+    index = get_meal_combo_index()
+    if not len(index):
+        raise ValueError("Meal combo table is empty.")
+
+    meal_numbers = matrix.meal_numbers()
+    selected_by_meal = (job.input_snapshot_json or {}).get("day_selected_slot_foods") or {}
+    selected_rows = normalize_many_slots_to_supported_combo_values(
+        [selected_by_meal.get(str(meal_number)) or {} for meal_number in meal_numbers]
+    )
+
+    picks = []
+    for meal_number, selected_slots in zip(meal_numbers, selected_rows):
+        columns = matrix.meals[meal_number]
+        meal_target = {"protein": columns.target_protein, "carbs": columns.target_carbs, "fats": columns.target_fats}
+        picks.append((meal_number, columns, _best_error_index(columns), _pick_combo(index, selected_slots, meal_target)))
+
+    names = {getattr(combo, field) for *_, combo in picks for group in MACRO_GROUPS for field in group[3]}
+    foods = _load_foods_by_category(names - {"", "-"})
+
+    rows = []
+    for meal_number, columns, error_index, combo in picks:
+        row = {
+            "day_of_week": job.day_of_week,
+            "meal_number": meal_number,
+            "combo_template_id": combo.combo_id,
+            "error_code": matrix.error_codes[error_index],
+        }
+        for _, residual_column, macro_field, slot_fields, split_fields, amount_fields in MACRO_GROUPS:
+            residual = Decimal(str(getattr(columns, residual_column)[error_index]))
+            for share, slot_field, amount_field in zip(_slot_shares(combo, slot_fields, split_fields), slot_fields, amount_fields):
+                density = _macro_density(foods, getattr(combo, slot_field), macro_field)
+                amount = residual * share / density if density > 0 else Decimal("0")
+                row[amount_field] = amount.quantize(AMOUNT_QUANTUM)
+        rows.append(row)
+
+    generated = write_generated_meals(job, rows)
+    return FullPipelineRunResult(
+        generated_meal_count=generated,
+        selected_candidate_count=len(picks),
+        step1_row_count=matrix.row_count,
+        note="Generated with the reference solver backend.",
+    )
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import reduce
+import operator
+from typing import Any, Iterable
+
+from django.db.models import Q
+
+from core.services.table_versions import FOOD_LIBRARY, MEAL_COMBOS, get_table_version
+from users.client_area.models import (
+    ClientFoodOverride,
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanRenderedDay,
+)
+
+from .day_detail import DayDetailIndexes, build_day_detail_payload, collect_slot_names, load_day_detail_indexes
+
+
+def _rendered_source_version() -> str:
+    # Food and combo edits change slot labels/measurement basis for every client at once,
+    # so they are checked by version on read instead of deleting every rendered row.
+    return f"{get_table_version(FOOD_LIBRARY)}:{get_table_version(MEAL_COMBOS)}"
+
+
+def render_day_details(user_id: int, jobs: list) -> dict[int, dict[str, Any]]:
+    """
+    Render several of one client's jobs with a single generated-meal query and one
+    shared set of food/override/image indexes.
+    """
+    rows_by_job = defaultdict(list)
+    for row in (
+        ClientMealPlanGeneratedMeal.objects.filter(job__in=jobs)
+        .select_related("combo_template")
+        .order_by("job_id", "meal_number")
+    ):
+        rows_by_job[row.job_id].append(row)
+
+    slot_names = set()
+    for job in jobs:
+        day_selected_slot_foods = ((job.input_snapshot_json or {}).get("day_selected_slot_foods") or {})
+        slot_names.update(collect_slot_names(rows_by_job.get(job.id, []), day_selected_slot_foods))
+    indexes = load_day_detail_indexes(user_id, slot_names) if slot_names else DayDetailIndexes()
+
+    return {job.id: build_day_detail_payload(job, rows_by_job.get(job.id, []), indexes) for job in jobs}
+
+
+def render_day_detail(job) -> dict[str, Any]:
+    return render_day_details(job.user_id, [job])[job.id]
+
+
+def store_rendered_days(jobs: list, payloads: dict[int, dict[str, Any]]) -> int:
+    """Upsert rendered payloads for completed jobs; other statuses are never stored."""
+    source_version = _rendered_source_version()
+    records = [
+        ClientMealPlanRenderedDay(
+            job=job,
+            user_id=job.user_id,
+            day_of_week=job.day_of_week,
+            payload_json=payloads[job.id],
+            source_version=source_version,
+        )
+        for job in jobs
+        if job.status == "completed" and job.id in payloads
+    ]
+    if records:
+        ClientMealPlanRenderedDay.objects.bulk_create(
+            records,
+            update_conflicts=True,
+            unique_fields=["job"],
+            update_fields=["payload_json", "source_version", "updated_at"],
+        )
+    return len(records)
+
+
+def materialize_rendered_day(job) -> dict[str, Any] | None:
+    if job.status != "completed":
+        return None
+    payload = render_day_detail(job)
+    store_rendered_days([job], {job.id: payload})
+    return payload
+
+
+def fresh_rendered_payload(job) -> dict[str, Any] | None:
+    """Stored payload when `job.rendered_day` (select_related) is current, else None."""
+    try:
+        rendered = job.rendered_day
+    except ClientMealPlanRenderedDay.DoesNotExist:
+        return None
+    if rendered.source_version != _rendered_source_version():
+        return None
+    return rendered.payload_json
+
+
+def get_rendered_day_payload(job) -> dict[str, Any]:
+    """
+    Serve the day detail from ClientMealPlanRenderedDay. Select `rendered_day` with
+    the job so a fresh record costs no extra query; stale or missing records are
+    rebuilt in place.
+    """
+    payload = fresh_rendered_payload(job)
+    if payload is not None:
+        return payload
+    if job.status == "completed":
+        return materialize_rendered_day(job)
+    return render_day_detail(job)
+
+
+def invalidate_rendered_days_for_user(user_id: int) -> int:
+    deleted, _ = ClientMealPlanRenderedDay.objects.filter(user_id=user_id).delete()
+    return deleted
+
+
+def invalidate_rendered_days_for_image_submissions(submissions: Iterable[Any]) -> int:
+    """Drop rendered days of clients whose active overrides point at these products."""
+    product_filters = []
+    for submission in submissions:
+        product_filters.append(Q(external_provider=submission.provider, external_food_id=submission.provider_product_id))
+        if submission.barcode:
+            product_filters.append(Q(barcode=submission.barcode))
+    if not product_filters:
+        return 0
+
+    user_ids = set(
+        ClientFoodOverride.objects.filter(reduce(operator.or_, product_filters), active=True).values_list("user_id", flat=True)
+    )
+    if not user_ids:
+        return 0
+    deleted, _ = ClientMealPlanRenderedDay.objects.filter(user_id__in=user_ids).delete()
+    return deleted
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import time
+
+from django.conf import settings
+from django.db.models import Count, F, Q, Subquery, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+from users.client_area.models import ClientMealPlanGenerationJob, ClientMealPlanGenerationStep1Row
+
+from .step1_partitions import drop_expired_step1_partitions, ensure_step1_partitions
+
+
+TERMINAL_JOB_STATUSES = ("completed", "failed")
+COMPACTED_SNAPSHOT_KEYS = ("profile", "core_calculations", "parameter_settings")
+COMPACTED_DAY_PAYLOAD_KEYS = ("day", "training_before_meal", "meals_per_day")
+
+
+@dataclass
+class RetentionResult:
+    jobs_deleted: int = 0
+    step1_rows_deleted: int = 0
+    snapshots_compacted: int = 0
+    step1_summaries_recorded: int = 0
+    delete_batches: int = 0
+    partitions_created: int = 0
+    partitions_dropped: int = 0
+    dry_run: bool = False
+
+
+def _setting_int(name: str, default: int) -> int:
+    try:
+        return int(getattr(settings, name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _ranked_jobs(**filters):
+    return ClientMealPlanGenerationJob.objects.filter(**filters).annotate(
+        recency=Window(
+            RowNumber(),
+            partition_by=[F("user_id"), F("day_of_week")],
+            order_by=[F("created_at").desc(), F("id").desc()],
+        )
+    )
+
+
+def _ranked_job_ids(keep_latest: int):
+    """Ids of jobs beyond the newest `keep_latest` for their (user, day)."""
+    return _ranked_jobs().filter(recency__gt=keep_latest).values("id")
+
+
+def _live_plan_job_ids():
+    """Ids of the newest completed job per (user, day): the plan the client sees, even after failed reruns."""
+    return _ranked_jobs(status="completed").filter(recency=1).values("id")
+
+
+def expired_jobs(keep_latest: int, cutoff):
+    return ClientMealPlanGenerationJob.objects.filter(
+        id__in=Subquery(_ranked_job_ids(keep_latest)),
+        status__in=TERMINAL_JOB_STATUSES,
+        created_at__lt=cutoff,
+    ).exclude(id__in=Subquery(_live_plan_job_ids()))
+
+
+def compactable_jobs(cutoff):
+    # Every job except the newest per (user, day) and the live plan keeps only what detail/cache reads need.
+    return (
+        ClientMealPlanGenerationJob.objects.filter(
+            id__in=Subquery(_ranked_job_ids(1)),
+            status__in=TERMINAL_JOB_STATUSES,
+            created_at__lt=cutoff,
+        )
+        .exclude(id__in=Subquery(_live_plan_job_ids()))
+        .exclude(input_snapshot_json__has_key="compacted")
+    )
+
+
+def compact_snapshot(snapshot: dict) -> dict:
+    compacted = {key: value for key, value in (snapshot or {}).items() if key not in COMPACTED_SNAPSHOT_KEYS}
+    day_payload = compacted.get("day_payload") or {}
+    compacted["day_payload"] = {key: day_payload[key] for key in COMPACTED_DAY_PAYLOAD_KEYS if key in day_payload}
+    compacted["compacted"] = True
+    return compacted
+
+
+def _pause(seconds: float) -> None:
+    if seconds > 0:
+        time.sleep(seconds)
+
+
+def _delete_step1_rows(row_filter: Q, batch_size: int, pause_seconds: float, result: RetentionResult) -> None:
+    while True:
+        ids = list(
+            ClientMealPlanGenerationStep1Row.objects.filter(row_filter).order_by().values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return
+        deleted, _ = ClientMealPlanGenerationStep1Row.objects.filter(id__in=ids).delete()
+        result.step1_rows_deleted += deleted
+        result.delete_batches += 1
+        _pause(pause_seconds)
+
+
+def _record_step1_summaries(job_filter: Q, batch_size: int, result: RetentionResult) -> None:
+    """Jobs from before step1_summary existed keep their Step1 row count once the rows are gone."""
+    jobs = (
+        ClientMealPlanGenerationJob.objects.filter(job_filter, step1_rows__isnull=False)
+        .exclude(input_snapshot_json__has_key="step1_summary")
+        .annotate(step1_row_count=Count("step1_rows"))
+        .only("id", "input_snapshot_json")
+    )
+    while True:
+        batch = list(jobs[:batch_size])
+        if not batch:
+            return
+        for job in batch:
+            job.input_snapshot_json = {
+                **(job.input_snapshot_json or {}),
+                "step1_summary": {"row_count": job.step1_row_count, "persisted": False, "pruned": True},
+            }
+        ClientMealPlanGenerationJob.objects.bulk_update(batch, ["input_snapshot_json"])
+        result.step1_summaries_recorded += len(batch)
+
+
+def prune_meal_plan_generation(
+    *,
+    keep_latest: int | None = None,
+    batch_size: int | None = None,
+    step1_grace_hours: int | None = None,
+    pause_seconds: float | None = None,
+    dry_run: bool = False,
+) -> RetentionResult:
+    """
+    Apply generation job retention in bounded batches:
+
+    1. on PostgreSQL, attach the next Step1 partitions and drop whole partitions
+       whose jobs are all finished and past the grace period;
+    2. delete completed/failed jobs beyond the newest `keep_latest` per (user, day),
+       removing their Step1 rows first so no single statement touches more than
+       `batch_size` rows;
+    3. drop the remaining Step1 rows of completed jobs older than the grace period;
+    4. compact the snapshots of every remaining job except the newest per (user, day).
+
+    The newest completed job per (user, day) is the client's live plan and is
+    neither deleted nor compacted, even when failed reruns are newer. Running and
+    pending jobs are never touched.
+    """
+    keep_latest = max(1, keep_latest if keep_latest is not None else _setting_int("MEAL_PLAN_RETENTION_KEEP_JOBS_PER_DAY", 3))
+    batch_size = max(1, batch_size if batch_size is not None else _setting_int("MEAL_PLAN_RETENTION_BATCH_SIZE", 5000))
+    grace_hours = step1_grace_hours if step1_grace_hours is not None else _setting_int("MEAL_PLAN_RETENTION_STEP1_GRACE_HOURS", 24)
+    if pause_seconds is None:
+        pause_seconds = float(getattr(settings, "MEAL_PLAN_RETENTION_PAUSE_SECONDS", 0) or 0)
+    cutoff = timezone.now() - timedelta(hours=max(0, grace_hours))
+    result = RetentionResult(dry_run=dry_run)
+
+    if dry_run:
+        expired = expired_jobs(keep_latest, cutoff)
+        result.jobs_deleted = expired.count()
+        result.step1_rows_deleted = ClientMealPlanGenerationStep1Row.objects.filter(
+            Q(job__in=expired) | Q(job__status="completed", job__created_at__lt=cutoff)
+        ).count()
+        result.snapshots_compacted = compactable_jobs(cutoff).exclude(id__in=expired.values("id")).count()
+        return result
+
+    # Row counts of pre-step1_summary jobs are kept before any of their rows go away.
+    _record_step1_summaries(Q(status__in=TERMINAL_JOB_STATUSES, created_at__lt=cutoff), batch_size, result)
+    result.partitions_created = len(ensure_step1_partitions())
+    result.partitions_dropped = len(drop_expired_step1_partitions(cutoff))
+
+    # Job ids are small; Step1 rows under them are deleted in bounded chunks first.
+    job_batch_size = max(1, batch_size // 50)
+    while True:
+        job_ids = list(expired_jobs(keep_latest, cutoff).values_list("id", flat=True)[:job_batch_size])
+        if not job_ids:
+            break
+        _delete_step1_rows(Q(job_id__in=job_ids), batch_size, pause_seconds, result)
+        deleted_jobs = ClientMealPlanGenerationJob.objects.filter(id__in=job_ids).delete()[1].get(
+            ClientMealPlanGenerationJob._meta.label, 0
+        )
+        result.jobs_deleted += deleted_jobs
+        result.delete_batches += 1
+        _pause(pause_seconds)
+
+    _delete_step1_rows(Q(job__status="completed", job__created_at__lt=cutoff), batch_size, pause_seconds, result)
+
+    while True:
+        batch = list(compactable_jobs(cutoff).only("id", "input_snapshot_json")[:batch_size])
+        if not batch:
+            break
+        for job in batch:
+            job.input_snapshot_json = compact_snapshot(job.input_snapshot_json)
+        ClientMealPlanGenerationJob.objects.bulk_update(batch, ["input_snapshot_json"])
+        result.snapshots_compacted += len(batch)
+        _pause(pause_seconds)
+
+    return result
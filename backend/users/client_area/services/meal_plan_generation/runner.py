@@ -1,30 +1,68 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 import uuid
 from typing import Any
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count
 from django.utils import timezone
 
-from core.models import FoodLibraryItem
 from users.client_area.models import (
-    ClientFoodOverride,
     ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationBatch,
     ClientMealPlanGenerationJob,
     ClientMealPlanGenerationStep1Row,
-    ClientProfile,
-    ClientQuestionnaireProgress,
-    ProductImageSubmission,
 )
-from users.client_area.services.results_engine import BuildResultsContext, build_questionnaire_results
 
-from .step1 import build_step1_rows_for_day
-from .pipeline import run_steps_2_to_10_for_day
+from .batches import (
+    batch_day_summary,
+    batch_status_payload,
+    create_generation_batch,
+    queued_day_summary,
+    record_batch_day,
+    record_batch_day_on_commit,
+    set_generation_batch_task_id,
+)
+from .context import GenerationContext, build_generation_context
+from .generation_cache import (
+    clone_generated_meals,
+    compute_generation_cache_key,
+    find_cached_generation_job,
+    generation_cache_enabled,
+    record_generation_cache_hit,
+    record_generation_cache_miss,
+)
+from .step1 import (
+    STEP1_MODE_IN_MEMORY,
+    STEP1_MODE_PERSISTED,
+    STEP1_MODES,
+    build_step1_rows_for_day,
+    compute_step1_matrix,
+    persist_step1_matrix,
+)
+from .pipeline import SolverBackend, get_solver_backend, run_steps_2_to_10_for_day, solver_accepts_step1_matrix
+from .progress_events import publish_day_failure, publish_job_progress, summarize_batch_status
+from .rendered_day import get_rendered_day_payload, materialize_rendered_day
+from .timings import (
+    TIMING_STEP_CACHE_CLONE,
+    TIMING_STEP_CACHE_LOOKUP,
+    TIMING_STEP_CONTEXT,
+    TIMING_STEP_PERSIST,
+    TIMING_STEP_SOLVER,
+    TIMING_STEP_STEP1,
+    GenerationTimings,
+)
+from .week_detail import build_week_detail, iter_week_detail
 
 
 WEEK_DAYS = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
 MEAL_SLOT_KEYS = ("protein_1", "protein_2", "carbs_1", "carbs_2", "fats_1", "fats_2")
+WEEK_GENERATION_MODE_SERIAL = "serial"
+WEEK_GENERATION_MODE_PARALLEL = "parallel"
+WEEK_GENERATION_MODES = (WEEK_GENERATION_MODE_SERIAL, WEEK_GENERATION_MODE_PARALLEL)
 
 
 @dataclass
@@ -74,31 +112,6 @@ def _normalize_days(days: list[str] | None) -> list[str]:
     return normalized or list(WEEK_DAYS)
 
 
-def _get_client_generation_context(user):
-    profile = ClientProfile.objects.filter(user=user).select_related("associated_admin").first()
-    if not profile:
-        raise ValueError("Client profile not found.")
-    progress = ClientQuestionnaireProgress.objects.filter(user=user).first()
-    if not progress or progress.status != "completed":
-        raise ValueError("Complete the questionnaire before generating a meal plan.")
-    results = build_questionnaire_results(
-        BuildResultsContext(
-            answers=progress.answers_json or {},
-            admin_identity=profile.associated_admin if profile else None,
-        )
-    )
-    if not results:
-        raise ValueError("Could not build macro results from questionnaire answers.")
-    return profile, progress, results
-
-
-def _find_day_payload(results: dict[str, Any], day: str):
-    for row in results.get("weekly_days") or []:
-        if (row or {}).get("day") == day:
-            return row
-    return None
-
-
 def _extract_day_selected_slot_foods_from_answers(answers: dict[str, Any], day: str) -> dict[str, dict[str, str]]:
     food_preferences = ((answers or {}).get("food_preferences") or {}) if isinstance(answers, dict) else {}
     weekly_days = food_preferences.get("weekly_days") if isinstance(food_preferences, dict) else {}
@@ -141,17 +154,55 @@ def _with_optional_batch_snapshot(snapshot: dict[str, Any], batch_id: str | None
     return snapshot
 
 
+def get_week_generation_mode() -> str:
+    mode = str(getattr(settings, "MEAL_PLAN_WEEK_GENERATION_MODE", WEEK_GENERATION_MODE_SERIAL) or "").strip().lower()
+    return mode if mode in WEEK_GENERATION_MODES else WEEK_GENERATION_MODE_SERIAL
+
+
+def _week_generation_max_workers(day_count: int) -> int:
+    try:
+        configured = int(getattr(settings, "MEAL_PLAN_WEEK_MAX_WORKERS", len(WEEK_DAYS)) or len(WEEK_DAYS))
+    except (TypeError, ValueError):
+        configured = len(WEEK_DAYS)
+    return max(1, min(configured, day_count))
+
+
+def _step1_mode() -> str:
+    mode = str(getattr(settings, "MEAL_PLAN_STEP1_MODE", STEP1_MODE_PERSISTED) or "").strip().lower()
+    return mode if mode in STEP1_MODES else STEP1_MODE_PERSISTED
+
+
+def _run_step1_stage(job, day_payload: dict[str, Any], backend: SolverBackend):
+    """
+    Compute the Step1 matrix and decide whether it has to be written to
+    ClientMealPlanGenerationStep1Row. In-memory mode only skips the write when the
+    selected solver can consume the matrix directly and the debug flag is off.
+    """
+    mode = _step1_mode()
+    matrix = compute_step1_matrix(day_payload)
+    persist = (
+        mode != STEP1_MODE_IN_MEMORY
+        or bool(getattr(settings, "MEAL_PLAN_STEP1_PERSIST_DEBUG", False))
+        or not solver_accepts_step1_matrix(backend)
+    )
+    row_count = persist_step1_matrix(job, matrix) if persist else matrix.row_count
+    summary = {"mode": mode, **matrix.summary(persisted=persist)}
+    return row_count, (matrix if mode == STEP1_MODE_IN_MEMORY else None), summary
+
+
 @transaction.atomic
 def run_step1_for_day(user, day_of_week: str | None = None) -> Step1RunResult:
     day = _normalize_day(day_of_week)
-    profile, progress, results = _get_client_generation_context(user)
-    day_payload = _find_day_payload(results, day)
+    timings = GenerationTimings()
+    with timings.step(TIMING_STEP_CONTEXT):
+        context = build_generation_context(user)
+    day_payload = context.day_payload(day)
     if not day_payload:
         raise ValueError(f"No calculated macro schedule found for {day}.")
 
     job = ClientMealPlanGenerationJob.objects.create(
         user=user,
-        client_profile=profile,
+        client_profile=context.profile,
         day_of_week=day,
         status="running",
         current_step=0,
@@ -159,28 +210,32 @@ def run_step1_for_day(user, day_of_week: str | None = None) -> Step1RunResult:
         started_at=timezone.now(),
         input_snapshot_json=_seed_job_input_snapshot(
             day_payload=day_payload,
-            results=results,
-            progress=progress,
-            answers=progress.answers_json or {},
+            results=context.results,
+            progress=context.progress,
+            answers=context.answers,
             day=day,
             note="Only Step1 is currently ported from the WordPress meal generation pipeline.",
         ),
     )
 
     try:
-        row_count = build_step1_rows_for_day(job, day_payload)
+        with timings.step(TIMING_STEP_STEP1) as step1_timing:
+            row_count = build_step1_rows_for_day(job, day_payload)
+            step1_timing.rows_written = row_count
     except Exception as exc:
         job.status = "failed"
         job.error_message = str(exc)
         job.completed_at = timezone.now()
-        job.save(update_fields=["status", "error_message", "completed_at", "updated_at"])
+        job.timings_json = timings.as_dict()
+        job.save(update_fields=["status", "error_message", "completed_at", "timings_json", "updated_at"])
         raise
 
     job.status = "completed"
     job.current_step = 1
     job.progress_percent = 10
     job.completed_at = timezone.now()
-    job.save(update_fields=["status", "current_step", "progress_percent", "completed_at", "updated_at"])
+    job.timings_json = timings.as_dict()
+    job.save(update_fields=["status", "current_step", "progress_percent", "completed_at", "timings_json", "updated_at"])
 
     return Step1RunResult(
         job_id=job.id,
@@ -193,23 +248,137 @@ def run_step1_for_day(user, day_of_week: str | None = None) -> Step1RunResult:
     )
 
 
-@transaction.atomic
+def _complete_job_from_cached_generation(job, source_job, timings: GenerationTimings) -> FullGenerationRunResult:
+    with timings.step(TIMING_STEP_CACHE_CLONE) as clone_timing:
+        generated_meal_count = clone_generated_meals(source_job, job)
+        clone_timing.rows_written = generated_meal_count
+    source_snapshot = source_job.input_snapshot_json or {}
+    pipeline_summary = dict(source_snapshot.get("pipeline_summary") or {})
+    pipeline_summary["generated_meals"] = generated_meal_count
+
+    snapshot = dict(job.input_snapshot_json or {})
+    if source_snapshot.get("step1_summary"):
+        snapshot["step1_summary"] = source_snapshot["step1_summary"]
+    snapshot["pipeline_summary"] = pipeline_summary
+    snapshot["generation_cache"] = {"hit": True, "source_job_id": source_job.id}
+
+    job.status = "completed"
+    job.current_step = 10
+    job.progress_percent = 100
+    job.completed_at = timezone.now()
+    job.input_snapshot_json = snapshot
+    _persist_completed_job(job, timings)
+    publish_job_progress(job, generated_meal_count=generated_meal_count)
+    record_batch_day_on_commit(job, generated_meal_count)
+
+    return FullGenerationRunResult(
+        job_id=job.id,
+        status=job.status,
+        day_of_week=job.day_of_week,
+        row_count=int(pipeline_summary.get("step1_rows") or 0),
+        generated_meal_count=generated_meal_count,
+        current_step=job.current_step,
+        progress_percent=job.progress_percent,
+        note=f"Reused generated meals from job {source_job.id}; inputs were unchanged.",
+    )
+
+
+def _persist_completed_job(job, timings: GenerationTimings) -> None:
+    # Rendering only needs the in-memory status and the meal rows, so it runs before
+    # the final save and the save can carry the complete timings.
+    with timings.step(TIMING_STEP_PERSIST) as persist_timing:
+        persist_timing.rows_written = 1 if materialize_rendered_day(job) is not None else 0
+    job.timings_json = timings.as_dict()
+    job.save(
+        update_fields=[
+            "status",
+            "current_step",
+            "progress_percent",
+            "completed_at",
+            "input_snapshot_json",
+            "timings_json",
+            "updated_at",
+        ]
+    )
+
+
 def run_full_generation_for_day(
     user,
     day_of_week: str | None = None,
     *,
     batch_id: str | None = None,
     batch_mode: str | None = None,
+    context: GenerationContext | None = None,
+    bypass_cache: bool = False,
 ) -> FullGenerationRunResult:
+    """
+    `context` lets week runners share one GenerationContext across every day of
+    the batch; when omitted it is built (or read from the results cache) here.
+
+    Identical requests (same day payload, slot selections, overrides and table
+    versions) reuse the meals of the previous matching job unless `bypass_cache`
+    is set or the generation cache is switched off.
+
+    Batch days are marked running on their ClientMealPlanGenerationBatch before
+    the job transaction starts and marked failed (and published as failed) after
+    it rolls back, so the batch record and event stream still show a day whose
+    job row was discarded or never created.
+    """
     day = _normalize_day(day_of_week)
-    profile, progress, results = _get_client_generation_context(user)
-    day_payload = _find_day_payload(results, day)
+    if batch_id:
+        record_batch_day(batch_id, day, {**queued_day_summary(day), "status": "running"})
+    try:
+        return _run_full_generation_for_day(
+            user,
+            day,
+            batch_id=batch_id,
+            batch_mode=batch_mode,
+            context=context,
+            bypass_cache=bypass_cache,
+        )
+    except Exception as exc:
+        if batch_id:
+            record_batch_day(batch_id, day, {**queued_day_summary(day), "status": "failed", "error_message": str(exc)})
+            publish_day_failure(user.id, batch_id, day, str(exc))
+        raise
+
+
+@transaction.atomic
+def _run_full_generation_for_day(
+    user,
+    day: str,
+    *,
+    batch_id: str | None,
+    batch_mode: str | None,
+    context: GenerationContext | None,
+    bypass_cache: bool,
+) -> FullGenerationRunResult:
+    timings = GenerationTimings()
+    if context is None:
+        with timings.step(TIMING_STEP_CONTEXT):
+            context = build_generation_context(user)
+    day_payload = context.day_payload(day)
     if not day_payload:
         raise ValueError(f"No calculated macro schedule found for {day}.")
 
+    backend = get_solver_backend()
+    use_cache = not bypass_cache and generation_cache_enabled()
+    with timings.step(TIMING_STEP_CACHE_LOOKUP):
+        cache_key = compute_generation_cache_key(
+            user=user,
+            day_payload=day_payload,
+            day_selected_slot_foods=_extract_day_selected_slot_foods_from_answers(context.answers, day),
+            algorithm_version=backend.version,
+        )
+        cached_job = find_cached_generation_job(user, cache_key) if use_cache else None
+
     job = ClientMealPlanGenerationJob.objects.create(
         user=user,
-        client_profile=profile,
+        client_profile=context.profile,
+        algorithm_version=backend.version,
+        generation_cache_key=cache_key,
+        batch_id=batch_id or "",
+        batch_mode=batch_mode or "",
         day_of_week=day,
         status="running",
         current_step=0,
@@ -218,9 +387,9 @@ def run_full_generation_for_day(
         input_snapshot_json=_with_optional_batch_snapshot(
             _seed_job_input_snapshot(
                 day_payload=day_payload,
-                results=results,
-                progress=progress,
-                answers=progress.answers_json or {},
+                results=context.results,
+                progress=context.progress,
+                answers=context.answers,
                 day=day,
                 note="Running full WP-style meal generation port (Steps 1-10).",
             ),
@@ -228,19 +397,37 @@ def run_full_generation_for_day(
             batch_mode=batch_mode,
         ),
     )
+    publish_job_progress(job)
+
+    if cached_job is not None:
+        record_generation_cache_hit()
+        return _complete_job_from_cached_generation(job, cached_job, timings)
+    if use_cache:
+        record_generation_cache_miss()
 
     try:
-        row_count = build_step1_rows_for_day(job, day_payload)
+        with timings.step(TIMING_STEP_STEP1) as step1_timing:
+            row_count, step1_matrix, step1_summary = _run_step1_stage(job, day_payload, backend)
+            step1_timing.rows_written = row_count if step1_summary.get("persisted") else 0
         job.current_step = 1
         job.progress_percent = 10
         job.save(update_fields=["current_step", "progress_percent", "updated_at"])
+        publish_job_progress(job)
 
-        pipeline_result = run_steps_2_to_10_for_day(job=job, day_payload=day_payload)
+        with timings.step(TIMING_STEP_SOLVER) as solver_timing:
+            pipeline_result = run_steps_2_to_10_for_day(
+                job=job,
+                day_payload=day_payload,
+                step1_matrix=step1_matrix,
+                backend=backend,
+            )
+            solver_timing.rows_written = pipeline_result.generated_meal_count
     except Exception as exc:
         job.status = "failed"
         job.error_message = str(exc)
         job.completed_at = timezone.now()
-        job.save(update_fields=["status", "error_message", "completed_at", "updated_at"])
+        job.timings_json = timings.as_dict()
+        job.save(update_fields=["status", "error_message", "completed_at", "timings_json", "updated_at"])
         raise
 
     job.status = "completed"
@@ -248,22 +435,17 @@ def run_full_generation_for_day(
     job.progress_percent = 100
     job.completed_at = timezone.now()
     snapshot = dict(job.input_snapshot_json or {})
+    snapshot["step1_summary"] = step1_summary
     snapshot["pipeline_summary"] = {
         "step1_rows": pipeline_result.step1_row_count,
         "generated_meals": pipeline_result.generated_meal_count,
         "selected_candidates": pipeline_result.selected_candidate_count,
+        "solver_backend": backend.name,
     }
     job.input_snapshot_json = snapshot
-    job.save(
-        update_fields=[
-            "status",
-            "current_step",
-            "progress_percent",
-            "completed_at",
-            "input_snapshot_json",
-            "updated_at",
-        ]
-    )
+    _persist_completed_job(job, timings)
+    publish_job_progress(job, generated_meal_count=pipeline_result.generated_meal_count)
+    record_batch_day_on_commit(job, pipeline_result.generated_meal_count)
 
     return FullGenerationRunResult(
         job_id=job.id,
@@ -277,42 +459,78 @@ def run_full_generation_for_day(
     )
 
 
+def week_generation_job_summary(result: FullGenerationRunResult) -> dict[str, Any]:
+    return {
+        "day_of_week": result.day_of_week,
+        "job_id": result.job_id,
+        "status": result.status,
+        "step1_row_count": result.row_count,
+        "generated_meal_count": result.generated_meal_count,
+        "current_step": result.current_step,
+        "progress_percent": result.progress_percent,
+        "note": result.note,
+    }
+
+
+def _run_full_generation_for_day_in_thread(user, day: str, **kwargs) -> FullGenerationRunResult:
+    try:
+        return run_full_generation_for_day(user, day_of_week=day, **kwargs)
+    finally:
+        # Django connections are per thread; pool threads must not leak them.
+        connections.close_all()
+
+
 def run_full_generation_for_week(
     user,
     days: list[str] | None = None,
     *,
     batch_id: str | None = None,
     batch_mode: str | None = "week",
+    mode: str | None = None,
+    context: GenerationContext | None = None,
 ) -> FullWeekGenerationRunResult:
+    """
+    Generate every requested day from one questionnaire results payload.
+
+    In parallel mode days run on a local thread pool for synchronous callers
+    (Celery batches fan out per-day tasks instead); serial mode keeps the
+    original one-day-at-a-time loop.
+    """
     requested_days = _normalize_days(days)
-    jobs: list[dict[str, Any]] = []
-    completed: list[str] = []
-
-    for day in requested_days:
-        result = run_full_generation_for_day(user, day_of_week=day, batch_id=batch_id, batch_mode=batch_mode)
-        jobs.append(
-            {
-                "day_of_week": result.day_of_week,
-                "job_id": result.job_id,
-                "status": result.status,
-                "step1_row_count": result.row_count,
-                "generated_meal_count": result.generated_meal_count,
-                "current_step": result.current_step,
-                "progress_percent": result.progress_percent,
-                "note": result.note,
-            }
-        )
-        completed.append(result.day_of_week)
+    if batch_id:
+        create_generation_batch(user, batch_id, requested_days, batch_mode=batch_mode or "week")
+    context = context or build_generation_context(user)
+    mode = mode or get_week_generation_mode()
+    day_kwargs = {"batch_id": batch_id, "batch_mode": batch_mode, "context": context}
+
+    if mode == WEEK_GENERATION_MODE_PARALLEL and len(requested_days) > 1:
+        with ThreadPoolExecutor(max_workers=_week_generation_max_workers(len(requested_days))) as executor:
+            futures = [
+                executor.submit(_run_full_generation_for_day_in_thread, user, day, **day_kwargs)
+                for day in requested_days
+            ]
+        day_results = [future.result() for future in futures]
+    else:
+        day_results = [
+            run_full_generation_for_day(user, day_of_week=day, **day_kwargs)
+            for day in requested_days
+        ]
 
     return FullWeekGenerationRunResult(
         days_requested=requested_days,
-        days_completed=completed,
-        jobs=jobs,
+        days_completed=[result.day_of_week for result in day_results],
+        jobs=[week_generation_job_summary(result) for result in day_results],
         note="Completed full-week meal generation using the WP-style Steps 1-10 pipeline for each requested day.",
     )
 
 
-def launch_full_generation_for_week_background(user, days: list[str] | None = None) -> dict[str, Any]:
+def launch_full_generation_for_week_background(
+    user,
+    days: list[str] | None = None,
+    *,
+    countdown: float | None = None,
+) -> dict[str, Any]:
+    """`countdown` delays the Celery batch task (bulk recalculation spreads its regenerations out with it)."""
     requested_days = _normalize_days(days)
     batch_id = str(uuid.uuid4())
     # Lazy import keeps the synchronous generation path free of task import side effects.
@@ -326,9 +544,18 @@ def launch_full_generation_for_week_background(user, days: list[str] | None = No
             ) from exc
         raise
 
-    async_result = run_week_generation_batch_task.apply_async(
-        kwargs={"user_id": int(user.id), "days": requested_days, "batch_id": batch_id}
-    )
+    # Only record the batch once it can actually be dispatched.
+    create_generation_batch(user, batch_id, requested_days)
+    try:
+        async_result = run_week_generation_batch_task.apply_async(
+            kwargs={"user_id": int(user.id), "days": requested_days, "batch_id": batch_id},
+            countdown=countdown,
+        )
+    except Exception:
+        # Broker unreachable: nothing will ever run this batch, so do not leave it reported as pending.
+        ClientMealPlanGenerationBatch.objects.filter(batch_id=batch_id).delete()
+        raise
+    set_generation_batch_task_id(batch_id, async_result.id)
     return {
         "batch_id": batch_id,
         "task_id": async_result.id,
@@ -338,9 +565,19 @@ def launch_full_generation_for_week_background(user, days: list[str] | None = No
 
 
 def get_generation_week_batch_status(user, batch_id: str, days: list[str] | None = None) -> dict[str, Any]:
+    """
+    Batch progress from the ClientMealPlanGenerationBatch record (one read on its
+    unique batch_id). Batches without a record fall back to the latest job per day
+    through the indexed `batch_id` column.
+    """
     requested_days = _normalize_days(days)
+    batch = ClientMealPlanGenerationBatch.objects.filter(user=user, batch_id=batch_id).first()
+    if batch is not None:
+        return batch_status_payload(batch, requested_days)
+
     jobs_qs = (
-        ClientMealPlanGenerationJob.objects.filter(user=user, input_snapshot_json__batch_id=batch_id)
+        ClientMealPlanGenerationJob.objects.filter(user=user, batch_id=batch_id, day_of_week__in=requested_days)
+        .defer("input_snapshot_json")
         .order_by("day_of_week", "-created_at")
     )
     latest_by_day: dict[str, ClientMealPlanGenerationJob] = {}
@@ -348,61 +585,27 @@ def get_generation_week_batch_status(user, batch_id: str, days: list[str] | None
         if job.day_of_week not in latest_by_day:
             latest_by_day[job.day_of_week] = job
 
-    jobs = []
-    days_completed = []
-    any_running = False
-    any_failed = False
-    for day in requested_days:
-        job = latest_by_day.get(day)
-        if not job:
-            jobs.append(
-                {
-                    "day_of_week": day,
-                    "job_id": None,
-                    "status": "queued",
-                    "current_step": 0,
-                    "progress_percent": 0,
-                    "generated_meal_count": 0,
-                }
-            )
-            continue
-
-        generated_count = ClientMealPlanGeneratedMeal.objects.filter(job=job).count() if job.status == "completed" else 0
-        jobs.append(
-            {
-                "day_of_week": day,
-                "job_id": job.id,
-                "status": job.status,
-                "current_step": job.current_step,
-                "progress_percent": job.progress_percent,
-                "generated_meal_count": generated_count,
-                "error_message": job.error_message,
-                "created_at": job.created_at,
-                "started_at": job.started_at,
-                "completed_at": job.completed_at,
-            }
+    completed_job_ids = [job.id for job in latest_by_day.values() if job.status == "completed"]
+    generated_counts = {}
+    if completed_job_ids:
+        generated_counts = dict(
+            ClientMealPlanGeneratedMeal.objects.filter(job_id__in=completed_job_ids)
+            .values("job_id")
+            .annotate(row_count=Count("id"))
+            .values_list("job_id", "row_count")
         )
-        if job.status == "completed":
-            days_completed.append(day)
-        elif job.status == "running" or job.status == "pending":
-            any_running = True
-        elif job.status == "failed":
-            any_failed = True
-
-    if len(days_completed) == len(requested_days):
-        batch_status = "completed"
-    elif any_failed:
-        batch_status = "failed"
-    elif any_running or any(job["status"] == "queued" for job in jobs):
-        batch_status = "running"
-    else:
-        batch_status = "pending"
 
+    jobs = [
+        batch_day_summary(latest_by_day[day], generated_counts.get(latest_by_day[day].id, 0))
+        if day in latest_by_day
+        else queued_day_summary(day)
+        for day in requested_days
+    ]
     return {
         "batch_id": batch_id,
-        "status": batch_status,
+        "status": summarize_batch_status(jobs, requested_days),
         "days_requested": requested_days,
-        "days_completed": days_completed,
+        "days_completed": [job["day_of_week"] for job in jobs if job["status"] == "completed"],
         "jobs": jobs,
     }
 
@@ -417,6 +620,8 @@ def get_generation_job_snapshot(user, job_id: int) -> dict[str, Any] | None:
         return None
 
     step1_qs = ClientMealPlanGenerationStep1Row.objects.filter(job=job)
+    step1_summary = (job.input_snapshot_json or {}).get("step1_summary") or {}
+    step1_row_count = step1_qs.count()
     sample_rows = list(
         step1_qs.order_by("meal_number", "error_code")
         .values("meal_number", "error_code", "pro_negative", "carbs_negative", "fats_negative")[:10]
@@ -451,9 +656,11 @@ def get_generation_job_snapshot(user, job_id: int) -> dict[str, Any] | None:
             "created_at": job.created_at,
             "started_at": job.started_at,
             "completed_at": job.completed_at,
+            "timings": job.timings_json or {},
         },
         "step1": {
-            "row_count": step1_qs.count(),
+            "row_count": step1_row_count or int(step1_summary.get("row_count") or 0),
+            "persisted": bool(step1_row_count) or bool(step1_summary.get("persisted")),
             "sample_rows": sample_rows,
         },
         "generated_meals": {
@@ -466,173 +673,19 @@ def get_generation_job_snapshot(user, job_id: int) -> dict[str, Any] | None:
 
 def get_generated_meal_day_detail(user, day_of_week: str | None = None, job_id: int | None = None) -> dict[str, Any] | None:
     day = _normalize_day(day_of_week)
-    base_qs = ClientMealPlanGenerationJob.objects.filter(user=user, day_of_week=day)
+    base_qs = ClientMealPlanGenerationJob.objects.filter(user=user, day_of_week=day).select_related("rendered_day")
     if job_id is not None:
         job = base_qs.filter(id=job_id).first()
     else:
         job = base_qs.order_by("-created_at").first()
     if not job:
         return None
+    return get_rendered_day_payload(job)
 
-    rows = list(
-        ClientMealPlanGeneratedMeal.objects.filter(job=job)
-        .select_related("combo_template")
-        .order_by("meal_number")
-    )
-    if not rows:
-        return {
-            "job_id": job.id,
-            "day_of_week": day,
-            "training_time": ((job.input_snapshot_json or {}).get("day_payload") or {}).get("training_before_meal") or "none",
-            "meals": [],
-        }
-
-    day_payload = ((job.input_snapshot_json or {}).get("day_payload") or {})
-    training_time = day_payload.get("training_before_meal") or "none"
-    day_selected_slot_foods = ((job.input_snapshot_json or {}).get("day_selected_slot_foods") or {})
-    overrides_by_category = {
-        row.canonical_category: row
-        for row in ClientFoodOverride.objects.filter(user=user, active=True)
-    }
-    food_names = set()
-    for row in rows:
-        combo = row.combo_template
-        food_names.update(
-            {
-                combo.protein_slot_1,
-                combo.protein_slot_2,
-                combo.carb_slot_1,
-                combo.carb_slot_2,
-                combo.fat_slot_1,
-                combo.fat_slot_2,
-            }
-        )
-        selected = day_selected_slot_foods.get(str(row.meal_number)) or day_selected_slot_foods.get(row.meal_number) or {}
-        if isinstance(selected, dict):
-            food_names.update(str(value or "").strip() for value in selected.values())
 
-    food_rows = FoodLibraryItem.objects.filter(
-        is_active=True,
-        approval_status=FoodLibraryItem.ApprovalStatus.APPROVED,
-    )
-    foods_by_category = {}
-    normalized_food_names = {str(name or "").strip() for name in food_names if str(name or "").strip() and str(name or "").strip() != "-"}
-    for food in food_rows:
-        for key in (food.name, food.display_name, food.category, food.canonical_category, food.canonical_name):
-            clean = str(key or "").strip()
-            if clean in normalized_food_names and clean not in foods_by_category:
-                foods_by_category[clean] = food
-
-    approved_images = list(ProductImageSubmission.objects.filter(status=ProductImageSubmission.Status.APPROVED))
-
-    def _approved_image_for_override(override):
-        if not override:
-            return None
-        for submission in approved_images:
-            if (
-                submission.provider == override.external_provider
-                and submission.provider_product_id == override.external_food_id
-            ) or (submission.barcode and submission.barcode == override.barcode):
-                return submission
-        return None
+def get_generated_meal_week_detail(user, days: list[str] | None = None) -> dict[str, Any]:
+    return build_week_detail(user, _normalize_days(days))
 
-    def _generic_food_for_name(name):
-        return foods_by_category.get(str(name or "").strip())
-
-    def _measurement_label(state, label):
-        if label:
-            return label
-        mapping = {
-            "raw": "Measure raw",
-            "cooked": "Measure cooked",
-            "boiled": "Measure cooked/boiled",
-            "grilled": "Measure cooked/grilled",
-            "baked": "Measure baked",
-            "drained": "Measure drained/cooked",
-            "dry_uncooked": "Measure dry/uncooked",
-            "as_packaged": "As packaged",
-        }
-        return mapping.get(state or "unknown", "Measurement basis not specified")
-
-    def selected_name_for_slot(meal_number: int, slot_key: str, fallback_name: str) -> str:
-        row = day_selected_slot_foods.get(str(meal_number)) or day_selected_slot_foods.get(meal_number) or {}
-        if not isinstance(row, dict):
-            row = {}
-        selected = str(row.get(slot_key) or "").strip()
-        return selected or (fallback_name or "-")
-
-    def _slot_payload(name: str, amount):
-        amount_oz = float(amount or 0)
-        override = overrides_by_category.get(name or "")
-        food = None if override else _generic_food_for_name(name)
-        approved_image = _approved_image_for_override(override)
-        image_url = ""
-        image_source = ""
-        if approved_image and approved_image.image:
-            image_url = approved_image.image.url
-            image_source = "approved_local"
-        elif override and override.image_url:
-            image_url = override.image_url
-            image_source = "selected_product"
-        preparation_state = (
-            override.preparation_state
-            if override
-            else getattr(food, "preparation_state", "unknown")
-        )
-        measurement_basis_label = _measurement_label(
-            preparation_state,
-            override.measurement_basis_label if override else getattr(food, "measurement_basis_label", ""),
-        )
-        return {
-            "name": override.display_name if override else name or "-",
-            "canonical_name": name or "-",
-            "image_url": image_url,
-            "image_source": image_source,
-            "preparation_state": preparation_state,
-            "measurement_basis_label": measurement_basis_label,
-            "override": {
-                "source_type": override.source_type,
-                "external_provider": override.external_provider,
-                "external_food_id": override.external_food_id,
-                "display_name": override.display_name,
-                "brand_name": override.brand_name,
-                "barcode": override.barcode,
-                "image_url": image_url,
-                "image_source": image_source,
-                "preparation_state": override.preparation_state,
-                "measurement_basis_label": measurement_basis_label,
-            }
-            if override
-            else None,
-            "amount_oz": amount_oz,
-            "amount_g": round(amount_oz * 28.3495, 2),
-        }
-
-    meals = []
-    for row in rows:
-        combo = row.combo_template
-        meals.append(
-            {
-                "meal_number": row.meal_number,
-                "combo_id": row.combo_template_id,
-                "error_code": row.error_code,
-                "slots": {
-                    "protein_1": _slot_payload(selected_name_for_slot(row.meal_number, "protein_1", combo.protein_slot_1), row.protein1_total),
-                    "protein_2": _slot_payload(selected_name_for_slot(row.meal_number, "protein_2", combo.protein_slot_2), row.protein2_total),
-                    "carbs_1": _slot_payload(selected_name_for_slot(row.meal_number, "carbs_1", combo.carb_slot_1), row.carbs1_total),
-                    "carbs_2": _slot_payload(selected_name_for_slot(row.meal_number, "carbs_2", combo.carb_slot_2), row.carbs2_total),
-                    "fats_1": _slot_payload(selected_name_for_slot(row.meal_number, "fats_1", combo.fat_slot_1), row.fats1_total),
-                    "fats_2": _slot_payload(selected_name_for_slot(row.meal_number, "fats_2", combo.fat_slot_2), row.fats2_total),
-                },
-            }
-        )
 
-    return {
-        "job_id": job.id,
-        "day_of_week": day,
-        "job_status": job.status,
-        "progress_percent": job.progress_percent,
-        "training_time": training_time,
-        "meals_per_day": day_payload.get("meals_per_day"),
-        "meals": meals,
-    }
+def iter_generated_meal_week_detail(user, days: list[str] | None = None):
+    return iter_week_detail(user, _normalize_days(days))
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+from array import array
+from dataclasses import dataclass, field
+from typing import Any, Iterator
 
-from core.models import ComboMacroErrorLookup
+from core.services.combo_error_table import get_combo_error_table
 
 from users.client_area.models import ClientMealPlanGenerationStep1Row
 
+from .bulk_writer import get_bulk_writer
+
+
+STEP1_MODE_PERSISTED = "persisted"
+STEP1_MODE_IN_MEMORY = "in_memory"
+STEP1_MODES = (STEP1_MODE_PERSISTED, STEP1_MODE_IN_MEMORY)
+
 
 def _to_float(value: Any, default: float = 0.0) -> float:
     try:
@@ -14,66 +23,105 @@ def _to_float(value: Any, default: float = 0.0) -> float:
         return float(default)
 
 
-def build_step1_rows_for_day(job, day_payload: dict[str, Any], chunk_size: int = 5000) -> int:
+@dataclass
+class Step1MealColumns:
+    meal_number: int
+    target_protein: float
+    target_carbs: float
+    target_fats: float
+    pro_negative: array = field(default_factory=lambda: array("d"))
+    carbs_negative: array = field(default_factory=lambda: array("d"))
+    fats_negative: array = field(default_factory=lambda: array("d"))
+
+
+@dataclass
+class Step1Matrix:
+    """
+    Column-oriented Step1 result for one day.
+
+    `error_codes` is shared by every meal; each meal holds three float columns
+    aligned with it, so row `i` of meal `m` is
+    (m, error_codes[i], pro_negative[i], carbs_negative[i], fats_negative[i]).
+    """
+
+    error_codes: array
+    meals: dict[int, Step1MealColumns]
+
+    @property
+    def row_count(self) -> int:
+        return len(self.error_codes) * len(self.meals)
+
+    def meal_numbers(self) -> list[int]:
+        return sorted(self.meals.keys())
+
+    def iter_rows(self) -> Iterator[tuple[int, int, float, float, float]]:
+        for meal_number in self.meal_numbers():
+            columns = self.meals[meal_number]
+            for index, error_code in enumerate(self.error_codes):
+                yield (
+                    meal_number,
+                    error_code,
+                    columns.pro_negative[index],
+                    columns.carbs_negative[index],
+                    columns.fats_negative[index],
+                )
+
+    def summary(self, *, persisted: bool) -> dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "error_code_count": len(self.error_codes),
+            "meal_numbers": self.meal_numbers(),
+            "persisted": persisted,
+        }
+
+
+def compute_step1_matrix(day_payload: dict[str, Any]) -> Step1Matrix:
     meal_splits = list(day_payload.get("meal_macro_splits") or [])
     if not meal_splits:
         raise ValueError("No meal macro splits available for selected day.")
 
-    error_rows = list(
-        ComboMacroErrorLookup.objects.values("error_code", "protein_error", "carbs_error", "fats_error").order_by("error_code")
-    )
-    if not error_rows:
+    error_table = get_combo_error_table()
+    if not len(error_table):
         raise ValueError("Combo macro error lookup table is empty.")
 
-    ClientMealPlanGenerationStep1Row.objects.filter(job=job).delete()
-
-    pending = []
-    total_created = 0
+    protein_errors = error_table.protein_errors
+    carbs_errors = error_table.carbs_errors
+    fats_errors = error_table.fats_errors
 
+    meals: dict[int, Step1MealColumns] = {}
     for meal in meal_splits:
         meal_number = int(meal.get("meal_number") or 0)
+        if meal_number < 1:
+            continue
         grams = meal.get("grams") or {}
         target_protein = max(0.0, _to_float(grams.get("protein_g")))
         target_carbs = max(0.0, _to_float(grams.get("carbs_g")))
         target_fats = max(0.0, _to_float(grams.get("fats_g")))
-        if meal_number < 1:
-            continue
-
-        for error_row in error_rows:
-            pro_negative = max(0.0, target_protein - _to_float(error_row.get("protein_error")))
-            carbs_negative = max(0.0, target_carbs - _to_float(error_row.get("carbs_error")))
-            fats_negative = max(0.0, target_fats - _to_float(error_row.get("fats_error")))
-
-            pending.append(
-                ClientMealPlanGenerationStep1Row(
-                    job=job,
-                    meal_number=meal_number,
-                    error_code=int(error_row["error_code"]),
-                    pro_negative=pro_negative,
-                    carbs_negative=carbs_negative,
-                    fats_negative=fats_negative,
-                )
-            )
-
-            if len(pending) >= chunk_size:
-                ClientMealPlanGenerationStep1Row.objects.bulk_create(
-                    pending,
-                    batch_size=chunk_size,
-                    update_conflicts=True,
-                    unique_fields=["job", "meal_number", "error_code"],
-                    update_fields=["pro_negative", "carbs_negative", "fats_negative"],
-                )
-                total_created += len(pending)
-                pending = []
-
-    if pending:
-        ClientMealPlanGenerationStep1Row.objects.bulk_create(
-            pending,
-            batch_size=chunk_size,
-            update_conflicts=True,
-            unique_fields=["job", "meal_number", "error_code"],
-            update_fields=["pro_negative", "carbs_negative", "fats_negative"],
+        meals[meal_number] = Step1MealColumns(
+            meal_number=meal_number,
+            target_protein=target_protein,
+            target_carbs=target_carbs,
+            target_fats=target_fats,
+            pro_negative=array("d", (max(0.0, target_protein - value) for value in protein_errors)),
+            carbs_negative=array("d", (max(0.0, target_carbs - value) for value in carbs_errors)),
+            fats_negative=array("d", (max(0.0, target_fats - value) for value in fats_errors)),
         )
-        total_created += len(pending)
 
-    return total_created
+    return Step1Matrix(error_codes=error_table.error_codes, meals=meals)
+
+
+STEP1_ROW_FIELDS = ("job_id", "meal_number", "error_code", "pro_negative", "carbs_negative", "fats_negative")
+
+
+def persist_step1_matrix(job, matrix: Step1Matrix, chunk_size: int = 5000) -> int:
+    ClientMealPlanGenerationStep1Row.objects.filter(job=job).delete()
+
+    # Rows were just cleared, so a plain insert (COPY on PostgreSQL) replaces the old upsert.
+    writer = get_bulk_writer(ClientMealPlanGenerationStep1Row, STEP1_ROW_FIELDS, chunk_size=chunk_size)
+    job_id = job.id
+    return writer.write((job_id, *row) for row in matrix.iter_rows())
+
+
+def build_step1_rows_for_day(job, day_payload: dict[str, Any], chunk_size: int = 5000) -> int:
+    matrix = compute_step1_matrix(day_payload)
+    return persist_step1_matrix(job, matrix, chunk_size=chunk_size)
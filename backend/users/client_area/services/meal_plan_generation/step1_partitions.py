@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import re
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Max, Min, Q
+
+from users.client_area.models import ClientMealPlanGenerationJob, ClientMealPlanGenerationStep1Row
+
+
+TERMINAL_JOB_STATUSES = ("completed", "failed")
+PARTITION_LOCK_KEY = 0x5354_4550_31  # "STEP1"; serializes partition DDL across workers
+_BOUND_PATTERN = re.compile(r"FROM \((?P<lower>MINVALUE|'?-?\d+'?)\) TO \((?P<upper>MAXVALUE|'?-?\d+'?)\)")
+
+
+@dataclass(frozen=True)
+class Step1Partition:
+    name: str
+    lower: int | None  # None: MINVALUE
+    upper: int | None  # None: MAXVALUE
+    is_default: bool = False
+
+
+def step1_table() -> str:
+    return ClientMealPlanGenerationStep1Row._meta.db_table
+
+
+def partition_job_span() -> int:
+    try:
+        return max(1, int(getattr(settings, "MEAL_PLAN_STEP1_PARTITION_JOB_SPAN", 5000)))
+    except (TypeError, ValueError):
+        return 5000
+
+
+def partitions_ahead() -> int:
+    try:
+        return max(1, int(getattr(settings, "MEAL_PLAN_STEP1_PARTITIONS_AHEAD", 2)))
+    except (TypeError, ValueError):
+        return 2
+
+
+def partition_name(lower: int) -> str:
+    return f"{step1_table()}_p{lower}"
+
+
+def step1_partitioning_enabled() -> bool:
+    """True on PostgreSQL once migration 0025 has turned the Step1 table into a partitioned table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [step1_table()],
+        )
+        return cursor.fetchone() is not None
+
+
+def _parse_bound(value: str) -> int | None:
+    value = value.strip("'")
+    return None if value in ("MINVALUE", "MAXVALUE") else int(value)
+
+
+def parse_partition_bound(name: str, bound: str | None) -> Step1Partition | None:
+    """Read `pg_get_expr(relpartbound)` output such as "FOR VALUES FROM ('0') TO ('5000')"."""
+    if bound == "DEFAULT":
+        return Step1Partition(name=name, lower=None, upper=None, is_default=True)
+    match = _BOUND_PATTERN.search(bound or "")
+    if not match:
+        return None
+    return Step1Partition(name=name, lower=_parse_bound(match["lower"]), upper=_parse_bound(match["upper"]))
+
+
+def list_step1_partitions() -> list[Step1Partition]:
+    if not step1_partitioning_enabled():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid) "
+            "FROM pg_inherits i "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+            [step1_table()],
+        )
+        rows = cursor.fetchall()
+
+    partitions = [partition for partition in (parse_partition_bound(name, bound) for name, bound in rows) if partition]
+    return sorted(partitions, key=lambda row: (row.is_default, row.lower if row.lower is not None else -1))
+
+
+def _create_partition(lower: int, upper: int, default_partition: Step1Partition | None) -> str:
+    """
+    Create and attach [lower, upper). Rows that already landed in the DEFAULT
+    partition for that range are moved first, otherwise ATTACH would be rejected.
+    """
+    quote = connection.ops.quote_name
+    table = quote(step1_table())
+    name = partition_name(lower)
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {quote(name)} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        if default_partition is not None:
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {quote(default_partition.name)} WHERE job_id >= %s AND job_id < %s RETURNING *) "
+                f"INSERT INTO {quote(name)} SELECT * FROM moved",
+                [lower, upper],
+            )
+        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {quote(name)} FOR VALUES FROM (%s) TO (%s)", [lower, upper])
+    return name
+
+
+def ensure_step1_partitions(max_job_id: int | None = None) -> list[str]:
+    """
+    Keep MEAL_PLAN_STEP1_PARTITIONS_AHEAD job-id ranges attached beyond the newest
+    job so inserts never need DDL. Run from the retention task, not the hot path.
+    """
+    if not step1_partitioning_enabled():
+        return []
+    if max_job_id is None:
+        max_job_id = ClientMealPlanGenerationJob.objects.aggregate(value=Max("id"))["value"] or 0
+    span = partition_job_span()
+    target_upper = ((max_job_id // span) + 1 + partitions_ahead()) * span
+
+    created = []
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [PARTITION_LOCK_KEY])
+        partitions = list_step1_partitions()
+        default_partition = next((row for row in partitions if row.is_default), None)
+        ranged = [row for row in partitions if not row.is_default]
+        covered_upper = max((row.upper for row in ranged if row.upper is not None), default=0)
+        lower = covered_upper
+        while lower < target_upper:
+            upper = lower + span - (lower % span)
+            created.append(_create_partition(lower, upper, default_partition))
+            lower = upper
+    return created
+
+
+def drop_expired_step1_partitions(cutoff) -> list[str]:
+    """
+    Detach and drop ranged partitions whose jobs are all finished and older than
+    `cutoff`; this is what the retention rule would have deleted row by row.
+    Partitions at or beyond the newest job are never dropped.
+    """
+    if not step1_partitioning_enabled():
+        return []
+    blocking_min_id = (
+        ClientMealPlanGenerationJob.objects.filter(~Q(status__in=TERMINAL_JOB_STATUSES) | Q(created_at__gte=cutoff))
+        .aggregate(value=Min("id"))["value"]
+    )
+    newest_job_id = ClientMealPlanGenerationJob.objects.aggregate(value=Max("id"))["value"] or 0
+    drop_below = min(blocking_min_id if blocking_min_id is not None else newest_job_id + 1, newest_job_id + 1)
+
+    quote = connection.ops.quote_name
+    dropped = []
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [PARTITION_LOCK_KEY])
+        for partition in list_step1_partitions():
+            if partition.is_default or partition.upper is None or partition.upper > drop_below:
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE {quote(step1_table())} DETACH PARTITION {quote(partition.name)}")
+                cursor.execute(f"DROP TABLE {quote(partition.name)}")
+            dropped.append(partition.name)
+    return dropped
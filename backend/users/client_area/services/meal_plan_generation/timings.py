@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import time
+from typing import Any, Iterator
+
+from django.db import connection
+
+from users.client_area.models import ClientMealPlanGenerationJob
+
+
+# Stage names recorded by the runner, in execution order.
+TIMING_STEP_CONTEXT = "context"
+TIMING_STEP_CACHE_LOOKUP = "cache_lookup"
+TIMING_STEP_CACHE_CLONE = "cache_clone"
+TIMING_STEP_STEP1 = "step1"
+TIMING_STEP_SOLVER = "solver"
+TIMING_STEP_PERSIST = "persist"
+TIMING_METRICS = ("wall_ms", "queries", "query_ms", "rows_written")
+
+
+@dataclass
+class StepTiming:
+    wall_ms: float = 0.0
+    queries: int = 0
+    query_ms: float = 0.0
+    rows_written: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "wall_ms": round(self.wall_ms, 3),
+            "queries": self.queries,
+            "query_ms": round(self.query_ms, 3),
+            "rows_written": self.rows_written,
+        }
+
+
+class GenerationTimings:
+    """
+    Per-stage wall time, DB query count/time and rows written for one generation
+    job. Queries are counted with a connection execute wrapper, so it works with
+    DEBUG off and only sees the current thread's connection.
+    """
+
+    def __init__(self):
+        self.steps: dict[str, StepTiming] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StepTiming]:
+        timing = self.steps.setdefault(name, StepTiming())
+
+        def wrapper(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                timing.queries += 1
+                timing.query_ms += (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(wrapper):
+                yield timing
+        finally:
+            timing.wall_ms += (time.perf_counter() - started) * 1000
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "steps": {name: timing.as_dict() for name, timing in self.steps.items()},
+            # jsonb does not keep key order, so execution order is stored explicitly.
+            "step_order": list(self.steps),
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+        }
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    value = sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+    return round(value, 3)
+
+
+def _summarize(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {"p50": _percentile(ordered, 0.5), "p95": _percentile(ordered, 0.95), "max": round(ordered[-1], 3)}
+
+
+def aggregate_generation_timings(*, since=None, limit: int = 500) -> dict[str, Any]:
+    """
+    p50/p95/max of every recorded metric per stage over the newest `limit`
+    completed jobs (optionally only those created after `since`). Jobs from
+    before timings were recorded are skipped.
+    """
+    jobs = ClientMealPlanGenerationJob.objects.filter(status="completed").exclude(timings_json={})
+    if since is not None:
+        jobs = jobs.filter(created_at__gte=since)
+    rows = list(jobs.order_by("-created_at").values_list("timings_json", flat=True)[: max(1, limit)])
+
+    samples: dict[str, dict[str, list[float]]] = {}
+    totals = []
+    for timings in rows:
+        if not isinstance(timings, dict):
+            continue
+        if timings.get("total_ms") is not None:
+            totals.append(float(timings["total_ms"]))
+        for name, step in (timings.get("steps") or {}).items():
+            metrics = samples.setdefault(name, {metric: [] for metric in TIMING_METRICS})
+            for metric in TIMING_METRICS:
+                metrics[metric].append(float(step.get(metric) or 0))
+
+    return {
+        "job_count": len(rows),
+        "total_ms": _summarize(totals) if totals else None,
+        "steps": {
+            name: {"job_count": len(metrics["wall_ms"]), **{metric: _summarize(values) for metric, values in metrics.items()}}
+            for name, metrics in samples.items()
+        },
+    }
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from django.db.models import OuterRef, Subquery
+
+from users.client_area.models import ClientMealPlanGenerationJob
+
+from .rendered_day import fresh_rendered_payload, render_day_details, store_rendered_days
+
+
+def _latest_jobs_by_day(user, days: list[str]) -> dict[str, ClientMealPlanGenerationJob]:
+    latest_for_day = (
+        ClientMealPlanGenerationJob.objects.filter(user=user, day_of_week=OuterRef("day_of_week"))
+        .order_by("-created_at")
+        .values("id")[:1]
+    )
+    jobs = (
+        ClientMealPlanGenerationJob.objects.filter(user=user, day_of_week__in=days, id=Subquery(latest_for_day))
+        .select_related("rendered_day")
+    )
+    return {job.day_of_week: job for job in jobs}
+
+
+def iter_week_detail(user, days: list[str]) -> Iterator[dict[str, Any]]:
+    """
+    Yield `{"day_of_week", "meal_plan_day"}` for each requested day in order.
+
+    Days with a current ClientMealPlanRenderedDay are served as-is; the rest are
+    rendered together (one generated-meal query, one shared food/override/image
+    index) the first time one of them is reached, then materialized.
+    """
+    jobs_by_day = _latest_jobs_by_day(user, days)
+    fresh_payloads = {day: fresh_rendered_payload(job) for day, job in jobs_by_day.items()}
+    rendered_payloads: dict[int, dict[str, Any]] | None = None
+
+    for day in days:
+        job = jobs_by_day.get(day)
+        payload = fresh_payloads.get(day)
+        if job is not None and payload is None:
+            if rendered_payloads is None:
+                stale_jobs = [jobs_by_day[stale_day] for stale_day, fresh in fresh_payloads.items() if fresh is None]
+                rendered_payloads = render_day_details(user.id, stale_jobs)
+                store_rendered_days(stale_jobs, rendered_payloads)
+            payload = rendered_payloads.get(job.id)
+        yield {"day_of_week": day, "meal_plan_day": payload}
+
+
+def build_week_detail(user, days: list[str]) -> dict[str, Any]:
+    week_days = list(iter_week_detail(user, days))
+    return {
+        "days_requested": days,
+        "days_available": [row["day_of_week"] for row in week_days if row["meal_plan_day"]],
+        "days": week_days,
+    }
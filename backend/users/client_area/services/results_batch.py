@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+
+import numpy as np
+
+from .results_engine import (
+    WEEK_DAYS,
+    BuildResultsContext,
+    PreparedAnswers,
+    assemble_questionnaire_results,
+    build_day_row,
+    daily_macros_payload,
+    meal_split_payload,
+    prepare_questionnaire_answers,
+)
+
+
+DAYS_PER_WEEK = len(WEEK_DAYS)
+
+
+def _round_exact(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Vectorized built-in round(), which the scalar path uses. np.round rounds the
+    scaled product, and that product can land on the other side of a half from the
+    exact decimal value (round(2.675, 2) is 2.67, np.round gives 2.68). Only those
+    near-half values go through round(); every other entry stays in numpy, and
+    k / 10**ndigits is the same correctly rounded double round() returns.
+    """
+    scale = 10.0**ndigits
+    scaled = values * scale
+    rounded = np.round(scaled) / scale
+    near_half = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 1e-12 * np.maximum(1.0, np.abs(scaled))
+    for index in zip(*np.nonzero(near_half)):
+        rounded[index] = round(float(values[index]), ndigits)
+    return rounded
+
+
+def _clamp_nonnegative(values: np.ndarray) -> np.ndarray:
+    return np.where(values > 0, values, 0.0)
+
+
+@dataclass(frozen=True)
+class QuestionnaireResultsBatch:
+    """
+    Macro results for N answer sets as column arrays. Rows where `valid` is
+    False had incomplete answers (build_questionnaire_results returns None for
+    those) and hold NaN. Shapes: (N,) per client, (N, 7) per day in WEEK_DAYS
+    order, (N, 7, max meals) per meal; meals past a day's `meal_count` are NaN.
+
+    Calorie columns are unrounded; macro and meal gram columns are rounded to
+    2 decimals exactly as the scalar path rounds them.
+    """
+
+    prepared: tuple[PreparedAnswers | None, ...]
+    valid: np.ndarray
+    bmr: np.ndarray
+    tdee_multiplier: np.ndarray
+    tdee_calories: np.ndarray
+    calories_target: np.ndarray
+    protein_g: np.ndarray
+    carbs_g: np.ndarray
+    fats_g: np.ndarray
+    meal_count: np.ndarray
+    meal_protein_g: np.ndarray
+    meal_carbs_g: np.ndarray
+    meal_fats_g: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.prepared)
+
+    def results(self, index: int) -> dict[str, Any] | None:
+        """Same dict build_questionnaire_results returns for this answer set."""
+        prepared = self.prepared[index]
+        if prepared is None:
+            return None
+
+        tdee_calories = self.tdee_calories[index].tolist()
+        calories_target = self.calories_target[index].tolist()
+        protein_g = self.protein_g[index].tolist()
+        carbs_g = self.carbs_g[index].tolist()
+        fats_g = self.fats_g[index].tolist()
+        meal_protein_g = self.meal_protein_g[index].tolist()
+        meal_carbs_g = self.meal_carbs_g[index].tolist()
+        meal_fats_g = self.meal_fats_g[index].tolist()
+
+        weekly_rows = []
+        for d, prepared_day in enumerate(prepared.days):
+            weekly_rows.append(
+                build_day_row(
+                    prepared_day,
+                    tdee_calories=tdee_calories[d],
+                    adjusted_calories=calories_target[d],
+                    daily_macros=daily_macros_payload(protein_g[d], carbs_g[d], fats_g[d], prepared_day.macro_rules),
+                    meal_splits=[
+                        meal_split_payload(split, meal_protein_g[d][m], meal_carbs_g[d][m], meal_fats_g[d][m])
+                        for m, split in enumerate(prepared_day.distribution)
+                    ],
+                )
+            )
+        return assemble_questionnaire_results(prepared, float(self.bmr[index]), weekly_rows)
+
+    def meal_split_grams(self, index: int, day_index: int) -> tuple[tuple[int, float, float, float], ...]:
+        """(meal_number, protein_g, carbs_g, fats_g) per meal, as in the day's meal_macro_splits."""
+        prepared = self.prepared[index]
+        if prepared is None:
+            return ()
+        distribution = prepared.days[day_index].distribution
+        count = len(distribution)
+        return tuple(
+            zip(
+                (split.meal_number for split in distribution),
+                self.meal_protein_g[index, day_index, :count].tolist(),
+                self.meal_carbs_g[index, day_index, :count].tolist(),
+                self.meal_fats_g[index, day_index, :count].tolist(),
+            )
+        )
+
+    def iter_results(self) -> Iterator[dict[str, Any] | None]:
+        for index in range(len(self)):
+            yield self.results(index)
+
+
+def build_questionnaire_results_batch(contexts: Sequence[BuildResultsContext]) -> QuestionnaireResultsBatch:
+    """
+    Vectorized build_questionnaire_results for many answer sets at once, for
+    bulk recalculation. Answer parsing and parameter lookups are shared with
+    the scalar path; the arithmetic runs over whole columns in the same
+    operation order, so every value matches the scalar result exactly.
+    """
+    prepared = tuple(prepare_questionnaire_answers(context) for context in contexts)
+    n = len(prepared)
+    max_meals = max((len(day.distribution) for p in prepared if p for day in p.days), default=0)
+
+    valid = np.array([p is not None for p in prepared], dtype=bool)
+    is_male = np.zeros(n, dtype=bool)
+    weight_kg = np.zeros(n)
+    weight_lbs = np.zeros(n)
+    height_cm = np.zeros(n)
+    age = np.zeros(n)
+    goal_pct = np.zeros(n)
+    multiplier = np.zeros((n, DAYS_PER_WEEK))
+    protein_factor = np.zeros((n, DAYS_PER_WEEK))
+    carb_percent = np.zeros((n, DAYS_PER_WEEK))
+    fat_percent = np.zeros((n, DAYS_PER_WEEK))
+    meal_count = np.zeros((n, DAYS_PER_WEEK), dtype=np.int64)
+    split_protein = np.full((n, DAYS_PER_WEEK, max_meals), np.nan)
+    split_carbs = np.full((n, DAYS_PER_WEEK, max_meals), np.nan)
+    split_fats = np.full((n, DAYS_PER_WEEK, max_meals), np.nan)
+
+    for i, p in enumerate(prepared):
+        if p is None:
+            continue
+        is_male[i] = p.gender == "male"
+        weight_kg[i] = p.weight_kg
+        weight_lbs[i] = p.weight_lbs
+        height_cm[i] = p.height_cm
+        age[i] = p.age
+        goal_pct[i] = p.goal_pct
+        for d, day in enumerate(p.days):
+            multiplier[i, d] = day.multiplier
+            protein_factor[i, d] = day.macro_rules.protein_factor_value
+            carb_percent[i, d] = day.macro_rules.carb_percent
+            fat_percent[i, d] = day.macro_rules.fat_percent
+            meal_count[i, d] = len(day.distribution)
+            for m, split in enumerate(day.distribution):
+                split_protein[i, d, m] = split.protein
+                split_carbs[i, d, m] = split.carbs
+                split_fats[i, d, m] = split.fats
+
+    # Mifflin-St Jeor, same operation order as _calculate_bmr.
+    bmr = (10 * weight_kg) + (6.25 * height_cm) - (5 * age) + np.where(is_male, 5.0, -160.0)
+    tdee_calories = bmr[:, None] * multiplier
+    calories_target = tdee_calories * (1 + (goal_pct / 100.0))[:, None]
+
+    protein_raw = _clamp_nonnegative(weight_lbs[:, None] * protein_factor)
+    remaining_calories = np.maximum(0.0, calories_target - protein_raw * 4)
+    carbs_raw = (remaining_calories * (carb_percent / 100.0)) / 4.0
+    fats_raw = (remaining_calories * (fat_percent / 100.0)) / 9.0
+
+    # Meal grams are taken from the rounded daily totals, like the scalar path.
+    protein_g = _round_exact(protein_raw, 2)
+    carbs_g = _round_exact(_clamp_nonnegative(carbs_raw), 2)
+    fats_g = _round_exact(_clamp_nonnegative(fats_raw), 2)
+    meal_protein_g = _round_exact(protein_g[:, :, None] * (split_protein / 100.0), 2)
+    meal_carbs_g = _round_exact(carbs_g[:, :, None] * (split_carbs / 100.0), 2)
+    meal_fats_g = _round_exact(fats_g[:, :, None] * (split_fats / 100.0), 2)
+
+    invalid = ~valid
+    for column in (bmr, tdee_calories, calories_target, protein_g, carbs_g, fats_g, multiplier):
+        column[invalid] = np.nan
+
+    return QuestionnaireResultsBatch(
+        prepared=prepared,
+        valid=valid,
+        bmr=bmr,
+        tdee_multiplier=multiplier,
+        tdee_calories=tdee_calories,
+        calories_target=calories_target,
+        protein_g=protein_g,
+        carbs_g=carbs_g,
+        fats_g=fats_g,
+        meal_count=meal_count,
+        meal_protein_g=meal_protein_g,
+        meal_carbs_g=meal_carbs_g,
+        meal_fats_g=meal_fats_g,
+    )
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import cached_property
 from typing import Any
 
-from core.seed_data.admin_parameter_defaults import get_admin_parameter_defaults_v1
+from .admin_parameters import (
+    CompiledAdminParameters,
+    CompiledMacroRules,
+    CompiledMealSplit,
+    CompiledTdeeTable,
+    get_compiled_admin_parameters,
+)
 
 
 WEEK_DAYS = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
@@ -78,48 +86,13 @@ def _calculate_bmr(gender: str | None, weight_kg: float, height_cm: float, age:
     return (10 * weight_kg) + (6.25 * height_cm) - (5 * age) - 160
 
 
-def _safe_get_admin_params(admin_identity):
-    settings = getattr(admin_identity, "parameter_settings", None) if admin_identity else None
-    if settings and getattr(settings, "parameters_json", None):
-        return settings.parameters_json
-    return get_admin_parameter_defaults_v1()
-
-
-def _admin_param_source(admin_identity):
-    settings = getattr(admin_identity, "parameter_settings", None) if admin_identity else None
-    if settings and getattr(settings, "parameters_json", None):
-        return "associated_admin"
-    return "dta_default_v1"
-
-
-def _get_goal_adjustment_percent(params: dict[str, Any], goal: str):
-    mapping = {
-        "lose": "lose_weight_percent",
-        "maintain": "maintain_weight_percent",
-        "gain": "gain_weight_percent",
-    }
-    key = mapping.get(goal or "")
-    return _to_float(((params.get("goal_calorie_adjustments") or {}).get(key)), 0.0) if key else 0.0
-
-
-def _get_weekly_tdee_table(params: dict[str, Any], lifestyle: str, training_days_per_week: int):
-    tdee = params.get("tdee") or {}
-    weekly = tdee.get("weekly_day_multiplier_splits") or {}
-    lifestyle_payload = weekly.get(lifestyle) or {}
-    tables = lifestyle_payload.get("tables_by_training_days_per_week") or {}
-    return tables.get(str(training_days_per_week)) or {}
-
-
-def _partition_day_multipliers_for_schedule(day_multipliers: list[float], workout_days: list[str]):
+def _partition_day_multipliers_for_schedule(day_multipliers_desc: tuple[float, ...], workout_days: list[str]):
     selected_workout = [d for d in WEEK_DAYS if d in set(workout_days or [])]
     off_days = [d for d in WEEK_DAYS if d not in set(selected_workout)]
-    if len(day_multipliers) != 7:
-        day_multipliers = [1.2] * 7
 
-    sorted_desc = sorted([_to_float(v, 1.2) for v in day_multipliers], reverse=True)
     workout_count = len(selected_workout)
-    workout_pool = sorted_desc[:workout_count]
-    off_pool = sorted_desc[workout_count:]
+    workout_pool = day_multipliers_desc[:workout_count]
+    off_pool = day_multipliers_desc[workout_count:]
 
     assigned = {}
     for idx, day in enumerate(selected_workout):
@@ -129,89 +102,60 @@ def _partition_day_multipliers_for_schedule(day_multipliers: list[float], workou
     return assigned
 
 
-def _select_macro_rules_for_day(params, meal_plan_type, goal, is_workout_day):
-    meal_plans = params.get("meal_plans") or {}
-    mpt = meal_plans.get(meal_plan_type) or {}
-    if meal_plan_type == "carb_cycling":
-        rules_by_goal = mpt.get("macro_rules_by_goal") or {}
-        goal_rules = rules_by_goal.get(goal) or {}
-        carb_key = "high_day" if is_workout_day else "low_day"
-        carb_set = goal_rules.get(carb_key) or {}
-        return {
-            "protein_factor_value": _to_float(goal_rules.get("protein_factor_value"), 1.0),
-            "carb_percent": _to_float(carb_set.get("carb_percent"), 0.0),
-            "fat_percent": _to_float(carb_set.get("fat_percent"), 0.0),
-            "carb_cycling_mode": "high_carbs" if is_workout_day else "low_carbs",
-        }
-
-    rules_by_goal = mpt.get("macro_rules_by_goal") or {}
-    goal_rules = rules_by_goal.get(goal) or {}
+def daily_macros_payload(protein_g: float, carbs_g: float, fats_g: float, macro_rules: CompiledMacroRules):
     return {
-        "protein_factor_value": _to_float(goal_rules.get("protein_factor_value"), 1.0),
-        "carb_percent": _to_float(goal_rules.get("carb_percent"), 0.0),
-        "fat_percent": _to_float(goal_rules.get("fat_percent"), 0.0),
-        "carb_cycling_mode": None,
+        "protein_g": protein_g,
+        "carbs_g": carbs_g,
+        "fats_g": fats_g,
+        "macro_rules": {
+            "protein_factor_value": round(macro_rules.protein_factor_value, 4),
+            "carb_percent": round(macro_rules.carb_percent, 3),
+            "fat_percent": round(macro_rules.fat_percent, 3),
+        },
     }
 
 
-def _calculate_daily_macros(calories: float, weight_lbs: float, macro_rules: dict[str, Any]):
-    protein_g = _clamp_nonnegative(weight_lbs * _to_float(macro_rules.get("protein_factor_value"), 1.0))
+def _calculate_daily_macros(calories: float, weight_lbs: float, macro_rules: CompiledMacroRules):
+    protein_g = _clamp_nonnegative(weight_lbs * macro_rules.protein_factor_value)
     protein_calories = protein_g * 4
     remaining_calories = max(0.0, calories - protein_calories)
-    carb_percent = _to_float(macro_rules.get("carb_percent"), 0.0)
-    fat_percent = _to_float(macro_rules.get("fat_percent"), 0.0)
-    carbs_g = (remaining_calories * (carb_percent / 100.0)) / 4.0
-    fats_g = (remaining_calories * (fat_percent / 100.0)) / 9.0
+    carbs_g = (remaining_calories * (macro_rules.carb_percent / 100.0)) / 4.0
+    fats_g = (remaining_calories * (macro_rules.fat_percent / 100.0)) / 9.0
+    return daily_macros_payload(
+        round(protein_g, 2),
+        round(_clamp_nonnegative(carbs_g), 2),
+        round(_clamp_nonnegative(fats_g), 2),
+        macro_rules,
+    )
+
+
+def meal_split_payload(split: CompiledMealSplit, protein_g: float, carbs_g: float, fats_g: float):
     return {
-        "protein_g": round(protein_g, 2),
-        "carbs_g": round(_clamp_nonnegative(carbs_g), 2),
-        "fats_g": round(_clamp_nonnegative(fats_g), 2),
-        "macro_rules": {
-            "protein_factor_value": round(_to_float(macro_rules.get("protein_factor_value"), 1.0), 4),
-            "carb_percent": round(carb_percent, 3),
-            "fat_percent": round(fat_percent, 3),
+        "meal_key": split.meal_key,
+        "meal_number": split.meal_number,
+        "percentages": {
+            "protein": round(split.protein, 3),
+            "carbs": round(split.carbs, 3),
+            "fats": round(split.fats, 3),
+        },
+        "grams": {
+            "protein_g": protein_g,
+            "carbs_g": carbs_g,
+            "fats_g": fats_g,
         },
     }
 
 
-def _get_distribution_table(params, meal_plan_type, meals_per_day, training_schedule_value, carb_cycling_mode=None):
-    meal_plans = params.get("meal_plans") or {}
-    plan_payload = meal_plans.get(meal_plan_type) or {}
-    distributions = plan_payload.get("meal_macro_distribution") or {}
-
-    if meal_plan_type == "carb_cycling":
-        bucket = distributions.get(f"meals_{meals_per_day}") or {}
-        scenario_tables = bucket.get(carb_cycling_mode or "low_carbs") or {}
-    else:
-        scenario_tables = distributions.get(f"meals_{meals_per_day}") or {}
-
-    scenario_key = str(training_schedule_value or "no_training").strip()
-    if scenario_key.startswith("before_meal_"):
-        scenario_key = f"train_{scenario_key}"
-    return scenario_tables.get(scenario_key) or scenario_tables.get("no_training") or {}
-
-
-def _build_meal_splits_for_day(distribution_table, daily_macros):
-    rows = []
-    for meal_key in sorted(distribution_table.keys(), key=lambda k: int(k.split("_")[-1])):
-        pct = distribution_table.get(meal_key) or {}
-        rows.append(
-            {
-                "meal_key": meal_key,
-                "meal_number": int(meal_key.split("_")[-1]),
-                "percentages": {
-                    "protein": round(_to_float(pct.get("protein"), 0.0), 3),
-                    "carbs": round(_to_float(pct.get("carbs"), 0.0), 3),
-                    "fats": round(_to_float(pct.get("fats"), 0.0), 3),
-                },
-                "grams": {
-                    "protein_g": round(daily_macros["protein_g"] * (_to_float(pct.get("protein"), 0.0) / 100.0), 2),
-                    "carbs_g": round(daily_macros["carbs_g"] * (_to_float(pct.get("carbs"), 0.0) / 100.0), 2),
-                    "fats_g": round(daily_macros["fats_g"] * (_to_float(pct.get("fats"), 0.0) / 100.0), 2),
-                },
-            }
+def _build_meal_splits_for_day(splits: tuple[CompiledMealSplit, ...], daily_macros):
+    return [
+        meal_split_payload(
+            split,
+            round(daily_macros["protein_g"] * (split.protein / 100.0), 2),
+            round(daily_macros["carbs_g"] * (split.carbs / 100.0), 2),
+            round(daily_macros["fats_g"] * (split.fats / 100.0), 2),
         )
-    return rows
+        for split in splits
+    ]
 
 
 @dataclass
@@ -220,21 +164,89 @@ class BuildResultsContext:
     admin_identity: Any = None
 
 
-def build_questionnaire_results(context: BuildResultsContext):
+@dataclass(frozen=True)
+class PreparedDay:
+    day: str
+    is_workout_day: bool
+    training_value: Any
+    meals_per_day: int
+    multiplier: float
+    macro_rules: CompiledMacroRules
+    distribution: tuple[CompiledMealSplit, ...]
+
+
+@dataclass(frozen=True)
+class PreparedAnswers:
+    """
+    Parsed questionnaire answers plus the lookups shared by every day. Per-day
+    parameters are resolved by `prepare_day`, so a caller that needs one day
+    never resolves the other six.
+    """
+
+    gender: str
+    age: int
+    height_cm: float
+    weight_kg: float
+    weight_lbs: float
+    goal: str
+    lifestyle: str
+    meal_plan_type: str
+    training_days_per_week: int
+    goal_pct: float
+    tdee_table: CompiledTdeeTable
+    params: CompiledAdminParameters
+    workout_days: tuple[str, ...]
+    meal_schedule: dict[str, Any]
+    training_schedule: dict[str, Any]
+    assigned_multipliers: dict[str, Any]
+
+    def prepare_day(self, day: str) -> PreparedDay:
+        is_workout_day = day in self.workout_days
+        meals_per_day = int(self.meal_schedule.get(day) or 0)
+        if meals_per_day not in (3, 4, 5, 6):
+            meals_per_day = 3
+        training_value = self.training_schedule.get(day) if is_workout_day else "no_training"
+        if not training_value and is_workout_day:
+            training_value = "no_training"
+
+        macro_rules = self.params.macro_rules_for_day(self.meal_plan_type, self.goal, is_workout_day)
+        return PreparedDay(
+            day=day,
+            is_workout_day=is_workout_day,
+            training_value=training_value,
+            meals_per_day=meals_per_day,
+            multiplier=_to_float(self.assigned_multipliers.get(day), 1.2),
+            macro_rules=macro_rules,
+            distribution=self.params.distribution(
+                self.meal_plan_type,
+                meals_per_day,
+                training_value if training_value in {"no_training"} or str(training_value).startswith("before_meal_") else "no_training",
+                carb_cycling_mode=macro_rules.carb_cycling_mode,
+            ),
+        )
+
+    @cached_property
+    def days(self) -> tuple[PreparedDay, ...]:
+        return tuple(self.prepare_day(day) for day in WEEK_DAYS)
+
+
+REQUIRED_ANSWER_KEYS = (
+    "gender",
+    "height",
+    "weight",
+    "date_of_birth",
+    "goal",
+    "lifestyle",
+    "meal_plan_type",
+    "workout_days",
+    "meal_schedule",
+    "training_schedule",
+)
+
+
+def prepare_questionnaire_answers(context: BuildResultsContext) -> PreparedAnswers | None:
     answers = context.answers or {}
-    required_core = [
-        "gender",
-        "height",
-        "weight",
-        "date_of_birth",
-        "goal",
-        "lifestyle",
-        "meal_plan_type",
-        "workout_days",
-        "meal_schedule",
-        "training_schedule",
-    ]
-    for key in required_core:
+    for key in REQUIRED_ANSWER_KEYS:
         if key not in answers:
             return None
 
@@ -253,85 +265,79 @@ def build_questionnaire_results(context: BuildResultsContext):
     training_schedule = answers.get("training_schedule") or {}
     training_days_per_week = len(workout_days)
 
-    params = _safe_get_admin_params(context.admin_identity)
-    admin_param_source = _admin_param_source(context.admin_identity)
-    bmr = _calculate_bmr(gender, weight_kg, height_cm, age)
-    goal_pct = _get_goal_adjustment_percent(params, goal)
-
-    tdee_table = _get_weekly_tdee_table(params, lifestyle, training_days_per_week)
-    day_multipliers = tdee_table.get("day_multipliers") or [1.2] * 7
-    assigned_multipliers = _partition_day_multipliers_for_schedule(day_multipliers, workout_days)
+    params = get_compiled_admin_parameters(context.admin_identity)
+    tdee_table = params.tdee_table(lifestyle, training_days_per_week)
+    assigned_multipliers = _partition_day_multipliers_for_schedule(tdee_table.day_multipliers_desc, workout_days)
+
+    return PreparedAnswers(
+        gender=gender,
+        age=age,
+        height_cm=height_cm,
+        weight_kg=weight_kg,
+        weight_lbs=weight_lbs,
+        goal=goal,
+        lifestyle=lifestyle,
+        meal_plan_type=meal_plan_type,
+        training_days_per_week=training_days_per_week,
+        goal_pct=params.goal_adjustment(goal),
+        tdee_table=tdee_table,
+        params=params,
+        workout_days=tuple(workout_days),
+        meal_schedule=meal_schedule,
+        training_schedule=training_schedule,
+        assigned_multipliers=assigned_multipliers,
+    )
+
+
+def build_day_row(prepared_day: PreparedDay, *, tdee_calories: float, adjusted_calories: float, daily_macros, meal_splits):
+    return {
+        "day": prepared_day.day,
+        "is_workout_day": prepared_day.is_workout_day,
+        "training_before_meal": (
+            None if not prepared_day.is_workout_day or prepared_day.training_value == "no_training" else prepared_day.training_value
+        ),
+        "meals_per_day": prepared_day.meals_per_day,
+        "tdee_multiplier": round(prepared_day.multiplier, 6),
+        "tdee_calories": round(tdee_calories, 2),
+        "calories_target": round(adjusted_calories, 2),
+        "daily_macros": daily_macros,
+        "meal_macro_splits": meal_splits,
+        "carb_cycling_mode": prepared_day.macro_rules.carb_cycling_mode,
+    }
 
-    category_multipliers = ((params.get("tdee") or {}).get("category_multipliers") or {})
-    selected_category = tdee_table.get("category")
-    target_category_multiplier = _to_float(category_multipliers.get(str(selected_category)), 0.0) if selected_category else 0.0
 
-    weekly_rows = []
-    for day in WEEK_DAYS:
-        is_workout_day = day in workout_days
-        meals_per_day = int(meal_schedule.get(day) or 0)
-        if meals_per_day not in (3, 4, 5, 6):
-            meals_per_day = 3
-        training_value = training_schedule.get(day) if is_workout_day else "no_training"
-        if not training_value and is_workout_day:
-            training_value = "no_training"
+def results_generated_at() -> str:
+    return datetime.utcnow().isoformat() + "Z"
 
-        day_multiplier = _to_float(assigned_multipliers.get(day), 1.2)
-        tdee_calories = bmr * day_multiplier
-        adjusted_calories = tdee_calories * (1 + (goal_pct / 100.0))
-
-        macro_rules = _select_macro_rules_for_day(params, meal_plan_type, goal, is_workout_day)
-        daily_macros = _calculate_daily_macros(adjusted_calories, weight_lbs, macro_rules)
-        distribution_table = _get_distribution_table(
-            params,
-            meal_plan_type,
-            meals_per_day,
-            training_value if training_value in {"no_training"} or str(training_value).startswith("before_meal_") else "no_training",
-            carb_cycling_mode=macro_rules.get("carb_cycling_mode"),
-        )
-        meal_splits = _build_meal_splits_for_day(distribution_table, daily_macros)
-
-        weekly_rows.append(
-            {
-                "day": day,
-                "is_workout_day": is_workout_day,
-                "training_before_meal": None if not is_workout_day or training_value == "no_training" else training_value,
-                "meals_per_day": meals_per_day,
-                "tdee_multiplier": round(day_multiplier, 6),
-                "tdee_calories": round(tdee_calories, 2),
-                "calories_target": round(adjusted_calories, 2),
-                "daily_macros": daily_macros,
-                "meal_macro_splits": meal_splits,
-                "carb_cycling_mode": macro_rules.get("carb_cycling_mode"),
-            }
-        )
 
+def assemble_questionnaire_results(prepared: PreparedAnswers, bmr: float, weekly_rows: list[dict[str, Any]]):
     workout_rows = [r for r in weekly_rows if r["is_workout_day"]]
     off_rows = [r for r in weekly_rows if not r["is_workout_day"]]
     avg = lambda rows, key: round(sum(r[key] for r in rows) / len(rows), 2) if rows else None
+    target_category_multiplier = prepared.tdee_table.category_multiplier
 
     return {
         "profile": {
-            "gender": gender,
-            "age": age,
-            "height_cm": round(height_cm, 2),
-            "weight_kg": round(weight_kg, 2),
-            "weight_lbs": round(weight_lbs, 2),
-            "goal": goal,
-            "lifestyle": lifestyle,
-            "meal_plan_type": meal_plan_type,
-            "training_days_per_week": training_days_per_week,
+            "gender": prepared.gender,
+            "age": prepared.age,
+            "height_cm": round(prepared.height_cm, 2),
+            "weight_kg": round(prepared.weight_kg, 2),
+            "weight_lbs": round(prepared.weight_lbs, 2),
+            "goal": prepared.goal,
+            "lifestyle": prepared.lifestyle,
+            "meal_plan_type": prepared.meal_plan_type,
+            "training_days_per_week": prepared.training_days_per_week,
         },
         "core_calculations": {
             "bmr": round(bmr, 2),
-            "goal_calorie_adjustment_percent": round(goal_pct, 2),
-            "tdee_category": selected_category,
+            "goal_calorie_adjustment_percent": round(prepared.goal_pct, 2),
+            "tdee_category": prepared.tdee_table.category,
             "tdee_category_target_multiplier": round(target_category_multiplier, 6) if target_category_multiplier else None,
             "weekly_average_multiplier": round(sum(r["tdee_multiplier"] for r in weekly_rows) / len(weekly_rows), 6) if weekly_rows else None,
         },
         "parameter_settings": {
-            "source": admin_param_source,
-            "defaults_version": (params or {}).get("version") or "v1",
+            "source": prepared.params.source,
+            "defaults_version": prepared.params.defaults_version,
         },
         "summary": {
             "workout_day_avg_calories": avg(workout_rows, "calories_target"),
@@ -340,5 +346,84 @@ def build_questionnaire_results(context: BuildResultsContext):
             "off_day_avg_tdee": avg(off_rows, "tdee_calories"),
         },
         "weekly_days": weekly_rows,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "generated_at": results_generated_at(),
     }
+
+
+class QuestionnaireResults(Mapping):
+    """
+    Lazy view of build_questionnaire_results. BMR, the goal adjustment and the
+    multiplier assignment are computed once up front; each day's macros and
+    meal splits are computed on first `day()` access. Reading any other key
+    materializes the full dict, which is also what `to_dict()` returns.
+    """
+
+    def __init__(self, prepared: PreparedAnswers):
+        self.prepared = prepared
+        self.bmr = _calculate_bmr(prepared.gender, prepared.weight_kg, prepared.height_cm, prepared.age)
+        self._day_rows: dict[str, dict[str, Any]] = {}
+        self._materialized: dict[str, Any] | None = None
+
+    def day(self, day: str) -> dict[str, Any] | None:
+        if day not in WEEK_DAYS:
+            return None
+        row = self._day_rows.get(day)
+        if row is None:
+            row = self._day_rows[day] = self._build_day_row(self.prepared.prepare_day(day))
+        return row
+
+    def _build_day_row(self, prepared_day: PreparedDay) -> dict[str, Any]:
+        tdee_calories = self.bmr * prepared_day.multiplier
+        adjusted_calories = tdee_calories * (1 + (self.prepared.goal_pct / 100.0))
+        daily_macros = _calculate_daily_macros(adjusted_calories, self.prepared.weight_lbs, prepared_day.macro_rules)
+        return build_day_row(
+            prepared_day,
+            tdee_calories=tdee_calories,
+            adjusted_calories=adjusted_calories,
+            daily_macros=daily_macros,
+            meal_splits=_build_meal_splits_for_day(prepared_day.distribution, daily_macros),
+        )
+
+    @property
+    def weekly_days(self) -> list[dict[str, Any]]:
+        return [self.day(day) for day in WEEK_DAYS]
+
+    def to_dict(self) -> dict[str, Any]:
+        if self._materialized is None:
+            self._materialized = assemble_questionnaire_results(self.prepared, self.bmr, self.weekly_days)
+        return self._materialized
+
+    def __getitem__(self, key):
+        return self.to_dict()[key]
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+
+def results_day_payload(results, day: str) -> dict[str, Any] | None:
+    """One day's row from a results dict or a QuestionnaireResults, computing only that day for the latter."""
+    if isinstance(results, QuestionnaireResults):
+        return results.day(day)
+    if not isinstance(results, Mapping):
+        return None
+    for row in results.get("weekly_days") or []:
+        if isinstance(row, dict) and row.get("day") == day:
+            return row
+    return None
+
+
+def build_lazy_questionnaire_results(context: BuildResultsContext) -> QuestionnaireResults | None:
+    prepared = prepare_questionnaire_answers(context)
+    if prepared is None:
+        return None
+    return QuestionnaireResults(prepared)
+
+
+def build_questionnaire_results(context: BuildResultsContext):
+    results = build_lazy_questionnaire_results(context)
+    if results is None:
+        return None
+    return results.to_dict()
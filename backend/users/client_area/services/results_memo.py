@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+import hashlib
+import json
+from typing import Any
+
+from django.core.cache import cache
+
+from core.services.cache_counters import hit_rate_stats, increment_counter, reset_counters
+from core.services.table_versions import ADMIN_PARAMETERS, get_table_version
+
+from .results_engine import (
+    REQUIRED_ANSWER_KEYS,
+    BuildResultsContext,
+    QuestionnaireResults,
+    build_lazy_questionnaire_results,
+    build_questionnaire_results,
+    results_generated_at,
+)
+
+
+RESULTS_CACHE_PREFIX = "meal_plan:questionnaire_results:"
+RESULTS_MEMO_HITS_KEY = "meal_plan:questionnaire_results_memo:hits"
+RESULTS_MEMO_MISSES_KEY = "meal_plan:questionnaire_results_memo:misses"
+# Bump when build_questionnaire_results changes shape or math so old entries are ignored.
+RESULTS_ALGORITHM_VERSION = "v1"
+
+
+def questionnaire_results_hash(answers: dict[str, Any], admin_identity=None) -> str:
+    """
+    Content hash of everything build_questionnaire_results depends on: the required
+    answers (food preferences and other keys the engine never reads are left out),
+    the admin's parameters and today's date, since age comes from date_of_birth.
+    """
+    answers = answers or {}
+    key_material = {
+        "answers": {key: answers[key] for key in REQUIRED_ANSWER_KEYS if key in answers},
+        "admin_id": getattr(admin_identity, "id", None),
+        "admin_parameters_version": get_table_version(ADMIN_PARAMETERS),
+        "algorithm_version": RESULTS_ALGORITHM_VERSION,
+        "today": date.today().isoformat(),
+    }
+    encoded = json.dumps(key_material, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def seconds_until_tomorrow(now: datetime | None = None) -> int:
+    # Entries are keyed on today's date, so nothing can hit them after midnight.
+    now = now or datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def _cached_results(cache_key: str) -> dict[str, Any] | None:
+    # Entries are stored without generated_at so a hit reports when it was read.
+    results = cache.get(cache_key)
+    if results is None:
+        return None
+    return {**results, "generated_at": results_generated_at()}
+
+
+def get_or_build_questionnaire_results(answers: dict[str, Any], admin_identity=None):
+    """
+    Questionnaire results for these answers from the shared cache, built on a miss.
+    Returns `(results, results_hash)`; results are None (and never cached) when the
+    answers are incomplete.
+    """
+    results_hash = questionnaire_results_hash(answers, admin_identity)
+    cache_key = f"{RESULTS_CACHE_PREFIX}{results_hash}"
+    results = _cached_results(cache_key)
+    if results is not None:
+        increment_counter(RESULTS_MEMO_HITS_KEY)
+        return results, results_hash
+
+    increment_counter(RESULTS_MEMO_MISSES_KEY)
+    results = build_questionnaire_results(BuildResultsContext(answers=answers, admin_identity=admin_identity))
+    if results:
+        cached = {key: value for key, value in results.items() if key != "generated_at"}
+        cache.set(cache_key, cached, timeout=seconds_until_tomorrow())
+    return results, results_hash
+
+
+def get_questionnaire_results(context: BuildResultsContext):
+    """Memoized drop-in for build_questionnaire_results; use this from request and task code."""
+    return get_or_build_questionnaire_results(context.answers or {}, context.admin_identity)[0]
+
+
+def get_lazy_questionnaire_results(context: BuildResultsContext) -> dict[str, Any] | QuestionnaireResults | None:
+    """
+    For callers that read only some days (via results_day_payload): the memoized
+    dict on a hit, otherwise a QuestionnaireResults that computes just the days
+    asked for. Misses are not memoized here since only full results are cached.
+    """
+    answers = context.answers or {}
+    results = _cached_results(f"{RESULTS_CACHE_PREFIX}{questionnaire_results_hash(answers, context.admin_identity)}")
+    if results is not None:
+        increment_counter(RESULTS_MEMO_HITS_KEY)
+        return results
+    increment_counter(RESULTS_MEMO_MISSES_KEY)
+    return build_lazy_questionnaire_results(BuildResultsContext(answers=answers, admin_identity=context.admin_identity))
+
+
+def get_results_memo_stats() -> dict[str, Any]:
+    return hit_rate_stats(RESULTS_MEMO_HITS_KEY, RESULTS_MEMO_MISSES_KEY)
+
+
+def reset_results_memo_stats() -> None:
+    reset_counters(RESULTS_MEMO_HITS_KEY, RESULTS_MEMO_MISSES_KEY)
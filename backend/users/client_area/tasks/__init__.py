@@ -1,4 +1,15 @@
-from .meal_plan_generation import run_week_generation_batch_task
-
-__all__ = ["run_week_generation_batch_task"]
+from .macro_recalculation import run_macro_recalculation_task
+from .meal_plan_generation import (
+    finalize_week_generation_batch_task,
+    prune_meal_plan_generation_task,
+    run_week_generation_batch_task,
+    run_week_generation_day_task,
+)
 
+__all__ = [
+    "run_week_generation_batch_task",
+    "run_week_generation_day_task",
+    "finalize_week_generation_batch_task",
+    "prune_meal_plan_generation_task",
+    "run_macro_recalculation_task",
+]
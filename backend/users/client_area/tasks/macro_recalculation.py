@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from celery import shared_task
+from django.db import close_old_connections
+
+from users.client_area.services.macro_recalculation import fail_macro_recalculation, run_macro_recalculation_chunk
+
+
+@shared_task(bind=True, autoretry_for=(), retry_backoff=False)
+def run_macro_recalculation_task(self, *, job_id: int):
+    """
+    Process one chunk of a bulk recalculation and schedule the next with a
+    countdown instead of looping, so the worker slot is free for interactive
+    generation between chunks.
+    """
+    close_old_connections()
+    try:
+        try:
+            result = run_macro_recalculation_chunk(job_id)
+        except Exception as exc:
+            fail_macro_recalculation(job_id, str(exc))
+            raise
+        if result.has_more:
+            run_macro_recalculation_task.apply_async(kwargs={"job_id": job_id}, countdown=result.next_delay_seconds)
+        return asdict(result)
+    finally:
+        close_old_connections()
@@ -1,25 +1,66 @@
 from __future__ import annotations
 
-from celery import shared_task
+from dataclasses import asdict
+
+from celery import chord, group, shared_task
 from django.contrib.auth import get_user_model
 from django.db import close_old_connections
 
-from users.client_area.services.meal_plan_generation.runner import run_full_generation_for_week
+from users.client_area.services.meal_plan_generation.context import build_generation_context
+from users.client_area.services.meal_plan_generation.retention import prune_meal_plan_generation
+from users.client_area.services.meal_plan_generation.runner import (
+    WEEK_GENERATION_MODE_PARALLEL,
+    WEEK_GENERATION_MODE_SERIAL,
+    get_week_generation_mode,
+    run_full_generation_for_day,
+    run_full_generation_for_week,
+    week_generation_job_summary,
+)
 
 
 @shared_task(bind=True, autoretry_for=(), retry_backoff=False)
 def run_week_generation_batch_task(self, *, user_id: int, days: list[str], batch_id: str):
     """
-    Execute week generation in a Celery worker. Progress is tracked through the existing
-    per-day ClientMealPlanGenerationJob rows (with input_snapshot_json.batch_id).
+    Execute week generation in a Celery worker. Progress is tracked on the batch's
+    ClientMealPlanGenerationBatch record and its per-day ClientMealPlanGenerationJob rows.
+
+    In parallel mode the questionnaire results are built once here and each day is
+    dispatched as its own task in a chord; finalize_week_generation_batch_task closes it.
     """
     close_old_connections()
     try:
         User = get_user_model()
         user = User.objects.get(id=user_id)
-        result = run_full_generation_for_week(user, days=days, batch_id=batch_id, batch_mode="week")
+
+        if get_week_generation_mode() == WEEK_GENERATION_MODE_PARALLEL and len(days) > 1:
+            results = build_generation_context(user).results
+            header = group(
+                run_week_generation_day_task.s(
+                    user_id=user_id,
+                    day=day,
+                    batch_id=batch_id,
+                    results=results,
+                )
+                for day in days
+            )
+            async_result = chord(header)(finalize_week_generation_batch_task.s(batch_id=batch_id, days=days))
+            return {
+                "batch_id": batch_id,
+                "mode": WEEK_GENERATION_MODE_PARALLEL,
+                "days_requested": days,
+                "finalize_task_id": async_result.id,
+            }
+
+        result = run_full_generation_for_week(
+            user,
+            days=days,
+            batch_id=batch_id,
+            batch_mode="week",
+            mode=WEEK_GENERATION_MODE_SERIAL,
+        )
         return {
             "batch_id": batch_id,
+            "mode": WEEK_GENERATION_MODE_SERIAL,
             "days_requested": result.days_requested,
             "days_completed": result.days_completed,
             "job_count": len(result.jobs),
@@ -27,3 +68,51 @@ def run_week_generation_batch_task(self, *, user_id: int, days: list[str], batch
     finally:
         close_old_connections()
 
+
+@shared_task(bind=True, autoretry_for=(), retry_backoff=False)
+def run_week_generation_day_task(self, *, user_id: int, day: str, batch_id: str, results: dict | None = None):
+    """
+    Generate one day of a parallel week batch. Failures are returned instead of raised
+    so the chord callback still runs for the remaining days.
+    """
+    close_old_connections()
+    try:
+        User = get_user_model()
+        user = User.objects.get(id=user_id)
+        try:
+            result = run_full_generation_for_day(
+                user,
+                day_of_week=day,
+                batch_id=batch_id,
+                batch_mode="week",
+                context=build_generation_context(user, results=results),
+            )
+        except Exception as exc:
+            return {"day_of_week": day, "job_id": None, "status": "failed", "error_message": str(exc)}
+        return week_generation_job_summary(result)
+    finally:
+        close_old_connections()
+
+
+@shared_task(bind=True, autoretry_for=(), retry_backoff=False)
+def finalize_week_generation_batch_task(self, day_results: list[dict], *, batch_id: str, days: list[str]):
+    """Chord callback for a parallel week batch; returns the same summary shape as serial mode."""
+    jobs = [row for row in (day_results or []) if isinstance(row, dict)]
+    return {
+        "batch_id": batch_id,
+        "mode": WEEK_GENERATION_MODE_PARALLEL,
+        "days_requested": days,
+        "days_completed": [row["day_of_week"] for row in jobs if row.get("status") == "completed"],
+        "days_failed": [row["day_of_week"] for row in jobs if row.get("status") == "failed"],
+        "job_count": len([row for row in jobs if row.get("job_id")]),
+    }
+
+
+@shared_task(bind=True, autoretry_for=(), retry_backoff=False)
+def prune_meal_plan_generation_task(self):
+    """Periodic retention run (see CELERY_BEAT_SCHEDULE); deletes in bounded batches."""
+    close_old_connections()
+    try:
+        return asdict(prune_meal_plan_generation())
+    finally:
+        close_old_connections()
@@ -0,0 +1,74 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.seed_data.admin_parameter_defaults import get_admin_parameter_defaults_v1
+from users.admin_area.models import AdminIdentity, AdminKetoSettings, AdminTDEESettings
+from users.admin_area.services.admin_parameter_tables import apply_admin_parameter_payload
+from users.client_area.services.admin_parameters import (
+    PARAMETER_SOURCE_ADMIN,
+    PARAMETER_SOURCE_DEFAULTS,
+    clear_compiled_admin_parameters_cache,
+    get_compiled_admin_parameters,
+)
+from users.client_area.services.results_engine import BuildResultsContext, build_questionnaire_results
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+
+
+class CompiledAdminParametersTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_compiled_admin_parameters_cache()
+        self.custom = get_admin_parameter_defaults_v1()
+        self.custom["version"] = "v2"
+        self.custom["goal_calorie_adjustments"]["maintain_weight_percent"] = "5"
+        self.admin = AdminIdentity.objects.create(admin_email="coach@example.com")
+
+    def test_defaults_are_compiled_once_and_parsed(self):
+        compiled = get_compiled_admin_parameters()
+
+        self.assertIs(get_compiled_admin_parameters(None), compiled)
+        self.assertEqual(compiled.source, PARAMETER_SOURCE_DEFAULTS)
+        self.assertEqual(compiled.goal_adjustment("gain"), 20.0)
+        self.assertEqual(compiled.goal_adjustment("unknown"), 0.0)
+        table = compiled.tdee_table("low_active", 2)
+        self.assertEqual(table.day_multipliers_desc, (1.4, 1.4, 1.12, 1.12, 1.12, 1.12, 1.12))
+        self.assertEqual(table.category_multiplier, 1.2)
+        splits = compiled.distribution("carb_cycling", 3, "no_training", "low_carbs")
+        self.assertEqual([split.meal_number for split in splits], [1, 2, 3])
+        self.assertEqual(splits[0].carbs, 20.0)
+        self.assertEqual(compiled.distribution("standard", 3, "before_meal_9"), compiled.distribution("standard", 3, "no_training"))
+
+    def test_admin_parameters_are_cached_per_admin_until_the_table_version_changes(self):
+        apply_admin_parameter_payload(self.admin, self.custom)
+        first = get_compiled_admin_parameters(self.admin)
+
+        with self.assertNumQueries(0):
+            self.assertIs(get_compiled_admin_parameters(self.admin), first)
+        self.assertEqual(first.source, PARAMETER_SOURCE_ADMIN)
+        self.assertEqual(first.defaults_version, "v2")
+        self.assertEqual(first.goal_adjustment("maintain"), 5.0)
+
+        tdee = AdminTDEESettings.objects.get(admin=self.admin)
+        tdee.maintain_weight_percent = 25
+        tdee.save()
+        refreshed = get_compiled_admin_parameters(self.admin)
+
+        self.assertIsNot(refreshed, first)
+        self.assertEqual(refreshed.goal_adjustment("maintain"), 25.0)
+
+    def test_admins_with_incomplete_tables_use_the_defaults(self):
+        AdminKetoSettings.objects.get(admin=self.admin, goal="gain").delete()
+
+        self.assertIs(get_compiled_admin_parameters(self.admin), get_compiled_admin_parameters())
+
+    def test_results_report_the_parameter_source(self):
+        defaults = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+        seeded = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS, admin_identity=self.admin))
+        apply_admin_parameter_payload(self.admin, self.custom)
+        custom = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS, admin_identity=self.admin))
+
+        self.assertEqual(defaults["parameter_settings"], {"source": PARAMETER_SOURCE_DEFAULTS, "defaults_version": "v1"})
+        self.assertEqual(seeded["parameter_settings"], {"source": PARAMETER_SOURCE_ADMIN, "defaults_version": "v1"})
+        self.assertEqual(seeded["weekly_days"], defaults["weekly_days"])
+        self.assertEqual(custom["parameter_settings"], {"source": PARAMETER_SOURCE_ADMIN, "defaults_version": "v2"})
+        self.assertGreater(custom["weekly_days"][0]["calories_target"], defaults["weekly_days"][0]["calories_target"])
@@ -0,0 +1,253 @@
+import copy
+import sys
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from users.admin_area.models import AdminIdentity
+from users.client_area.models import (
+    ClientMacroRecalculationJob,
+    ClientMealPlanGenerationJob,
+    ClientProfile,
+    ClientQuestionnaireProgress,
+)
+from users.client_area.services.admin_parameters import clear_compiled_admin_parameters_cache
+from users.client_area.services.macro_recalculation import (
+    CELERY_UNAVAILABLE_MESSAGE,
+    SUPERSEDED_MESSAGE,
+    run_macro_recalculation,
+    run_macro_recalculation_chunk,
+    start_macro_recalculation,
+)
+from users.client_area.services.meal_plan_generation.retention import compact_snapshot
+from users.client_area.services.results_engine import BuildResultsContext, build_questionnaire_results
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+
+
+LAUNCH_PATH = "users.client_area.services.macro_recalculation.launch_full_generation_for_week_background"
+
+
+class MacroRecalculationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_compiled_admin_parameters_cache()
+        self.admin = AdminIdentity.objects.create(admin_email="coach@example.com")
+        self.results = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+
+    def _client(self, email, *, admin=None, questionnaire=True, is_active=True):
+        user = get_user_model().objects.create_user(username=email, email=email, password="pass12345", role="client")
+        ClientProfile.objects.create(
+            user=user,
+            associated_admin=admin or self.admin,
+            offer_code="food_plan_monthly",
+            includes_food_plan=True,
+            is_active=is_active,
+        )
+        if questionnaire:
+            ClientQuestionnaireProgress.objects.create(user=user, status="completed", answers_json=QUESTIONNAIRE_ANSWERS)
+        return user
+
+    def _generated_day(self, user, day, *, stale=False):
+        day_payload = copy.deepcopy(next(row for row in self.results["weekly_days"] if row["day"] == day))
+        if stale:
+            day_payload["meal_macro_splits"][0]["grams"]["protein_g"] += 5
+        return ClientMealPlanGenerationJob.objects.create(
+            user=user,
+            day_of_week=day,
+            status="completed",
+            input_snapshot_json={"day_payload": day_payload},
+        )
+
+    def test_only_days_with_changed_meal_splits_are_regenerated(self):
+        unchanged = self._client("unchanged@example.com")
+        self._generated_day(unchanged, "sunday")
+        self._generated_day(unchanged, "monday")
+        stale = self._client("stale@example.com")
+        self._generated_day(stale, "sunday")
+        self._generated_day(stale, "monday", stale=True)
+        # An older stale job is ignored: the newest completed job per day is the plan.
+        self._generated_day(stale, "tuesday", stale=True)
+        self._generated_day(stale, "tuesday")
+        self._client("no-questionnaire@example.com", questionnaire=False)
+        self._client("inactive@example.com", is_active=False)
+        other_admin = AdminIdentity.objects.create(admin_email="other-coach@example.com")
+        self._generated_day(self._client("other@example.com", admin=other_admin), "monday", stale=True)
+
+        job = ClientMacroRecalculationJob.objects.create(admin=self.admin, trigger="manual_save")
+        with patch(LAUNCH_PATH) as launch:
+            job = run_macro_recalculation(job.id, chunk_size=2)
+
+        launch.assert_called_once_with(stale, days=["monday"], countdown=None)
+        self.assertEqual(job.status, "completed")
+        self.assertEqual(job.progress_percent, 100)
+        self.assertEqual(job.clients_total, 3)
+        self.assertEqual(job.clients_processed, 3)
+        self.assertEqual(job.clients_skipped, 1)
+        self.assertEqual(job.clients_changed, 1)
+        self.assertEqual(job.days_changed, 1)
+        self.assertEqual(job.regenerations_queued, 1)
+        self.assertEqual(job.changed_days_json, {str(stale.id): ["monday"]})
+        self.assertTrue(job.admin_parameters_version)
+
+    def test_days_without_stored_meal_splits_are_not_regenerated(self):
+        user = self._client("compacted@example.com")
+        compacted = self._generated_day(user, "monday", stale=True)
+        compacted.input_snapshot_json = compact_snapshot(compacted.input_snapshot_json)
+        compacted.save(update_fields=["input_snapshot_json"])
+        ClientMealPlanGenerationJob.objects.create(user=user, day_of_week="tuesday", status="completed", input_snapshot_json={})
+
+        job = ClientMacroRecalculationJob.objects.create(admin=self.admin)
+        with patch(LAUNCH_PATH) as launch:
+            job = run_macro_recalculation(job.id)
+
+        launch.assert_not_called()
+        self.assertEqual(job.days_changed, 0)
+        self.assertEqual(job.changed_days_json, {})
+
+    @override_settings(
+        MEAL_PLAN_RECALCULATION_REGENERATIONS_PER_MINUTE=30,
+        MEAL_PLAN_RECALCULATION_CHUNK_PAUSE_SECONDS=1,
+    )
+    def test_chunks_report_progress_and_space_out_regenerations(self):
+        users = [self._client(f"client{index}@example.com") for index in range(3)]
+        for user in users:
+            self._generated_day(user, "friday", stale=True)
+        job = ClientMacroRecalculationJob.objects.create(admin=self.admin)
+
+        with patch(LAUNCH_PATH) as launch:
+            first = run_macro_recalculation_chunk(job.id, chunk_size=2)
+
+        job.refresh_from_db()
+        self.assertTrue(first.has_more)
+        self.assertEqual(first.status, "running")
+        self.assertEqual(job.clients_processed, 2)
+        self.assertEqual(job.progress_percent, 66)
+        self.assertEqual([call.kwargs["countdown"] for call in launch.call_args_list], [None, 2.0])
+        # Two regenerations two seconds apart: the next chunk waits for them, not just the pause.
+        self.assertEqual(first.next_delay_seconds, 4.0)
+
+        with patch(LAUNCH_PATH):
+            second = run_macro_recalculation_chunk(job.id, chunk_size=2)
+        self.assertFalse(second.has_more)
+        self.assertEqual(second.status, "completed")
+        self.assertEqual(second.regenerations_queued, 1)
+
+    def test_newer_job_for_the_same_admin_supersedes_a_running_one(self):
+        self._client("client@example.com")
+        older = ClientMacroRecalculationJob.objects.create(admin=self.admin, status="running", clients_total=1)
+        ClientMacroRecalculationJob.objects.create(admin=self.admin)
+
+        result = run_macro_recalculation_chunk(older.id)
+
+        older.refresh_from_db()
+        self.assertFalse(result.has_more)
+        self.assertEqual(older.status, "failed")
+        self.assertEqual(older.error_message, SUPERSEDED_MESSAGE)
+
+    def test_task_is_dispatched_after_commit(self):
+        with patch("users.client_area.tasks.run_macro_recalculation_task.apply_async") as apply_async:
+            apply_async.return_value.id = "task-1"
+            with self.captureOnCommitCallbacks(execute=True):
+                job = start_macro_recalculation(self.admin, trigger="manual")
+                apply_async.assert_not_called()
+
+        apply_async.assert_called_once_with(kwargs={"job_id": job.id})
+        job.refresh_from_db()
+        self.assertEqual(job.task_id, "task-1")
+
+    def test_dispatch_without_celery_fails_the_job_instead_of_running_inline(self):
+        self._generated_day(self._client("client@example.com"), "monday", stale=True)
+
+        with patch.dict(sys.modules), patch(LAUNCH_PATH) as launch:
+            for name in [name for name in sys.modules if name.startswith("users.client_area.tasks")]:
+                del sys.modules[name]
+            sys.modules["celery"] = None
+            with self.captureOnCommitCallbacks(execute=True):
+                job = start_macro_recalculation(self.admin, trigger="manual")
+
+        launch.assert_not_called()
+        job.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(job.error_message, CELERY_UNAVAILABLE_MESSAGE)
+        self.assertEqual(job.clients_processed, 0)
+
+
+class ParameterSettingsRecalculationViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="coach@example.com",
+            email="coach@example.com",
+            password="pass12345",
+            role="admin",
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_saving_changed_parameters_starts_a_recalculation(self):
+        params = self.client.get("/api/v1/users/admin/parameter_settings/").data["parameter_settings"]["parameters_json"]
+
+        with self.captureOnCommitCallbacks(execute=False):
+            unchanged = self.client.put(
+                "/api/v1/users/admin/parameter_settings/",
+                {"parameters_json": params, "initialized": False},
+                format="json",
+            )
+            params["goal_calorie_adjustments"]["maintain_weight_percent"] = 5
+            changed = self.client.put(
+                "/api/v1/users/admin/parameter_settings/",
+                {"parameters_json": params, "initialized": False},
+                format="json",
+            )
+
+        self.assertIsNone(unchanged.data["recalculation"])
+        self.assertEqual(changed.data["recalculation"]["status"], "pending")
+        self.assertEqual(changed.data["recalculation"]["trigger"], "manual_save")
+        status_response = self.client.get("/api/v1/users/admin/parameter_settings/recalculation/")
+        self.assertEqual(status_response.data["recalculation"]["job_id"], changed.data["recalculation"]["job_id"])
+        self.assertEqual(ClientMacroRecalculationJob.objects.count(), 1)
+
+    def test_saved_parameter_changes_queue_regeneration_of_generated_days(self):
+        params = self.client.get("/api/v1/users/admin/parameter_settings/").data["parameter_settings"]["parameters_json"]
+        identity = AdminIdentity.objects.get(admin_email="coach@example.com")
+        client_user = get_user_model().objects.create_user(
+            username="client@example.com", email="client@example.com", password="pass12345", role="client"
+        )
+        ClientProfile.objects.create(
+            user=client_user,
+            associated_admin=identity,
+            offer_code="food_plan_monthly",
+            includes_food_plan=True,
+            is_active=True,
+        )
+        ClientQuestionnaireProgress.objects.create(user=client_user, status="completed", answers_json=QUESTIONNAIRE_ANSWERS)
+        results = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS, admin_identity=identity))
+        for day in ("monday", "tuesday"):
+            ClientMealPlanGenerationJob.objects.create(
+                user=client_user,
+                day_of_week=day,
+                status="completed",
+                input_snapshot_json={"day_payload": next(row for row in results["weekly_days"] if row["day"] == day)},
+            )
+
+        params["goal_calorie_adjustments"]["maintain_weight_percent"] = 25
+        with patch("users.client_area.tasks.run_macro_recalculation_task.apply_async") as apply_async:
+            apply_async.return_value.id = "task-1"
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.put(
+                    "/api/v1/users/admin/parameter_settings/",
+                    {"parameters_json": params, "initialized": False},
+                    format="json",
+                )
+        job_id = response.data["recalculation"]["job_id"]
+        apply_async.assert_called_once_with(kwargs={"job_id": job_id})
+
+        with patch(LAUNCH_PATH) as launch:
+            job = run_macro_recalculation(job_id)
+
+        launch.assert_called_once_with(client_user, days=["monday", "tuesday"], countdown=None)
+        self.assertEqual(job.status, "completed")
+        self.assertEqual(job.changed_days_json, {str(client_user.id): ["monday", "tuesday"]})
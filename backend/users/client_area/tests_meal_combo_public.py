@@ -1,7 +1,12 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
 from django.test import TestCase
 from rest_framework.test import APIClient
 
 from core.models import FoodLibraryItem, MealComboTemplate
+from users.client_area.views import meal_combo_public
 from users.client_area.views.meal_combo_public import _combo_to_payload, _pick_combo
 
 
@@ -243,6 +248,34 @@ class MealComboStarterTemplateShapePolicyTests(TestCase):
         meals = response.data["starter_templates"][0]["default_day_meals"]
         self.assertIn("Banana STANDARD", {meal["carbs_2"] for meal in meals})
 
+    def test_starter_catalog_is_cached_per_day_shape_and_combo_version(self):
+        payload = self._day_payload(protein=40, carbs=65)
+        first = self._starter(payload)
+
+        # Same shape buckets with different grams and day reuse the cached catalog.
+        with patch("users.client_area.views.meal_combo_public._build_template") as build_template:
+            again = self._starter({**self._day_payload(protein=42, carbs=70), "day": "sunday"})
+        build_template.assert_not_called()
+        self.assertEqual(again.data, first.data)
+
+        MealComboTemplate.objects.filter(combo_id=107).delete()
+        with patch(
+            "users.client_area.views.meal_combo_public._build_template",
+            wraps=meal_combo_public._build_template,
+        ) as build_template:
+            self._starter(payload)
+        self.assertTrue(build_template.called)
+
+    def test_warm_command_fills_the_catalog_cache(self):
+        out = StringIO()
+        call_command("warm_starter_catalog", stdout=out)
+
+        self.assertIn("warmed for 33 day shapes", out.getvalue())
+        with patch("users.client_area.views.meal_combo_public._build_template") as build_template:
+            response = self._starter(self._day_payload(protein=40, carbs=65))
+        build_template.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+
 
 class MealComboStarterTemplateFatPolicyTests(TestCase):
     def test_chicken_breast_prefers_oil_as_single_fat_for_low_fat_meal(self):
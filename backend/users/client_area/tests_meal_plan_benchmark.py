@@ -0,0 +1,69 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from core.models import FoodLibraryItem, MealComboTemplate
+from core.services.table_versions import ALL_TABLES, get_table_version
+from users.client_area.benchmarks.meal_plan_generation import BenchmarkSizes, run_generation_benchmark
+from users.client_area.models import ClientMealPlanGeneratedMeal, ClientMealPlanGenerationJob
+
+
+SMALL_SIZES = BenchmarkSizes(foods=20, combos=15, error_codes=50, repeat=1, plan_types=("standard",), meals_per_day=(3,))
+
+
+class GenerationBenchmarkCommandTests(TestCase):
+    def test_command_reports_every_operation_and_rolls_back_seeded_rows(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_meal_plan_generation",
+            "--foods", "20",
+            "--combos", "15",
+            "--error-codes", "50",
+            "--repeat", "1",
+            "--plan-types", "standard,keto",
+            "--meals", "3",
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(report["seeded"], {"foods": 20, "combos": 15, "error_codes": 50})
+        self.assertEqual([(row["plan_type"], row["meals_per_day"]) for row in report["scenarios"]], [("standard", 3), ("keto", 3)])
+        operations = report["scenarios"][0]["operations"]
+        self.assertEqual(
+            set(operations),
+            {
+                "build_questionnaire_results",
+                "build_step1_rows_for_day",
+                "run_full_generation_for_day",
+                "get_generated_meal_day_detail",
+            },
+        )
+        generation = operations["run_full_generation_for_day"]
+        self.assertGreater(generation["queries"], 0)
+        self.assertEqual(generation["rows_written"], 3)
+        self.assertGreater(operations["build_step1_rows_for_day"]["rows_written"], 0)
+        self.assertGreater(generation["peak_kib"], 0)
+        self.assertEqual(set(generation["wall_ms"]), {"min", "median", "max"})
+
+        self.assertFalse(FoodLibraryItem.objects.exists())
+        self.assertFalse(MealComboTemplate.objects.exists())
+        self.assertFalse(ClientMealPlanGenerationJob.objects.exists())
+        self.assertFalse(ClientMealPlanGeneratedMeal.objects.exists())
+
+    def test_rolled_back_run_restores_table_version_stamps(self):
+        before = {name: get_table_version(name) for name in ALL_TABLES}
+
+        run_generation_benchmark(SMALL_SIZES)
+
+        self.assertEqual({name: get_table_version(name) for name in ALL_TABLES}, before)
+
+    def test_keep_data_can_run_twice(self):
+        run_generation_benchmark(SMALL_SIZES, keep_data=True)
+        report = run_generation_benchmark(SMALL_SIZES, keep_data=True)
+
+        self.assertEqual(report["seeded"]["foods"], 20)
+        self.assertEqual(FoodLibraryItem.objects.count(), 20)
+        self.assertEqual(MealComboTemplate.objects.count(), 15)
@@ -0,0 +1,67 @@
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from core.models import MealComboTemplate
+from users.client_area.models import ClientMealPlanGeneratedMeal, ClientMealPlanGenerationJob
+from users.client_area.services.meal_plan_generation import bulk_writer
+from users.client_area.services.meal_plan_generation.bulk_writer import CopyBulkWriter, OrmBulkWriter, get_bulk_writer
+from users.client_area.services.meal_plan_generation.generation_cache import clone_generated_meals, write_generated_meals
+
+
+class BulkWriterTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="writer@example.com",
+            email="writer@example.com",
+            password="pass12345",
+            role="client",
+        )
+        MealComboTemplate.objects.create(combo_id=7, protein_slot_1="Chicken STANDARD")
+        self.job = ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="monday", status="running")
+
+    def test_bulk_create_fallback_off_postgres(self):
+        self.assertIsInstance(get_bulk_writer(ClientMealPlanGeneratedMeal, ("job_id",)), OrmBulkWriter)
+        with patch.object(bulk_writer, "copy_supported", return_value=True):
+            self.assertIsInstance(get_bulk_writer(ClientMealPlanGeneratedMeal, ("job_id",)), CopyBulkWriter)
+            with override_settings(MEAL_PLAN_BULK_WRITER="orm"):
+                self.assertNotIsInstance(get_bulk_writer(ClientMealPlanGeneratedMeal, ("job_id",)), CopyBulkWriter)
+
+    def test_copy_buffer_fills_defaults_timestamps_and_escapes_text(self):
+        writer = CopyBulkWriter(ClientMealPlanGeneratedMeal, ("job_id", "user_id", "day_of_week", "meal_number", "protein1_total"))
+        now = datetime(2026, 1, 5, 12, 0, tzinfo=dt_timezone.utc)
+
+        with patch.object(bulk_writer.timezone, "now", return_value=now):
+            lines = writer._buffer([(1, 2, "mon\tday", 3, Decimal("12.500000")), (1, 2, None, 4, 1.25)]).read().splitlines()
+
+        self.assertNotIn("id", writer.columns)
+        self.assertEqual(len(writer.columns), len(lines[0].split("\t")))
+        first = dict(zip(writer.columns, lines[0].split("\t")))
+        self.assertEqual(first["day_of_week"], "mon\\tday")
+        self.assertEqual(first["protein1_total"], "12.500000")
+        self.assertEqual(first["error_code"], "0")
+        self.assertEqual(first["created_at"], now.isoformat())
+        second = dict(zip(writer.columns, lines[1].split("\t")))
+        self.assertEqual(second["day_of_week"], "\\N")
+        self.assertEqual(second["protein1_total"], "1.25")
+
+    def test_write_and_clone_generated_meals(self):
+        written = write_generated_meals(
+            self.job,
+            [
+                {"day_of_week": "monday", "meal_number": 1, "combo_template_id": 7, "protein1_total": Decimal("30")},
+                {"day_of_week": "monday", "meal_number": 2, "combo_template_id": 7},
+            ],
+        )
+        target = ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="monday", status="running")
+
+        self.assertEqual(written, 2)
+        self.assertEqual(clone_generated_meals(self.job, target), 2)
+        cloned = list(ClientMealPlanGeneratedMeal.objects.filter(job=target).order_by("meal_number"))
+        self.assertEqual([row.meal_number for row in cloned], [1, 2])
+        self.assertEqual(cloned[0].protein1_total, Decimal("30"))
+        self.assertEqual(cloned[1].error_code, 0)
+        self.assertEqual(cloned[1].user_id, self.user.id)
@@ -0,0 +1,241 @@
+from decimal import Decimal
+import json
+import tempfile
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from core.models import FoodLibraryItem, MealComboTemplate
+from users.client_area.models import (
+    ClientFoodOverride,
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationJob,
+    ClientMealPlanRenderedDay,
+    ProductImageSubmission,
+)
+from users.client_area.admin import approve_product_images
+from users.client_area.services.meal_plan_generation.rendered_day import render_day_detail
+from users.client_area.services.meal_plan_generation.runner import (
+    get_generated_meal_day_detail,
+    get_generated_meal_week_detail,
+)
+
+
+class DayDetailTestBase(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="detail@example.com",
+            email="detail@example.com",
+            password="pass12345",
+            role="client",
+        )
+        FoodLibraryItem.objects.bulk_create(
+            [
+                FoodLibraryItem(source_food_id=1, category="Chicken Breast STANDARD", name="Chicken Breast STANDARD", preparation_state="cooked"),
+                FoodLibraryItem(source_food_id=2, category="Rice STANDARD", name="Rice STANDARD", preparation_state="dry_uncooked"),
+                FoodLibraryItem(source_food_id=3, category="Rice STANDARD", name="Jasmine Rice", preparation_state="raw"),
+                FoodLibraryItem(source_food_id=4, category="Unused STANDARD", name="Unused STANDARD", preparation_state="raw"),
+            ]
+        )
+        MealComboTemplate.objects.create(
+            combo_id=10,
+            protein_slot_1="Chicken Breast STANDARD",
+            carb_slot_1="Rice STANDARD",
+            fat_slot_1="Avocado STANDARD",
+        )
+        self.job = ClientMealPlanGenerationJob.objects.create(
+            user=self.user,
+            day_of_week="sunday",
+            status="completed",
+            progress_percent=100,
+            input_snapshot_json={
+                "day_payload": {"day": "sunday", "training_before_meal": "before_meal_2", "meals_per_day": 2},
+                "day_selected_slot_foods": {"2": {"carbs_1": "Jasmine Rice"}},
+            },
+        )
+        for meal_number in (1, 2):
+            ClientMealPlanGeneratedMeal.objects.create(
+                job=self.job,
+                user=self.user,
+                day_of_week="sunday",
+                meal_number=meal_number,
+                combo_template_id=10,
+                error_code=7,
+                protein1_total=Decimal("6"),
+                carbs1_total=Decimal("2"),
+            )
+        self.override = ClientFoodOverride.objects.create(
+            user=self.user,
+            canonical_category="Avocado STANDARD",
+            external_provider="open_food_facts",
+            external_food_id="555",
+            barcode="555",
+            display_name="Brand Avocado",
+            image_url="https://example.com/avocado.jpg",
+            protein=0,
+            carbs=0,
+            fats=Decimal("7"),
+            calories=0,
+        )
+
+    def _approved_image(self, **fields):
+        return ProductImageSubmission.objects.create(
+            submitted_by=self.user,
+            image=SimpleUploadedFile("approved.jpg", b"fake-image", content_type="image/jpeg"),
+            status=ProductImageSubmission.Status.APPROVED,
+            **fields,
+        )
+
+
+@override_settings(MEDIA_ROOT=tempfile.gettempdir())
+class GeneratedMealDayDetailTests(DayDetailTestBase):
+    def test_detail_resolves_selected_foods_overrides_and_approved_images(self):
+        self._approved_image(provider="open_food_facts", provider_product_id="other", barcode="999")
+        image = self._approved_image(provider="usda", provider_product_id="x", barcode="555")
+
+        detail = get_generated_meal_day_detail(self.user, "sunday")
+
+        self.assertEqual(detail["training_time"], "before_meal_2")
+        meal_1, meal_2 = detail["meals"]
+        self.assertEqual(meal_1["slots"]["protein_1"]["preparation_state"], "cooked")
+        self.assertEqual(meal_1["slots"]["protein_1"]["amount_g"], round(6 * 28.3495, 2))
+        self.assertEqual(meal_1["slots"]["carbs_1"]["measurement_basis_label"], "Measure dry/uncooked")
+        self.assertEqual(meal_2["slots"]["carbs_1"]["canonical_name"], "Jasmine Rice")
+        self.assertEqual(meal_2["slots"]["carbs_1"]["preparation_state"], "raw")
+        self.assertEqual(meal_1["slots"]["protein_2"]["measurement_basis_label"], "Measurement basis not specified")
+
+        fat_slot = meal_1["slots"]["fats_1"]
+        self.assertEqual(fat_slot["name"], "Brand Avocado")
+        self.assertEqual(fat_slot["image_source"], "approved_local")
+        self.assertEqual(fat_slot["image_url"], image.image.url)
+
+    def test_newest_matching_image_wins_across_product_and_barcode_keys(self):
+        self._approved_image(provider="other", provider_product_id="x", barcode="555")
+        newest = self._approved_image(provider="open_food_facts", provider_product_id="555", barcode="")
+
+        detail = get_generated_meal_day_detail(self.user, "sunday")
+
+        self.assertEqual(detail["meals"][0]["slots"]["fats_1"]["image_url"], newest.image.url)
+
+    def test_query_count_does_not_grow_with_library_or_image_table(self):
+        FoodLibraryItem.objects.bulk_create(
+            [FoodLibraryItem(source_food_id=100 + index, name=f"Filler {index}") for index in range(50)]
+        )
+        for index in range(5):
+            self._approved_image(provider="usda", provider_product_id=f"filler-{index}")
+
+        # generated meals + combos, overrides, foods, images
+        with self.assertNumQueries(4):
+            detail = render_day_detail(self.job)
+
+        self.assertEqual(detail["meals"][0]["slots"]["fats_1"]["image_source"], "selected_product")
+
+
+@override_settings(MEDIA_ROOT=tempfile.gettempdir())
+class RenderedDayTests(DayDetailTestBase):
+    def setUp(self):
+        super().setUp()
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def test_completed_job_detail_is_served_from_one_query(self):
+        first = get_generated_meal_day_detail(self.user, "sunday")
+        self.assertTrue(ClientMealPlanRenderedDay.objects.filter(job=self.job).exists())
+
+        with self.assertNumQueries(1):
+            second = get_generated_meal_day_detail(self.user, "sunday")
+
+        self.assertEqual(first, second)
+
+    def test_override_delete_invalidates_rendered_day(self):
+        get_generated_meal_day_detail(self.user, "sunday")
+
+        response = self.api.delete(f"/api/v1/users/client/app/food-overrides/{self.override.id}/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(ClientMealPlanRenderedDay.objects.filter(job=self.job).exists())
+        detail = get_generated_meal_day_detail(self.user, "sunday")
+        self.assertEqual(detail["meals"][0]["slots"]["fats_1"]["name"], "Avocado STANDARD")
+
+    def test_image_approval_invalidates_rendered_day(self):
+        submission = ProductImageSubmission.objects.create(
+            submitted_by=self.user,
+            provider="open_food_facts",
+            provider_product_id="555",
+            image=SimpleUploadedFile("pending.jpg", b"fake-image", content_type="image/jpeg"),
+        )
+        self.assertEqual(get_generated_meal_day_detail(self.user, "sunday")["meals"][0]["slots"]["fats_1"]["image_source"], "selected_product")
+
+        # The changelist filtered to pending submissions: the action must not lose them to its own update.
+        pending = ProductImageSubmission.objects.filter(id=submission.id, status=ProductImageSubmission.Status.PENDING)
+        approve_product_images(None, SimpleNamespace(user=self.user), pending)
+
+        detail = get_generated_meal_day_detail(self.user, "sunday")
+        self.assertEqual(detail["meals"][0]["slots"]["fats_1"]["image_source"], "approved_local")
+
+    def test_food_library_edit_rebuilds_stale_rendered_day(self):
+        get_generated_meal_day_detail(self.user, "sunday")
+
+        FoodLibraryItem.objects.filter(source_food_id=1).update(preparation_state="raw")
+
+        detail = get_generated_meal_day_detail(self.user, "sunday")
+        self.assertEqual(detail["meals"][0]["slots"]["protein_1"]["preparation_state"], "raw")
+
+
+@override_settings(MEDIA_ROOT=tempfile.gettempdir())
+class WeekDetailTests(DayDetailTestBase):
+    def setUp(self):
+        super().setUp()
+        self.monday_job = ClientMealPlanGenerationJob.objects.create(
+            user=self.user,
+            day_of_week="monday",
+            status="completed",
+            input_snapshot_json={"day_payload": {"day": "monday", "meals_per_day": 1}},
+        )
+        ClientMealPlanGeneratedMeal.objects.create(
+            job=self.monday_job,
+            user=self.user,
+            day_of_week="monday",
+            meal_number=1,
+            combo_template_id=10,
+            fats1_total=Decimal("1"),
+        )
+        self.api = APIClient()
+        self.api.force_authenticate(user=self.user)
+
+    def test_week_detail_matches_day_detail_and_renders_days_together(self):
+        # latest jobs, generated meals, overrides, foods, images, rendered-day upsert
+        with self.assertNumQueries(6):
+            week = get_generated_meal_week_detail(self.user, days=["sunday", "monday", "tuesday"])
+
+        self.assertEqual(week["days_available"], ["sunday", "monday"])
+        self.assertIsNone(week["days"][2]["meal_plan_day"])
+        self.assertEqual(week["days"][0]["meal_plan_day"], get_generated_meal_day_detail(self.user, "sunday"))
+        self.assertEqual(week["days"][1]["meal_plan_day"]["meals"][0]["slots"]["fats_1"]["name"], "Brand Avocado")
+
+        with self.assertNumQueries(1):
+            get_generated_meal_week_detail(self.user, days=["sunday", "monday", "tuesday"])
+
+    def test_week_detail_uses_latest_job_per_day(self):
+        newer = ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="monday", status="running")
+
+        week = get_generated_meal_week_detail(self.user, days=["monday"])
+
+        self.assertEqual(week["days"][0]["meal_plan_day"]["job_id"], newer.id)
+        self.assertEqual(week["days"][0]["meal_plan_day"]["meals"], [])
+
+    def test_week_detail_endpoint_streams_one_day_per_line(self):
+        response = self.api.get("/api/v1/users/client/app/meal-plan-week/detailed/?stream=1")
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([line["day_of_week"] for line in lines][:2], ["sunday", "monday"])
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(lines[1]["meal_plan_day"]["job_id"], self.monday_job.id)
+
+        response = self.api.get("/api/v1/users/client/app/meal-plan-week/detailed/?day=monday")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["meal_plan_week"]["days_available"], ["monday"])
@@ -0,0 +1,136 @@
+import importlib
+import sys
+from unittest.mock import patch
+
+from django.apps import apps
+from django.test import TestCase
+
+from users.client_area.models import (
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationBatch,
+    ClientMealPlanGenerationJob,
+)
+from users.client_area.services.meal_plan_generation.batches import (
+    create_generation_batch,
+    queued_day_summary,
+    record_batch_day,
+)
+from users.client_area.services.meal_plan_generation.runner import (
+    get_generation_week_batch_status,
+    launch_full_generation_for_week_background,
+    run_full_generation_for_week,
+)
+from users.client_area.tests_meal_plan_step1 import PRIVATE_PIPELINE_LOADER, create_generation_client, stub_solver_runner
+
+
+backfill_migration = importlib.import_module("users.client_area.migrations.0024_clientmealplangenerationbatch_and_job_batch_id")
+
+
+class GenerationBatchTests(TestCase):
+    def setUp(self):
+        self.user = create_generation_client("batch@example.com")
+        self.failing_days = set()
+
+    def _run_week(self, days, batch_id):
+        runner = stub_solver_runner(failing_days=self.failing_days, meals_per_day=1)
+        with patch(PRIVATE_PIPELINE_LOADER, return_value=runner), self.captureOnCommitCallbacks(execute=True):
+            return run_full_generation_for_week(self.user, days=days, batch_id=batch_id, mode="serial")
+
+    def test_runner_keeps_batch_record_current_and_status_is_one_read(self):
+        self._run_week(["sunday", "monday"], "batch-ok")
+
+        batch = ClientMealPlanGenerationBatch.objects.get(batch_id="batch-ok")
+        self.assertEqual(batch.status, "completed")
+        self.assertEqual((batch.days_total, batch.days_completed, batch.days_failed), (2, 2, 0))
+        self.assertEqual(batch.generated_meal_count, 2)
+        self.assertIsNotNone(batch.completed_at)
+        self.assertEqual(
+            set(ClientMealPlanGenerationJob.objects.filter(batch_id="batch-ok").values_list("batch_mode", flat=True)),
+            {"week"},
+        )
+
+        with self.assertNumQueries(1):
+            status = get_generation_week_batch_status(self.user, "batch-ok", days=["sunday", "monday"])
+
+        self.assertEqual(status["status"], "completed")
+        self.assertEqual(status["days_completed"], ["sunday", "monday"])
+        self.assertEqual(status["jobs"][1]["generated_meal_count"], 1)
+
+    def test_failed_day_is_recorded_even_though_its_job_rolls_back(self):
+        self.failing_days = {"monday"}
+
+        with self.assertRaises(RuntimeError):
+            self._run_week(["sunday", "monday"], "batch-fail")
+
+        self.assertFalse(ClientMealPlanGenerationJob.objects.filter(batch_id="batch-fail", day_of_week="monday").exists())
+        status = get_generation_week_batch_status(self.user, "batch-fail", days=["sunday", "monday"])
+        self.assertEqual(status["status"], "failed")
+        self.assertEqual(status["jobs"][1]["error_message"], "solver exploded")
+        self.assertEqual(ClientMealPlanGenerationBatch.objects.get(batch_id="batch-fail").days_failed, 1)
+
+    def test_batch_is_finished_only_once_every_day_has_finished(self):
+        create_generation_batch(self.user, "batch-partial", ["sunday", "monday"])
+
+        record_batch_day("batch-partial", "sunday", {**queued_day_summary("sunday"), "status": "failed"})
+        batch = ClientMealPlanGenerationBatch.objects.get(batch_id="batch-partial")
+        self.assertEqual(batch.status, "failed")
+        self.assertIsNone(batch.completed_at)
+
+        record_batch_day("batch-partial", "monday", {**queued_day_summary("monday"), "status": "completed"})
+        batch.refresh_from_db()
+        self.assertIsNotNone(batch.completed_at)
+
+    def test_launch_without_celery_leaves_no_batch_record(self):
+        with patch.dict(sys.modules):
+            for name in [name for name in sys.modules if name.startswith("users.client_area.tasks")]:
+                del sys.modules[name]
+            sys.modules["celery"] = None
+            with self.assertRaises(ValueError):
+                launch_full_generation_for_week_background(self.user, days=["sunday"])
+
+        self.assertFalse(ClientMealPlanGenerationBatch.objects.exists())
+
+    def test_launch_drops_the_batch_record_when_the_broker_is_unreachable(self):
+        from users.client_area.tasks import run_week_generation_batch_task
+
+        with patch.object(run_week_generation_batch_task, "apply_async", side_effect=ConnectionError("broker down")):
+            with self.assertRaises(ConnectionError):
+                launch_full_generation_for_week_background(self.user, days=["sunday", "monday"])
+
+        self.assertFalse(ClientMealPlanGenerationBatch.objects.exists())
+
+    def test_backfill_promotes_snapshot_batch_ids_and_creates_batch_records(self):
+        older = ClientMealPlanGenerationJob.objects.create(
+            user=self.user,
+            day_of_week="sunday",
+            status="failed",
+            input_snapshot_json={"batch_id": "legacy", "batch_mode": "week"},
+        )
+        latest = ClientMealPlanGenerationJob.objects.create(
+            user=self.user,
+            day_of_week="sunday",
+            status="completed",
+            input_snapshot_json={"batch_id": "legacy", "batch_mode": "week"},
+        )
+        ClientMealPlanGeneratedMeal.objects.create(job=latest, user=self.user, day_of_week="sunday", meal_number=1, combo_template_id=77)
+        ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="monday", status="completed")
+
+        backfill_migration.backfill_generation_batches(apps, None)
+
+        older.refresh_from_db()
+        self.assertEqual((older.batch_id, older.batch_mode), ("legacy", "week"))
+        batch = ClientMealPlanGenerationBatch.objects.get(batch_id="legacy")
+        self.assertEqual(batch.status, "completed")
+        self.assertEqual(batch.days_requested, ["sunday"])
+        self.assertEqual(batch.day_jobs_json["sunday"]["job_id"], latest.id)
+        self.assertEqual(batch.generated_meal_count, 1)
+        self.assertEqual(ClientMealPlanGenerationBatch.objects.count(), 1)
+
+    def test_batches_without_a_record_fall_back_to_the_batch_id_column(self):
+        job = ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="sunday", status="running", batch_id="no-record")
+
+        status = get_generation_week_batch_status(self.user, "no-record", days=["sunday", "monday"])
+
+        self.assertEqual(status["status"], "running")
+        self.assertEqual(status["jobs"][0]["job_id"], job.id)
+        self.assertEqual(status["jobs"][1]["status"], "queued")
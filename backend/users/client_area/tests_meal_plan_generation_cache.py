@@ -0,0 +1,84 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.models import MealComboTemplate
+from users.client_area.models import (
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationJob,
+    ClientQuestionnaireProgress,
+)
+from users.client_area.services.meal_plan_generation.generation_cache import get_generation_cache_stats
+from users.client_area.services.meal_plan_generation.runner import run_full_generation_for_day
+from users.client_area.tests_meal_plan_step1 import (
+    PRIVATE_PIPELINE_LOADER,
+    QUESTIONNAIRE_ANSWERS,
+    create_generation_client,
+    stub_solver_runner,
+)
+
+
+class GenerationCacheTests(TestCase):
+    def setUp(self):
+        self.user = create_generation_client("memo@example.com")
+        self.progress = ClientQuestionnaireProgress.objects.get(user=self.user)
+        self.solver_calls = []
+
+    def _generate(self, **kwargs):
+        runner = stub_solver_runner(calls=self.solver_calls, protein1_total=Decimal("4.5"))
+        with patch(PRIVATE_PIPELINE_LOADER, return_value=runner):
+            return run_full_generation_for_day(self.user, "sunday", **kwargs)
+
+    def test_identical_request_clones_previous_meals(self):
+        first = self._generate()
+        second = self._generate()
+
+        self.assertEqual(self.solver_calls, [first.job_id])
+        self.assertNotEqual(first.job_id, second.job_id)
+        self.assertEqual(second.generated_meal_count, first.generated_meal_count)
+        cloned = ClientMealPlanGeneratedMeal.objects.filter(job_id=second.job_id).order_by("meal_number")
+        self.assertEqual([row.protein1_total for row in cloned], [Decimal("4.5")] * 3)
+        job = ClientMealPlanGenerationJob.objects.get(id=second.job_id)
+        self.assertEqual(job.input_snapshot_json["generation_cache"]["source_job_id"], first.job_id)
+        self.assertEqual(get_generation_cache_stats()["hits"], 1)
+        self.assertEqual(get_generation_cache_stats()["misses"], 1)
+
+    def test_changed_slot_selection_or_bypass_reruns_solver(self):
+        self._generate()
+        self._generate(bypass_cache=True)
+
+        self.progress.answers_json = {
+            **QUESTIONNAIRE_ANSWERS,
+            "food_preferences": {"weekly_days": {"sunday": [{"protein_1": "Chicken STANDARD"}]}},
+        }
+        self.progress.save(update_fields=["answers_json"])
+        self._generate()
+
+        self.assertEqual(len(self.solver_calls), 3)
+
+    def test_combo_table_change_invalidates_cached_generation(self):
+        self._generate()
+        MealComboTemplate.objects.filter(combo_id=77).update(carb_slot_1="Rice STANDARD")
+        self._generate()
+
+        self.assertEqual(len(self.solver_calls), 2)
+
+    def test_superadmin_can_force_bypass(self):
+        superadmin = get_user_model().objects.create_superuser(
+            username="root@example.com",
+            email="root@example.com",
+            password="pass12345",
+        )
+        client = APIClient()
+        client.force_authenticate(user=superadmin)
+
+        response = client.post("/api/v1/users/superadmin/meal-plan-generation/cache/", {"bypass": True}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["generation_cache"]["bypass"])
+
+        self._generate()
+        self._generate()
+        self.assertEqual(len(self.solver_calls), 2)
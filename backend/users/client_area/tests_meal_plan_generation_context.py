@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.services.table_versions import ADMIN_PARAMETERS, bump_table_version
+from users.client_area.models import ClientProfile, ClientQuestionnaireProgress
+from users.client_area.services.meal_plan_generation.context import build_generation_context
+from users.client_area.services.results_engine import build_questionnaire_results
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+from users.client_area.tests_results_lazy import _without_generated_at
+
+
+RESULTS_BUILDER = "users.client_area.services.results_memo.build_questionnaire_results"
+
+
+class GenerationContextCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="context@example.com",
+            email="context@example.com",
+            password="pass12345",
+            role="client",
+        )
+        ClientProfile.objects.create(user=self.user, offer_code="food_plan_monthly", includes_food_plan=True)
+        self.progress = ClientQuestionnaireProgress.objects.create(
+            user=self.user,
+            status="completed",
+            answers_json=QUESTIONNAIRE_ANSWERS,
+        )
+
+    def test_unchanged_answers_reuse_cached_results(self):
+        with patch(RESULTS_BUILDER, wraps=build_questionnaire_results) as build_results:
+            first = build_generation_context(self.user)
+            second = build_generation_context(self.user)
+
+        self.assertEqual(build_results.call_count, 1)
+        self.assertEqual(first.results_hash, second.results_hash)
+        self.assertEqual(_without_generated_at(first.results), _without_generated_at(second.results))
+        self.assertEqual(second.day_payload("monday")["day"], "monday")
+
+    def test_changed_answers_or_admin_parameters_rebuild_results(self):
+        with patch(RESULTS_BUILDER, wraps=build_questionnaire_results) as build_results:
+            first = build_generation_context(self.user)
+
+            self.progress.answers_json = {**QUESTIONNAIRE_ANSWERS, "goal": "lose"}
+            self.progress.save(update_fields=["answers_json"])
+            second = build_generation_context(self.user)
+
+            bump_table_version(ADMIN_PARAMETERS)
+            third = build_generation_context(self.user)
+
+        self.assertEqual(build_results.call_count, 3)
+        self.assertEqual(len({first.results_hash, second.results_hash, third.results_hash}), 3)
+        self.assertEqual(second.results["profile"]["goal"], "lose")
@@ -0,0 +1,221 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import skipIf, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.utils import timezone
+
+from core.models import MealComboTemplate
+from users.client_area.models import (
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationJob,
+    ClientMealPlanGenerationStep1Row,
+)
+from users.client_area.services.meal_plan_generation.retention import prune_meal_plan_generation
+from users.client_area.services.meal_plan_generation.step1_partitions import (
+    Step1Partition,
+    drop_expired_step1_partitions,
+    ensure_step1_partitions,
+    list_step1_partitions,
+    partition_job_span,
+    parse_partition_bound,
+    step1_partitioning_enabled,
+)
+
+
+class GenerationRetentionTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="retention@example.com",
+            email="retention@example.com",
+            password="pass12345",
+            role="client",
+        )
+        MealComboTemplate.objects.create(combo_id=5, protein_slot_1="Chicken STANDARD")
+        self.sunday_jobs = [self._job("sunday", age_hours=48 - index) for index in range(4)]
+        self.stale_running = self._job("sunday", status="running", age_hours=100)
+        self.monday_job = self._job("monday", age_hours=48)
+
+    def _job(self, day, *, status="completed", age_hours=48):
+        job = ClientMealPlanGenerationJob.objects.create(
+            user=self.user,
+            day_of_week=day,
+            status=status,
+            input_snapshot_json={
+                "day_payload": {"day": day, "meals_per_day": 1, "training_before_meal": "none", "meal_macro_splits": [1, 2]},
+                "profile": {"weight": 180},
+                "core_calculations": {"tdee": 2500},
+                "parameter_settings": {"source": "dta_defaults"},
+                "day_selected_slot_foods": {"1": {"protein_1": "Chicken STANDARD"}},
+            },
+        )
+        ClientMealPlanGenerationJob.objects.filter(id=job.id).update(created_at=timezone.now() - timedelta(hours=age_hours))
+        ClientMealPlanGenerationStep1Row.objects.bulk_create(
+            [ClientMealPlanGenerationStep1Row(job=job, meal_number=1, error_code=code) for code in range(5)]
+        )
+        ClientMealPlanGeneratedMeal.objects.create(job=job, user=self.user, day_of_week=day, meal_number=1, combo_template_id=5)
+        return job
+
+    def test_prune_keeps_latest_jobs_drops_step1_rows_and_compacts_snapshots(self):
+        result = prune_meal_plan_generation(keep_latest=2, batch_size=3, step1_grace_hours=1, pause_seconds=0)
+
+        remaining = set(ClientMealPlanGenerationJob.objects.values_list("id", flat=True))
+        self.assertEqual(
+            remaining,
+            {self.sunday_jobs[2].id, self.sunday_jobs[3].id, self.stale_running.id, self.monday_job.id},
+        )
+        self.assertEqual(result.jobs_deleted, 2)
+        self.assertEqual(
+            set(ClientMealPlanGenerationStep1Row.objects.values_list("job_id", flat=True)),
+            {self.stale_running.id},
+        )
+        self.assertEqual(result.step1_rows_deleted, 25)
+        self.assertGreater(result.delete_batches, 8)
+
+        latest = ClientMealPlanGenerationJob.objects.get(id=self.sunday_jobs[3].id)
+        self.assertIn("profile", latest.input_snapshot_json)
+        self.assertEqual(latest.input_snapshot_json["step1_summary"]["row_count"], 5)
+
+        older = ClientMealPlanGenerationJob.objects.get(id=self.sunday_jobs[2].id)
+        self.assertTrue(older.input_snapshot_json["compacted"])
+        self.assertNotIn("profile", older.input_snapshot_json)
+        self.assertEqual(older.input_snapshot_json["day_payload"], {"day": "sunday", "meals_per_day": 1, "training_before_meal": "none"})
+        self.assertEqual(older.input_snapshot_json["day_selected_slot_foods"], {"1": {"protein_1": "Chicken STANDARD"}})
+        self.assertEqual(ClientMealPlanGeneratedMeal.objects.filter(job=older).count(), 1)
+
+    def test_live_plan_is_kept_whole_when_newer_reruns_failed(self):
+        failed_reruns = [self._job("monday", status="failed", age_hours=47 - index) for index in range(2)]
+
+        prune_meal_plan_generation(keep_latest=1, step1_grace_hours=1, pause_seconds=0)
+
+        live = ClientMealPlanGenerationJob.objects.get(id=self.monday_job.id)
+        self.assertNotIn("compacted", live.input_snapshot_json)
+        self.assertEqual(live.input_snapshot_json["day_payload"]["meal_macro_splits"], [1, 2])
+        self.assertEqual(ClientMealPlanGeneratedMeal.objects.filter(job=live).count(), 1)
+        self.assertFalse(ClientMealPlanGenerationJob.objects.filter(id=failed_reruns[0].id).exists())
+        self.assertTrue(ClientMealPlanGenerationJob.objects.filter(id=failed_reruns[1].id).exists())
+
+    def test_recent_jobs_are_left_alone_within_grace_period(self):
+        prune_meal_plan_generation(keep_latest=1, step1_grace_hours=72)
+
+        self.assertEqual(ClientMealPlanGenerationJob.objects.count(), 6)
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.count(), 30)
+
+    def test_command_dry_run_reports_without_deleting(self):
+        out = StringIO()
+
+        call_command("prune_meal_plan_generation", "--keep", "2", "--step1-grace-hours", "1", "--dry-run", stdout=out)
+
+        self.assertIn("Would prune 2 jobs and 25 Step1 rows; compacted 1 snapshots", out.getvalue())
+        self.assertEqual(ClientMealPlanGenerationJob.objects.count(), 6)
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.count(), 30)
+
+
+class Step1PartitionTests(TestCase):
+    def test_partition_bounds_are_parsed_from_postgres_expressions(self):
+        self.assertEqual(
+            parse_partition_bound("p_legacy", "FOR VALUES FROM (MINVALUE) TO ('15000')"),
+            Step1Partition(name="p_legacy", lower=None, upper=15000),
+        )
+        self.assertEqual(
+            parse_partition_bound("p15000", "FOR VALUES FROM ('15000') TO ('20000')"),
+            Step1Partition(name="p15000", lower=15000, upper=20000),
+        )
+        self.assertTrue(parse_partition_bound("p_default", "DEFAULT").is_default)
+
+    @skipIf(connection.vendor == "postgresql", "partitioning is active on PostgreSQL")
+    def test_partition_maintenance_is_a_no_op_without_postgres(self):
+        self.assertFalse(step1_partitioning_enabled())
+        self.assertEqual(ensure_step1_partitions(), [])
+        self.assertEqual(drop_expired_step1_partitions(timezone.now()), [])
+
+
+def _step1_partition_of(job_id: int) -> set[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT DISTINCT tableoid::regclass::text FROM {connection.ops.quote_name(ClientMealPlanGenerationStep1Row._meta.db_table)} "
+            "WHERE job_id = %s",
+            [job_id],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+@skipUnless(connection.vendor == "postgresql", "Step1 partitioning only exists on PostgreSQL")
+class Step1PostgresPartitionTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="partitions@example.com",
+            email="partitions@example.com",
+            password="pass12345",
+            role="client",
+        )
+
+    def _job_with_rows(self, job_id=None, *, age_hours=0):
+        job = ClientMealPlanGenerationJob.objects.create(id=job_id, user=self.user, day_of_week="sunday", status="completed")
+        ClientMealPlanGenerationJob.objects.filter(id=job.id).update(created_at=timezone.now() - timedelta(hours=age_hours))
+        rows = ClientMealPlanGenerationStep1Row.objects.bulk_create(
+            [ClientMealPlanGenerationStep1Row(job=job, meal_number=1, error_code=code) for code in range(3)]
+        )
+        self.assertTrue(all(row.id for row in rows))
+        return job
+
+    def test_migration_builds_partitioned_table_with_composite_key(self):
+        table = ClientMealPlanGenerationStep1Row._meta.db_table
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, table)
+
+        self.assertTrue(step1_partitioning_enabled())
+        primary_keys = [info["columns"] for info in constraints.values() if info["primary_key"]]
+        self.assertEqual(primary_keys, [["id", "job_id"]])
+        self.assertIn("client_meal_plan_step1_unique_row", constraints)
+        partitions = list_step1_partitions()
+        self.assertIsNone(partitions[0].lower)
+        self.assertTrue(partitions[-1].is_default)
+
+    def test_rows_past_the_attached_ranges_are_moved_out_of_default_on_attach(self):
+        covered_upper = max(row.upper for row in list_step1_partitions() if not row.is_default)
+        job = self._job_with_rows(covered_upper + 7)
+        self.assertEqual(_step1_partition_of(job.id), {f"{ClientMealPlanGenerationStep1Row._meta.db_table}_p_default"})
+
+        created = ensure_step1_partitions()
+
+        self.assertIn(f"{ClientMealPlanGenerationStep1Row._meta.db_table}_p{covered_upper}", created)
+        self.assertEqual(_step1_partition_of(job.id), {f"{ClientMealPlanGenerationStep1Row._meta.db_table}_p{covered_upper}"})
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.filter(job=job).count(), 3)
+
+    def test_expired_partitions_are_dropped_whole(self):
+        old_job = self._job_with_rows(age_hours=100)
+        recent_job = self._job_with_rows(old_job.id + partition_job_span())
+        # Rows inserted in this test transaction still have deferred FK checks queued,
+        # which blocks DROP TABLE; the retention task never runs in the inserting transaction.
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+        dropped = drop_expired_step1_partitions(timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(dropped, [f"{ClientMealPlanGenerationStep1Row._meta.db_table}_p_legacy"])
+        self.assertFalse(ClientMealPlanGenerationStep1Row.objects.filter(job=old_job).exists())
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.filter(job=recent_job).count(), 3)
+
+
+@skipUnless(connection.vendor == "postgresql", "Step1 partitioning only exists on PostgreSQL")
+class Step1PartitionMigrationReversalTests(TransactionTestCase):
+    def test_partitioning_round_trips_through_the_reverse_migration(self):
+        user = get_user_model().objects.create_user(username="reverse@example.com", email="reverse@example.com", password="x")
+        job = ClientMealPlanGenerationJob.objects.create(user=user, day_of_week="sunday", status="completed")
+        ClientMealPlanGenerationStep1Row.objects.bulk_create(
+            [ClientMealPlanGenerationStep1Row(job=job, meal_number=1, error_code=code) for code in range(3)]
+        )
+
+        call_command("migrate", "client_area", "0024", verbosity=0)
+        self.assertFalse(step1_partitioning_enabled())
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.filter(job_id=job.id).count(), 3)
+        # The identity sequence continues after the copied ids.
+        ClientMealPlanGenerationStep1Row.objects.create(job_id=job.id, meal_number=2, error_code=0)
+
+        call_command("migrate", "client_area", verbosity=0)
+        self.assertTrue(step1_partitioning_enabled())
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.filter(job_id=job.id).count(), 4)
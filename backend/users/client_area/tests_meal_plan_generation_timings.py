@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from users.client_area.models import ClientMealPlanGenerationJob
+from users.client_area.services.meal_plan_generation.runner import (
+    get_generation_job_snapshot,
+    run_full_generation_for_day,
+)
+from users.client_area.services.meal_plan_generation.timings import aggregate_generation_timings
+from users.client_area.tests_meal_plan_step1 import PRIVATE_PIPELINE_LOADER, create_generation_client, stub_solver_runner
+
+
+class GenerationTimingsTests(TestCase):
+    def setUp(self):
+        self.user = create_generation_client("timings@example.com")
+
+    def _generate(self, **kwargs):
+        with patch(PRIVATE_PIPELINE_LOADER, return_value=stub_solver_runner()):
+            return run_full_generation_for_day(self.user, "sunday", **kwargs)
+
+    def test_job_records_per_step_timings(self):
+        result = self._generate()
+
+        timings = ClientMealPlanGenerationJob.objects.get(id=result.job_id).timings_json
+        self.assertEqual(timings["step_order"], ["context", "cache_lookup", "step1", "solver", "persist"])
+        self.assertEqual(set(timings["steps"]), set(timings["step_order"]))
+        solver = timings["steps"]["solver"]
+        self.assertEqual(solver["queries"], 3)
+        self.assertEqual(solver["rows_written"], 3)
+        self.assertGreaterEqual(solver["wall_ms"], solver["query_ms"])
+        self.assertEqual(timings["steps"]["persist"]["rows_written"], 1)
+        self.assertGreater(timings["total_ms"], 0)
+
+        snapshot = get_generation_job_snapshot(self.user, result.job_id)
+        self.assertEqual(snapshot["job"]["timings"], timings)
+
+    def test_cache_hit_records_clone_instead_of_solver(self):
+        self._generate()
+        second = self._generate()
+
+        steps = ClientMealPlanGenerationJob.objects.get(id=second.job_id).timings_json["steps"]
+        self.assertNotIn("solver", steps)
+        self.assertEqual(steps["cache_clone"]["rows_written"], 3)
+
+    def test_aggregate_reports_percentiles_per_step(self):
+        for _ in range(3):
+            self._generate(bypass_cache=True)
+        ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="monday", status="completed")
+
+        aggregate = aggregate_generation_timings()
+
+        self.assertEqual(aggregate["job_count"], 3)
+        solver = aggregate["steps"]["solver"]
+        self.assertEqual(solver["job_count"], 3)
+        self.assertEqual(solver["rows_written"], {"p50": 3.0, "p95": 3.0, "max": 3.0})
+        self.assertLessEqual(solver["wall_ms"]["p50"], solver["wall_ms"]["p95"])
+
+    def test_superadmin_timings_endpoint(self):
+        self._generate()
+        superadmin = get_user_model().objects.create_superuser(
+            username="root@example.com",
+            email="root@example.com",
+            password="pass12345",
+        )
+        client = APIClient()
+        client.force_authenticate(user=superadmin)
+
+        response = client.get("/api/v1/users/superadmin/meal-plan-generation/timings/", {"days": 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["generation_timings"]["job_count"], 1)
+        self.assertIn("step1", response.data["generation_timings"]["steps"])
+
+        self.assertEqual(client.get("/api/v1/users/superadmin/meal-plan-generation/timings/", {"days": "x"}).status_code, 400)
+
+        client.force_authenticate(user=self.user)
+        self.assertEqual(client.get("/api/v1/users/superadmin/meal-plan-generation/timings/").status_code, 403)
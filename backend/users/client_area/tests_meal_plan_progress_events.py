@@ -0,0 +1,191 @@
+import json
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.client_area.models import ClientMealPlanGenerationJob
+from users.client_area.services.meal_plan_generation.progress_events import week_batch_channel
+from users.client_area.services.meal_plan_generation.runner import run_full_generation_for_day
+from users.client_area.tests_meal_plan_step1 import PRIVATE_PIPELINE_LOADER, create_generation_client, stub_solver_runner
+
+
+class FakePublisher:
+    def __init__(self):
+        self.messages = []
+
+    def publish(self, channel, data):
+        self.messages.append((channel, json.loads(data)))
+
+
+class FakePubSub:
+    def __init__(self, events):
+        self.messages = [{"type": "message", "data": json.dumps(event)} for event in events]
+        self.closed = False
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        return self.messages.pop(0) if self.messages else None
+
+    async def unsubscribe(self, channel):
+        return None
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    async def aclose(self):
+        return None
+
+
+def _parse_sse(body: str):
+    events = []
+    for block in body.split("\n\n"):
+        lines = block.splitlines()
+        if len(lines) == 2 and lines[0].startswith("event: "):
+            events.append((lines[0][len("event: "):], json.loads(lines[1][len("data: "):])))
+    return events
+
+
+@override_settings(MEAL_PLAN_PROGRESS_REDIS_URL="redis://progress.test/0")
+class ProgressPublishingTests(TestCase):
+    def setUp(self):
+        self.user = create_generation_client("progress@example.com")
+        self.publisher = FakePublisher()
+        publisher_patch = patch(
+            "users.client_area.services.meal_plan_generation.progress_events._get_publisher",
+            return_value=self.publisher,
+        )
+        publisher_patch.start()
+        self.addCleanup(publisher_patch.stop)
+
+    def _generate(self, **kwargs):
+        with patch(PRIVATE_PIPELINE_LOADER, return_value=stub_solver_runner()):
+            return run_full_generation_for_day(self.user, "sunday", **kwargs)
+
+    def test_batch_day_publishes_step_transitions_and_completion_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            result = self._generate(batch_id="batch-1", batch_mode="week")
+        before_commit = [event["progress_percent"] for _, event in self.publisher.messages]
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(before_commit, [0, 10])
+        channels = {channel for channel, _ in self.publisher.messages}
+        self.assertEqual(channels, {week_batch_channel(self.user.id, "batch-1")})
+        completed = self.publisher.messages[-1][1]
+        self.assertEqual(completed["status"], "completed")
+        self.assertEqual(completed["job_id"], result.job_id)
+        self.assertEqual(completed["generated_meal_count"], 3)
+
+    def test_batch_day_failing_before_its_job_exists_publishes_a_failed_event(self):
+        with patch(
+            "users.client_area.services.meal_plan_generation.runner.build_generation_context",
+            side_effect=ValueError("No calculated macro schedule found for sunday."),
+        ):
+            with self.assertRaises(ValueError):
+                self._generate(batch_id="batch-1", batch_mode="week")
+
+        self.assertEqual(
+            self.publisher.messages,
+            [
+                (
+                    week_batch_channel(self.user.id, "batch-1"),
+                    {
+                        "batch_id": "batch-1",
+                        "day_of_week": "sunday",
+                        "status": "failed",
+                        "error_message": "No calculated macro schedule found for sunday.",
+                    },
+                )
+            ],
+        )
+
+    def test_batch_day_solver_failure_publishes_one_failed_event(self):
+        with patch(PRIVATE_PIPELINE_LOADER, return_value=stub_solver_runner(failing_days={"sunday"})):
+            with self.assertRaises(RuntimeError):
+                run_full_generation_for_day(self.user, "sunday", batch_id="batch-1", batch_mode="week")
+
+        statuses = [event["status"] for _, event in self.publisher.messages]
+        self.assertEqual(statuses, ["running", "running", "failed"])
+        self.assertEqual(self.publisher.messages[-1][1]["error_message"], "solver exploded")
+
+    def test_day_outside_a_batch_publishes_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._generate()
+
+        self.assertEqual(self.publisher.messages, [])
+
+
+class WeekBatchEventStreamTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="stream@example.com",
+            email="stream@example.com",
+            password="pass12345",
+            role="client",
+        )
+        self.job = ClientMealPlanGenerationJob.objects.create(
+            user=self.user,
+            day_of_week="sunday",
+            status="running",
+            current_step=1,
+            progress_percent=10,
+            batch_id="batch-1",
+        )
+        self.url = "/api/v1/users/client/app/meal-plan-generation/run-week/batch-1/events/?day=sunday"
+        self.token = str(AccessToken.for_user(self.user))
+
+    async def _read_stream(self, events):
+        pubsub = FakePubSub(events)
+
+        async def subscribe(channel):
+            self.assertEqual(channel, week_batch_channel(self.user.id, "batch-1"))
+            return FakeRedis(), pubsub
+
+        with patch(
+            "users.client_area.services.meal_plan_generation.progress_stream._subscribe",
+            side_effect=subscribe,
+        ):
+            response = await self.async_client.get(f"{self.url}&token={self.token}")
+            self.assertEqual(response["Content-Type"], "text/event-stream")
+            body = "".join([chunk.decode() async for chunk in response.streaming_content])
+        self.assertTrue(pubsub.closed)
+        return _parse_sse(body)
+
+    @override_settings(MEAL_PLAN_PROGRESS_REDIS_URL="redis://progress.test/0")
+    async def test_stream_sends_snapshot_then_relays_events_until_batch_finishes(self):
+        completed = {
+            "batch_id": "batch-1",
+            "day_of_week": "sunday",
+            "job_id": self.job.id,
+            "status": "completed",
+            "current_step": 10,
+            "progress_percent": 100,
+            "generated_meal_count": 3,
+        }
+
+        events = await self._read_stream([{**completed, "day_of_week": "monday"}, completed])
+
+        self.assertEqual([name for name, _ in events], ["snapshot", "job", "batch"])
+        self.assertEqual(events[0][1]["jobs"][0]["progress_percent"], 10)
+        self.assertEqual(events[1][1]["progress_percent"], 100)
+        self.assertEqual(events[2][1]["status"], "completed")
+        self.assertEqual(events[2][1]["days_completed"], ["sunday"])
+
+    @override_settings(MEAL_PLAN_PROGRESS_REDIS_URL="redis://progress.test/0")
+    async def test_stream_requires_a_valid_token(self):
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+        response = await self.async_client.get(f"{self.url}&token=not-a-token")
+        self.assertEqual(response.status_code, 401)
+
+    @override_settings(MEAL_PLAN_PROGRESS_REDIS_URL="")
+    async def test_stream_is_unavailable_without_redis(self):
+        response = await self.async_client.get(f"{self.url}&token={self.token}")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.content)["error_code"], "PROGRESS_STREAM_UNAVAILABLE")
@@ -0,0 +1,175 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from core.models import ComboMacroErrorLookup, FoodLibraryItem, MealComboTemplate
+from users.client_area.models import (
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationJob,
+    ClientProfile,
+    ClientQuestionnaireProgress,
+)
+from users.client_area.services.meal_plan_generation.pipeline import (
+    SOLVER_BACKEND_PRIVATE,
+    SOLVER_BACKEND_REFERENCE,
+    FullPipelineRunResult,
+    get_solver_backend,
+    list_solver_backends,
+    solver_accepts_step1_matrix,
+)
+from users.client_area.services.meal_plan_generation.runner import run_full_generation_for_day
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+
+
+MEAL_FIELDS = (
+    "meal_number",
+    "combo_template_id",
+    "error_code",
+    "protein1_total",
+    "protein2_total",
+    "carbs1_total",
+    "carbs2_total",
+    "fats1_total",
+    "fats2_total",
+)
+
+
+@override_settings(MEAL_PLAN_SOLVER_BACKEND=SOLVER_BACKEND_REFERENCE, MEAL_PLAN_STEP1_MODE="in_memory")
+class ReferenceSolverTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="reference@example.com",
+            email="reference@example.com",
+            password="pass12345",
+            role="client",
+        )
+        ClientProfile.objects.create(user=self.user, offer_code="food_plan_monthly", includes_food_plan=True)
+        ClientQuestionnaireProgress.objects.create(
+            user=self.user,
+            status="completed",
+            answers_json={
+                **QUESTIONNAIRE_ANSWERS,
+                "food_preferences": {"weekly_days": {"sunday": [{"protein_1": "Salmon STANDARD"}]}},
+            },
+        )
+        ComboMacroErrorLookup.objects.create(error_code=1, protein_error=Decimal("2"), carbs_error=Decimal("2"), fats_error=Decimal("1"))
+        ComboMacroErrorLookup.objects.create(error_code=2, protein_error=Decimal("5"), carbs_error=Decimal("8"), fats_error=Decimal("3"))
+        MealComboTemplate.objects.create(
+            combo_id=10,
+            protein_slot_1="Chicken STANDARD",
+            carb_slot_1="Rice STANDARD",
+            fat_slot_1="Oil STANDARD",
+        )
+        MealComboTemplate.objects.create(
+            combo_id=20,
+            protein_slot_1="Salmon STANDARD",
+            carb_slot_1="Rice STANDARD",
+            carb_slot_2="Oats STANDARD",
+            carb_split_1=Decimal("75"),
+            carb_split_2=Decimal("25"),
+            fat_slot_1="Oil STANDARD",
+        )
+        for source_food_id, macro, category, protein, carbs, fats in (
+            (1, "Protein", "Chicken STANDARD", "8", "0", "1"),
+            (2, "Protein", "Salmon STANDARD", "6", "0", "3"),
+            (3, "Carbs", "Rice STANDARD", "1", "8", "0"),
+            (4, "Carbs", "Oats STANDARD", "3", "16", "2"),
+            (5, "Fats", "Oil STANDARD", "0", "0", "14"),
+        ):
+            FoodLibraryItem.objects.create(
+                source_food_id=source_food_id,
+                macro=macro,
+                category=category,
+                name=category,
+                protein=Decimal(protein),
+                carbs=Decimal(carbs),
+                fats=Decimal(fats),
+            )
+
+    def _meals(self, job_id):
+        return list(ClientMealPlanGeneratedMeal.objects.filter(job_id=job_id).order_by("meal_number").values(*MEAL_FIELDS))
+
+    def test_reference_backend_generates_deterministic_meals(self):
+        first = run_full_generation_for_day(self.user, "sunday", bypass_cache=True)
+        second = run_full_generation_for_day(self.user, "sunday", bypass_cache=True)
+
+        meals = self._meals(first.job_id)
+        self.assertEqual(len(meals), 3)
+        self.assertEqual(
+            [{key: value for key, value in meal.items() if key != "meal_number"} for meal in meals],
+            [{key: value for key, value in meal.items() if key != "meal_number"} for meal in self._meals(second.job_id)],
+        )
+        # Meal 1 keeps the client's protein; every meal uses the error code with the smallest residual.
+        self.assertEqual(meals[0]["combo_template_id"], 20)
+        self.assertEqual({meal["combo_template_id"] for meal in meals[1:]}, {10})
+        self.assertEqual({meal["error_code"] for meal in meals}, {2})
+
+        job = ClientMealPlanGenerationJob.objects.get(id=first.job_id)
+        self.assertEqual(job.algorithm_version, "reference_v1")
+        self.assertEqual(job.input_snapshot_json["pipeline_summary"]["solver_backend"], SOLVER_BACKEND_REFERENCE)
+        self.assertFalse(job.input_snapshot_json["step1_summary"]["persisted"])
+
+        split = job.input_snapshot_json["day_payload"]["meal_macro_splits"][0]["grams"]
+        carbs_residual = Decimal(str(max(0.0, float(split["carbs_g"]) - 8)))
+        self.assertAlmostEqual(float(meals[0]["carbs1_total"]), float(carbs_residual * Decimal("0.75") / 8), places=5)
+        self.assertAlmostEqual(float(meals[0]["carbs2_total"]), float(carbs_residual * Decimal("0.25") / 16), places=5)
+        self.assertEqual(meals[0]["protein2_total"], Decimal("0"))
+
+    def test_cached_generations_do_not_cross_backends(self):
+        private_calls = []
+
+        def private_runner(*, job, day_payload, step1_matrix=None):
+            private_calls.append(job.id)
+            return FullPipelineRunResult(0, 0, 0, "private")
+
+        reference = run_full_generation_for_day(self.user, "sunday")
+        with (
+            override_settings(MEAL_PLAN_SOLVER_BACKEND=SOLVER_BACKEND_PRIVATE),
+            patch(
+                "users.client_area.services.meal_plan_generation.pipeline._load_private_pipeline",
+                return_value=private_runner,
+            ),
+        ):
+            private = run_full_generation_for_day(self.user, "sunday")
+        reused = run_full_generation_for_day(self.user, "sunday")
+
+        self.assertEqual(private_calls, [private.job_id])
+        self.assertEqual(ClientMealPlanGenerationJob.objects.get(id=private.job_id).algorithm_version, "wp_v1")
+        self.assertEqual(
+            ClientMealPlanGenerationJob.objects.get(id=reused.job_id).input_snapshot_json["generation_cache"]["source_job_id"],
+            reference.job_id,
+        )
+
+    def test_backend_registry_reports_capabilities(self):
+        backends = {backend["name"]: backend for backend in list_solver_backends()}
+
+        self.assertTrue(backends[SOLVER_BACKEND_REFERENCE]["available"])
+        self.assertTrue(backends[SOLVER_BACKEND_REFERENCE]["accepts_step1_matrix"])
+        self.assertEqual(backends[SOLVER_BACKEND_PRIVATE]["version"], "wp_v1")
+        self.assertTrue(solver_accepts_step1_matrix())
+        with override_settings(MEAL_PLAN_SOLVER_BACKEND=""):
+            self.assertEqual(get_solver_backend().name, SOLVER_BACKEND_PRIVATE)
+        with override_settings(MEAL_PLAN_SOLVER_BACKEND="refrence"):
+            with self.assertRaisesMessage(ImproperlyConfigured, "'refrence' is not a registered solver backend"):
+                get_solver_backend()
+
+    def test_superadmin_solver_endpoint(self):
+        superadmin = get_user_model().objects.create_superuser(
+            username="root@example.com",
+            email="root@example.com",
+            password="pass12345",
+        )
+        client = APIClient()
+        client.force_authenticate(user=superadmin)
+
+        response = client.get("/api/v1/users/superadmin/meal-plan-generation/solvers/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["active"], SOLVER_BACKEND_REFERENCE)
+        self.assertIn(SOLVER_BACKEND_PRIVATE, [backend["name"] for backend in response.data["solver_backends"]])
@@ -0,0 +1,188 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.models import ComboMacroErrorLookup, MealComboTemplate
+from users.client_area.models import (
+    ClientMealPlanGeneratedMeal,
+    ClientMealPlanGenerationJob,
+    ClientMealPlanGenerationStep1Row,
+    ClientProfile,
+    ClientQuestionnaireProgress,
+)
+from users.client_area.services.meal_plan_generation.pipeline import FullPipelineRunResult
+from users.client_area.services.meal_plan_generation.runner import run_full_generation_for_day
+from users.client_area.services.meal_plan_generation.step1 import build_step1_rows_for_day, compute_step1_matrix
+
+
+QUESTIONNAIRE_ANSWERS = {
+    "gender": "male",
+    "height": {"unit": "cm", "value": 180},
+    "weight": {"unit": "lbs", "value": 180},
+    "date_of_birth": "1990-01-01",
+    "goal": "maintain",
+    "lifestyle": "moderate",
+    "meal_plan_type": "standard",
+    "workout_days": ["monday"],
+    "meal_schedule": {
+        "mode": "same",
+        "default_meals": 3,
+        "days": {day: 3 for day in ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]},
+    },
+    "training_schedule": {"monday": "before_meal_1"},
+}
+
+DAY_PAYLOAD = {
+    "day": "sunday",
+    "meal_macro_splits": [
+        {"meal_number": 1, "grams": {"protein_g": 40, "carbs_g": 50, "fats_g": 10}},
+        {"meal_number": 2, "grams": {"protein_g": 30, "carbs_g": 20, "fats_g": 15}},
+    ],
+}
+
+
+PRIVATE_PIPELINE_LOADER = "users.client_area.services.meal_plan_generation.pipeline._load_private_pipeline"
+STUB_COMBO_ID = 77
+
+
+def create_generation_client(username):
+    """
+    Client with a completed questionnaire, plus the error-code and combo rows the
+    stub solver writes against. Clears the cache so memoized results don't leak
+    between tests.
+    """
+    cache.clear()
+    user = get_user_model().objects.create_user(username=username, email=username, password="pass12345", role="client")
+    ClientProfile.objects.create(user=user, offer_code="food_plan_monthly", includes_food_plan=True)
+    ClientQuestionnaireProgress.objects.create(user=user, status="completed", answers_json=QUESTIONNAIRE_ANSWERS)
+    ComboMacroErrorLookup.objects.create(error_code=1, protein_error=Decimal("5"), carbs_error=Decimal("10"), fats_error=Decimal("1"))
+    MealComboTemplate.objects.create(combo_id=STUB_COMBO_ID, protein_slot_1="Chicken STANDARD")
+    return user
+
+
+def stub_solver_runner(*, calls=None, failing_days=(), meals_per_day=None, **meal_fields):
+    """
+    Stand-in for the private solver: one generated meal per macro split (or
+    `meals_per_day` meals) on the stub combo. Job ids are appended to `calls`, and
+    days in `failing_days` raise, checked at call time so tests can change the set.
+    """
+
+    def runner(*, job, day_payload, step1_matrix=None):
+        if calls is not None:
+            calls.append(job.id)
+        if job.day_of_week in failing_days:
+            raise RuntimeError("solver exploded")
+        meal_numbers = [split["meal_number"] for split in day_payload["meal_macro_splits"]][:meals_per_day]
+        for meal_number in meal_numbers:
+            ClientMealPlanGeneratedMeal.objects.create(
+                job=job,
+                user=job.user,
+                day_of_week=job.day_of_week,
+                meal_number=meal_number,
+                combo_template_id=STUB_COMBO_ID,
+                error_code=1,
+                **meal_fields,
+            )
+        return FullPipelineRunResult(len(meal_numbers), 0, len(meal_numbers), "solved")
+
+    return runner
+
+
+def _recording_runner(calls):
+    def runner(*, job, day_payload, step1_matrix=None):
+        calls.append(step1_matrix)
+        return FullPipelineRunResult(
+            generated_meal_count=0,
+            selected_candidate_count=0,
+            step1_row_count=step1_matrix.row_count if step1_matrix is not None else 0,
+            note="stub",
+        )
+
+    return runner
+
+
+class Step1MatrixTests(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username="step1@example.com",
+            email="step1@example.com",
+            password="pass12345",
+            role="client",
+        )
+        ComboMacroErrorLookup.objects.bulk_create(
+            [
+                ComboMacroErrorLookup(error_code=1, protein_error=Decimal("5"), carbs_error=Decimal("60"), fats_error=Decimal("1")),
+                ComboMacroErrorLookup(error_code=2, protein_error=Decimal("-2.5"), carbs_error=Decimal("10"), fats_error=Decimal("20")),
+                ComboMacroErrorLookup(error_code=3, protein_error=Decimal("45"), carbs_error=Decimal("0"), fats_error=Decimal("0")),
+            ]
+        )
+
+    def _create_generation_client(self):
+        ClientProfile.objects.create(user=self.user, offer_code="food_plan_monthly", includes_food_plan=True)
+        ClientQuestionnaireProgress.objects.create(user=self.user, status="completed", answers_json=QUESTIONNAIRE_ANSWERS)
+
+    def test_matrix_matches_persisted_rows(self):
+        matrix = compute_step1_matrix(DAY_PAYLOAD)
+        job = ClientMealPlanGenerationJob.objects.create(user=self.user, day_of_week="sunday")
+
+        row_count = build_step1_rows_for_day(job, DAY_PAYLOAD)
+
+        persisted = [
+            (row.meal_number, row.error_code, float(row.pro_negative), float(row.carbs_negative), float(row.fats_negative))
+            for row in ClientMealPlanGenerationStep1Row.objects.filter(job=job).order_by("meal_number", "error_code")
+        ]
+        self.assertEqual(row_count, matrix.row_count)
+        self.assertEqual(persisted, list(matrix.iter_rows()))
+        self.assertEqual(list(matrix.meals[1].pro_negative), [35.0, 42.5, 0.0])
+        self.assertEqual(list(matrix.meals[1].carbs_negative), [0.0, 40.0, 50.0])
+
+    @override_settings(MEAL_PLAN_STEP1_MODE="in_memory", MEAL_PLAN_STEP1_PERSIST_DEBUG=False)
+    def test_in_memory_mode_hands_matrix_to_solver_without_persisting_rows(self):
+        self._create_generation_client()
+        calls = []
+        with patch(
+            "users.client_area.services.meal_plan_generation.pipeline._load_private_pipeline",
+            return_value=_recording_runner(calls),
+        ):
+            result = run_full_generation_for_day(self.user, "sunday")
+
+        job = ClientMealPlanGenerationJob.objects.get(id=result.job_id)
+        self.assertEqual(len(calls), 1)
+        self.assertIsNotNone(calls[0])
+        self.assertEqual(result.row_count, calls[0].row_count)
+        self.assertFalse(ClientMealPlanGenerationStep1Row.objects.filter(job=job).exists())
+        self.assertEqual(job.input_snapshot_json["step1_summary"]["persisted"], False)
+        self.assertEqual(job.input_snapshot_json["step1_summary"]["row_count"], 9)
+
+    @override_settings(MEAL_PLAN_STEP1_MODE="in_memory", MEAL_PLAN_STEP1_PERSIST_DEBUG=True)
+    def test_in_memory_debug_flag_still_persists_rows(self):
+        self._create_generation_client()
+        calls = []
+        with patch(
+            "users.client_area.services.meal_plan_generation.pipeline._load_private_pipeline",
+            return_value=_recording_runner(calls),
+        ):
+            result = run_full_generation_for_day(self.user, "sunday")
+
+        self.assertEqual(ClientMealPlanGenerationStep1Row.objects.filter(job_id=result.job_id).count(), 9)
+        self.assertIsNotNone(calls[0])
+
+    @override_settings(MEAL_PLAN_STEP1_MODE="in_memory", MEAL_PLAN_STEP1_PERSIST_DEBUG=False)
+    def test_in_memory_mode_persists_rows_for_solvers_that_read_the_table(self):
+        self._create_generation_client()
+        calls = []
+
+        def legacy_runner(*, job, day_payload):
+            calls.append(ClientMealPlanGenerationStep1Row.objects.filter(job=job).count())
+            return FullPipelineRunResult(0, 0, calls[-1], "legacy")
+
+        with patch(
+            "users.client_area.services.meal_plan_generation.pipeline._load_private_pipeline",
+            return_value=legacy_runner,
+        ):
+            run_full_generation_for_day(self.user, "sunday")
+
+        self.assertEqual(calls, [9])
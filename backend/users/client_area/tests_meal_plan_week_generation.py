@@ -0,0 +1,98 @@
+import sys
+from unittest.mock import patch
+
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from users.client_area.models import ClientMealPlanGenerationJob
+from users.client_area.services.meal_plan_generation import runner
+from users.client_area.services.meal_plan_generation.runner import (
+    launch_full_generation_for_week_background,
+    run_full_generation_for_week,
+)
+from users.client_area.services.results_engine import build_questionnaire_results
+from users.client_area.tasks.meal_plan_generation import (
+    finalize_week_generation_batch_task,
+    run_week_generation_batch_task,
+    run_week_generation_day_task,
+)
+from users.client_area.tests_meal_plan_step1 import PRIVATE_PIPELINE_LOADER, create_generation_client, stub_solver_runner
+
+
+@patch(PRIVATE_PIPELINE_LOADER, return_value=stub_solver_runner())
+class WeekGenerationFanOutTests(TestCase):
+    def setUp(self):
+        self.user = create_generation_client("week@example.com")
+        # Tasks call close_old_connections(); inside the test transaction that would
+        # close the connection on PostgreSQL (in-memory SQLite ignores it).
+        patcher = patch("users.client_area.tasks.meal_plan_generation.close_old_connections")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_week_builds_questionnaire_results_once(self, _loader):
+        with patch(
+            "users.client_area.services.results_memo.build_questionnaire_results",
+            wraps=build_questionnaire_results,
+        ) as build_results:
+            result = run_full_generation_for_week(self.user, days=["sunday", "monday", "tuesday"], mode="serial")
+
+        self.assertEqual(build_results.call_count, 1)
+        self.assertEqual(result.days_completed, ["sunday", "monday", "tuesday"])
+        self.assertEqual(ClientMealPlanGenerationJob.objects.filter(user=self.user, status="completed").count(), 3)
+
+    @override_settings(MEAL_PLAN_WEEK_GENERATION_MODE="parallel")
+    def test_batch_task_dispatches_one_subtask_per_day_in_a_chord(self, _loader):
+        with patch("users.client_area.tasks.meal_plan_generation.chord") as chord_mock:
+            chord_mock.return_value.return_value.id = "finalize-id"
+            payload = run_week_generation_batch_task.run(user_id=self.user.id, days=["sunday", "monday"], batch_id="b-1")
+
+        header = chord_mock.call_args.args[0]
+        day_signatures = list(header.tasks)
+        self.assertEqual([signature.kwargs["day"] for signature in day_signatures], ["sunday", "monday"])
+        self.assertIs(day_signatures[0].kwargs["results"], day_signatures[1].kwargs["results"])
+        self.assertEqual(payload["finalize_task_id"], "finalize-id")
+        self.assertFalse(ClientMealPlanGenerationJob.objects.exists())
+
+    def test_day_task_and_finalize_report_batch_summary(self, _loader):
+        day_result = run_week_generation_day_task.run(user_id=self.user.id, day="sunday", batch_id="b-2")
+        missing_day = {"day_of_week": "monday", "job_id": None, "status": "failed", "error_message": "boom"}
+
+        summary = finalize_week_generation_batch_task.run([day_result, missing_day], batch_id="b-2", days=["sunday", "monday"])
+
+        job = ClientMealPlanGenerationJob.objects.get(id=day_result["job_id"])
+        self.assertEqual(job.input_snapshot_json["batch_id"], "b-2")
+        self.assertEqual(summary["days_completed"], ["sunday"])
+        self.assertEqual(summary["days_failed"], ["monday"])
+        self.assertEqual(summary["job_count"], 1)
+
+    def test_background_launch_without_celery_fails_instead_of_running_inline(self, _loader):
+        with patch.dict(sys.modules), patch.object(runner, "run_full_generation_for_week") as run_week:
+            for name in [name for name in sys.modules if name.startswith("users.client_area.tasks")]:
+                del sys.modules[name]
+            sys.modules["celery"] = None
+            with self.assertRaisesMessage(ValueError, "Celery is not installed"):
+                launch_full_generation_for_week_background(self.user, days=["sunday"])
+
+        run_week.assert_not_called()
+
+
+@patch(PRIVATE_PIPELINE_LOADER, return_value=stub_solver_runner())
+class ParallelWeekGenerationTests(TransactionTestCase):
+    # Pool threads use their own connections, so the rows must be committed.
+    def setUp(self):
+        self.user = create_generation_client("week@example.com")
+
+    # One worker still goes through the pool; SQLite's shared in-memory test
+    # database locks tables when two connections write at once.
+    @override_settings(MEAL_PLAN_WEEK_MAX_WORKERS=1)
+    def test_parallel_mode_runs_days_on_the_thread_pool(self, _loader):
+        with patch.object(
+            runner, "_run_full_generation_for_day_in_thread", wraps=runner._run_full_generation_for_day_in_thread
+        ) as in_thread:
+            result = run_full_generation_for_week(self.user, days=["sunday", "monday", "tuesday"], mode="parallel")
+
+        self.assertEqual(in_thread.call_count, 3)
+        self.assertEqual(result.days_completed, ["sunday", "monday", "tuesday"])
+        self.assertEqual(
+            set(ClientMealPlanGenerationJob.objects.filter(user=self.user, status="completed").values_list("day_of_week", flat=True)),
+            {"sunday", "monday", "tuesday"},
+        )
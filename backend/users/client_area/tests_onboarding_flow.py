@@ -274,7 +274,7 @@ class ClientOnboardingFlowTests(TestCase):
         }
         self.api.force_authenticate(user=user)
 
-        with patch("users.client_area.views.auth_flow.build_questionnaire_results", return_value=low_macro_results):
+        with patch("users.client_area.views.auth_flow.get_lazy_questionnaire_results", return_value=low_macro_results):
             response = self.api.put(
                 "/api/v1/users/client/app/food-preferences/",
                 {"builder_value": payload},
@@ -0,0 +1,125 @@
+import random
+
+import numpy as np
+from django.core.cache import cache
+from django.test import TestCase
+
+from core.seed_data.admin_parameter_defaults import get_admin_parameter_defaults_v1
+from users.admin_area.models import AdminIdentity
+from users.admin_area.services.admin_parameter_tables import apply_admin_parameter_payload
+from users.client_area.services.admin_parameters import clear_compiled_admin_parameters_cache
+from users.client_area.services.results_batch import _round_exact, build_questionnaire_results_batch
+from users.client_area.services.results_engine import WEEK_DAYS, BuildResultsContext, build_questionnaire_results
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+
+
+def _random_answers(rng: random.Random):
+    """One answer set drawn across units, plans, schedules and bad input."""
+    if rng.random() < 0.5:
+        height = {"unit": "imperial", "feet": rng.randint(4, 7), "inches": round(rng.uniform(0, 11.9), 1)}
+    else:
+        height = {"unit": "cm", "value": round(rng.uniform(140, 210), 2)}
+    weight_unit = rng.choice(["lbs", "kg"])
+    weight = {"unit": weight_unit, "value": round(rng.uniform(90, 350) if weight_unit == "lbs" else rng.uniform(40, 160), 1)}
+    workout_days = rng.sample(WEEK_DAYS, rng.randint(0, 7))
+    answers = {
+        "gender": rng.choice(["male", "female", " Male ", ""]),
+        "height": height,
+        "weight": weight,
+        "date_of_birth": f"{rng.randint(1940, 2008)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "goal": rng.choice(["lose", "maintain", "gain", "unknown"]),
+        "lifestyle": rng.choice(["low_active", "middle_active", "high_active", "unknown"]),
+        "meal_plan_type": rng.choice(["standard", "keto", "carb_cycling", "unknown"]),
+        "workout_days": workout_days,
+        "meal_schedule": {"days": {day: rng.choice([3, 4, 5, 6, 2, None]) for day in WEEK_DAYS}},
+        "training_schedule": {
+            day: rng.choice(["before_meal_1", "before_meal_2", "before_meal_3", "no_training", None]) for day in workout_days
+        },
+    }
+    roll = rng.random()
+    if roll < 0.04:
+        answers.pop(rng.choice(list(answers)))
+    elif roll < 0.08:
+        answers["weight"] = {"unit": "lbs", "value": 0}
+    elif roll < 0.1:
+        answers["date_of_birth"] = "not-a-date"
+    return answers
+
+
+def _without_timestamp(results):
+    if results is not None:
+        results.pop("generated_at")
+    return results
+
+
+class QuestionnaireResultsBatchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        clear_compiled_admin_parameters_cache()
+
+    def assert_matches_scalar(self, contexts):
+        batch = build_questionnaire_results_batch(contexts)
+
+        self.assertEqual(len(batch), len(contexts))
+        for index, context in enumerate(contexts):
+            expected = _without_timestamp(build_questionnaire_results(context))
+            self.assertEqual(_without_timestamp(batch.results(index)), expected, msg=f"answer set {index}")
+            self.assertEqual(bool(batch.valid[index]), expected is not None)
+        return batch
+
+    def test_random_answer_sets_match_scalar_results_exactly(self):
+        rng = random.Random(20240611)
+        custom = get_admin_parameter_defaults_v1()
+        custom["goal_calorie_adjustments"]["lose_weight_percent"] = "-17.5"
+        custom["meal_plans"]["keto"]["macro_rules_by_goal"]["gain"]["carb_percent"] = "12.5"
+        admin = AdminIdentity.objects.create(admin_email="coach@example.com")
+        apply_admin_parameter_payload(admin, custom)
+
+        contexts = [
+            BuildResultsContext(answers=_random_answers(rng), admin_identity=admin if rng.random() < 0.3 else None)
+            for _ in range(400)
+        ]
+        batch = self.assert_matches_scalar(contexts)
+
+        self.assertTrue(batch.valid.any())
+        self.assertFalse(batch.valid.all())
+
+    def test_vectorized_rounding_matches_builtin_round_including_halves(self):
+        rng = np.random.default_rng(20240611)
+        values = np.concatenate(
+            [
+                rng.uniform(0, 500, 20000),
+                rng.integers(0, 50000, 20000) / 1000.0 + 0.005,
+                [2.675, 1.005, 0.125, 0.015, np.nan],
+            ]
+        ).reshape(-1, 5)
+
+        rounded = _round_exact(values, 2)
+
+        self.assertEqual(rounded.shape, values.shape)
+        np.testing.assert_array_equal(rounded.ravel(), [round(value, 2) for value in values.ravel().tolist()])
+
+    def test_columns_hold_per_day_values_and_nan_for_invalid_rows(self):
+        invalid = dict(QUESTIONNAIRE_ANSWERS)
+        invalid.pop("goal")
+        batch = self.assert_matches_scalar(
+            [BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS), BuildResultsContext(answers=invalid)]
+        )
+        results = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+
+        self.assertEqual(batch.protein_g.shape, (2, 7))
+        self.assertEqual(batch.protein_g[0].tolist(), [row["daily_macros"]["protein_g"] for row in results["weekly_days"]])
+        self.assertEqual(batch.meal_count[0].tolist(), [row["meals_per_day"] for row in results["weekly_days"]])
+        monday = WEEK_DAYS.index("monday")
+        self.assertEqual(
+            batch.meal_carbs_g[0, monday, : batch.meal_count[0, monday]].tolist(),
+            [split["grams"]["carbs_g"] for split in results["weekly_days"][monday]["meal_macro_splits"]],
+        )
+        self.assertTrue(np.isnan(batch.bmr[1]))
+        self.assertIsNone(batch.results(1))
+
+    def test_empty_batch(self):
+        batch = build_questionnaire_results_batch([])
+
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(list(batch.iter_results()), [])
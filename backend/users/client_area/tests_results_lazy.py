@@ -0,0 +1,65 @@
+import json
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from users.client_area.services import results_engine
+from users.client_area.services.results_engine import (
+    WEEK_DAYS,
+    BuildResultsContext,
+    build_lazy_questionnaire_results,
+    build_questionnaire_results,
+    results_day_payload,
+)
+from users.client_area.services.results_memo import get_lazy_questionnaire_results, get_questionnaire_results
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+
+
+def _without_generated_at(results):
+    return {key: value for key, value in results.items() if key != "generated_at"}
+
+
+class LazyQuestionnaireResultsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_materializes_to_the_same_dict_as_the_builder(self):
+        lazy = build_lazy_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+        expected = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+
+        self.assertEqual(_without_generated_at(lazy.to_dict()), _without_generated_at(expected))
+        self.assertEqual(_without_generated_at(dict(lazy)), _without_generated_at(expected))
+        self.assertEqual(json.loads(json.dumps(lazy.to_dict())), lazy.to_dict())
+
+    def test_day_access_computes_only_that_day_once(self):
+        lazy = build_lazy_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+        expected = build_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+
+        with patch.object(results_engine, "_calculate_daily_macros", wraps=results_engine._calculate_daily_macros) as macros:
+            monday = lazy.day("monday")
+            self.assertIs(lazy.day("monday"), monday)
+            self.assertEqual(macros.call_count, 1)
+
+            lazy.to_dict()
+            self.assertEqual(macros.call_count, len(WEEK_DAYS))
+
+        self.assertEqual(monday, results_day_payload(expected, "monday"))
+        self.assertIsNone(lazy.day("someday"))
+        self.assertIsNone(results_day_payload(expected, "someday"))
+
+    def test_incomplete_answers_build_nothing(self):
+        answers = {key: value for key, value in QUESTIONNAIRE_ANSWERS.items() if key != "weight"}
+        self.assertIsNone(build_lazy_questionnaire_results(BuildResultsContext(answers=answers)))
+        self.assertIsNone(get_lazy_questionnaire_results(BuildResultsContext(answers=answers)))
+
+    def test_memo_hit_returns_cached_dict_and_miss_returns_lazy_results(self):
+        context = BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS)
+
+        miss = get_lazy_questionnaire_results(context)
+        self.assertIsInstance(miss, results_engine.QuestionnaireResults)
+
+        cached = get_questionnaire_results(context)
+        hit = get_lazy_questionnaire_results(context)
+        self.assertEqual(_without_generated_at(hit), _without_generated_at(cached))
+        self.assertEqual(results_day_payload(hit, "friday"), miss.day("friday"))
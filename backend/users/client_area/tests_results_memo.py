@@ -0,0 +1,122 @@
+from datetime import date, datetime
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.services.table_versions import ADMIN_PARAMETERS, bump_table_version
+from users.client_area.models import ClientProfile, ClientQuestionnaireProgress
+from users.client_area.services.results_engine import BuildResultsContext, build_questionnaire_results
+from users.client_area.services.results_memo import (
+    get_questionnaire_results,
+    get_results_memo_stats,
+    questionnaire_results_hash,
+    seconds_until_tomorrow,
+)
+from users.client_area.tests_meal_plan_step1 import QUESTIONNAIRE_ANSWERS
+from users.client_area.tests_results_lazy import _without_generated_at
+
+
+RESULTS_BUILDER = "users.client_area.services.results_memo.build_questionnaire_results"
+
+
+class QuestionnaireResultsMemoTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_repeat_lookups_hit_the_memo_and_are_counted(self):
+        with patch(RESULTS_BUILDER, wraps=build_questionnaire_results) as build_results:
+            first = get_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+            # Key order does not matter: the hash is over canonical JSON.
+            second = get_questionnaire_results(BuildResultsContext(answers=dict(reversed(QUESTIONNAIRE_ANSWERS.items()))))
+
+        self.assertEqual(build_results.call_count, 1)
+        self.assertEqual(_without_generated_at(first), _without_generated_at(second))
+        self.assertEqual(get_results_memo_stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_answers_the_engine_does_not_read_leave_the_key_unchanged(self):
+        answers = {**QUESTIONNAIRE_ANSWERS, "food_preferences": {"proteins": ["chicken"]}}
+        changed_weight = {**QUESTIONNAIRE_ANSWERS, "weight": {"unit": "lbs", "value": 200}}
+
+        self.assertEqual(questionnaire_results_hash(answers), questionnaire_results_hash(QUESTIONNAIRE_ANSWERS))
+        self.assertNotEqual(questionnaire_results_hash(changed_weight), questionnaire_results_hash(QUESTIONNAIRE_ANSWERS))
+
+    def test_hits_report_a_fresh_generated_at(self):
+        context = BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS)
+        with patch("users.client_area.services.results_engine.results_generated_at", return_value="2026-03-01T08:00:00Z"):
+            first = get_questionnaire_results(context)
+        with patch("users.client_area.services.results_memo.results_generated_at", return_value="2026-03-01T09:00:00Z"):
+            second = get_questionnaire_results(context)
+
+        self.assertEqual(first["generated_at"], "2026-03-01T08:00:00Z")
+        self.assertEqual(second["generated_at"], "2026-03-01T09:00:00Z")
+        self.assertEqual(_without_generated_at(first), _without_generated_at(second))
+        self.assertEqual(list(second), list(first))
+
+    def test_incomplete_answers_are_not_memoized(self):
+        answers = {key: value for key, value in QUESTIONNAIRE_ANSWERS.items() if key != "goal"}
+
+        with patch(RESULTS_BUILDER, wraps=build_questionnaire_results) as build_results:
+            self.assertIsNone(get_questionnaire_results(BuildResultsContext(answers=answers)))
+            self.assertIsNone(get_questionnaire_results(BuildResultsContext(answers=answers)))
+
+        self.assertEqual(build_results.call_count, 2)
+        self.assertEqual(get_results_memo_stats()["misses"], 2)
+
+    def test_key_changes_with_the_day_and_parameter_version(self):
+        today = questionnaire_results_hash(QUESTIONNAIRE_ANSWERS)
+        with patch("users.client_area.services.results_memo.date") as fake_date:
+            fake_date.today.return_value = date(2031, 1, 1)
+            tomorrow = questionnaire_results_hash(QUESTIONNAIRE_ANSWERS)
+        bump_table_version(ADMIN_PARAMETERS)
+
+        self.assertEqual(len({today, tomorrow, questionnaire_results_hash(QUESTIONNAIRE_ANSWERS)}), 3)
+
+    def test_entries_expire_at_midnight(self):
+        self.assertEqual(seconds_until_tomorrow(datetime(2026, 3, 1, 23, 59, 30)), 30)
+        self.assertEqual(seconds_until_tomorrow(datetime(2026, 3, 1, 0, 0, 0)), 24 * 60 * 60)
+
+
+class ResultsMemoCallerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="memo@example.com",
+            email="memo@example.com",
+            password="pass12345",
+            role="client",
+        )
+        ClientProfile.objects.create(user=self.user, offer_code="food_plan_monthly", includes_food_plan=True)
+        ClientQuestionnaireProgress.objects.create(user=self.user, status="completed", answers_json=QUESTIONNAIRE_ANSWERS)
+        self.api = APIClient()
+
+    def test_dashboard_loads_reuse_memoized_results(self):
+        self.api.force_authenticate(user=self.user)
+
+        with patch(RESULTS_BUILDER, wraps=build_questionnaire_results) as build_results:
+            first = self.api.get("/api/v1/users/client/app/dashboard/")
+            second = self.api.get("/api/v1/users/client/app/dashboard/")
+
+        self.assertEqual(build_results.call_count, 1)
+        self.assertEqual(_without_generated_at(first.data["results"]), _without_generated_at(second.data["results"]))
+
+    def test_superadmin_can_read_and_reset_memo_stats(self):
+        get_questionnaire_results(BuildResultsContext(answers=QUESTIONNAIRE_ANSWERS))
+        superadmin = get_user_model().objects.create_superuser(
+            username="root@example.com",
+            email="root@example.com",
+            password="pass12345",
+        )
+        self.api.force_authenticate(user=superadmin)
+
+        response = self.api.get("/api/v1/users/superadmin/meal-plan-generation/results-memo/")
+        self.assertEqual(response.data["results_memo"]["misses"], 1)
+
+        response = self.api.post(
+            "/api/v1/users/superadmin/meal-plan-generation/results-memo/",
+            {"reset_stats": True},
+            format="json",
+        )
+        self.assertEqual(response.data["results_memo"], {"hits": 0, "misses": 0, "hit_rate": None})
@@ -38,8 +38,10 @@ from users.client_area.views.meal_plan_generation import (
     client_meal_plan_generation_job_status,
     client_meal_plan_generation_run_full,
     client_meal_plan_generation_run_week,
+    client_meal_plan_generation_run_week_events,
     client_meal_plan_generation_run_week_status,
     client_meal_plan_generation_step1_run,
+    client_meal_plan_week_detail,
 )
 from users.client_area.views.meal_recipe_suggestions import client_meal_plan_day_recipe_ideas
 from users.client_area.views.tracking import client_progress_photos, client_weight_entries
@@ -92,9 +94,11 @@ urlpatterns = [
     path('app/meal-plan-generation/run/', client_meal_plan_generation_run_full, name='client_meal_plan_generation_run_full'),
     path('app/meal-plan-generation/run-week/', client_meal_plan_generation_run_week, name='client_meal_plan_generation_run_week'),
     path('app/meal-plan-generation/run-week/<str:batch_id>/status/', client_meal_plan_generation_run_week_status, name='client_meal_plan_generation_run_week_status'),
+    path('app/meal-plan-generation/run-week/<str:batch_id>/events/', client_meal_plan_generation_run_week_events, name='client_meal_plan_generation_run_week_events'),
     path('app/meal-plan-generation/step1-run/', client_meal_plan_generation_step1_run, name='client_meal_plan_generation_step1_run'),
     path('app/meal-plan-generation/jobs/<int:job_id>/', client_meal_plan_generation_job_status, name='client_meal_plan_generation_job_status'),
     path('app/meal-plan-days/<str:day_of_week>/detailed/', client_meal_plan_day_detail, name='client_meal_plan_day_detail'),
+    path('app/meal-plan-week/detailed/', client_meal_plan_week_detail, name='client_meal_plan_week_detail'),
     path('app/meal-plan-days/<str:day_of_week>/recipe-ideas/', client_meal_plan_day_recipe_ideas, name='client_meal_plan_day_recipe_ideas'),
     path('app/questionnaire/', questionnaire_status_or_draft, name='client_questionnaire_status_or_draft'),
     path('app/questionnaire/submit/', questionnaire_submit, name='client_questionnaire_submit'),
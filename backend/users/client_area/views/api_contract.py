@@ -9,7 +9,7 @@ def ok(data=None, http_status=status.HTTP_200_OK):
     return Response(payload, status=http_status)
 
 
-def error(code, message, http_status=status.HTTP_400_BAD_REQUEST, details=None):
+def error_payload(code, message, details=None):
     payload = {
         "ok": False,
         "error": {
@@ -20,7 +20,11 @@ def error(code, message, http_status=status.HTTP_400_BAD_REQUEST, details=None):
     }
     if details is not None:
         payload["error"]["details"] = details
-    return Response(payload, status=http_status)
+    return payload
+
+
+def error(code, message, http_status=status.HTTP_400_BAD_REQUEST, details=None):
+    return Response(error_payload(code, message, details=details), status=http_status)
 
 
 def require_client(request):
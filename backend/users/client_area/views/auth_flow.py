@@ -5,6 +5,7 @@ from django.core.validators import validate_email
 from django.db import transaction
 from django.utils import timezone
 from django.utils.crypto import get_random_string
+from collections.abc import Mapping
 from datetime import timedelta
 import logging
 from urllib.parse import quote_plus
@@ -37,11 +38,16 @@ from core.services.google_oauth import verify_google_id_token
 from core.services.meal_combo_lookup import (
     find_meal_combo_id_by_slots,
     get_supported_combo_slot_values,
-    normalize_slots_to_supported_combo_values,
+    normalize_many_slots_to_supported_combo_values,
+)
+from core.services.meal_combo_index import get_meal_combo_index
+from core.services.meal_combo_shape_policy import (
+    MealComboSelectionRequest,
+    select_meal_combo_templates_for_targets,
 )
-from core.services.meal_combo_shape_policy import select_meal_combo_template_for_target
 from core.models import MealComboTemplate
-from users.client_area.services.results_engine import BuildResultsContext, build_questionnaire_results
+from users.client_area.services.results_engine import BuildResultsContext, results_day_payload
+from users.client_area.services.results_memo import get_lazy_questionnaire_results, get_questionnaire_results
 from core.services.theme_preferences import normalize_theme
 
 stripe.api_key = getattr(settings, "STRIPE_SECRET_KEY", None)
@@ -306,19 +312,24 @@ def _serialize_saved_weekly_combo_rows(user):
     return weekly
 
 
-def _normalize_meal_combo_payload(meal, supported_slot_values=None):
-    source = meal if isinstance(meal, dict) else {}
-    normalized_slots = normalize_slots_to_supported_combo_values(
-        {key: source.get(key) for key in MEAL_COMBO_SLOT_KEYS},
+def _normalize_meal_combo_payloads(meals, supported_slot_values=None):
+    sources = [meal if isinstance(meal, dict) else {} for meal in meals]
+    normalized_rows = normalize_many_slots_to_supported_combo_values(
+        [{key: source.get(key) for key in MEAL_COMBO_SLOT_KEYS} for source in sources],
         supported_values=supported_slot_values,
     )
-    combo_id = find_meal_combo_id_by_slots(**normalized_slots)
-    return {
-        **source,
-        **normalized_slots,
-        "combo_id": int(combo_id) if combo_id else None,
-        "combo_match": "matched" if combo_id else "not_found",
-    }
+    payloads = []
+    for source, normalized_slots in zip(sources, normalized_rows):
+        combo_id = find_meal_combo_id_by_slots(**normalized_slots)
+        payloads.append(
+            {
+                **source,
+                **normalized_slots,
+                "combo_id": int(combo_id) if combo_id else None,
+                "combo_match": "matched" if combo_id else "not_found",
+            }
+        )
+    return payloads
 
 
 def _normalize_food_preference_builder(builder_value):
@@ -329,14 +340,14 @@ def _normalize_food_preference_builder(builder_value):
     supported_slot_values = get_supported_combo_slot_values()
 
     if isinstance(normalized.get("default_day_meals"), list):
-        normalized["default_day_meals"] = [
-            _normalize_meal_combo_payload(meal, supported_slot_values) for meal in normalized["default_day_meals"]
-        ]
+        normalized["default_day_meals"] = _normalize_meal_combo_payloads(
+            normalized["default_day_meals"], supported_slot_values
+        )
 
     weekly_days = normalized.get("weekly_days")
     if isinstance(weekly_days, dict):
         normalized["weekly_days"] = {
-            day: [_normalize_meal_combo_payload(meal, supported_slot_values) for meal in meals]
+            day: _normalize_meal_combo_payloads(meals, supported_slot_values)
             if isinstance(meals, list)
             else meals
             for day, meals in weekly_days.items()
@@ -347,7 +358,7 @@ def _normalize_food_preference_builder(builder_value):
         normalized["saved_templates"] = [
             {
                 **template,
-                "meals": [_normalize_meal_combo_payload(meal, supported_slot_values) for meal in template.get("meals", [])]
+                "meals": _normalize_meal_combo_payloads(template.get("meals", []), supported_slot_values)
                 if isinstance(template, dict) and isinstance(template.get("meals"), list)
                 else template.get("meals", []) if isinstance(template, dict) else [],
             }
@@ -419,53 +430,71 @@ def _combo_id_from_meal(meal):
 
 
 def _apply_combo_shape_policy_to_food_preferences(builder_value, results):
-    if not isinstance(builder_value, dict) or not isinstance(results, dict):
+    if not isinstance(builder_value, dict) or not isinstance(results, Mapping):
         return builder_value
 
     weekly_days = builder_value.get("weekly_days")
+    # Only the days being saved are read, so lazy results compute just those.
     result_days = {
-        (row or {}).get("day"): row
-        for row in (results.get("weekly_days") or [])
-        if isinstance(row, dict) and (row or {}).get("day")
+        day: row
+        for day in (weekly_days if isinstance(weekly_days, dict) else {})
+        if (row := results_day_payload(results, day))
     }
     if not isinstance(weekly_days, dict) or not result_days:
         return builder_value
 
-    combo_ids = sorted(
-        {
-            _combo_id_from_meal(meal)
-            for meals in weekly_days.values()
-            if isinstance(meals, list)
-            for meal in meals
-            if isinstance(meal, dict) and _combo_id_from_meal(meal) > 0
-        }
-    )
-    templates = {combo.combo_id: combo for combo in MealComboTemplate.objects.filter(combo_id__in=combo_ids)}
+    templates = get_meal_combo_index().by_combo_id
     next_builder = {**builder_value, "weekly_days": dict(weekly_days)}
     debug_rows = {}
 
+    # Collect every meal of the week first so shape selection runs as one batch.
+    selections = []
     for day, meals in weekly_days.items():
         day_payload = result_days.get(day)
         if not day_payload or not isinstance(meals, list):
             continue
         targets = _meal_targets_from_day_payload(day_payload)
         training_adjacent = _training_adjacent_meals(day_payload)
-        patched_meals = []
         for idx, meal in enumerate(meals, start=1):
             if not isinstance(meal, dict):
-                patched_meals.append(meal)
                 continue
             saved_combo = templates.get(_combo_id_from_meal(meal))
             target = targets.get(idx)
             if not saved_combo or not target:
-                patched_meals.append(meal)
                 continue
-            decision = select_meal_combo_template_for_target(
-                saved_combo=saved_combo,
-                meal_target=target,
-                is_training_adjacent=idx in training_adjacent,
-                selected_slots=meal,
+            selections.append(
+                (
+                    day,
+                    idx,
+                    MealComboSelectionRequest(
+                        saved_combo=saved_combo,
+                        meal_target=target,
+                        is_training_adjacent=idx in training_adjacent,
+                        selected_slots=meal,
+                    ),
+                )
             )
+    decisions = {
+        (day, idx): decision
+        for (day, idx, _), decision in zip(
+            selections,
+            select_meal_combo_templates_for_targets([request for _, _, request in selections]),
+        )
+    }
+
+    for day, meals in weekly_days.items():
+        day_payload = result_days.get(day)
+        if not day_payload or not isinstance(meals, list):
+            continue
+        targets = _meal_targets_from_day_payload(day_payload)
+        training_adjacent = _training_adjacent_meals(day_payload)
+        patched_meals = []
+        for idx, meal in enumerate(meals, start=1):
+            decision = decisions.get((day, idx))
+            if decision is None:
+                patched_meals.append(meal)
+                continue
+            target = targets[idx]
             patched_meals.append(_combo_payload_from_template(decision.combo, meal))
             debug_rows[f"{day}:{idx}"] = {
                 "day": day,
@@ -538,8 +567,7 @@ def _extract_weekly_combo_selection_rows(answers):
             )
             continue
 
-        for idx, meal in enumerate(day_meals, start=1):
-            normalized_meal = _normalize_meal_combo_payload(meal, supported_slot_values)
+        for idx, normalized_meal in enumerate(_normalize_meal_combo_payloads(day_meals, supported_slot_values), start=1):
             combo_id = normalized_meal.get("combo_id")
             if not combo_id:
                 invalid.append({"day": day, "meal_number": idx, "reason": "missing_combo_id"})
@@ -1100,7 +1128,7 @@ def macro_access_preview(request, token):
                 "sale_channel": link.sale_channel,
                 "admin_slug": link.admin.subdomain_slug if link.admin else None,
                 "questionnaire": _macro_link_questionnaire_payload(link),
-                "results": build_questionnaire_results(
+                "results": get_questionnaire_results(
                     BuildResultsContext(
                         answers=link.questionnaire_answers_json or {},
                         admin_identity=link.admin,
@@ -1161,7 +1189,7 @@ def macro_access_questionnaire_submit(request, token):
         {
             "message": "Questionnaire submitted.",
             "questionnaire": _macro_link_questionnaire_payload(link),
-            "results": build_questionnaire_results(
+            "results": get_questionnaire_results(
                 BuildResultsContext(
                     answers=link.questionnaire_answers_json or {},
                     admin_identity=link.admin,
@@ -1208,7 +1236,7 @@ def public_macro_calculator(request):
     if User.objects.filter(email=email).exists():
         return error("EMAIL_ALREADY_REGISTERED", "This email already has an account. Log in to view your dashboard.", http_status=409)
 
-    results = build_questionnaire_results(BuildResultsContext(answers=answers or {}, admin_identity=admin_identity))
+    results = get_questionnaire_results(BuildResultsContext(answers=answers or {}, admin_identity=admin_identity))
     if not results:
         return error(
             "UNABLE_TO_CALCULATE_MACROS",
@@ -1311,7 +1339,7 @@ def client_dashboard(request):
             },
             "questionnaire": _questionnaire_payload(progress),
             "onboarding": _onboarding_payload(profile, progress),
-            "results": build_questionnaire_results(
+            "results": get_questionnaire_results(
                 BuildResultsContext(
                     answers=progress.answers_json or {},
                     admin_identity=profile.associated_admin if profile else None,
@@ -1453,7 +1481,7 @@ def client_food_preferences(request):
                 "food_preferences": {
                     "builder_value": builder_value,
                     "meal_schedule_days": (progress.answers_json or {}).get("meal_schedule", {}).get("days", {}),
-                    "results": build_questionnaire_results(
+                    "results": get_questionnaire_results(
                         BuildResultsContext(
                             answers=progress.answers_json or {},
                             admin_identity=profile.associated_admin if profile else None,
@@ -1471,7 +1499,7 @@ def client_food_preferences(request):
     if not isinstance(builder_value, dict):
         return error("INVALID_PAYLOAD", "builder_value must be an object.", http_status=400)
     builder_value = _normalize_food_preference_builder(builder_value)
-    results = build_questionnaire_results(
+    results = get_lazy_questionnaire_results(
         BuildResultsContext(
             answers=progress.answers_json or {},
             admin_identity=profile.associated_admin if profile else None,
@@ -1587,7 +1615,7 @@ def questionnaire_status_or_draft(request):
         },
     }
     if progress.status == "completed":
-        payload["results"] = build_questionnaire_results(
+        payload["results"] = get_questionnaire_results(
             BuildResultsContext(
                 answers=progress.answers_json or {},
                 admin_identity=profile.associated_admin if profile else None,
@@ -1629,7 +1657,7 @@ def questionnaire_submit(request):
             "message": "Questionnaire submitted." if not already_completed else "Questionnaire updates saved.",
             "questionnaire": _questionnaire_payload(progress),
             "onboarding": _onboarding_payload(profile, progress),
-            "results": build_questionnaire_results(
+            "results": get_questionnaire_results(
                 BuildResultsContext(
                     answers=progress.answers_json or {},
                     admin_identity=profile.associated_admin if profile else None,
@@ -9,6 +9,7 @@ from core.services.meal_combo_lookup import get_supported_combo_slot_values
 from core.services.product_search import ProductSearchError, get_product_details, lookup_barcode, search_products
 from core.services.usda_fooddata import USDAFoodDataError, get_food_details, search_foods
 from users.client_area.models import ClientFoodOverride, ProductImageSubmission
+from users.client_area.services.meal_plan_generation.rendered_day import invalidate_rendered_days_for_user
 from users.client_area.views.api_contract import error, ok, require_client
 
 
@@ -395,6 +396,7 @@ def client_food_override_save(request):
             raw_payload=details["raw_payload"] or {},
             active=True,
         )
+        invalidate_rendered_days_for_user(request.user.id)
 
     return ok({"food_override": _override_payload(row)})
 
@@ -409,4 +411,5 @@ def client_food_override_delete(request, override_id: int):
     updated = ClientFoodOverride.objects.filter(user=request.user, id=override_id, active=True).update(active=False)
     if not updated:
         return error("OVERRIDE_NOT_FOUND", "Food override not found.", http_status=404)
+    invalidate_rendered_days_for_user(request.user.id)
     return ok({"deleted": True, "id": override_id})
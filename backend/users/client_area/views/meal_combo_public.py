@@ -1,20 +1,25 @@
+from itertools import product
 import logging
 
+from django.core.cache import cache
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
-from django.db.models import Q
 
-from core.models import MealComboTemplate
+from core.services.meal_combo_index import get_meal_combo_index
 from core.services.meal_combo_lookup import (
     find_meal_combo_id_by_slots,
     normalize_slots_to_supported_combo_values,
 )
 from core.services.meal_combo_shape_policy import preferred_combo_shape_for_meal
 from core.services.meal_combo_shape_policy import requires_cooking_fat_for_protein
+from core.services.table_versions import MEAL_COMBOS, get_table_version
 from users.client_area.views.api_contract import error, ok
 
 logger = logging.getLogger(__name__)
 
+STARTER_CATALOG_CACHE_PREFIX = "meal_combo:starter_catalog"
+STARTER_CATALOG_CACHE_SECONDS = 24 * 60 * 60
+
 CHICKEN = "Chicken Breast STANDARD"
 STEAK = "Steak STANDARD"
 GROUND_BEEF = "Ground Beef STANDARD"
@@ -103,16 +108,10 @@ TEMPLATE_SPECS = [
 ]
 
 
-def _distinct_values(field_name):
-    rows = (
-        MealComboTemplate.objects.exclude(**{field_name: ""})
-        .values_list(field_name, flat=True)
-        .distinct()
-        .order_by(field_name)
-    )
+def _distinct_values(slot_key):
     seen = set()
     values = []
-    for row in rows:
+    for row in get_meal_combo_index().slot_values[slot_key]:
         value = str(row or "").strip()
         if not value or value in seen:
             continue
@@ -128,12 +127,12 @@ def _distinct_values(field_name):
 @permission_classes([AllowAny])
 def meal_combo_slot_options(request):
     slot_categories = {
-        "protein_1": _distinct_values("protein_slot_1"),
-        "protein_2": _distinct_values("protein_slot_2"),
-        "carbs_1": _distinct_values("carb_slot_1"),
-        "carbs_2": _distinct_values("carb_slot_2"),
-        "fats_1": _distinct_values("fat_slot_1"),
-        "fats_2": _distinct_values("fat_slot_2"),
+        "protein_1": _distinct_values("protein_1"),
+        "protein_2": _distinct_values("protein_2"),
+        "carbs_1": _distinct_values("carbs_1"),
+        "carbs_2": _distinct_values("carbs_2"),
+        "fats_1": _distinct_values("fats_1"),
+        "fats_2": _distinct_values("fats_2"),
     }
 
     return ok(
@@ -224,20 +223,20 @@ def _target_for_meal(day_payload, meal_number):
     return _meal_targets_from_day_payload(day_payload).get(meal_number)
 
 
-def _filter_for_shape(qs, shape):
-    filtered = qs
+def _filter_for_shape(index, mask, shape):
+    filtered = mask
     fallback_reasons = []
 
     if shape.preferred_protein_slot_2 == "-":
-        protein_filtered = filtered.filter(protein_slot_2="-")
-        if protein_filtered.exists():
+        protein_filtered = filtered & index.mask("protein_2", ["-"])
+        if protein_filtered:
             filtered = protein_filtered
         else:
             fallback_reasons.append("no_one_protein_starter_combo")
 
     if shape.preferred_carb_slot_2 == "-":
-        carb_filtered = filtered.filter(carb_slot_2="-")
-        if carb_filtered.exists():
+        carb_filtered = filtered & index.mask("carbs_2", ["-"])
+        if carb_filtered:
             filtered = carb_filtered
         else:
             fallback_reasons.append("no_one_carb_starter_combo")
@@ -245,21 +244,21 @@ def _filter_for_shape(qs, shape):
     return filtered, fallback_reasons
 
 
-def _filter_for_fat_policy(qs, shape, preferred_protein=None):
-    filtered = qs
+def _filter_for_fat_policy(index, mask, shape, preferred_protein=None):
+    filtered = mask
     fallback_reasons = []
     require_oil = requires_cooking_fat_for_protein(preferred_protein)
 
     if require_oil:
-        oil_filtered = filtered.filter(Q(fat_slot_1=OIL) | Q(fat_slot_2=OIL))
-        if oil_filtered.exists():
+        oil_filtered = filtered & (index.mask("fats_1", [OIL]) | index.mask("fats_2", [OIL]))
+        if oil_filtered:
             filtered = oil_filtered
         else:
             fallback_reasons.append("no_cooking_oil_combo_for_lean_protein")
 
     if shape.preferred_fat_slot_2 == "-":
-        one_fat_filtered = filtered.filter(fat_slot_2="-")
-        if one_fat_filtered.exists():
+        one_fat_filtered = filtered & index.mask("fats_2", ["-"])
+        if one_fat_filtered:
             filtered = one_fat_filtered
         else:
             fallback_reasons.append("no_one_fat_starter_combo")
@@ -267,8 +266,18 @@ def _filter_for_fat_policy(qs, shape, preferred_protein=None):
     return filtered, fallback_reasons
 
 
-def _protein_match_q(values):
-    return Q(protein_slot_1__in=values) | Q(protein_slot_2__in=values)
+def _protein_match_mask(index, values):
+    return index.mask("protein_1", values) | index.mask("protein_2", values)
+
+
+def _protein_filtered_mask(index, mask, *, allowed_proteins, preferred_protein, require_eggs):
+    if require_eggs:
+        mask &= _protein_match_mask(index, [EGGS])
+    if allowed_proteins:
+        mask &= _protein_match_mask(index, allowed_proteins)
+    if preferred_protein:
+        mask &= _protein_match_mask(index, [preferred_protein])
+    return mask
 
 
 def _pick_combo(
@@ -282,62 +291,53 @@ def _pick_combo(
     is_training_adjacent=False,
     debug_context=None,
 ):
-    base = MealComboTemplate.objects.filter(
-        carb_slot_1=carb_1,
-        carb_slot_2=carb_2,
-    )
+    # Slot filters run as bitmap intersections over the in-memory combo index.
+    index = get_meal_combo_index()
+    base = index.mask("carbs_1", [carb_1]) & index.mask("carbs_2", [carb_2])
+    protein_filters = {
+        "allowed_proteins": allowed_proteins,
+        "preferred_protein": preferred_protein,
+        "require_eggs": require_eggs,
+    }
 
-    allowed_plus = sorted(set(allowed_proteins or []) | {"-"} | ({EGGS} if require_eggs else set()))
-    strict = base.filter(protein_slot_1__in=allowed_plus, protein_slot_2__in=allowed_plus)
-    if require_eggs:
-        strict = strict.filter(_protein_match_q([EGGS]))
-    if allowed_proteins:
-        strict = strict.filter(_protein_match_q(allowed_proteins))
-    if preferred_protein:
-        strict = strict.filter(_protein_match_q([preferred_protein]))
+    allowed_plus = set(allowed_proteins or []) | {"-"} | ({EGGS} if require_eggs else set())
+    strict = base & index.mask("protein_1", allowed_plus) & index.mask("protein_2", allowed_plus)
+    strict = _protein_filtered_mask(index, strict, **protein_filters)
     shape = preferred_combo_shape_for_meal(meal_target, is_training_adjacent=is_training_adjacent)
-    candidates_before = strict.count()
-    shaped, fallback_reasons = _filter_for_shape(strict, shape)
-    shaped, fat_fallback_reasons = _filter_for_fat_policy(shaped, shape, preferred_protein=preferred_protein)
+    shaped, fallback_reasons = _filter_for_shape(index, strict, shape)
+    shaped, fat_fallback_reasons = _filter_for_fat_policy(index, shaped, shape, preferred_protein=preferred_protein)
     fallback_reasons.extend(fat_fallback_reasons)
-    candidates_after = shaped.count()
-    combo = shaped.order_by("combo_id").first()
+    combo = index.first(shaped)
     if combo:
         _log_starter_selection(
             debug_context=debug_context,
             meal_target=meal_target,
             is_training_adjacent=is_training_adjacent,
             shape=shape,
-            candidates_before=candidates_before,
-            candidates_after=candidates_after,
+            candidates_before=index.count(strict),
+            candidates_after=index.count(shaped),
             combo=combo,
             fallback_reason=";".join(fallback_reasons) or None,
         )
         return combo
 
-    relaxed = base
-    if require_eggs:
-        relaxed = relaxed.filter(_protein_match_q([EGGS]))
-    if allowed_proteins:
-        relaxed = relaxed.filter(_protein_match_q(allowed_proteins))
-    if preferred_protein:
-        relaxed = relaxed.filter(_protein_match_q([preferred_protein]))
-    relaxed_before = relaxed.count()
-    relaxed_shaped, relaxed_fallback_reasons = _filter_for_shape(relaxed, shape)
+    relaxed = _protein_filtered_mask(index, base, **protein_filters)
+    relaxed_shaped, relaxed_fallback_reasons = _filter_for_shape(index, relaxed, shape)
     relaxed_shaped, relaxed_fat_fallback_reasons = _filter_for_fat_policy(
+        index,
         relaxed_shaped,
         shape,
         preferred_protein=preferred_protein,
     )
-    combo = relaxed_shaped.order_by("combo_id").first()
+    combo = index.first(relaxed_shaped)
     if combo:
         _log_starter_selection(
             debug_context=debug_context,
             meal_target=meal_target,
             is_training_adjacent=is_training_adjacent,
             shape=shape,
-            candidates_before=relaxed_before,
-            candidates_after=relaxed_shaped.count(),
+            candidates_before=index.count(relaxed),
+            candidates_after=index.count(relaxed_shaped),
             combo=combo,
             fallback_reason=";".join(
                 [*fallback_reasons, *relaxed_fallback_reasons, *relaxed_fat_fallback_reasons, "relaxed_protein_match"]
@@ -345,22 +345,22 @@ def _pick_combo(
         )
         return combo
 
-    base_before = base.count()
-    base_shaped, base_fallback_reasons = _filter_for_shape(base, shape)
+    base_shaped, base_fallback_reasons = _filter_for_shape(index, base, shape)
     base_shaped, base_fat_fallback_reasons = _filter_for_fat_policy(
+        index,
         base_shaped,
         shape,
         preferred_protein=preferred_protein,
     )
-    combo = base_shaped.order_by("combo_id").first() or base.order_by("combo_id").first()
+    combo = index.first(base_shaped) or index.first(base)
     if combo:
         _log_starter_selection(
             debug_context=debug_context,
             meal_target=meal_target,
             is_training_adjacent=is_training_adjacent,
             shape=shape,
-            candidates_before=base_before,
-            candidates_after=base_shaped.count(),
+            candidates_before=index.count(base),
+            candidates_after=index.count(base_shaped),
             combo=combo,
             fallback_reason=";".join([*fallback_reasons, *base_fallback_reasons, *base_fat_fallback_reasons, "base_combo_fallback"]),
         )
@@ -414,6 +414,11 @@ def _carb_patterns_for_shape(shape, pasta_carb):
     return [*TWO_CARB_PATTERNS, *ONE_CARB_PATTERNS, (pasta_carb, "-")]
 
 
+def _default_meal_count(day_payload):
+    default_meal_count = int((day_payload or {}).get("meals_per_day") or 6) if isinstance(day_payload, dict) else 6
+    return default_meal_count if default_meal_count in (3, 4, 5, 6) else 6
+
+
 def _build_template(spec, day_payload=None):
     protein_cycle = PROTEIN_GROUPS[spec["protein_group"]]
     breakfast_preferred = protein_cycle[0] if protein_cycle else None
@@ -434,8 +439,7 @@ def _build_template(spec, day_payload=None):
         return None
 
     meal_combos = [breakfast_combo]
-    default_meal_count = int((day_payload or {}).get("meals_per_day") or 6) if isinstance(day_payload, dict) else 6
-    default_meal_count = default_meal_count if default_meal_count in (3, 4, 5, 6) else 6
+    default_meal_count = _default_meal_count(day_payload)
     for meal_number in range(2, default_meal_count + 1):
         meal_target = _target_for_meal(day_payload, meal_number)
         shape = preferred_combo_shape_for_meal(meal_target, meal_number in training_adjacent)
@@ -473,6 +477,59 @@ def _build_template(spec, day_payload=None):
     }
 
 
+def starter_catalog_shape_key(day_payload=None):
+    """
+    The only day inputs the starter templates depend on: the meal count and the
+    (second protein, second carb, second fat) shape bucket of every meal, with
+    training adjacency already folded into the buckets.
+    """
+    training_adjacent = _training_adjacent_meals(day_payload)
+    targets = _meal_targets_from_day_payload(day_payload)
+    buckets = []
+    for meal_number in range(1, _default_meal_count(day_payload) + 1):
+        shape = preferred_combo_shape_for_meal(targets.get(meal_number), meal_number in training_adjacent)
+        buckets.append(
+            "".join("2" if allowed else "1" for allowed in (shape.allows_second_protein, shape.allows_second_carb, shape.allows_second_fat))
+        )
+    return "-".join(buckets)
+
+
+def build_starter_catalog(day_payload=None):
+    return [built for built in (_build_template(spec, day_payload=day_payload) for spec in TEMPLATE_SPECS) if built]
+
+
+def get_starter_catalog(day_payload=None):
+    """
+    Every buildable starter template for the day shape, cached in the shared
+    cache per combo table version so onboarding requests skip the combo picks.
+    """
+    key = f"{STARTER_CATALOG_CACHE_PREFIX}:{get_table_version(MEAL_COMBOS)}:{starter_catalog_shape_key(day_payload)}"
+    catalog = cache.get(key)
+    if catalog is None:
+        catalog = build_starter_catalog(day_payload)
+        cache.set(key, catalog, timeout=STARTER_CATALOG_CACHE_SECONDS)
+    return catalog
+
+
+def warm_starter_catalog():
+    """Build the GET catalog plus uniform-shape catalogs for 3-6 meals; returns how many were cached."""
+    day_payloads = [None]
+    for meals_per_day in (3, 4, 5, 6):
+        for protein_g, carbs_g, fats_g in product((40, 55), (35, 65), (15, 25)):
+            day_payloads.append(
+                {
+                    "meals_per_day": meals_per_day,
+                    "meal_macro_splits": [
+                        {"meal_number": meal_number, "grams": {"protein_g": protein_g, "carbs_g": carbs_g, "fats_g": fats_g}}
+                        for meal_number in range(1, meals_per_day + 1)
+                    ],
+                }
+            )
+    for day_payload in day_payloads:
+        get_starter_catalog(day_payload)
+    return len(day_payloads)
+
+
 @api_view(["GET", "POST"])
 @permission_classes([AllowAny])
 def meal_combo_starter_templates(request):
@@ -486,14 +543,7 @@ def meal_combo_starter_templates(request):
     if day_payload is not None and not isinstance(day_payload, dict):
         return error("INVALID_DAY_PAYLOAD", "day_payload must be an object.", http_status=400)
 
-    templates = []
-    for spec in TEMPLATE_SPECS:
-        built = _build_template(spec, day_payload=day_payload)
-        if built:
-            templates.append(built)
-        if len(templates) >= count:
-            break
-
+    templates = get_starter_catalog(day_payload)[:count]
     if not templates:
         return error("NO_COMBOS", "No meal combos available to build starter templates.", http_status=404)
     return ok({"starter_templates": templates})
@@ -1,16 +1,29 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import IsAuthenticated
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 
 from users.client_area.services.meal_plan_generation import (
     get_generated_meal_day_detail,
+    get_generated_meal_week_detail,
     get_generation_job_snapshot,
     get_generation_week_batch_status,
+    iter_generated_meal_week_detail,
     launch_full_generation_for_week_background,
     run_full_generation_for_day,
     run_full_generation_for_week,
     run_step1_for_day,
 )
-from users.client_area.views.api_contract import error, ok, require_client
+from users.client_area.services.meal_plan_generation.progress_events import progress_stream_enabled
+from users.client_area.services.meal_plan_generation.progress_stream import stream_week_batch_events
+from users.client_area.views.api_contract import error, error_payload, ok, require_client
 
 
 @api_view(["POST"])
@@ -40,7 +53,7 @@ def client_meal_plan_generation_run_week(request):
                 "days_completed": [],
                 "jobs": [],
                 "queued_at": result["queued_at"],
-                "note": "Background week generation started. Poll the batch status endpoint for progress.",
+                "note": "Background week generation started. Follow the batch events stream or poll the batch status endpoint for progress.",
             },
         }
     )
@@ -126,6 +139,51 @@ def client_meal_plan_generation_run_week_status(request, batch_id: str):
     return ok({"generation_week": payload})
 
 
+def _authenticate_event_stream(request):
+    """
+    EventSource cannot send an Authorization header, so the access token may also
+    come as `?token=`. Returns the user, or None when neither credential is valid.
+    """
+    authenticator = JWTAuthentication()
+    try:
+        authenticated = authenticator.authenticate(request)
+        if authenticated is not None:
+            return authenticated[0]
+        raw_token = request.GET.get("token")
+        if not raw_token:
+            return None
+        return authenticator.get_user(authenticator.get_validated_token(raw_token))
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None
+
+
+@require_GET
+async def client_meal_plan_generation_run_week_events(request, batch_id: str):
+    """Server-Sent Events for a week batch; served by the ASGI app as an async stream."""
+    user = await sync_to_async(_authenticate_event_stream)(request)
+    if user is None:
+        return JsonResponse(
+            error_payload("UNAUTHENTICATED", "Authentication credentials were not provided."),
+            status=401,
+        )
+    if getattr(user, "role", None) != "client":
+        return JsonResponse(error_payload("FORBIDDEN", "Not authorized as client."), status=403)
+    if not progress_stream_enabled():
+        return JsonResponse(
+            error_payload("PROGRESS_STREAM_UNAVAILABLE", "Live progress is not configured. Poll the batch status endpoint."),
+            status=503,
+        )
+
+    raw_days = request.GET.getlist("day")
+    response = StreamingHttpResponse(
+        stream_week_batch_events(user, batch_id, raw_days or None),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def client_meal_plan_day_detail(request, day_of_week: str):
@@ -148,6 +206,27 @@ def client_meal_plan_day_detail(request, day_of_week: str):
     return ok({"meal_plan_day": payload})
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def client_meal_plan_week_detail(request):
+    auth_error = require_client(request)
+    if auth_error:
+        return auth_error
+
+    raw_days = request.query_params.getlist("day")
+    days = raw_days if raw_days else None
+    stream = (request.query_params.get("stream") or "").strip().lower() in {"1", "true", "ndjson"}
+    if stream:
+        # One JSON object per line, one line per day, so the page can render days as they arrive.
+        lines = (
+            json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+            for row in iter_generated_meal_week_detail(request.user, days=days)
+        )
+        return StreamingHttpResponse(lines, content_type="application/x-ndjson")
+
+    return ok({"meal_plan_week": get_generated_meal_week_detail(request.user, days=days)})
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def client_meal_plan_generation_job_status(request, job_id: int):
@@ -3,6 +3,12 @@ from users.superadmin_area.views import dashboard
 from users.superadmin_area.views.analytics import analytics
 from users.superadmin_area.views.direct_client_tracking import direct_client_tracking
 from users.superadmin_area.views.food_library import food_library_browser
+from users.superadmin_area.views.meal_plan_generation import (
+    meal_plan_generation_cache,
+    meal_plan_generation_solvers,
+    meal_plan_generation_timings,
+    meal_plan_results_memo,
+)
 from users.superadmin_area.views.token_login import SuperAdminTokenObtainPairView
 
 urlpatterns = [
@@ -10,5 +16,9 @@ urlpatterns = [
     path('analytics/', analytics, name='analytics'),
     path('direct-clients/<int:user_id>/tracking/', direct_client_tracking, name='direct_client_tracking'),
     path('food-library/', food_library_browser, name='food_library_browser'),
+    path('meal-plan-generation/cache/', meal_plan_generation_cache, name='meal_plan_generation_cache'),
+    path('meal-plan-generation/timings/', meal_plan_generation_timings, name='meal_plan_generation_timings'),
+    path('meal-plan-generation/solvers/', meal_plan_generation_solvers, name='meal_plan_generation_solvers'),
+    path('meal-plan-generation/results-memo/', meal_plan_results_memo, name='meal_plan_results_memo'),
     path('login/', SuperAdminTokenObtainPairView.as_view(), name='login'),
 ]
@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+
+from users.client_area.services.meal_plan_generation.generation_cache import (
+    get_generation_cache_stats,
+    reset_generation_cache_stats,
+    set_generation_cache_bypass,
+)
+from users.client_area.services.meal_plan_generation.pipeline import list_solver_backends, solver_backend_name
+from users.client_area.services.meal_plan_generation.timings import aggregate_generation_timings
+from users.client_area.services.results_memo import get_results_memo_stats, reset_results_memo_stats
+from .api_contract import error, ok, require_superadmin
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAuthenticated])
+def meal_plan_generation_cache(request):
+    auth_error = require_superadmin(request)
+    if auth_error:
+        return auth_error
+
+    if request.method == "POST":
+        payload = request.data or {}
+        bypass = payload.get("bypass")
+        if bypass is not None and not isinstance(bypass, bool):
+            return error(
+                code="INVALID_BYPASS",
+                message="bypass must be true or false.",
+                http_status=400,
+            )
+        if bypass is not None:
+            set_generation_cache_bypass(bypass)
+        if payload.get("reset_stats") is True:
+            reset_generation_cache_stats()
+
+    return ok({"generation_cache": get_generation_cache_stats()})
+
+
+@api_view(["GET", "POST"])
+@permission_classes([IsAuthenticated])
+def meal_plan_results_memo(request):
+    auth_error = require_superadmin(request)
+    if auth_error:
+        return auth_error
+
+    if request.method == "POST" and (request.data or {}).get("reset_stats") is True:
+        reset_results_memo_stats()
+
+    return ok({"results_memo": get_results_memo_stats()})
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def meal_plan_generation_timings(request):
+    auth_error = require_superadmin(request)
+    if auth_error:
+        return auth_error
+
+    try:
+        days = int(request.query_params.get("days") or 7)
+        limit = int(request.query_params.get("limit") or 500)
+    except (TypeError, ValueError):
+        return error(
+            code="INVALID_WINDOW",
+            message="days and limit must be whole numbers.",
+            http_status=400,
+        )
+    if days < 1 or not 1 <= limit <= 5000:
+        return error(
+            code="INVALID_WINDOW",
+            message="days must be at least 1 and limit between 1 and 5000.",
+            http_status=400,
+        )
+
+    since = timezone.now() - timedelta(days=days)
+    return ok(
+        {
+            "window": {"days": days, "limit": limit},
+            "generation_timings": aggregate_generation_timings(since=since, limit=limit),
+        }
+    )
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def meal_plan_generation_solvers(request):
+    auth_error = require_superadmin(request)
+    if auth_error:
+        return auth_error
+
+    try:
+        active = solver_backend_name()
+    except ImproperlyConfigured as exc:
+        return error(code="SOLVER_BACKEND_MISCONFIGURED", message=str(exc), http_status=500)
+    return ok({"active": active, "solver_backends": list_solver_backends()})
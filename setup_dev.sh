@@ -17,6 +17,9 @@ python manage.py migrate
 echo "🥗 Seeding food library defaults from table_defaults..."
 python manage.py refresh_food_library_from_root
 
+echo "🔥 Warming the starter template catalog..."
+python manage.py warm_starter_catalog
+
 # Frontend dependencies
 cd ../frontend
 